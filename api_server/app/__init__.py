@@ -22,6 +22,7 @@ from auth.utils.exceptions import (
     EmailConfirmationTokenSpamCreationException,
     ExpiredJWTTokenError,
     JWTTokenError,
+    PasswordHashingQueueFullError,
     UserAlreadyActivatedException,
     authjwt_exception_handler,
     change_password_token_anti_creation_spam_handler,
@@ -33,8 +34,10 @@ from auth.utils.exceptions import (
     expired_jwt_token_handler,
     invalid_auth_credentials_handler,
     invalid_jwt_token_handler,
+    password_hashing_queue_full_handler,
     user_already_activated_handler,
 )
+from auth.utils.password_hashing import password_hashing_executor
 from charities.routers import charities_router
 from charities.utils.exceptions import (
     CharityEmployeeDuplicateError,
@@ -59,6 +62,7 @@ from charities.utils.exceptions import (
     employee_role_not_supported_error_handler,
 )
 from common.constants.api import ApiConstants
+from db import dispose_db_engine, start_db_engine
 from fundraisers.routers import fundraisers_router
 from fundraisers.utils.exceptions import (
     FundraiseNotFoundError,
@@ -72,7 +76,7 @@ from fundraisers.utils.exceptions import (
     fundraise_status_not_supported_error_handler,
     fundraise_status_permission_error_handler,
 )
-from users.routers import users_router
+from users.routers import picture_files_router, users_router
 from users.utils.exceptions import (
     UserNotFoundError,
     UserPermissionError,
@@ -87,7 +91,12 @@ from users.utils.exceptions import (
     user_picture_resolution_error_handler,
     user_picture_size_error_handler,
 )
-from utils.exceptions import integrity_error_handler
+from users.utils.storage import local_storage
+from utils.cache import read_through_cache
+from utils.compression import CompressionMiddleware
+from utils.count_providers import pagination_count_provider
+from utils.exceptions import PaginationCursorError, integrity_error_handler, pagination_cursor_error_handler
+from utils.file_spool import file_spool
 from utils.prepopulates.employee_roles import populate_employee_roles_table
 from utils.prepopulates.fundraise_statuses import populate_fundraise_statuses_table
 
@@ -117,8 +126,19 @@ def create_app(config_name=ApiConstants.DEVELOPMENT_CONFIG.value) -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    # Compress responses.
+    if config.COMPRESSION_ENABLED:
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=config.COMPRESSION_MINIMUM_SIZE,
+            gzip_level=config.COMPRESSION_GZIP_LEVEL,
+            brotli_quality=config.COMPRESSION_BROTLI_QUALITY,
+            content_types=config.COMPRESSION_CONTENT_TYPES,
+        )
     # Adding on start_up events.
     app_on_start_up_events(app)
+    # Adding on shutdown events.
+    app_on_shutdown_events(app)
 
     @AuthJWT.load_config
     def get_config():
@@ -140,6 +160,7 @@ def app_route_includer(app: FastAPI) -> FastAPI:
     app.include_router(auth_router, prefix=f'/api/v{ApiConstants.API_VERSION_V1.value}')
     app.include_router(charities_router, prefix=f'/api/v{ApiConstants.API_VERSION_V1.value}')
     app.include_router(fundraisers_router, prefix=f'/api/v{ApiConstants.API_VERSION_V1.value}')
+    app.include_router(picture_files_router, prefix=f'/api/v{ApiConstants.API_VERSION_V1.value}')
     return app
 
 
@@ -175,6 +196,7 @@ def app_exception_handler(app: FastAPI) -> FastAPI:
     )
     app.add_exception_handler(ChangePasswordTokenNotFoundError, change_password_token_not_found_handler)
     app.add_exception_handler(ChangePasswordTokenExpiredError, change_password_token_expired_in_db_handler)
+    app.add_exception_handler(PasswordHashingQueueFullError, password_hashing_queue_full_handler)
     app.add_exception_handler(FundraiseNotFoundError, fundraise_not_found_error_handler)
     app.add_exception_handler(FundraisePermissionError, fundraise_no_permissions_error_handler)
     app.add_exception_handler(CharityEmployeePermissionError, charity_employee_permission_error_handler)
@@ -189,6 +211,7 @@ def app_exception_handler(app: FastAPI) -> FastAPI:
     app.add_exception_handler(FundraiseStatusNotFoundError, fundraise_status_not_found_error_handler)
     app.add_exception_handler(FundraiseStatusNotSupportedError, fundraise_status_not_supported_error_handler)
     app.add_exception_handler(FundraiseStatusPermissionError, fundraise_status_permission_error_handler)
+    app.add_exception_handler(PaginationCursorError, pagination_cursor_error_handler)
     return app
 
 
@@ -201,5 +224,27 @@ def app_on_start_up_events(app: FastAPI) -> FastAPI:
     Returns:
     An instance of FastAPI with added start_up handlers.
     """
+    app.add_event_handler(event_type='startup', func=partial(start_db_engine, app=app))
+    app.add_event_handler(event_type='startup', func=partial(password_hashing_executor.start, config=app.app_config))
+    app.add_event_handler(event_type='startup', func=partial(pagination_count_provider.start, config=app.app_config))
+    app.add_event_handler(event_type='startup', func=partial(file_spool.start, config=app.app_config))
+    app.add_event_handler(event_type='startup', func=partial(local_storage.start, config=app.app_config))
+    app.add_event_handler(event_type='startup', func=partial(read_through_cache.start, config=app.app_config))
     app.add_event_handler(event_type='startup', func=partial(populate_fundraise_statuses_table, config=app.app_config))
     app.add_event_handler(event_type='startup', func=partial(populate_employee_roles_table, config=app.app_config))
+    return app
+
+
+def app_on_shutdown_events(app: FastAPI) -> FastAPI:
+    """Add on shutdown handlers to FastAPI app.
+
+    Args:
+        app: FastAPI instance.
+
+    Returns:
+    An instance of FastAPI with added shutdown handlers.
+    """
+    app.add_event_handler(event_type='shutdown', func=partial(dispose_db_engine, app=app))
+    app.add_event_handler(event_type='shutdown', func=password_hashing_executor.shutdown)
+    app.add_event_handler(event_type='shutdown', func=read_through_cache.shutdown)
+    return app
@@ -0,0 +1,195 @@
+from contextlib import AsyncExitStack
+from typing import Coroutine
+import asyncio
+import time
+
+from aiobotocore.session import get_session as get_aiobotocore_session
+from celery.app.utils import Settings
+from celery.signals import worker_process_init, worker_process_shutdown
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+import httpx
+
+from app.celery_base import app
+from auth.utils.email_lambdas import email_transport
+from auth.utils.email_templates import email_template_registry
+from common.constants.celery import CeleryConstants
+from common.constants.users import S3ClientConstants
+from db import create_engine
+from users.utils.aws_s3 import create_s3_client
+from users.utils.image_renditions import image_rendition_executor
+from users.utils.storage import local_storage
+from utils.cache import read_through_cache
+from utils.file_spool import file_spool
+from utils.logging import setup_logging
+
+
+class CeleryWorkerResources:
+    """Long-lived resources of a single Celery worker process reused by every task it runs.
+
+    Worker process owns one event loop, one pooled AsyncEngine with session factory, one pooled aiobotocore S3 client
+    and email transport, so tasks don't pay loop startup, database connect and clients teardown on every run.
+    """
+
+    def __init__(self) -> None:
+        self._log = setup_logging(self.__class__.__name__)
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.db_engine: AsyncEngine | None = None
+        self.db_session_maker: sessionmaker | None = None
+        self.s3_client = None
+        self._exit_stack: AsyncExitStack | None = None
+
+    @property
+    def started(self) -> bool:
+        return self.loop is not None
+
+    def start(self, config: Settings) -> None:
+        """Creates event loop, AsyncEngine, S3 client, email transport and templates, file spool, storage and rendition pool.
+
+        Args:
+            config: Celery app config.
+
+        Returns:
+        Nothing.
+        """
+        if self.started:
+            return
+        self.loop = asyncio.new_event_loop()
+        self.db_engine = create_engine(
+            database_url=config.get('POSTGRES_DATABASE_URL'),
+            echo=config.get('API_SQLALCHEMY_ECHO'),
+            future=config.get('API_SQLALCHEMY_FUTURE'),
+            pool_size=config.get('CELERY_WORKER_SQLALCHEMY_POOL_SIZE'),
+            max_overflow=config.get('CELERY_WORKER_SQLALCHEMY_MAX_OVERFLOW'),
+            pool_pre_ping=True,
+        )
+        self.db_session_maker = sessionmaker(self.db_engine, class_=AsyncSession, expire_on_commit=False)
+        self._exit_stack = AsyncExitStack()
+        self.s3_client = self.loop.run_until_complete(self._exit_stack.enter_async_context(
+            create_s3_client(
+                aws_access_key_id=config.get('AWS_ACCESS_KEY_ID'),
+                aws_secret_access_key=config.get('AWS_SECRET_ACCESS_KEY'),
+                max_pool_connections=config.get('AWS_S3_MAX_POOL_CONNECTIONS'),
+                local_dir=config.get('AWS_S3_LOCAL_DIR'),
+            )
+        ))
+        file_spool.start(config)
+        local_storage.start(config)
+        image_rendition_executor.start(config)
+        email_transport.start(config)
+        email_template_registry.start(config)
+        # Tasks updating user pictures invalidate cached charities through Redis shared with api server.
+        read_through_cache.start(config)
+        self._log.debug('Celery worker process resources started.')
+
+    def run(self, coro: Coroutine):
+        """Runs coroutine in event loop of worker process, starts worker resources if not started yet.
+
+        Args:
+            coro: coroutine to run.
+
+        Returns:
+        Result of the coroutine.
+        """
+        if not self.started:
+            self.start(app.conf)
+        return self.loop.run_until_complete(coro)
+
+    def shutdown(self) -> None:
+        """Closes S3 client, AsyncEngine, event loop, image rendition pool and email transport of worker process.
+
+        Returns:
+        Nothing.
+        """
+        if not self.started:
+            return
+        self.loop.run_until_complete(self._close())
+        self.loop.close()
+        image_rendition_executor.shutdown()
+        email_transport.shutdown()
+        self.loop = None
+        self.db_engine = None
+        self.db_session_maker = None
+        self.s3_client = None
+        self._exit_stack = None
+        self._log.debug('Celery worker process resources closed.')
+
+    async def _close(self) -> None:
+        await read_through_cache.shutdown()
+        await self._exit_stack.aclose()
+        await self.db_engine.dispose()
+
+
+celery_worker_resources = CeleryWorkerResources()
+
+
+@worker_process_init.connect
+def start_celery_worker_resources(**kwargs) -> None:
+    """Starts long-lived resources after Celery worker process is forked.
+
+    Returns:
+    Nothing.
+    """
+    celery_worker_resources.start(app.conf)
+
+
+@worker_process_shutdown.connect
+def shutdown_celery_worker_resources(**kwargs) -> None:
+    """Closes long-lived resources before Celery worker process exits.
+
+    Returns:
+    Nothing.
+    """
+    celery_worker_resources.shutdown()
+
+
+async def _run_cold_task_setup(config: Settings) -> None:
+    """Repeats per task setup and teardown done by tasks before worker process resources were introduced."""
+    engine = create_engine(
+        database_url=config.get('POSTGRES_DATABASE_URL'),
+        echo=config.get('API_SQLALCHEMY_ECHO'),
+        future=config.get('API_SQLALCHEMY_FUTURE'),
+    )
+    async with get_aiobotocore_session().create_client(
+            S3ClientConstants.S3_NAME.value,
+            aws_secret_access_key=config.get('AWS_SECRET_ACCESS_KEY'),
+            aws_access_key_id=config.get('AWS_ACCESS_KEY_ID'),
+    ):
+        async with httpx.AsyncClient():
+            async with sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as session:
+                await session.execute(text(CeleryConstants.BENCHMARK_QUERY.value))
+    await engine.dispose()
+
+
+async def _run_warm_task_setup() -> None:
+    """Runs the same database round trip with worker process resources."""
+    async with celery_worker_resources.db_session_maker() as session:
+        await session.execute(text(CeleryConstants.BENCHMARK_QUERY.value))
+
+
+@app.task
+def benchmark_task_overhead(iterations: int = CeleryConstants.BENCHMARK_DEFAULT_ITERATIONS.value) -> dict:
+    """Background celery task measuring per task overhead of event loop, database and clients setup.
+
+    Args:
+        iterations: number of measured runs of every setup.
+
+    Returns:
+    dict with average seconds per run of cold setup and of worker process resources.
+    """
+    cold_started_at = time.perf_counter()
+    for _ in range(iterations):
+        asyncio.run(_run_cold_task_setup(app.conf))
+    cold_avg = (time.perf_counter() - cold_started_at) / iterations
+    # Resources are started once per worker process, so startup is not a part of per task overhead.
+    celery_worker_resources.run(_run_warm_task_setup())
+    warm_started_at = time.perf_counter()
+    for _ in range(iterations):
+        celery_worker_resources.run(_run_warm_task_setup())
+    warm_avg = (time.perf_counter() - warm_started_at) / iterations
+    return {
+        'iterations': iterations,
+        'cold_avg_seconds': cold_avg,
+        'warm_avg_seconds': warm_avg,
+    }
@@ -1,3 +1,4 @@
+import json
 import os
 
 from dotenv import load_dotenv
@@ -5,6 +6,7 @@ from pydantic import BaseModel
 
 from common.constants.api import ApiConstants
 from common.constants.celery import CeleryConstants
+from common.constants.compression import CompressionConstants
 
 load_dotenv()
 
@@ -20,6 +22,51 @@ class DevelopmentConfig(BaseModel):
     API_SQLALCHEMY_ECHO: bool = (os.getenv('API_SQLALCHEMY_ECHO', 'False') == 'True')
     API_SQLALCHEMY_FUTURE: bool = (os.getenv('API_SQLALCHEMY_FUTURE', 'False') == 'True')
 
+    # Sqlalchemy connection pool settings.
+    API_SQLALCHEMY_POOL_SIZE: int = int(os.getenv('API_SQLALCHEMY_POOL_SIZE', '10'))
+    API_SQLALCHEMY_MAX_OVERFLOW: int = int(os.getenv('API_SQLALCHEMY_MAX_OVERFLOW', '20'))
+    API_SQLALCHEMY_POOL_RECYCLE: int = int(os.getenv('API_SQLALCHEMY_POOL_RECYCLE', '1800'))
+    API_SQLALCHEMY_POOL_PRE_PING: bool = (os.getenv('API_SQLALCHEMY_POOL_PRE_PING', 'True') == 'True')
+    API_SQLALCHEMY_POOL_TIMEOUT: int = int(os.getenv('API_SQLALCHEMY_POOL_TIMEOUT', '30'))
+
+    # Password hashing executor settings.
+    PASSWORD_HASHING_EXECUTOR: str = os.getenv('PASSWORD_HASHING_EXECUTOR', 'thread')
+    PASSWORD_HASHING_MAX_WORKERS: int = int(os.getenv('PASSWORD_HASHING_MAX_WORKERS', '2'))
+    PASSWORD_HASHING_MAX_QUEUE_DEPTH: int = int(os.getenv('PASSWORD_HASHING_MAX_QUEUE_DEPTH', '64'))
+
+    # Pagination total count settings.
+    PAGINATION_COUNT_STRATEGY: str = os.getenv('PAGINATION_COUNT_STRATEGY', 'exact')
+    PAGINATION_COUNT_CACHE_TTL: int = int(os.getenv('PAGINATION_COUNT_CACHE_TTL', '30'))
+
+    # File spool settings.
+    FILE_SPOOL_DIR: str | None = os.getenv('FILE_SPOOL_DIR')
+
+    # Picture local storage settings.
+    LOCAL_STORAGE_DIR: str | None = os.getenv('LOCAL_STORAGE_DIR')
+    LOCAL_STORAGE_URL: str | None = os.getenv('LOCAL_STORAGE_URL')
+
+    # Read-through cache settings.
+    CACHE_ENABLED: bool = (os.getenv('CACHE_ENABLED', 'True') == 'True')
+    CACHE_REDIS_URL: str | None = os.getenv('CACHE_REDIS_URL')
+    CACHE_TTL: int = int(os.getenv('CACHE_TTL', '300'))
+    CACHE_LOCAL_MAX_SIZE: int = int(os.getenv('CACHE_LOCAL_MAX_SIZE', '1024'))
+    CACHE_LOCAL_TTL: float = float(os.getenv('CACHE_LOCAL_TTL', '5'))
+
+    # Response compression settings.
+    COMPRESSION_ENABLED: bool = (os.getenv('COMPRESSION_ENABLED', 'True') == 'True')
+    COMPRESSION_MINIMUM_SIZE: int = int(
+        os.getenv('COMPRESSION_MINIMUM_SIZE', str(CompressionConstants.DEFAULT_MINIMUM_SIZE.value))
+    )
+    COMPRESSION_GZIP_LEVEL: int = int(
+        os.getenv('COMPRESSION_GZIP_LEVEL', str(CompressionConstants.DEFAULT_GZIP_LEVEL.value))
+    )
+    COMPRESSION_BROTLI_QUALITY: int = int(
+        os.getenv('COMPRESSION_BROTLI_QUALITY', str(CompressionConstants.DEFAULT_BROTLI_QUALITY.value))
+    )
+    COMPRESSION_CONTENT_TYPES: list[str] = json.loads(
+        os.getenv('COMPRESSION_CONTENT_TYPES', json.dumps(CompressionConstants.DEFAULT_CONTENT_TYPES.value))
+    )
+
     # Postgres settings.
     POSTGRES_DIALECT_DRIVER: str = os.getenv('POSTGRES_DIALECT_DRIVER')
     POSTGRES_DB_USERNAME: str = os.getenv('POSTGRES_DB_USERNAME')
@@ -49,6 +96,43 @@ class TestingConfig(BaseModel):
     API_SQLALCHEMY_ECHO: bool = (os.getenv('API_SQLALCHEMY_ECHO', 'False') == 'True')
     API_SQLALCHEMY_FUTURE: bool = (os.getenv('API_SQLALCHEMY_FUTURE', 'False') == 'True')
 
+    # Sqlalchemy connection pool settings.
+    API_SQLALCHEMY_POOL_SIZE: int = 5
+    API_SQLALCHEMY_MAX_OVERFLOW: int = 5
+    API_SQLALCHEMY_POOL_RECYCLE: int = 1800
+    API_SQLALCHEMY_POOL_PRE_PING: bool = True
+    API_SQLALCHEMY_POOL_TIMEOUT: int = 10
+
+    # Password hashing executor settings.
+    PASSWORD_HASHING_EXECUTOR: str = 'thread'
+    PASSWORD_HASHING_MAX_WORKERS: int = 2
+    PASSWORD_HASHING_MAX_QUEUE_DEPTH: int = 64
+
+    # Pagination total count settings.
+    PAGINATION_COUNT_STRATEGY: str = 'exact'
+    PAGINATION_COUNT_CACHE_TTL: int = 30
+
+    # File spool settings.
+    FILE_SPOOL_DIR: str | None = None
+
+    # Picture local storage settings.
+    LOCAL_STORAGE_DIR: str | None = None
+    LOCAL_STORAGE_URL: str | None = None
+
+    # Read-through cache settings.
+    CACHE_ENABLED: bool = True
+    CACHE_REDIS_URL: str | None = None
+    CACHE_TTL: int = 300
+    CACHE_LOCAL_MAX_SIZE: int = 1024
+    CACHE_LOCAL_TTL: float = 5
+
+    # Response compression settings.
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = CompressionConstants.DEFAULT_MINIMUM_SIZE.value
+    COMPRESSION_GZIP_LEVEL: int = CompressionConstants.DEFAULT_GZIP_LEVEL.value
+    COMPRESSION_BROTLI_QUALITY: int = CompressionConstants.DEFAULT_BROTLI_QUALITY.value
+    COMPRESSION_CONTENT_TYPES: list[str] = CompressionConstants.DEFAULT_CONTENT_TYPES.value
+
     # Postgres settings.
     POSTGRES_DIALECT_DRIVER: str = os.getenv('POSTGRES_DIALECT_DRIVER')
     POSTGRES_DB_USERNAME: str = os.getenv('POSTGRES_DB_USERNAME')
@@ -97,10 +181,10 @@ class CeleryDevelopmentConfig:
 
     CELERY_APP_NAME = os.getenv('CELERY_APP_NAME')
     C_FORCE_ROOT = os.getenv('C_FORCE_ROOT')
-    accept_content = [os.getenv('CELERY_ACCEPT_CONTENT')]
-    result_accept_content = [os.getenv('CELERY_RESULT_ACCEPT_CONTENT')]
-    task_serializer = os.getenv('CELERY_TASK_SERIALIZER')
-    result_serializer = os.getenv('CELERY_RESULT_SERIALIZER')
+    accept_content = [os.getenv('CELERY_ACCEPT_CONTENT', 'json')]
+    result_accept_content = [os.getenv('CELERY_RESULT_ACCEPT_CONTENT', 'json')]
+    task_serializer = os.getenv('CELERY_TASK_SERIALIZER', 'json')
+    result_serializer = os.getenv('CELERY_RESULT_SERIALIZER', 'json')
     backend = os.getenv('RESULT_BACKEND')
     broker = os.getenv('BROKER_URL')
 
@@ -109,11 +193,38 @@ class CeleryDevelopmentConfig:
     AWS_SECRET_ACCESS_KEY = os.getenv('AWS_SECRET_ACCESS_KEY')
     AWS_S3_BUCKET_NAME = os.getenv('AWS_S3_BUCKET_NAME')
     AWS_S3_BUCKET_REGION = os.getenv('AWS_S3_BUCKET_REGION')
+    AWS_S3_MAX_POOL_CONNECTIONS: int = int(os.getenv('AWS_S3_MAX_POOL_CONNECTIONS', '10'))
+    AWS_S3_LOCAL_DIR: str | None = os.getenv('AWS_S3_LOCAL_DIR')
+
+    # Picture storage settings, 's3' or 'local'.
+    PICTURE_STORAGE_BACKEND: str = os.getenv('PICTURE_STORAGE_BACKEND', 's3')
+    LOCAL_STORAGE_DIR: str | None = os.getenv('LOCAL_STORAGE_DIR')
+    LOCAL_STORAGE_URL: str | None = os.getenv('LOCAL_STORAGE_URL')
 
     # API settings.
     API_SQLALCHEMY_ECHO: bool = (os.getenv('API_SQLALCHEMY_ECHO', 'False') == 'True')
     API_SQLALCHEMY_FUTURE: bool = (os.getenv('API_SQLALCHEMY_FUTURE', 'False') == 'True')
 
+    # Worker process settings.
+    CELERY_WORKER_SQLALCHEMY_POOL_SIZE: int = int(os.getenv('CELERY_WORKER_SQLALCHEMY_POOL_SIZE', '2'))
+    CELERY_WORKER_SQLALCHEMY_MAX_OVERFLOW: int = int(os.getenv('CELERY_WORKER_SQLALCHEMY_MAX_OVERFLOW', '2'))
+    FILE_SPOOL_DIR: str | None = os.getenv('FILE_SPOOL_DIR')
+
+    # Outbox relay settings.
+    OUTBOX_RELAY_BATCH_SIZE: int = int(os.getenv('OUTBOX_RELAY_BATCH_SIZE', '100'))
+    OUTBOX_RELAY_POLL_INTERVAL: float = float(os.getenv('OUTBOX_RELAY_POLL_INTERVAL', '1.0'))
+
+    # Read-through cache settings, worker invalidates cached objects changed by tasks.
+    CACHE_ENABLED: bool = (os.getenv('CACHE_ENABLED', 'True') == 'True')
+    CACHE_REDIS_URL: str | None = os.getenv('CACHE_REDIS_URL')
+    CACHE_TTL: int = int(os.getenv('CACHE_TTL', '300'))
+    CACHE_LOCAL_MAX_SIZE: int = int(os.getenv('CACHE_LOCAL_MAX_SIZE', '1024'))
+    CACHE_LOCAL_TTL: float = float(os.getenv('CACHE_LOCAL_TTL', '5'))
+
+    # Image rendition executor settings.
+    IMAGE_RENDITION_EXECUTOR: str = os.getenv('IMAGE_RENDITION_EXECUTOR', 'process')
+    IMAGE_RENDITION_MAX_WORKERS: int = int(os.getenv('IMAGE_RENDITION_MAX_WORKERS', '2'))
+
     # Postgres settings.
     POSTGRES_DIALECT_DRIVER: str = os.getenv('POSTGRES_DIALECT_DRIVER')
     POSTGRES_DB_USERNAME: str = os.getenv('POSTGRES_DB_USERNAME')
@@ -135,16 +246,25 @@ class CeleryDevelopmentConfig:
     AWS_SES_EMAIL_SOURCE: str = os.getenv('AWS_SES_EMAIL_SOURCE')
     AWS_EMAIL_LAMBDA_URL: str = os.getenv('AWS_EMAIL_LAMBDA_URL')
 
+    # Email transport settings.
+    EMAIL_HTTP2: bool = (os.getenv('EMAIL_HTTP2', 'True') == 'True')
+    EMAIL_MAX_CONNECTIONS: int = int(os.getenv('EMAIL_MAX_CONNECTIONS', '20'))
+    # Letter tasks of prefork pool never share a batch, batch mode only helps processes sending many letters at once.
+    EMAIL_BATCH_MODE: bool = (os.getenv('EMAIL_BATCH_MODE', 'False') == 'True')
+    EMAIL_BATCH_MAX_SIZE: int = int(os.getenv('EMAIL_BATCH_MAX_SIZE', '50'))
+    EMAIL_BATCH_WINDOW: float = float(os.getenv('EMAIL_BATCH_WINDOW', '0.5'))
+    EMAIL_TEMPLATES_BYTECODE_CACHE_DIR: str | None = os.getenv('EMAIL_TEMPLATES_BYTECODE_CACHE_DIR')
+
 
 class CeleryTestingConfig:
     """Celery testing environment variables."""
 
     CELERY_APP_NAME = os.getenv('CELERY_APP_NAME')
     C_FORCE_ROOT = os.getenv('C_FORCE_ROOT')
-    accept_content = [os.getenv('CELERY_ACCEPT_CONTENT')]
-    result_accept_content = [os.getenv('CELERY_RESULT_ACCEPT_CONTENT')]
-    task_serializer = os.getenv('CELERY_TASK_SERIALIZER')
-    result_serializer = os.getenv('CELERY_RESULT_SERIALIZER')
+    accept_content = [os.getenv('CELERY_ACCEPT_CONTENT', 'json')]
+    result_accept_content = [os.getenv('CELERY_RESULT_ACCEPT_CONTENT', 'json')]
+    task_serializer = os.getenv('CELERY_TASK_SERIALIZER', 'json')
+    result_serializer = os.getenv('CELERY_RESULT_SERIALIZER', 'json')
     backend = os.getenv('RESULT_BACKEND')
     broker = os.getenv('BROKER_URL')
 
@@ -153,11 +273,46 @@ class CeleryTestingConfig:
     AWS_SECRET_ACCESS_KEY = f'test_{os.getenv("AWS_SECRET_ACCESS_KEY")}'
     AWS_S3_BUCKET_NAME = f'test_{os.getenv("AWS_S3_BUCKET_NAME")}'
     AWS_S3_BUCKET_REGION = os.getenv('AWS_S3_BUCKET_REGION')
+    AWS_S3_MAX_POOL_CONNECTIONS: int = 10
+    AWS_S3_LOCAL_DIR: str | None = None
+
+    # Picture storage settings, 's3' or 'local'.
+    PICTURE_STORAGE_BACKEND: str = 's3'
+    LOCAL_STORAGE_DIR: str | None = None
+    LOCAL_STORAGE_URL: str | None = None
 
     # API settings.
     API_SQLALCHEMY_ECHO: bool = (os.getenv('API_SQLALCHEMY_ECHO', 'False') == 'True')
     API_SQLALCHEMY_FUTURE: bool = (os.getenv('API_SQLALCHEMY_FUTURE', 'False') == 'True')
 
+    # Worker process settings.
+    CELERY_WORKER_SQLALCHEMY_POOL_SIZE: int = 2
+    CELERY_WORKER_SQLALCHEMY_MAX_OVERFLOW: int = 2
+    FILE_SPOOL_DIR: str | None = None
+
+    # Outbox relay settings.
+    OUTBOX_RELAY_BATCH_SIZE: int = 100
+    OUTBOX_RELAY_POLL_INTERVAL: float = 1.0
+
+    # Read-through cache settings, worker invalidates cached objects changed by tasks.
+    CACHE_ENABLED: bool = True
+    CACHE_REDIS_URL: str | None = None
+    CACHE_TTL: int = 300
+    CACHE_LOCAL_MAX_SIZE: int = 1024
+    CACHE_LOCAL_TTL: float = 5
+
+    # Image rendition executor settings.
+    IMAGE_RENDITION_EXECUTOR: str = 'thread'
+    IMAGE_RENDITION_MAX_WORKERS: int = 2
+
+    # Email transport settings.
+    EMAIL_HTTP2: bool = False
+    EMAIL_MAX_CONNECTIONS: int = 20
+    EMAIL_BATCH_MODE: bool = False
+    EMAIL_BATCH_MAX_SIZE: int = 50
+    EMAIL_BATCH_WINDOW: float = 0.5
+    EMAIL_TEMPLATES_BYTECODE_CACHE_DIR: str | None = None
+
     # Postgres settings.
     POSTGRES_DIALECT_DRIVER: str = os.getenv('POSTGRES_DIALECT_DRIVER')
     POSTGRES_DB_USERNAME: str = os.getenv('POSTGRES_DB_USERNAME')
@@ -1,9 +1,11 @@
 from datetime import datetime
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from sqlalchemy import and_, select, update
+from sqlalchemy.orm import joinedload
 
 from auth.models import ChangePasswordToken
+from auth.utils.jwt_tokens import create_token_digest
 from users.cruds.users_crud import UserCRUD
 from utils.logging import setup_logging
 
@@ -14,29 +16,37 @@ class ChangePasswordTokenCRUD(UserCRUD):
         self._log = setup_logging(self.__class__.__name__)
         self.session = session
 
-    async def add_change_password_token(self, id_: UUID, token: str) -> ChangePasswordToken:
+    async def add_change_password_token(
+            self, id_: UUID, token: str, token_id: UUID | None = None,
+    ) -> ChangePasswordToken:
         """Add ChangePasswordToken object to the database.
 
         Args:
             id_: UUID of User object.
             token: string with encoded JWT token.
+            token_id: UUID of created ChangePasswordToken object, generated if not provided.
 
         Returns:
         newly created ChangePasswordToken object.
         """
-        return await self._add_change_password_token(id_, token)
+        return await self._add_change_password_token(id_, token, token_id)
 
-    async def _add_change_password_token(self, id_: UUID, token: str) -> ChangePasswordToken:
+    async def _add_change_password_token(
+            self, id_: UUID, token: str, token_id: UUID | None = None,
+    ) -> ChangePasswordToken:
         await self._expire_all_existing_change_password_tokens(id_=id_)
-        change_password_token = ChangePasswordToken(user_id=id_, token=token)
+        change_password_token = ChangePasswordToken(
+            id=token_id or uuid4(), user_id=id_, token=token, token_digest=create_token_digest(token),
+        )
         self.session.add(change_password_token)
         await self.session.commit()
-        await self.session.refresh(change_password_token)
-        return change_password_token
+        return await self._select_change_password_token(column='id', value=change_password_token.id)
 
     async def _expire_all_existing_change_password_tokens(self, id_: UUID) -> None:
         """Finds all user's non expired tokens and expires them by setting 'expired_at' field with current time.
 
+        Tokens are expired in the same transaction as new token is added.
+
         Args:
             id_: UUID of a user.
 
@@ -54,16 +64,28 @@ class ChangePasswordTokenCRUD(UserCRUD):
             expired_at=datetime.utcnow()
         )
         await self.session.execute(q)
-        await self.session.commit()
 
-    async def _select_change_password_token(self, column: str, value: UUID | str) -> ChangePasswordToken:
+    async def _select_change_password_token(self, column: str, value: UUID | str | bytes) -> ChangePasswordToken:
         change_password_token = await self.session.execute(
-            select(ChangePasswordToken).where(ChangePasswordToken.__table__.columns[column] == value),
+            select(ChangePasswordToken)
+            .where(ChangePasswordToken.__table__.columns[column] == value)
+            .options(joinedload(ChangePasswordToken.user)),
         )
         return change_password_token.scalars().one_or_none()
 
+    async def get_change_password_token_by_id(self, id_: UUID) -> ChangePasswordToken:
+        """Get ChangePasswordToken object with loaded user from database filtered by id.
+
+        Args:
+            id_: UUID of ChangePasswordToken object.
+
+        Returns:
+        Single ChangePasswordToken object filtered by id.
+        """
+        return await self._select_change_password_token(column='id', value=id_)
+
     async def _get_change_password_by_token(self, token: str) -> ChangePasswordToken:
-        return await self._select_change_password_token(column='token', value=token)
+        return await self._select_change_password_token(column='token_digest', value=create_token_digest(token))
 
     async def _get_last_non_expired_change_password_token_by_user_id(self, user_id: UUID) -> ChangePasswordToken:
         q = select(
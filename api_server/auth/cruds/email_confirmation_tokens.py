@@ -1,9 +1,11 @@
 from datetime import datetime
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from sqlalchemy import and_, select, update
+from sqlalchemy.orm import joinedload
 
 from auth.models import EmailConfirmationToken
+from auth.utils.jwt_tokens import create_token_digest
 from users.cruds.users_crud import UserCRUD
 from utils.logging import setup_logging
 
@@ -14,29 +16,37 @@ class EmailConfirmationTokenCRUD(UserCRUD):
         self._log = setup_logging(self.__class__.__name__)
         self.session = session
 
-    async def add_email_confirmation_token(self, id_: UUID, token: str) -> EmailConfirmationToken:
+    async def add_email_confirmation_token(
+            self, id_: UUID, token: str, token_id: UUID | None = None,
+    ) -> EmailConfirmationToken:
         """Add EmailConfirmationToken object to the database.
 
         Args:
             id_: UUID of User object.
             token: string with encoded JWT token.
+            token_id: UUID of created EmailConfirmationToken object, generated if not provided.
 
         Returns:
         newly created EmailConfirmationToken object.
         """
-        return await self._add_email_confirmation_token(id_, token)
+        return await self._add_email_confirmation_token(id_, token, token_id)
 
-    async def _add_email_confirmation_token(self, id_: UUID, token: str) -> EmailConfirmationToken:
+    async def _add_email_confirmation_token(
+            self, id_: UUID, token: str, token_id: UUID | None = None,
+    ) -> EmailConfirmationToken:
         await self._expire_all_existing_email_confirmation_tokens(id_=id_)
-        email_confirmation_token = EmailConfirmationToken(user_id=id_, token=token)
+        email_confirmation_token = EmailConfirmationToken(
+            id=token_id or uuid4(), user_id=id_, token=token, token_digest=create_token_digest(token),
+        )
         self.session.add(email_confirmation_token)
         await self.session.commit()
-        await self.session.refresh(email_confirmation_token)
-        return email_confirmation_token
+        return await self._select_email_confirmation_token(column='id', value=email_confirmation_token.id)
 
     async def _expire_all_existing_email_confirmation_tokens(self, id_: UUID) -> None:
         """Finds all user's non expired tokens and expires them by setting 'expired_at' field with current time.
 
+        Tokens are expired in the same transaction as new token is added.
+
         Args:
             id_: UUID of a user.
 
@@ -54,7 +64,6 @@ class EmailConfirmationTokenCRUD(UserCRUD):
             expired_at=datetime.utcnow()
         )
         await self.session.execute(q)
-        await self.session.commit()
 
     async def _expire_email_confirmation_token_by_id(self, id_: UUID) -> None:
         """Expires specific EmailConfirmationToken object by setting 'expired_at' field with current time.
@@ -76,13 +85,26 @@ class EmailConfirmationTokenCRUD(UserCRUD):
         )
         await self.session.commit()
 
-    async def _select_email_confirmation_token(self, column: str, value: UUID | str) -> EmailConfirmationToken:
+    async def _select_email_confirmation_token(self, column: str, value: UUID | str | bytes) -> EmailConfirmationToken:
         self._log.debug(f'Getting EmailConfirmationToken with: "{column}": "{value}" from the db.')
         email_confirmation_token = await self.session.execute(
-            select(EmailConfirmationToken).where(EmailConfirmationToken.__table__.columns[column] == value),
+            select(EmailConfirmationToken)
+            .where(EmailConfirmationToken.__table__.columns[column] == value)
+            .options(joinedload(EmailConfirmationToken.user)),
         )
         return email_confirmation_token.scalars().one_or_none()
 
+    async def get_email_confirmation_token_by_id(self, id_: UUID) -> EmailConfirmationToken:
+        """Get EmailConfirmationToken object with loaded user from database filtered by id.
+
+        Args:
+            id_: UUID of EmailConfirmationToken object.
+
+        Returns:
+        Single EmailConfirmationToken object filtered by id.
+        """
+        return await self._select_email_confirmation_token(column='id', value=id_)
+
     async def get_email_confirmation_by_token(self, token: str) -> EmailConfirmationToken:
         """Get EmailConfirmationToken object from database filtered by token field.
 
@@ -95,7 +117,7 @@ class EmailConfirmationTokenCRUD(UserCRUD):
         return await self._get_email_confirmation_by_token(token)
 
     async def _get_email_confirmation_by_token(self, token: str) -> EmailConfirmationToken:
-        return await self._select_email_confirmation_token(column='token', value=token)
+        return await self._select_email_confirmation_token(column='token_digest', value=create_token_digest(token))
 
     async def _get_last_non_expired_email_confirmation_token_by_user_id(self, user_id: UUID) -> EmailConfirmationToken:
         q = select(
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Column, DateTime, ForeignKey, String, func
+from sqlalchemy import Column, DateTime, ForeignKey, Index, LargeBinary, String, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -12,13 +12,20 @@ class ChangePasswordToken(Base):
     """A model representing change password token."""
 
     __tablename__ = 'change-password-token'
+    __table_args__ = (
+        # Covers lookup of user's last non-expired token.
+        Index('ix_change_password_token_user_id_not_expired', 'user_id', postgresql_where=text('expired_at IS NULL')),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=False)
-    token = Column(String(ChangePasswordTokenModelConstants.CHAR_SIZE_2048.value), nullable=True, unique=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=False, index=True)
+    token = Column(String(ChangePasswordTokenModelConstants.CHAR_SIZE_2048.value), nullable=True)
+    token_digest = Column(
+        LargeBinary(ChangePasswordTokenModelConstants.SHA256_DIGEST_SIZE.value), nullable=True, unique=True,
+    )
     created_at = Column(DateTime, server_default=func.now())
     expired_at = Column(DateTime, nullable=True)
-    user = relationship('User', back_populates='change_password_token', lazy='selectin')
+    user = relationship('User', back_populates='change_password_token', lazy='raise')
 
     __mapper_args__ = {'eager_defaults': True}
 
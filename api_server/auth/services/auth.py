@@ -1,9 +1,8 @@
 from datetime import datetime, timedelta
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from fastapi import Depends, status
 
-from passlib.hash import argon2
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from auth.cruds import ChangePasswordTokenCRUD, EmailConfirmationTokenCRUD
@@ -27,6 +26,7 @@ from auth.utils.exceptions import (
     UserAlreadyActivatedException,
 )
 from auth.utils.jwt_tokens import create_jwt_token, create_token_payload, decode_jwt_token
+from auth.utils.password_hashing import password_hashing_executor
 from common.constants.auth import ChangePasswordTokenConstants, EmailConfirmationTokenConstants
 from common.exceptions.auth import (
     AuthExceptionMsgs,
@@ -34,6 +34,7 @@ from common.exceptions.auth import (
     EmailConfirmationTokenExceptionMsgs,
 )
 from db import get_session
+from outbox.cruds import OutboxMessageCRUD
 from users.models import User
 from users.services import UserService
 from utils.logging import setup_logging
@@ -48,6 +49,7 @@ class AuthService:
         self.user_service = UserService(session=self.session)
         self.email_confirmation_token_crud = EmailConfirmationTokenCRUD(session=self.session)
         self.change_password_token_crud = ChangePasswordTokenCRUD(session=self.session)
+        self.outbox_message_crud = OutboxMessageCRUD(session=self.session)
 
     async def verify_user_credentials(self, user_credentials: AuthUserInputSchema) -> User:
         """Finds user in db and verifies user's password hash with provided password.
@@ -82,7 +84,7 @@ class AuthService:
         return await self._verify_password(password, password_hash)
 
     async def _verify_password(self, password: str, password_hash: str) -> bool:
-        return argon2.verify(password, password_hash)
+        return await password_hashing_executor.verify(password, password_hash)
 
     async def me(self, username: str) -> User:
         """Gets user information based on JWT credentials.
@@ -161,17 +163,19 @@ class AuthService:
             time_unit=EmailConfirmationTokenConstants.MINUTES.value,
         )
         jwt_token = create_jwt_token(payload=jwt_token_payload, key=user.password)
-        db_email_confirmation_token = await self.email_confirmation_token_crud.add_email_confirmation_token(
-            id_=user.id,
-            token=jwt_token,
-        )
-        send_email_confirmation_letter.apply_async(
+        token_id = uuid4()
+        # Sending confirmation email task is committed to outbox together with EmailConfirmationToken.
+        self.outbox_message_crud.stage_outbox_message(
+            task=send_email_confirmation_letter,
             kwargs={
-                'email_confirmation_token': db_email_confirmation_token,
+                'email_confirmation_token_id': str(token_id),
             },
-            serializers='pickle',
         )
-        return db_email_confirmation_token
+        return await self.email_confirmation_token_crud.add_email_confirmation_token(
+            id_=user.id,
+            token=jwt_token,
+            token_id=token_id,
+        )
 
     async def _check_user_is_activated(self, user: User) -> bool:
         """Checks if user object has 'activated_at' field filled with data.
@@ -282,17 +286,19 @@ class AuthService:
             time_unit=EmailConfirmationTokenConstants.DAYS.value,
         )
         jwt_token = create_jwt_token(payload=jwt_token_payload, key=user.password)
-        db_change_password_token = await self.change_password_token_crud.add_change_password_token(
-            id_=user.id,
-            token=jwt_token,
-        )
-        send_change_password_letter.apply_async(
+        token_id = uuid4()
+        # Sending change password letter task is committed to outbox together with ChangePasswordToken.
+        self.outbox_message_crud.stage_outbox_message(
+            task=send_change_password_letter,
             kwargs={
-                'token': db_change_password_token,
+                'token_id': str(token_id),
             },
-            serializers='pickle',
         )
-        return db_change_password_token
+        return await self.change_password_token_crud.add_change_password_token(
+            id_=user.id,
+            token=jwt_token,
+            token_id=token_id,
+        )
 
     async def _prevent_change_password_token_spam_creation(self, user_id: UUID) -> None:
         """Checks user's change password token 'created_at' value against min token lifetime to prevent endpoint abuse.
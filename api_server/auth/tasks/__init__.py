@@ -1,7 +1,9 @@
 from auth.tasks.change_password_tokens import send_change_password_letter
 from auth.tasks.email_confirmation_tokens import send_email_confirmation_letter
+from auth.tasks.email_templates import benchmark_email_letters_rendering
 
 __all__ = [
     'send_email_confirmation_letter',
     'send_change_password_letter',
+    'benchmark_email_letters_rendering',
 ]
@@ -1,27 +1,38 @@
-import asyncio
+from uuid import UUID
 
 from app.celery_base import app
-from auth.models import ChangePasswordToken
+from app.celery_worker import celery_worker_resources
+from auth.cruds import ChangePasswordTokenCRUD
 from auth.utils.change_password_tokens import ChangePasswordLetter
-from auth.utils.email_lambdas import EmailLambdaClient
+from auth.utils.email_lambdas import EmailLambdaClient, EmailLambdaUnavailableError
+from common.constants.auth import EmailTransportConstants
 
 
-@app.task
-def send_change_password_letter(token: ChangePasswordToken) -> dict:
+@app.task(
+    autoretry_for=(EmailLambdaUnavailableError,),
+    max_retries=EmailTransportConstants.TASK_MAX_RETRIES.value,
+    retry_backoff=EmailTransportConstants.TASK_RETRY_BACKOFF.value,
+)
+def send_change_password_letter(token_id: str) -> dict:
     """Background celery task sends to user's email the letter with link to change user password.
 
     Args:
-        token: ChangePasswordToken object instance.
+        token_id: string with UUID of ChangePasswordToken object.
 
     Returns:
-    dict with AWS lambda boto3 ses response.
+    dict with AWS lambda boto3 ses response, empty dict if token not found.
     """
+    return celery_worker_resources.run(_send_change_password_letter(UUID(token_id)))
+
+
+async def _send_change_password_letter(token_id: UUID) -> dict:
+    async with celery_worker_resources.db_session_maker() as session:
+        token = await ChangePasswordTokenCRUD(session).get_change_password_token_by_id(token_id)
+    if token is None:
+        return {}
     letter = ChangePasswordLetter(
         db_token=token,
         server_config=app.conf,
     )
-    email_client = EmailLambdaClient(
-        letter=letter,
-        server_config=app.conf,
-    )
-    return asyncio.run(email_client.send_email())
+    email_client = EmailLambdaClient(letter=letter)
+    return await email_client.send_email()
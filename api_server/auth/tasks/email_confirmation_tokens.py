@@ -1,27 +1,40 @@
-import asyncio
+from uuid import UUID
 
 from app.celery_base import app
-from auth.models import EmailConfirmationToken
+from app.celery_worker import celery_worker_resources
+from auth.cruds import EmailConfirmationTokenCRUD
 from auth.utils.email_confirmation_tokens import EmailConfirmationLetter
-from auth.utils.email_lambdas import EmailLambdaClient
+from auth.utils.email_lambdas import EmailLambdaClient, EmailLambdaUnavailableError
+from common.constants.auth import EmailTransportConstants
 
 
-@app.task
-def send_email_confirmation_letter(email_confirmation_token: EmailConfirmationToken) -> dict:
+@app.task(
+    autoretry_for=(EmailLambdaUnavailableError,),
+    max_retries=EmailTransportConstants.TASK_MAX_RETRIES.value,
+    retry_backoff=EmailTransportConstants.TASK_RETRY_BACKOFF.value,
+)
+def send_email_confirmation_letter(email_confirmation_token_id: str) -> dict:
     """Background celery task sends to user's email the letter with user profile activation information.
 
     Args:
-        email_confirmation_token: EmailConfirmationToken object instance.
+        email_confirmation_token_id: string with UUID of EmailConfirmationToken object.
 
     Returns:
-    dict with AWS lambda boto3 ses response.
+    dict with AWS lambda boto3 ses response, empty dict if token not found.
     """
+    return celery_worker_resources.run(_send_email_confirmation_letter(UUID(email_confirmation_token_id)))
+
+
+async def _send_email_confirmation_letter(email_confirmation_token_id: UUID) -> dict:
+    async with celery_worker_resources.db_session_maker() as session:
+        email_confirmation_token = await EmailConfirmationTokenCRUD(session).get_email_confirmation_token_by_id(
+            email_confirmation_token_id,
+        )
+    if email_confirmation_token is None:
+        return {}
     email_confirmation_letter = EmailConfirmationLetter(
         email_confirmation_token=email_confirmation_token,
         server_config=app.conf,
     )
-    email_client = EmailLambdaClient(
-        letter=email_confirmation_letter,
-        server_config=app.conf,
-    )
-    return asyncio.run(email_client.send_email())
+    email_client = EmailLambdaClient(letter=email_confirmation_letter)
+    return await email_client.send_email()
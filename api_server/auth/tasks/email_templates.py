@@ -0,0 +1,51 @@
+import html
+import re
+import time
+
+from jinja2 import Template
+
+from app.celery_base import app
+from auth.models import EmailConfirmationToken
+from auth.utils.email_confirmation_tokens import EmailConfirmationLetter
+from common.constants.auth import EmailConfirmationLetterConstants, EmailTemplateRegistryConstants
+from users.models import User
+
+
+@app.task
+def benchmark_email_letters_rendering(
+        letters_count: int = EmailTemplateRegistryConstants.BENCHMARK_DEFAULT_LETTERS_COUNT.value,
+) -> dict:
+    """Background celery task measuring email confirmation letters rendered per second.
+
+    Letters rendered with compiled templates of EmailTemplateRegistry are compared with letters rendered from
+    template constant compiled for every letter.
+
+    Args:
+        letters_count: number of rendered letters.
+
+    Returns:
+    dict with letters per second of uncached and of registry rendering.
+    """
+    letter = EmailConfirmationLetter(
+        email_confirmation_token=EmailConfirmationToken(
+            token=EmailTemplateRegistryConstants.BENCHMARK_TOKEN.value,
+            user=User(email=EmailTemplateRegistryConstants.BENCHMARK_EMAIL.value),
+        ),
+        server_config=app.conf,
+    )
+    uncached_started_at = time.perf_counter()
+    for _ in range(letters_count):
+        template = Template(EmailConfirmationLetterConstants.EMAIL_HTML_TEMPLATE.value)
+        html.escape(re.sub('\n', '', template.render(**letter.template_context)))
+    uncached_seconds = time.perf_counter() - uncached_started_at
+    # Templates are compiled when worker process starts, so compilation is not a part of letter rendering.
+    letter.payload_data
+    registry_started_at = time.perf_counter()
+    for _ in range(letters_count):
+        letter.payload_data
+    registry_seconds = time.perf_counter() - registry_started_at
+    return {
+        'letters_count': letters_count,
+        'uncached_letters_per_second': letters_count / uncached_seconds,
+        'registry_letters_per_second': letters_count / registry_seconds,
+    }
@@ -146,7 +146,8 @@ class TestCasePostAuthChangePassword(TestMixin):
         assert response_data == expected_result
         assert response.status_code == status.HTTP_200_OK
         assert (await db_session.execute(select(func.count(ChangePasswordToken.id)))).scalar_one() == 1
-        await db_session.refresh(test_change_password_token)
+        await db_session.refresh(test_change_password_token, attribute_names=['expired_at'])
+        await db_session.refresh(test_change_password_token.user)
         assert test_change_password_token.expired_at is not None
         user_password_hash_after = test_change_password_token.user.password
         assert user_password_hash_before != user_password_hash_after
@@ -0,0 +1,63 @@
+from fastapi import FastAPI, status
+
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+import pytest
+
+from auth.utils.current_user import CurrentUser, current_user_metrics
+from common.tests.generics import TestMixin
+from common.tests.test_data.charities import request_test_charity_data
+from users.models import User
+from utils.tests import count_statements
+
+
+class TestCaseCurrentUser(TestMixin):
+
+    @pytest.mark.asyncio
+    async def test_current_user_memoized_in_session(self, db_session: AsyncSession, test_user: User) -> None:
+        """Test CurrentUser loads user, employee and charity memberships once per session.
+
+        Args:
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+            test_user: pytest fixture, add user to database.
+
+        Returns:
+        Nothing.
+        """
+        current_user = CurrentUser.from_session(db_session, test_user.username)
+        assert CurrentUser.from_session(db_session, test_user.username) is current_user
+        saved_lookups = current_user_metrics.saved_lookups
+        with count_statements(db_session.bind) as statements:
+            assert (await current_user.get_user()).id == test_user.id
+            assert await current_user.get_employee() is None
+            assert await current_user.get_charity_ids() == set()
+            # Second round served from memoized values.
+            assert (await current_user.get_user()).id == test_user.id
+            assert await current_user.get_employee() is None
+            assert await current_user.get_charity_ids() == set()
+        assert len(statements) == 3
+        # 'get_employee' reuses memoized user on first call as well.
+        assert current_user_metrics.saved_lookups - saved_lookups == 4
+        CurrentUser.forget(db_session)
+        assert CurrentUser.from_session(db_session, test_user.username) is not current_user
+
+    @pytest.mark.asyncio
+    async def test_post_charities_reuses_current_user(
+            self, app: FastAPI, client: AsyncClient, authenticated_test_user: User,
+    ) -> None:
+        """Test POST '/charities' endpoint loads authenticated user from the database once.
+
+        Args:
+            app: pytest fixture, an instance of FastAPI.
+            client: pytest fixture, an instance of AsyncClient for http requests.
+            authenticated_test_user: pytest fixture, add user to database and auth cookies to client fixture.
+
+        Returns:
+        Nothing.
+        """
+        url = app.url_path_for('post_charities')
+        metrics = current_user_metrics.snapshot()
+        response = await client.post(url, json=request_test_charity_data.ADD_CHARITY_TEST_DATA)
+        assert response.status_code == status.HTTP_201_CREATED
+        assert current_user_metrics.db_lookups - metrics['db_lookups'] == 2
+        assert current_user_metrics.saved_lookups - metrics['saved_lookups'] == 1
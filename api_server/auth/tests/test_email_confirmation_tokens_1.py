@@ -3,12 +3,13 @@ import time
 from fastapi import FastAPI, status
 
 from httpx import AsyncClient
-from sqlalchemy import func, select
+from sqlalchemy import func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 import pytest
 
 from auth.models import EmailConfirmationToken
 from auth.tests.test_data import response_auth_email_confirmation_data
+from auth.utils.jwt_tokens import create_token_digest
 from common.constants.auth import EmailConfirmationTokenConstants
 from common.tests.generics import TestMixin
 from common.tests.test_data.auth import request_test_auth_email_confirmation_data
@@ -186,7 +187,7 @@ class TestCaseGetAuthEmailConfirmation(TestMixin):
         assert (await db_session.execute(select(func.count(EmailConfirmationToken.id)))).scalar_one() == 2
         assert test_email_confirmation_token.expired_at is None
         assert test_email_confirmation_token.user.activated_at is None
-        await db_session.refresh(test_email_confirmation_token)
+        await db_session.refresh(test_email_confirmation_token, attribute_names=['expired_at'])
         await db_session.refresh(test_email_confirmation_token.user)
         assert test_email_confirmation_token.expired_at is not None
         assert test_email_confirmation_token.user.activated_at is not None
@@ -222,3 +223,29 @@ class TestCaseGetAuthEmailConfirmation(TestMixin):
         assert (await db_session.execute(select(func.count(EmailConfirmationToken.id)))).scalar_one() == 2
         assert test_activated_email_confirmation_token.expired_at is not None
         assert test_activated_email_confirmation_token.user.activated_at is not None
+
+
+class TestCaseEmailConfirmationTokenDigest(TestMixin):
+
+    @pytest.mark.asyncio
+    async def test_email_confirmation_token_digest(
+            self, db_session: AsyncSession, test_email_confirmation_token: EmailConfirmationToken,
+    ) -> None:
+        """Test EmailConfirmationToken stored with SHA-256 token digest that matches digest computed by postgres in
+        backfill migration.
+
+        Args:
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+            test_email_confirmation_token: pytest fixture, add email confirmation token to database.
+
+        Returns:
+        Nothing.
+        """
+        token_digest = create_token_digest(test_email_confirmation_token.token)
+        assert test_email_confirmation_token.token_digest == token_digest
+        db_token_digest = (
+            await db_session.execute(
+                text("select sha256(convert_to(:token, 'UTF8'))"), {'token': test_email_confirmation_token.token},
+            )
+        ).scalar_one()
+        assert db_token_digest == token_digest
@@ -0,0 +1,79 @@
+from pathlib import Path
+import html
+import re
+
+from jinja2 import Template
+
+from app.celery_base import app
+from auth.models import ChangePasswordToken, EmailConfirmationToken
+from auth.tasks import benchmark_email_letters_rendering
+from auth.utils.change_password_tokens import ChangePasswordLetter
+from auth.utils.email_confirmation_tokens import EmailConfirmationLetter
+from auth.utils.email_templates import EmailTemplateRegistry, email_template_registry
+from common.constants.auth import (
+    ChangePasswordLetterConstants,
+    EmailConfirmationLetterConstants,
+    EmailTemplateRegistryConstants,
+)
+from users.models import User
+
+
+class TestCaseEmailTemplateRegistry:
+
+    @staticmethod
+    def _render_uncached(template: str, context: dict) -> str:
+        return html.escape(re.sub('\n', '', Template(template).render(**context)))
+
+    def test_email_letters_rendered_by_registry(self) -> None:
+        """Test letters rendered with registry templates are equal to letters rendered from template constants.
+
+        Returns:
+        Nothing.
+        """
+        user = User(email='user@test.com')
+        email_confirmation_letter = EmailConfirmationLetter(
+            email_confirmation_token=EmailConfirmationToken(token='token&"value"', user=user),
+            server_config=app.conf,
+        )
+        change_password_letter = ChangePasswordLetter(
+            db_token=ChangePasswordToken(token='token<value>', user=user),
+            server_config=app.conf,
+        )
+        assert email_confirmation_letter.html_template == self._render_uncached(
+            EmailConfirmationLetterConstants.EMAIL_HTML_TEMPLATE.value, email_confirmation_letter.template_context,
+        )
+        assert change_password_letter.html_template == self._render_uncached(
+            ChangePasswordLetterConstants.EMAIL_HTML_TEMPLATE.value, change_password_letter.template_context,
+        )
+
+    def test_email_template_registry_compiles_templates_once(self, tmp_path: Path) -> None:
+        """Test 'EmailTemplateRegistry' compiles templates on start, caches them and writes their bytecode cache.
+
+        Args:
+            tmp_path: pytest fixture, creates temporary directory.
+
+        Returns:
+        Nothing.
+        """
+        registry = EmailTemplateRegistry()
+        registry.start({'EMAIL_TEMPLATES_BYTECODE_CACHE_DIR': str(tmp_path / 'jinja')})
+        name = EmailTemplateRegistryConstants.EMAIL_CONFIRMATION_TEMPLATE.value
+        template = registry.get_template(name)
+        assert registry.get_template(name) is template
+        assert len(list((tmp_path / 'jinja').iterdir())) == len(registry.templates)
+        # New process loads templates from bytecode cache.
+        other_registry = EmailTemplateRegistry()
+        other_registry.start({'EMAIL_TEMPLATES_BYTECODE_CACHE_DIR': str(tmp_path / 'jinja')})
+        context = {'FRONT_NAME': 'name', 'FRONT_URL': 'url', 'EMAIL_CONFIRMATION_URL': 'url'}
+        assert other_registry.render(name, **context) == registry.render(name, **context)
+
+    def test_benchmark_email_letters_rendering(self) -> None:
+        """Test benchmark task reports higher letters rendering rate with registry templates.
+
+        Returns:
+        Nothing.
+        """
+        email_template_registry.start()
+        result = benchmark_email_letters_rendering.apply(kwargs={'letters_count': 20}).get()
+        assert result['letters_count'] == 20
+        assert result['registry_letters_per_second'] > result['uncached_letters_per_second']
@@ -0,0 +1,173 @@
+from concurrent.futures import wait
+from unittest.mock import Mock
+
+from pytest_mock.plugin import MockerFixture
+from tenacity import wait_none
+import httpx
+import pytest
+
+from auth.utils.email_lambdas import EmailLambdaClient, EmailLambdaUnavailableError, EmailLetterError, EmailTransport
+from auth.utils.email_lambdas.stub_email_lambda import create_stub_email_lambda_app
+from common.constants.auth import EmailTransportConstants
+
+
+class TestCaseEmailTransport:
+
+    @staticmethod
+    def _start_transport(batch_mode: bool, failures: int = 0) -> tuple[EmailTransport, dict]:
+        stub_app = create_stub_email_lambda_app(latency=0, failures=failures)
+        transport = EmailTransport()
+        transport.start(
+            config={
+                'AWS_EMAIL_LAMBDA_URL': 'http://stub-email-lambda/',
+                'EMAIL_BATCH_MODE': batch_mode,
+                'EMAIL_BATCH_MAX_SIZE': 10,
+                'EMAIL_BATCH_WINDOW': 0.2,
+            },
+            transport=httpx.ASGITransport(app=stub_app),
+        )
+        return transport, stub_app.state.stats
+
+    def test_email_transport_sends_letters(self) -> None:
+        """Test 'EmailTransport' sends every letter by separate lambda call reusing one client.
+
+        Returns:
+        Nothing.
+        """
+        transport, stats = self._start_transport(batch_mode=False)
+        try:
+            responses = [transport.send({'to_address': f'user_{index}@test.com'}).result() for index in range(3)]
+        finally:
+            transport.shutdown()
+        assert all(response['MessageId'] for response in responses)
+        assert stats['requests'] == 3
+        assert stats['letters'] == 3
+
+    def test_email_transport_batch_mode_coalesces_letters(self) -> None:
+        """Test 'EmailTransport' in batch mode sends letters queued within batch window by one lambda call.
+
+        Returns:
+        Nothing.
+        """
+        transport, stats = self._start_transport(batch_mode=True)
+        try:
+            futures = [transport.send({'to_address': f'user_{index}@test.com'}) for index in range(15)]
+            wait(futures)
+        finally:
+            transport.shutdown()
+        assert len({future.result()['MessageId'] for future in futures}) == 15
+        # Batch of maximum size is sent at once, the rest is sent when batch window expires.
+        assert stats['requests'] == 2
+        assert stats['letters'] == 15
+
+    def test_email_transport_batch_mode_failed_letter(self) -> None:
+        """Test 'EmailTransport' in batch mode raises error only for letter failed by email lambda.
+
+        Returns:
+        Nothing.
+        """
+        transport = EmailTransport()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={'results': [{'MessageId': 'sent'}, {'error': 'MessageRejected'}]})
+
+        transport.start(
+            config={'AWS_EMAIL_LAMBDA_URL': 'http://stub-email-lambda/', 'EMAIL_BATCH_MODE': True},
+            transport=httpx.MockTransport(handler),
+        )
+        try:
+            futures = [transport.send({'to_address': f'user_{index}@test.com'}) for index in range(2)]
+            wait(futures)
+        finally:
+            transport.shutdown()
+        assert futures[0].result()['MessageId'] == 'sent'
+        with pytest.raises(EmailLetterError):
+            futures[1].result()
+
+    def test_email_transport_shutdown_sends_queued_letters(self) -> None:
+        """Test 'EmailTransport.shutdown()' sends letters queued in batch before stopping.
+
+        Returns:
+        Nothing.
+        """
+        transport, stats = self._start_transport(batch_mode=True)
+        future = transport.send({'to_address': 'user@test.com'})
+        transport.shutdown()
+        assert future.result()['MessageId']
+        assert stats['letters'] == 1
+
+    def test_email_transport_retries_unavailable_lambda(self) -> None:
+        """Test 'EmailTransport' retries lambda calls failed with retryable status code.
+
+        Returns:
+        Nothing.
+        """
+        transport, stats = self._start_transport(batch_mode=False, failures=2)
+        try:
+            response = transport.send({'to_address': 'user@test.com'}).result()
+        finally:
+            transport.shutdown()
+        assert response['MessageId']
+        assert stats['failures'] == 2
+        assert stats['requests'] == 3
+
+    def test_email_transport_unavailable_lambda_error(self, mocker: MockerFixture) -> None:
+        """Test 'EmailTransport' raises retryable error for letter task when lambda is unavailable after all retries.
+
+        Args:
+            mocker: A pytest_mock lib fixture.
+
+        Returns:
+        Nothing.
+        """
+        mocker.patch('auth.utils.email_lambdas.email_transport.wait_random_exponential', return_value=wait_none())
+        transport, stats = self._start_transport(batch_mode=False, failures=EmailTransportConstants.MAX_ATTEMPTS.value)
+        try:
+            with pytest.raises(EmailLambdaUnavailableError):
+                transport.send({'to_address': 'user@test.com'}).result()
+        finally:
+            transport.shutdown()
+        assert stats['requests'] == EmailTransportConstants.MAX_ATTEMPTS.value
+
+    def test_email_transport_does_not_retry_client_errors(self) -> None:
+        """Test 'EmailTransport' raises error of lambda call with not retryable status code without retries.
+
+        Returns:
+        Nothing.
+        """
+        transport = EmailTransport()
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(400)
+
+        transport.start(
+            config={'AWS_EMAIL_LAMBDA_URL': 'http://stub-email-lambda/'},
+            transport=httpx.MockTransport(handler),
+        )
+        try:
+            with pytest.raises(httpx.HTTPStatusError):
+                transport.send({'to_address': 'user@test.com'}).result()
+        finally:
+            transport.shutdown()
+        assert len(requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_email_lambda_client_batch_mode_raises_failed_batch(self) -> None:
+        """Test 'EmailLambdaClient.send_email()' in batch mode waits for the batch and raises its error for retry.
+
+        Returns:
+        Nothing.
+        """
+        transport = EmailTransport()
+        transport.start(
+            config={'AWS_EMAIL_LAMBDA_URL': 'http://stub-email-lambda/', 'EMAIL_BATCH_MODE': True},
+            transport=httpx.MockTransport(lambda request: httpx.Response(400)),
+        )
+        email_client = EmailLambdaClient(letter=Mock(payload_data={'to_address': 'user@test.com'}), transport=transport)
+        try:
+            with pytest.raises(httpx.HTTPStatusError):
+                await email_client.send_email()
+        finally:
+            transport.shutdown()
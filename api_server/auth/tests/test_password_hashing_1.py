@@ -0,0 +1,60 @@
+from fastapi import status
+
+import pytest
+
+from app.config import get_app_config
+from auth.utils.exceptions import PasswordHashingQueueFullError
+from auth.utils.password_hashing import PasswordHashingExecutor
+from common.constants.api import ApiConstants
+from common.exceptions.auth import AuthExceptionMsgs
+
+
+class TestCasePasswordHashingExecutor:
+
+    @pytest.fixture
+    def executor(self) -> PasswordHashingExecutor:
+        """A pytest fixture that creates and shutdowns instance of PasswordHashingExecutor.
+
+        Returns:
+        An instance of PasswordHashingExecutor.
+        """
+        executor = PasswordHashingExecutor()
+        executor.start(get_app_config(ApiConstants.TESTING_CONFIG.value)())
+        yield executor
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_hash_and_verify_password(self, executor: PasswordHashingExecutor) -> None:
+        """Test password hashing and verification in worker pool.
+
+        Args:
+            executor: pytest fixture, an instance of PasswordHashingExecutor.
+
+        Returns:
+        Nothing.
+        """
+        password_hash = await executor.hash('Test_password_1!')
+        assert password_hash.startswith('$argon2')
+        assert await executor.verify('Test_password_1!', password_hash) is True
+        assert await executor.verify('Wrong_password_1!', password_hash) is False
+        metrics = executor.metrics.snapshot()
+        assert metrics['total_jobs'] == 3
+        assert metrics['rejected_jobs'] == 0
+        assert metrics['max_hashing_time'] > 0
+
+    @pytest.mark.asyncio
+    async def test_hash_password_queue_full(self, executor: PasswordHashingExecutor) -> None:
+        """Test password hashing rejected with 503 status code when worker pool queue is full.
+
+        Args:
+            executor: pytest fixture, an instance of PasswordHashingExecutor.
+
+        Returns:
+        Nothing.
+        """
+        executor.in_flight = executor.max_workers + executor.max_queue_depth
+        with pytest.raises(PasswordHashingQueueFullError) as exc_info:
+            await executor.hash('Test_password_1!')
+        assert exc_info.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert exc_info.value.detail == AuthExceptionMsgs.PASSWORD_HASHING_QUEUE_FULL.value
+        assert executor.metrics.snapshot()['rejected_jobs'] == 1
@@ -1,11 +1,8 @@
-import html
-import re
-
 from celery.app.utils import Settings
-from jinja2 import Template
 
 from auth.models import ChangePasswordToken
-from common.constants.auth import ChangePasswordLetterConstants
+from auth.utils.email_templates import email_template_registry
+from common.constants.auth import ChangePasswordLetterConstants, EmailTemplateRegistryConstants
 
 
 class ChangePasswordLetter:
@@ -34,17 +31,19 @@ class ChangePasswordLetter:
     def front_name(self):
         return ChangePasswordLetterConstants.FRONT_NAME.value
 
+    @property
+    def template_context(self):
+        return {
+            'FRONT_NAME': self.front_name,
+            'FRONT_URL': self.front_url,
+            'CHANGE_PASSWORD_URL': self.change_password_url,
+        }
+
     @property
     def html_template(self):
-        change_password_template = Template(ChangePasswordLetterConstants.EMAIL_HTML_TEMPLATE.value)
-        change_password_template = change_password_template.render(
-            FRONT_NAME=self.front_name,
-            FRONT_URL=self.front_url,
-            CHANGE_PASSWORD_URL=self.change_password_url,
+        return email_template_registry.render(
+            EmailTemplateRegistryConstants.CHANGE_PASSWORD_TEMPLATE.value, **self.template_context,
         )
-        change_password_template = re.sub('\n', '', change_password_template)
-        change_password_template = html.escape(change_password_template)
-        return change_password_template
 
     @property
     def payload_data(self):
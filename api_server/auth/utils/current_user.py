@@ -0,0 +1,157 @@
+from fastapi import Depends
+
+from fastapi_jwt_auth import AuthJWT
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from charities.db_services import CharityEmployeeDBService, EmployeeDBService
+from charities.models import Employee
+from common.constants.auth.current_user import CurrentUserConstants
+from db import get_session
+from users.cruds import UserCRUD
+from users.models import User
+from utils.logging import setup_logging
+
+
+class CurrentUserMetrics:
+    """Container for counters of current user lookups."""
+
+    def __init__(self) -> None:
+        self.db_lookups = 0
+        self.saved_lookups = 0
+
+    def snapshot(self) -> dict:
+        """Makes dict with current metrics values.
+
+        Returns:
+        dict with number of performed and saved database lookups.
+        """
+        return {
+            'db_lookups': self.db_lookups,
+            'saved_lookups': self.saved_lookups,
+        }
+
+
+current_user_metrics = CurrentUserMetrics()
+
+
+class CurrentUser:
+    """Request-scoped identity of authenticated user.
+
+    User, Employee and charity memberships of jwt subject are loaded from the database once and memoized for the
+    rest of the request. Instance is stored in request session 'info', so every service sharing the session reuses it.
+    """
+
+    def __init__(self, session: AsyncSession, username: str) -> None:
+        self._log = setup_logging(self.__class__.__name__)
+        self.session = session
+        self.username = username
+        self._loaded: dict = {}
+
+    @classmethod
+    def from_session(cls, session: AsyncSession, username: str) -> 'CurrentUser':
+        """Get CurrentUser stored in session or creates new one for provided username.
+
+        Args:
+            session: sqlalchemy AsyncSession of current request.
+            username: User username from jwt token identity.
+
+        Returns:
+        CurrentUser object bound to session.
+        """
+        current_user = session.info.get(CurrentUserConstants.SESSION_INFO_KEY.value)
+        if current_user is None or current_user.username != username:
+            current_user = cls(session, username)
+            session.info[CurrentUserConstants.SESSION_INFO_KEY.value] = current_user
+        return current_user
+
+    @classmethod
+    def forget(cls, session: AsyncSession) -> None:
+        """Removes CurrentUser from session, next access loads user data from the database again.
+
+        Args:
+            session: sqlalchemy AsyncSession of current request.
+
+        Returns:
+        Nothing.
+        """
+        session.info.pop(CurrentUserConstants.SESSION_INFO_KEY.value, None)
+
+    async def _memoized(self, key: str, loader):
+        if key in self._loaded:
+            current_user_metrics.saved_lookups += 1
+            self._log.debug(f'Reusing "{key}" of User with username: "{self.username}".')
+            return self._loaded[key]
+        current_user_metrics.db_lookups += 1
+        self._loaded[key] = await loader()
+        return self._loaded[key]
+
+    async def get_user(self) -> User | None:
+        """Get User object of jwt subject.
+
+        Returns:
+        User object or None if user not found.
+        """
+        return await self._memoized(
+            CurrentUserConstants.USER.value,
+            lambda: UserCRUD(self.session).get_user_by_username(self.username),
+        )
+
+    async def get_employee(self) -> Employee | None:
+        """Get Employee object of jwt subject.
+
+        Returns:
+        Employee object or None if user is not an employee.
+        """
+        return await self._memoized(CurrentUserConstants.EMPLOYEE.value, self._load_employee)
+
+    async def _load_employee(self) -> Employee | None:
+        user = await self.get_user()
+        if user is None:
+            return None
+        return await EmployeeDBService(self.session).get_employee_by_user_id(user.id)
+
+    def set_employee(self, employee: Employee) -> None:
+        """Stores newly created Employee object of jwt subject.
+
+        Args:
+            employee: Employee object.
+
+        Returns:
+        Nothing.
+        """
+        self._loaded[CurrentUserConstants.EMPLOYEE.value] = employee
+
+    async def get_charity_ids(self) -> set:
+        """Get ids of charities where jwt subject listed as an employee.
+
+        Returns:
+        set of Charity UUIDs.
+        """
+        return await self._memoized(
+            CurrentUserConstants.CHARITY_IDS.value,
+            lambda: CharityEmployeeDBService(self.session).get_charity_ids_by_username(self.username),
+        )
+
+    def invalidate_charity_ids(self) -> None:
+        """Drops memoized charity memberships after they were changed.
+
+        Returns:
+        Nothing.
+        """
+        self._loaded.pop(CurrentUserConstants.CHARITY_IDS.value, None)
+
+
+async def get_current_user(
+        Authorize: AuthJWT = Depends(), session: AsyncSession = Depends(get_session),
+) -> CurrentUser:
+    """Request-scoped dependency with CurrentUser of authenticated user.
+
+    Args:
+        Authorize: dependency of AuthJWT library for JWT tokens.
+        session: dependency of sqlalchemy AsyncSession of current request.
+
+    Returns:
+    CurrentUser object shared by all services of the request.
+    """
+    Authorize.jwt_required()
+    return CurrentUser.from_session(session, Authorize.get_jwt_subject())
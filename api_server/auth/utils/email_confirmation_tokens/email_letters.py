@@ -1,11 +1,8 @@
-import html
-import re
-
 from celery.app.utils import Settings
-from jinja2 import Template
 
 from auth.models import EmailConfirmationToken
-from common.constants.auth import EmailConfirmationLetterConstants
+from auth.utils.email_templates import email_template_registry
+from common.constants.auth import EmailConfirmationLetterConstants, EmailTemplateRegistryConstants
 
 
 class EmailConfirmationLetter:
@@ -35,17 +32,19 @@ class EmailConfirmationLetter:
     def front_name(self):
         return EmailConfirmationLetterConstants.FRONT_NAME.value
 
+    @property
+    def template_context(self):
+        return {
+            'FRONT_NAME': self.front_name,
+            'FRONT_URL': self.front_url,
+            'EMAIL_CONFIRMATION_URL': self.email_confirmation_url,
+        }
+
     @property
     def html_template(self):
-        email_confirmation_template = Template(EmailConfirmationLetterConstants.EMAIL_HTML_TEMPLATE.value)
-        email_confirmation_template = email_confirmation_template.render(
-            FRONT_NAME=self.front_name,
-            FRONT_URL=self.front_url,
-            EMAIL_CONFIRMATION_URL=self.email_confirmation_url,
+        return email_template_registry.render(
+            EmailTemplateRegistryConstants.EMAIL_CONFIRMATION_TEMPLATE.value, **self.template_context,
         )
-        email_confirmation_template = re.sub('\n', '', email_confirmation_template)
-        email_confirmation_template = html.escape(email_confirmation_template)
-        return email_confirmation_template
 
     @property
     def payload_data(self):
@@ -1,5 +1,15 @@
 from auth.utils.email_lambdas.email_lambda_client import EmailLambdaClient
+from auth.utils.email_lambdas.email_transport import (
+    EmailLambdaUnavailableError,
+    EmailLetterError,
+    EmailTransport,
+    email_transport,
+)
 
 __all__ = [
     'EmailLambdaClient',
+    'EmailLambdaUnavailableError',
+    'EmailLetterError',
+    'EmailTransport',
+    'email_transport',
 ]
@@ -1,18 +1,19 @@
 import html
 import json
 
+from botocore.exceptions import ClientError
 import boto3
 
 
 def send_email(event, context):
-    """Sends email letter to the recipient.
+    """Sends email letter to the recipient, or every letter of the batch sent by email transport in batch mode.
 
     Args:
         event: AWS lambda event.
         context: AWS lambda context.
 
     Returns:
-    Response object from boto3 ses client.
+    Response object from boto3 ses client, or dict with 'results' list of responses in the order of batch letters.
     """
     return _send_email(event, context)
 
@@ -22,6 +23,21 @@ def _send_email(event, context):
 
     client = boto3.client('ses')
 
+    letters = email_data.get('letters')
+    if letters is None:
+        return _send_letter(client, email_data)
+    return {'results': [_send_batch_letter(client, letter) for letter in letters]}
+
+
+def _send_batch_letter(client, email_data: dict) -> dict:
+    try:
+        return _send_letter(client, email_data)
+    except ClientError as exc:
+        # Failed letter doesn't fail the whole batch, so letters already sent are not sent again by retries.
+        return {'error': str(exc)}
+
+
+def _send_letter(client, email_data: dict) -> dict:
     response = client.send_email(
         Source=email_data['source'],
         Destination={'ToAddresses': [email_data['to_address']]},
@@ -48,10 +64,11 @@ def get_email_data(event) -> dict:
         event: AWS lambda event.
 
     Returns:
-    dict with email letter data.
+    dict with email letter data, or dict with 'letters' list of email letters data in batch mode.
     """
     payload = json.loads(event['body'])
-    payload['html'] = html.unescape(payload['html'])
+    for letter in payload.get('letters', [payload]):
+        letter['html'] = html.unescape(letter['html'])
     return payload
 
 
@@ -63,6 +80,6 @@ def lambda_handler(event, context):
         context: AWS lambda context.
 
     Returns:
-    Response object from boto3 ses client.
+    Response object from boto3 ses client, or dict with 'results' list of responses in batch mode.
     """
     return send_email(event, context)
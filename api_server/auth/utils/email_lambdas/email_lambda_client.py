@@ -1,41 +1,31 @@
-from celery.app.utils import Settings
-from tenacity import retry, stop_after_attempt, wait_fixed
-import httpx
+import asyncio
 
 from auth.utils.change_password_tokens import ChangePasswordLetter
 from auth.utils.email_confirmation_tokens import EmailConfirmationLetter
-from common.constants.auth import EmailLambdaClientConstants
+from auth.utils.email_lambdas.email_transport import EmailTransport, email_transport
 from utils.logging import setup_logging
 
 
 class EmailLambdaClient:
 
-    def __init__(self, letter: EmailConfirmationLetter | ChangePasswordLetter, server_config: Settings) -> None:
+    def __init__(
+            self,
+            letter: EmailConfirmationLetter | ChangePasswordLetter,
+            transport: EmailTransport = email_transport,
+    ) -> None:
         self.letter = letter
-        self._server_config = server_config
-        self.client = httpx.AsyncClient()
+        self.transport = transport
         self._log = setup_logging(self.__class__.__name__)
 
     async def send_email(self) -> dict:
-        """Makes POST http request to AWS lambda that sends email letter.
+        """Sends email letter through process-wide email transport to AWS lambda.
+
+        In batch mode letter is sent with letters queued concurrently, sender waits for the batch to raise its errors.
 
         Returns:
         Response from boto3 ses client.
         """
         return await self._send_email()
 
-    @retry(
-        wait=wait_fixed(EmailLambdaClientConstants.SECOND_1.value),
-        stop=stop_after_attempt(EmailLambdaClientConstants.TIMES_5.value),
-    )
     async def _send_email(self) -> dict:
-        async with self.client as client:
-            try:
-                response = await client.post(
-                    url=self._server_config.get('AWS_EMAIL_LAMBDA_URL'),
-                    json=self.letter.payload_data,
-                )
-            except Exception as exc:
-                self._log.warning(exc)
-                raise exc
-            return response.json()
+        return await asyncio.wrap_future(self.transport.send(self.letter.payload_data))
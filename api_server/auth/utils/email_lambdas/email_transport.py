@@ -0,0 +1,230 @@
+from concurrent.futures import Future
+import asyncio
+import importlib.util
+import threading
+
+from celery.app.utils import Settings
+from tenacity import AsyncRetrying, retry_if_exception, stop_after_attempt, wait_random_exponential
+import httpx
+
+from common.constants.auth import EmailTransportConstants
+from utils.logging import setup_logging
+
+
+def _is_retryable_error(exc: BaseException) -> bool:
+    """Checks if failed request to email lambda can be retried.
+
+    Args:
+        exc: raised exception.
+
+    Returns:
+    bool of network error or retryable response status code.
+    """
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in EmailTransportConstants.RETRYABLE_STATUS_CODES.value
+    return isinstance(exc, httpx.TransportError)
+
+
+class EmailLambdaUnavailableError(Exception):
+    """Email lambda call failed with retryable error after all transport retries, letter task can be retried later."""
+
+
+class EmailLetterError(Exception):
+    """Letter of the batch was not sent by email lambda, other letters of the batch could be sent."""
+
+
+class EmailTransport:
+    """Process-wide transport of letters to email AWS lambda.
+
+    Transport owns one http client with keep-alive connection pool, HTTP/2 is used if 'h2' package is installed.
+    Client runs in event loop of a dedicated thread, so in batch mode letters queued concurrently in one process are
+    coalesced and sent by one lambda call, every sender waits for the result of its letter. Celery worker process runs
+    one task at a time in its event loop, so letter tasks of the default prefork pool never share a batch and batch
+    window only delays their letters. Batch mode is meant for processes sending many letters at once, keep it
+    disabled for letter tasks.
+    """
+
+    def __init__(self) -> None:
+        self._log = setup_logging(self.__class__.__name__)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._client: httpx.AsyncClient | None = None
+        self._batch: list[tuple[dict, asyncio.Future]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._batch_tasks: set[asyncio.Task] = set()
+        self.lambda_url: str | None = None
+        self.batch_mode = False
+        self.batch_max_size = EmailTransportConstants.DEFAULT_BATCH_MAX_SIZE.value
+        self.batch_window = EmailTransportConstants.DEFAULT_BATCH_WINDOW.value
+
+    @property
+    def started(self) -> bool:
+        return self._loop is not None
+
+    def start(self, config: Settings | None = None, transport: httpx.AsyncBaseTransport | None = None) -> None:
+        """Starts transport thread with http client based on Celery app config.
+
+        Args:
+            config: Celery app config.
+            transport: httpx transport used instead of network, for example ASGITransport of stub email lambda.
+
+        Returns:
+        Nothing.
+        """
+        if self.started:
+            return
+        http2 = False
+        max_connections = EmailTransportConstants.DEFAULT_MAX_CONNECTIONS.value
+        if config:
+            self.lambda_url = config.get('AWS_EMAIL_LAMBDA_URL')
+            self.batch_mode = config.get('EMAIL_BATCH_MODE', False)
+            self.batch_max_size = config.get('EMAIL_BATCH_MAX_SIZE', self.batch_max_size)
+            self.batch_window = config.get('EMAIL_BATCH_WINDOW', self.batch_window)
+            http2 = config.get('EMAIL_HTTP2', False)
+            max_connections = config.get('EMAIL_MAX_CONNECTIONS', max_connections)
+        if http2 and importlib.util.find_spec(EmailTransportConstants.HTTP2_PACKAGE.value) is None:
+            self._log.warning('HTTP/2 requires "h2" package, email transport falls back to HTTP/1.1.')
+            http2 = False
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever,
+            name=EmailTransportConstants.THREAD_NAME.value,
+            daemon=True,
+        )
+        self._thread.start()
+        self._client = asyncio.run_coroutine_threadsafe(
+            self._create_client(http2, max_connections, transport), self._loop,
+        ).result()
+        self._log.debug(
+            f'Email transport started, http2: {http2}, max connections: {max_connections}, '
+            f'batch mode: {self.batch_mode}.'
+        )
+
+    @staticmethod
+    async def _create_client(
+            http2: bool, max_connections: int, transport: httpx.AsyncBaseTransport | None,
+    ) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=EmailTransportConstants.MAX_KEEPALIVE_CONNECTIONS.value,
+                keepalive_expiry=EmailTransportConstants.KEEPALIVE_EXPIRY.value,
+            ),
+            timeout=httpx.Timeout(
+                EmailTransportConstants.TIMEOUT.value,
+                connect=EmailTransportConstants.CONNECT_TIMEOUT.value,
+            ),
+            transport=transport,
+        )
+
+    def shutdown(self) -> None:
+        """Sends queued letters, closes http client and stops transport thread.
+
+        Returns:
+        Nothing.
+        """
+        if not self.started:
+            return
+        asyncio.run_coroutine_threadsafe(self._close(), self._loop).result(
+            EmailTransportConstants.SHUTDOWN_TIMEOUT.value,
+        )
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+        self._thread = None
+        self._client = None
+        self._log.debug('Email transport stopped.')
+
+    async def _close(self) -> None:
+        self._flush()
+        if self._batch_tasks:
+            await asyncio.gather(*self._batch_tasks, return_exceptions=True)
+        await self._client.aclose()
+
+    def send(self, payload: dict) -> Future:
+        """Queues letter to be sent by transport thread, starts transport with default settings if not started.
+
+        Args:
+            payload: letter payload of email lambda.
+
+        Returns:
+        Future with email lambda response of the letter.
+        """
+        if not self.started:
+            self.start()
+        return asyncio.run_coroutine_threadsafe(self._send(payload), self._loop)
+
+    async def _send(self, payload: dict) -> dict:
+        if not self.batch_mode:
+            return await self._post(payload)
+        future = asyncio.get_running_loop().create_future()
+        self._batch.append((payload, future))
+        if len(self._batch) >= self.batch_max_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self.batch_window, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._batch = self._batch, []
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._post_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _post_batch(self, batch: list[tuple[dict, asyncio.Future]]) -> None:
+        try:
+            response = await self._post({
+                EmailTransportConstants.BATCH_LETTERS_KEY.value: [payload for payload, _ in batch],
+            })
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        results = response.get(EmailTransportConstants.BATCH_RESULTS_KEY.value, [])
+        for index, (_, future) in enumerate(batch):
+            if future.done():
+                continue
+            result = results[index] if index < len(results) else {}
+            if EmailTransportConstants.BATCH_ERROR_KEY.value in result:
+                future.set_exception(EmailLetterError(result[EmailTransportConstants.BATCH_ERROR_KEY.value]))
+            else:
+                future.set_result(result)
+        self._log.debug(f'Batch of {len(batch)} letters sent.')
+
+    async def _post(self, payload: dict) -> dict:
+        try:
+            return await self._post_with_retries(payload)
+        except httpx.HTTPError as exc:
+            # Client errors are permanent, so only errors left after retries of retryable ones can be retried later.
+            if _is_retryable_error(exc):
+                raise EmailLambdaUnavailableError(str(exc)) from exc
+            raise exc
+
+    async def _post_with_retries(self, payload: dict) -> dict:
+        async for attempt in AsyncRetrying(
+                wait=wait_random_exponential(
+                    multiplier=EmailTransportConstants.RETRY_MULTIPLIER.value,
+                    max=EmailTransportConstants.RETRY_MAX_WAIT.value,
+                ),
+                stop=stop_after_attempt(EmailTransportConstants.MAX_ATTEMPTS.value),
+                retry=retry_if_exception(_is_retryable_error),
+                reraise=True,
+        ):
+            with attempt:
+                try:
+                    response = await self._client.post(url=self.lambda_url, json=payload)
+                    response.raise_for_status()
+                except httpx.HTTPError as exc:
+                    self._log.warning(exc)
+                    raise exc
+        return response.json()
+
+
+email_transport = EmailTransport()
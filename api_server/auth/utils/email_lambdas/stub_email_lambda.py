@@ -0,0 +1,59 @@
+from collections import Counter
+from uuid import uuid4
+import asyncio
+import os
+
+from fastapi import FastAPI, Request, Response, status
+
+from common.constants.auth import EmailTransportConstants, StubEmailLambdaConstants
+
+
+def _ses_response() -> dict:
+    return {'MessageId': str(uuid4()), 'ResponseMetadata': {'HTTPStatusCode': status.HTTP_200_OK}}
+
+
+def create_stub_email_lambda_app(
+        latency: float = StubEmailLambdaConstants.DEFAULT_LATENCY.value, failures: int = 0,
+) -> FastAPI:
+    """Creates stub of email AWS lambda for load tests of email transport, letters are counted and not sent.
+
+    Args:
+        latency: seconds every lambda call takes.
+        failures: number of first lambda calls failed with 503 status code.
+
+    Returns:
+    Instance of FastAPI with stub lambda endpoint and its stats endpoint.
+    """
+    app = FastAPI()
+    app.state.stats = Counter()
+
+    @app.post('/')
+    async def send_email(request: Request):
+        payload = await request.json()
+        app.state.stats['requests'] += 1
+        await asyncio.sleep(latency)
+        if app.state.stats['requests'] <= failures:
+            app.state.stats['failures'] += 1
+            return Response(status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+        letters = payload.get(EmailTransportConstants.BATCH_LETTERS_KEY.value)
+        if letters is None:
+            app.state.stats['letters'] += 1
+            return _ses_response()
+        app.state.stats['letters'] += len(letters)
+        return {EmailTransportConstants.BATCH_RESULTS_KEY.value: [_ses_response() for _ in letters]}
+
+    @app.get(StubEmailLambdaConstants.STATS_PATH.value)
+    async def get_stats():
+        return dict(app.state.stats)
+
+    return app
+
+
+if __name__ == '__main__':
+    import uvicorn
+
+    uvicorn.run(
+        create_stub_email_lambda_app(),
+        host=os.getenv('STUB_EMAIL_LAMBDA_HOST', StubEmailLambdaConstants.DEFAULT_HOST.value),
+        port=int(os.getenv('STUB_EMAIL_LAMBDA_PORT', StubEmailLambdaConstants.DEFAULT_PORT.value)),
+    )
@@ -0,0 +1,111 @@
+from pathlib import Path
+from typing import Any
+import html
+import re
+
+from celery.app.utils import Settings
+from jinja2 import DictLoader, Environment, FileSystemBytecodeCache, Template
+
+from common.constants.auth import (
+    ChangePasswordLetterConstants,
+    EmailConfirmationLetterConstants,
+    EmailTemplateRegistryConstants,
+)
+from utils.logging import setup_logging
+
+
+def _prepare_template_source(source: str) -> str:
+    """Removes line breaks and html escapes static text of letter template once instead of every rendered letter.
+
+    Letter templates contain only '{{NAME}}' expressions, they are not changed by html escaping.
+
+    Args:
+        source: letter template.
+
+    Returns:
+    prepared letter template.
+    """
+    return html.escape(re.sub('\n', '', source))
+
+
+def _escape_value(value: Any) -> str:
+    return html.escape(str(value))
+
+
+class EmailTemplateRegistry:
+    """Process-wide registry of letter templates compiled once in Jinja Environment.
+
+    Compiled templates are cached by Environment and their bytecode is cached on disk, so forked Celery worker
+    processes load templates without parsing them. Rendered letters are equal to letters rendered from template
+    constant with line breaks removed and html escaped.
+    """
+
+    templates = {
+        EmailTemplateRegistryConstants.EMAIL_CONFIRMATION_TEMPLATE.value:
+            EmailConfirmationLetterConstants.EMAIL_HTML_TEMPLATE.value,
+        EmailTemplateRegistryConstants.CHANGE_PASSWORD_TEMPLATE.value:
+            ChangePasswordLetterConstants.EMAIL_HTML_TEMPLATE.value,
+    }
+
+    def __init__(self) -> None:
+        self._log = setup_logging(self.__class__.__name__)
+        self.environment: Environment | None = None
+
+    @property
+    def started(self) -> bool:
+        return self.environment is not None
+
+    def start(self, config: Settings | None = None) -> None:
+        """Creates Jinja Environment with bytecode cache and compiles letter templates.
+
+        Args:
+            config: Celery app config.
+
+        Returns:
+        Nothing.
+        """
+        if self.started:
+            return
+        bytecode_cache_dir = config.get('EMAIL_TEMPLATES_BYTECODE_CACHE_DIR') if config else None
+        if bytecode_cache_dir:
+            Path(bytecode_cache_dir).mkdir(parents=True, exist_ok=True)
+        self.environment = Environment(
+            loader=DictLoader({name: _prepare_template_source(source) for name, source in self.templates.items()}),
+            bytecode_cache=FileSystemBytecodeCache(
+                directory=bytecode_cache_dir,
+                pattern=EmailTemplateRegistryConstants.BYTECODE_CACHE_PATTERN.value,
+            ),
+            finalize=_escape_value,
+            auto_reload=False,
+        )
+        for name in self.templates:
+            self.environment.get_template(name)
+        self._log.debug(f'EmailTemplateRegistry started, templates compiled: {len(self.templates)}.')
+
+    def get_template(self, name: str) -> Template:
+        """Gets compiled letter template, starts registry with default settings if not started.
+
+        Args:
+            name: name of letter template.
+
+        Returns:
+        Jinja Template object.
+        """
+        if not self.started:
+            self.start()
+        return self.environment.get_template(name)
+
+    def render(self, name: str, **context: Any) -> str:
+        """Renders letter template, values of template expressions are html escaped.
+
+        Args:
+            name: name of letter template.
+            context: values of template expressions.
+
+        Returns:
+        html escaped letter without line breaks.
+        """
+        return self.get_template(name).render(**context)
+
+
+email_template_registry = EmailTemplateRegistry()
@@ -98,6 +98,11 @@ class ChangePasswordTokenExpiredError(HTTPException):
     pass
 
 
+class PasswordHashingQueueFullError(HTTPException):
+    """Custom password hashing executor queue is full exception."""
+    pass
+
+
 def user_already_activated_handler(request: Request, exc: UserAlreadyActivatedException):
     """Handler for UserAlreadyActivatedException exception that makes http response.
 
@@ -287,3 +292,25 @@ def change_password_token_expired_in_db_handler(request: Request, exc: ChangePas
         status_code=exc.status_code,
         content=response,
     )
+
+
+def password_hashing_queue_full_handler(request: Request, exc: PasswordHashingQueueFullError):
+    """Handler for PasswordHashingQueueFullError exception that makes http response.
+
+    Args:
+        request: FastAPI Request object.
+        exc: raised PasswordHashingQueueFullError.
+
+    Returns:
+    http response for raised PasswordHashingQueueFullError.
+    """
+    response = ResponseBaseSchema(
+        status_code=exc.status_code,
+        data=[],
+        errors=[{"detail": exc.detail}],
+    ).dict()
+    return JSONResponse(
+        status_code=exc.status_code,
+        content=response,
+        headers=exc.headers,
+    )
@@ -1,4 +1,5 @@
 from datetime import datetime, timedelta
+import hashlib
 
 from fastapi import status
 
@@ -40,6 +41,18 @@ def create_jwt_token(payload: dict, key: str) -> str:
     return encode_jwt_token(payload=payload, key=key)
 
 
+def create_token_digest(token: str) -> bytes:
+    """Creates fixed-width SHA-256 digest of JWT token used for token lookups in the db.
+
+    Args:
+        token: Encoded JWT token.
+
+    Returns:
+    32 bytes SHA-256 digest of token.
+    """
+    return hashlib.sha256(token.encode(JWTTokenConstants.ENCODING_UTF_8.value)).digest()
+
+
 def encode_jwt_token(
         payload: dict,
         key: str,
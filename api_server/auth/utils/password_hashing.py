@@ -0,0 +1,183 @@
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+import asyncio
+import time
+
+from fastapi import status
+
+from passlib.hash import argon2
+from pydantic import BaseModel
+
+from auth.utils.exceptions import PasswordHashingQueueFullError
+from common.constants.auth import PasswordHashingConstants
+from common.exceptions.auth import AuthExceptionMsgs
+from utils.logging import setup_logging
+
+
+def _hash_password(password: str, submitted_at: float) -> tuple[str, float, float]:
+    """Creates password hash with argon2 algorithm inside executor worker.
+
+    Args:
+        password: string with raw password to hash.
+        submitted_at: monotonic time when job was submitted to executor.
+
+    Returns:
+    tuple with hashed password string, queue wait seconds and hashing seconds.
+    """
+    started_at = time.monotonic()
+    password_hash = argon2.using(rounds=PasswordHashingConstants.ARGON2_ROUNDS.value).hash(password)
+    return password_hash, started_at - submitted_at, time.monotonic() - started_at
+
+
+def _verify_password(password: str, password_hash: str, submitted_at: float) -> tuple[bool, float, float]:
+    """Checks password and password hash with argon2 algorithm inside executor worker.
+
+    Args:
+        password: string with password.
+        password_hash: string with password hash.
+        submitted_at: monotonic time when job was submitted to executor.
+
+    Returns:
+    tuple with bool of verifying password, queue wait seconds and hashing seconds.
+    """
+    started_at = time.monotonic()
+    verified = argon2.verify(password, password_hash)
+    return verified, started_at - submitted_at, time.monotonic() - started_at
+
+
+class PasswordHashingMetrics:
+    """Container for password hashing timing metrics."""
+
+    def __init__(self) -> None:
+        self.total_jobs = 0
+        self.rejected_jobs = 0
+        self.total_hashing_time = 0.0
+        self.max_hashing_time = 0.0
+        self.total_queue_wait = 0.0
+        self.max_queue_wait = 0.0
+
+    def record(self, queue_wait: float, hashing_time: float) -> None:
+        """Adds timings of a single finished job to metrics.
+
+        Args:
+            queue_wait: seconds job waited for a free worker.
+            hashing_time: seconds worker spent on argon2 computation.
+
+        Returns:
+        Nothing.
+        """
+        self.total_jobs += 1
+        self.total_hashing_time += hashing_time
+        self.max_hashing_time = max(self.max_hashing_time, hashing_time)
+        self.total_queue_wait += queue_wait
+        self.max_queue_wait = max(self.max_queue_wait, queue_wait)
+
+    def snapshot(self) -> dict:
+        """Makes dict with current metrics values.
+
+        Returns:
+        dict with jobs counters, average and maximum hashing time and queue wait in seconds.
+        """
+        return {
+            'total_jobs': self.total_jobs,
+            'rejected_jobs': self.rejected_jobs,
+            'avg_hashing_time': self.total_hashing_time / self.total_jobs if self.total_jobs else 0.0,
+            'max_hashing_time': self.max_hashing_time,
+            'avg_queue_wait': self.total_queue_wait / self.total_jobs if self.total_jobs else 0.0,
+            'max_queue_wait': self.max_queue_wait,
+        }
+
+
+class PasswordHashingExecutor:
+    """Runs argon2 hashing and verification in a bounded worker pool outside of the event loop."""
+
+    def __init__(self) -> None:
+        self._log = setup_logging(self.__class__.__name__)
+        self._executor: Executor | None = None
+        self.max_workers = PasswordHashingConstants.DEFAULT_MAX_WORKERS.value
+        self.max_queue_depth = PasswordHashingConstants.DEFAULT_MAX_QUEUE_DEPTH.value
+        self.in_flight = 0
+        self.metrics = PasswordHashingMetrics()
+
+    def start(self, config: BaseModel | None = None) -> None:
+        """Creates worker pool based on app config, default settings used if config not provided.
+
+        Args:
+            config: fastapi app config.
+
+        Returns:
+        Nothing.
+        """
+        executor_type = PasswordHashingConstants.THREAD_EXECUTOR.value
+        if config:
+            executor_type = config.PASSWORD_HASHING_EXECUTOR
+            self.max_workers = config.PASSWORD_HASHING_MAX_WORKERS
+            self.max_queue_depth = config.PASSWORD_HASHING_MAX_QUEUE_DEPTH
+        if executor_type == PasswordHashingConstants.PROCESS_EXECUTOR.value:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='password_hashing')
+        self._log.debug(f'Password hashing {executor_type} pool started with {self.max_workers} workers.')
+
+    def shutdown(self) -> None:
+        """Shutdowns worker pool.
+
+        Returns:
+        Nothing.
+        """
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._log.debug(f'Password hashing pool stopped, metrics: {self.metrics.snapshot()}.')
+
+    async def hash(self, password: str) -> str:
+        """Creates password hash with argon2 algorithm in worker pool.
+
+        Args:
+            password: string with raw password to hash.
+
+        Returns:
+        Hashed password string.
+        """
+        return await self._run(PasswordHashingConstants.HASH_OPERATION.value, _hash_password, password)
+
+    async def verify(self, password: str, password_hash: str) -> bool:
+        """Checks password and password hash with argon2 algorithm in worker pool.
+
+        Args:
+            password: string with password.
+            password_hash: string with password hash.
+
+        Returns:
+        bool of verifying password with argon2 algorithm.
+        """
+        return await self._run(
+            PasswordHashingConstants.VERIFY_OPERATION.value, _verify_password, password, password_hash,
+        )
+
+    async def _run(self, operation: str, func, *args):
+        if not self._executor:
+            self.start()
+        if self.in_flight >= self.max_workers + self.max_queue_depth:
+            self.metrics.rejected_jobs += 1
+            self._log.warning(f'Password hashing queue is full, rejecting "{operation}" job.')
+            raise PasswordHashingQueueFullError(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=AuthExceptionMsgs.PASSWORD_HASHING_QUEUE_FULL.value,
+                headers={'Retry-After': '1'},
+            )
+        self.in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            result, queue_wait, hashing_time = await loop.run_in_executor(
+                self._executor, func, *args, time.monotonic(),
+            )
+        finally:
+            self.in_flight -= 1
+        self.metrics.record(queue_wait=queue_wait, hashing_time=hashing_time)
+        self._log.debug(
+            f'Password "{operation}" job done, queue wait: {queue_wait:.4f}s, hashing time: {hashing_time:.4f}s.'
+        )
+        return result
+
+
+password_hashing_executor = PasswordHashingExecutor()
@@ -1,10 +1,15 @@
-from charities.db_services.charities import CharityDBService
+from charities.db_services.charities import CharityDBService, CharityEmployeeListItem, CharityListItem
+from charities.db_services.charity_authorizations import CharityAuthorizationDBService, CharityEmployeeAuthorization
 from charities.db_services.charity_employees import CharityEmployeeDBService
 from charities.db_services.employee_roles import EmployeeRoleDBService
 from charities.db_services.employees import EmployeeDBService
 
 __all__ = [
+    'CharityAuthorizationDBService',
+    'CharityEmployeeAuthorization',
     'CharityDBService',
+    'CharityEmployeeListItem',
+    'CharityListItem',
     'CharityEmployeeDBService',
     'EmployeeRoleDBService',
     'EmployeeDBService',
@@ -1,12 +1,36 @@
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import func, update
+from sqlalchemy import update
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import selectinload
+from sqlalchemy.sql import Select
 
-from charities.models import Charity
+from charities.models import Charity, CharityEmployeeAssociation, CharityEmployeeRoleAssociation, Employee, EmployeeRole
 from charities.schemas import CharityInputSchema, CharityUpdateSchema
+from common.constants.cache import ReadThroughCacheConstants
+from fundraisers.models import Fundraise
+from users.models import User, UserPicture
+from utils.cache import read_through_cache
+from utils.count_providers import pagination_count_provider
 from utils.logging import setup_logging
+from utils.orm_helpers import KeyedBundle, OptionalBundle, ProjectedItem, apply_keyset_pagination, group_by_attribute
+
+
+class CharityListItem(ProjectedItem):
+    """Charity of list page with attributes required by CharityFullOutputSchema."""
+
+    __slots__ = (
+        'id', 'title', 'description', 'email', 'phone_number', 'created_at', 'fundraisers', 'charity_employees',
+    )
+
+
+class CharityEmployeeListItem(ProjectedItem):
+    """Charity employee of list page with attributes required by EmployeeOutputSchema."""
+
+    __slots__ = ('id', 'charity_id', 'user', 'roles')
 
 
 class CharityDBService:
@@ -29,9 +53,27 @@ class CharityDBService:
     async def _get_charity_by_id(self, id_: UUID) -> Charity | None:
         return await self._select_charity(column='id', value=id_)
 
+    def _charity_load_options(self) -> tuple:
+        # Relationships required by CharityFullOutputSchema and charity employees permission checks, both employees
+        # paths load the same User objects, so they have to load the same User relationships.
+        return (
+            selectinload(Charity.fundraisers),
+            selectinload(Charity.employees).joinedload(Employee.user).joinedload(User.profile_picture),
+            selectinload(Charity.charity_employees).selectinload(CharityEmployeeAssociation.roles),
+            selectinload(Charity.charity_employees)
+            .joinedload(CharityEmployeeAssociation.employee)
+            .joinedload(Employee.user)
+            .joinedload(User.profile_picture),
+        )
+
     async def _select_charity(self, column: str, value: UUID | str) -> Charity | None:
         self._log.debug(f'Getting Charity with "{column}": "{value}" from the db.')
-        q = select(Charity).where(Charity.__table__.columns[column] == value)
+        q = (
+            select(Charity)
+            .where(Charity.__table__.columns[column] == value)
+            .options(*self._charity_load_options())
+            .execution_options(populate_existing=True)
+        )
         result = await self.session.execute(q)
         return result.scalars().one_or_none()
 
@@ -50,39 +92,144 @@ class CharityDBService:
         db_charity = Charity(**charity.dict())
         self.session.add(db_charity)
         await self.session.commit()
+        pagination_count_provider.invalidate(Charity)
         await self.session.refresh(db_charity)
         self._log.debug(f'Charity with id: "{db_charity.id}" successfully created.')
         return db_charity
 
-    async def get_charities(self, page: int, page_size: int) -> list[Charity]:
-        """Get Charity objects from database.
+    async def get_charities(self, page: int, page_size: int) -> list[CharityListItem]:
+        """Get charities from database with column-projected queries.
 
         Args:
             page: number of result page.
             page_size: number of items per page.
 
         Returns:
-        list of Charity objects.
+        list of CharityListItem objects.
         """
         return await self._get_charities(page, page_size)
 
-    async def _get_charities(self, page: int, page_size: int) -> list[Charity]:
+    async def _get_charities(self, page: int, page_size: int) -> list[CharityListItem]:
         self._log.debug(f'Getting charities from the db, page: {page} with page size: {page_size}.')
-        q = select(Charity).limit(page_size).offset((page - 1) * page_size)
-        return (await self.session.execute(q)).scalars().all()
+        q = select(*self._charity_list_columns()).limit(page_size).offset((page - 1) * page_size)
+        return await self._select_charity_list_items(q)
+
+    async def get_charities_by_cursor(
+            self, after: tuple[datetime, UUID] | None, page_size: int,
+    ) -> list[CharityListItem]:
+        """Get charities from database with keyset pagination and column-projected queries.
 
-    async def get_total_charities(self) -> int:
-        """Counts number of charities in Charity table.
+        Args:
+            after: tuple with 'created_at' and 'id' of the last charity on a previous page, None for the first page.
+            page_size: number of items per page.
+
+        Returns:
+        list of CharityListItem objects with one extra CharityListItem object in case next page exists.
+        """
+        return await self._get_charities_by_cursor(after, page_size)
+
+    async def _get_charities_by_cursor(
+            self, after: tuple[datetime, UUID] | None, page_size: int,
+    ) -> list[CharityListItem]:
+        self._log.debug(f'Getting charities from the db after: {after} with page size: {page_size}.')
+        q = apply_keyset_pagination(
+            select(*self._charity_list_columns()), model=Charity, after=after, page_size=page_size,
+        )
+        return await self._select_charity_list_items(q)
+
+    def _charity_list_columns(self) -> tuple:
+        # Columns required by CharityFullOutputSchema, 'created_at' is used for keyset pagination cursor.
+        return (
+            Charity.id, Charity.title, Charity.description, Charity.email, Charity.phone_number, Charity.created_at,
+        )
+
+    async def _select_charity_list_items(self, q: Select) -> list[CharityListItem]:
+        # Rows of the page and their relationships, one query per relationship, are not added to identity map.
+        charity_rows = (await self.session.execute(q)).all()
+        if not charity_rows:
+            return []
+        charity_ids = [charity_row.id for charity_row in charity_rows]
+        fundraise_rows = group_by_attribute(await self._get_charities_fundraise_rows(charity_ids), 'charity_id')
+        charity_employees = group_by_attribute(await self._get_charities_employee_items(charity_ids), 'charity_id')
+        return [
+            CharityListItem(
+                charity_row,
+                fundraisers=fundraise_rows[charity_row.id],
+                charity_employees=charity_employees[charity_row.id],
+            ) for charity_row in charity_rows
+        ]
+
+    async def _get_charities_fundraise_rows(self, charity_ids: list[UUID]) -> list[Row]:
+        q = select(
+            Fundraise.charity_id,
+            Fundraise.id,
+            Fundraise.title,
+            Fundraise.description,
+            Fundraise.goal,
+            Fundraise.ending_at,
+            Fundraise.is_donatable,
+        ).where(
+            Fundraise.charity_id.in_(charity_ids),
+        ).order_by(
+            Fundraise.created_at, Fundraise.id,
+        )
+        return (await self.session.execute(q)).all()
+
+    async def _get_charities_employee_items(self, charity_ids: list[UUID]) -> list[CharityEmployeeListItem]:
+        employees_q = select(
+            CharityEmployeeAssociation.id,
+            CharityEmployeeAssociation.charity_id,
+            KeyedBundle(
+                'user',
+                User.id,
+                User.first_name,
+                User.last_name,
+                User.username,
+                User.email,
+                User.phone_number,
+                OptionalBundle('profile_picture', UserPicture.id, UserPicture.url),
+            ),
+        ).join(
+            Employee, Employee.id == CharityEmployeeAssociation.employee_id,
+        ).join(
+            User, User.id == Employee.user_id,
+        ).outerjoin(
+            UserPicture, UserPicture.user_id == User.id,
+        ).where(
+            CharityEmployeeAssociation.charity_id.in_(charity_ids),
+        ).order_by(
+            CharityEmployeeAssociation.created_at, CharityEmployeeAssociation.id,
+        )
+        roles_q = select(
+            CharityEmployeeRoleAssociation.charity_employee_id, EmployeeRole.id, EmployeeRole.name,
+        ).join(
+            EmployeeRole, EmployeeRole.id == CharityEmployeeRoleAssociation.role_id,
+        ).join(
+            CharityEmployeeAssociation,
+            CharityEmployeeAssociation.id == CharityEmployeeRoleAssociation.charity_employee_id,
+        ).where(
+            CharityEmployeeAssociation.charity_id.in_(charity_ids),
+        ).order_by(
+            CharityEmployeeRoleAssociation.created_at, CharityEmployeeRoleAssociation.id,
+        )
+        employee_rows = (await self.session.execute(employees_q)).all()
+        role_rows = group_by_attribute((await self.session.execute(roles_q)).all(), 'charity_employee_id')
+        return [
+            CharityEmployeeListItem(employee_row, roles=role_rows[employee_row.id]) for employee_row in employee_rows
+        ]
+
+    async def get_total_charities(self) -> tuple[int, bool]:
+        """Counts number of charities in Charity table with configured pagination count strategy.
 
         Returns:
-        Quantity of charity objects in Charity table.
+        tuple with quantity of charity objects in Charity table and bool whether quantity is exact.
         """
         return await self._get_total_charities()
 
-    async def _get_total_charities(self) -> int:
-        total_charities = (await self.session.execute(select(func.count(Charity.id)))).scalar_one()
-        self._log.debug(f'Charity table has totally: "{total_charities}" charities.')
-        return total_charities
+    async def _get_total_charities(self) -> tuple[int, bool]:
+        total_charities, is_exact = await pagination_count_provider.count(self.session, Charity)
+        self._log.debug(f'Charity table has totally: "{total_charities}" charities, exact: {is_exact}.')
+        return total_charities, is_exact
 
     async def update_charity(self, id_: UUID, update_data: CharityUpdateSchema) -> None:
         """Updates a Charity object in the database.
@@ -97,11 +244,20 @@ class CharityDBService:
         return await self._update_charity(id_, update_data)
 
     async def _update_charity(self, id_: UUID, update_data: CharityUpdateSchema) -> None:
+        fundraise_ids = await self._get_charity_fundraise_ids(id_)
         await self.session.execute(update(Charity).where(Charity.id == id_).values(**update_data.dict()))
         await self.session.commit()
-
+        await self._invalidate_cached_charity(id_, fundraise_ids)
         self._log.debug(f'Charity with id: "{id_}" successfully updated.')
 
+    async def _get_charity_fundraise_ids(self, id_: UUID) -> list[UUID]:
+        return (await self.session.execute(select(Fundraise.id).where(Fundraise.charity_id == id_))).scalars().all()
+
+    async def _invalidate_cached_charity(self, id_: UUID, fundraise_ids: list[UUID]) -> None:
+        # Cached fundraisers include their charity data.
+        await read_through_cache.invalidate(ReadThroughCacheConstants.CHARITIES_NAMESPACE.value, id_)
+        await read_through_cache.invalidate(ReadThroughCacheConstants.FUNDRAISERS_NAMESPACE.value, *fundraise_ids)
+
     async def refresh_object(self, object):
         """Refreshes object from the database.
 
@@ -131,6 +287,10 @@ class CharityDBService:
         return await self._delete_charity(charity)
 
     async def _delete_charity(self, charity: Charity) -> None:
+        fundraise_ids = await self._get_charity_fundraise_ids(charity.id)
         await self.session.delete(charity)
         await self.session.commit()
+        # Charity fundraisers are removed with 'ON DELETE CASCADE'.
+        pagination_count_provider.invalidate(Charity, Fundraise)
+        await self._invalidate_cached_charity(charity.id, fundraise_ids)
         self._log.debug(f'Charity with id: "{charity.id}" successfully deleted.')
@@ -0,0 +1,80 @@
+from uuid import UUID
+
+from sqlalchemy import and_, join
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from charities.models import Charity, CharityEmployeeAssociation, CharityEmployeeRoleAssociation, Employee, EmployeeRole
+from users.models import User
+from utils.logging import setup_logging
+
+
+class CharityEmployeeAuthorization:
+    """Result of charity authorization query for a single user."""
+
+    def __init__(self, charity: Charity, username: str, charity_employee_id: UUID | None, role_names: list) -> None:
+        self.charity = charity
+        self.charity_employee_id = charity_employee_id
+        self.is_employee = charity_employee_id is not None
+        self.usernames = [username] if self.is_employee else []
+        self.role_names = role_names
+
+
+class CharityAuthorizationDBService:
+    """Container class with authorization queries for Charity employees.
+
+    Returns:
+    CharityEmployeeAuthorization object or None.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._log = setup_logging(self.__class__.__name__)
+        self.session = session
+
+    async def get_charity_employee_authorization(
+            self, charity_id: UUID, username: str,
+    ) -> CharityEmployeeAuthorization | None:
+        """Get Charity and roles of employee with provided username in this charity in a single sql statement.
+
+        Args:
+            charity_id: UUID of charity.
+            username: User username.
+
+        Returns:
+        CharityEmployeeAuthorization object or None if charity not found.
+        """
+        return await self._get_charity_employee_authorization(charity_id, username)
+
+    async def _get_charity_employee_authorization(
+            self, charity_id: UUID, username: str,
+    ) -> CharityEmployeeAuthorization | None:
+        self._log.debug(f'Getting roles of User with username: "{username}" in Charity with id: "{charity_id}".')
+        user_charity_employee = join(
+            CharityEmployeeAssociation, Employee, CharityEmployeeAssociation.employee_id == Employee.id,
+        ).join(
+            User, and_(Employee.user_id == User.id, User.username == username),
+        )
+        q = select(
+            Charity, CharityEmployeeAssociation.id, EmployeeRole.name,
+        ).select_from(
+            Charity,
+        ).outerjoin(
+            user_charity_employee, CharityEmployeeAssociation.charity_id == Charity.id,
+        ).outerjoin(
+            CharityEmployeeRoleAssociation,
+            CharityEmployeeRoleAssociation.charity_employee_id == CharityEmployeeAssociation.id,
+        ).outerjoin(
+            EmployeeRole, EmployeeRole.id == CharityEmployeeRoleAssociation.role_id,
+        ).where(
+            Charity.id == charity_id,
+        )
+        rows = (await self.session.execute(q)).all()
+        if not rows:
+            return None
+        charity, charity_employee_id, _ = rows[0]
+        return CharityEmployeeAuthorization(
+            charity=charity,
+            username=username,
+            charity_employee_id=charity_employee_id,
+            role_names=[role_name for _, _, role_name in rows if role_name is not None],
+        )
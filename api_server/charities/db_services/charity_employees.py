@@ -1,11 +1,19 @@
+from uuid import UUID
+
 from fastapi import status
 
+from sqlalchemy import func
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.orm import joinedload, selectinload
 
-from charities.models import Charity, CharityEmployeeAssociation, Employee
+from charities.models import Charity, CharityEmployeeAssociation, CharityEmployeeRoleAssociation, Employee, EmployeeRole
 from charities.utils.exceptions import CharityEmployeeDuplicateError
+from common.constants.cache import ReadThroughCacheConstants
 from common.exceptions.charities import CharityEmployeesExceptionMsgs
+from users.models import User
+from utils.cache import read_through_cache
 from utils.logging import setup_logging
 
 
@@ -42,25 +50,107 @@ class CharityEmployeeDBService:
             self._log.debug(exc)
             await self.session.rollback()
             raise CharityEmployeeDuplicateError(status_code=status.HTTP_400_BAD_REQUEST, detail=err_msg)
-        await self.session.refresh(charity_employee_association)
+        await read_through_cache.invalidate(ReadThroughCacheConstants.CHARITIES_NAMESPACE.value, charity.id)
         self._log.debug(
             f'Employee with id: "{employee.id}" added to Charity with id: {charity.id}.'
         )
         return charity_employee_association
 
-    async def remove_employee_from_charity(self, charity: Charity, employee: Employee) -> None:
-        """Removes Employee from 'Charity.employees' collection.
+    async def get_charity_employee_by_id(self, id_: UUID) -> CharityEmployeeAssociation | None:
+        """Get CharityEmployeeAssociation object with roles and user from database filtered by id.
 
         Args:
-            charity: Charity object.
-            employee: Employee object.
+            id_: UUID of CharityEmployeeAssociation.
+
+        Returns:
+        Single CharityEmployeeAssociation object filtered by id.
+        """
+        return await self._get_charity_employee_by_id(id_)
+
+    async def _get_charity_employee_by_id(self, id_: UUID) -> CharityEmployeeAssociation | None:
+        self._log.debug(f'Getting CharityEmployeeAssociation with "id": "{id_}" from the db.')
+        q = (
+            select(CharityEmployeeAssociation)
+            .where(CharityEmployeeAssociation.id == id_)
+            .options(
+                selectinload(CharityEmployeeAssociation.roles),
+                joinedload(CharityEmployeeAssociation.employee)
+                .joinedload(Employee.user)
+                .joinedload(User.profile_picture),
+            )
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(q)
+        return result.scalars().one_or_none()
+
+    async def count_charity_employees_with_role(self, charity_id: UUID, role_name: str) -> int:
+        """Counts how many employees of Charity have specific role.
+
+        Args:
+            charity_id: UUID of charity.
+            role_name: Employee role name.
+
+        Returns:
+        int of how many charity employees have specific role.
+        """
+        return await self._count_charity_employees_with_role(charity_id, role_name)
+
+    async def _count_charity_employees_with_role(self, charity_id: UUID, role_name: str) -> int:
+        q = select(
+            func.count(CharityEmployeeAssociation.id)
+        ).join(
+            CharityEmployeeRoleAssociation,
+            CharityEmployeeRoleAssociation.charity_employee_id == CharityEmployeeAssociation.id,
+        ).join(
+            EmployeeRole, EmployeeRole.id == CharityEmployeeRoleAssociation.role_id,
+        ).where(
+            CharityEmployeeAssociation.charity_id == charity_id,
+            EmployeeRole.name == role_name,
+        )
+        return (await self.session.execute(q)).scalar_one()
+
+    async def get_charity_ids_by_username(self, username: str) -> set[UUID]:
+        """Get ids of charities where User with provided username listed as an employee.
+
+        Args:
+            username: User username.
+
+        Returns:
+        set of Charity UUIDs.
+        """
+        return await self._get_charity_ids_by_username(username)
+
+    async def _get_charity_ids_by_username(self, username: str) -> set[UUID]:
+        self._log.debug(f'Getting charity memberships of User with username: "{username}" from the db.')
+        q = select(
+            CharityEmployeeAssociation.charity_id
+        ).join(
+            Employee, Employee.id == CharityEmployeeAssociation.employee_id,
+        ).join(
+            User, User.id == Employee.user_id,
+        ).where(
+            User.username == username,
+        )
+        return set((await self.session.execute(q)).scalars().all())
+
+    async def remove_employee_from_charity(self, charity_employee: CharityEmployeeAssociation) -> None:
+        """Removes Employee from Charity by deleting CharityEmployeeAssociation object.
+
+        Args:
+            charity_employee: CharityEmployeeAssociation object with loaded roles.
 
         Returns:
         Nothing.
         """
-        return await self._remove_employee_from_charity(charity, employee)
+        return await self._remove_employee_from_charity(charity_employee)
 
-    async def _remove_employee_from_charity(self, charity: Charity, employee: Employee) -> None:
-        charity.employees.remove(employee)
+    async def _remove_employee_from_charity(self, charity_employee: CharityEmployeeAssociation) -> None:
+        await self.session.delete(charity_employee)
         await self.session.commit()
-        self._log.debug(f'Employee with id: "{employee.id}" removed from Charity with id: {charity.id}.')
+        await read_through_cache.invalidate(
+            ReadThroughCacheConstants.CHARITIES_NAMESPACE.value, charity_employee.charity_id,
+        )
+        self._log.debug(
+            f'Employee with id: "{charity_employee.employee_id}" removed from Charity with id: '
+            f'{charity_employee.charity_id}.'
+        )
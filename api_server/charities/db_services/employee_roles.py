@@ -9,7 +9,9 @@ from sqlalchemy.future import select
 from charities.models import CharityEmployeeAssociation, CharityEmployeeRoleAssociation, EmployeeRole
 from charities.schemas import EmployeeRoleInputSchema
 from charities.utils.exceptions import CharityEmployeeRoleDuplicateError
+from common.constants.cache import ReadThroughCacheConstants
 from common.exceptions.charities import EmployeeRolesExceptionMsgs
+from utils.cache import read_through_cache
 from utils.logging import setup_logging
 
 
@@ -98,6 +100,9 @@ class EmployeeRoleDBService:
             self._log.debug(exc)
             await self.session.rollback()
             raise CharityEmployeeRoleDuplicateError(status_code=status.HTTP_400_BAD_REQUEST, detail=err_msg)
+        await read_through_cache.invalidate(
+            ReadThroughCacheConstants.CHARITIES_NAMESPACE.value, charity_employee.charity_id,
+        )
         await self.session.refresh(charity_employee_role_association)
         self._log.debug(
             f'EmployeeRole with name: "{role.name}" added to CharityEmployeeAssociation with id: {charity_employee.id}.'
@@ -123,6 +128,9 @@ class EmployeeRoleDBService:
     ) -> None:
         charity_employee.roles.remove(role)
         await self.session.commit()
+        await read_through_cache.invalidate(
+            ReadThroughCacheConstants.CHARITIES_NAMESPACE.value, charity_employee.charity_id,
+        )
         self._log.debug(
             f'EmployeeRole with id: "{role.id}" removed from CharityEmployeeAssociation with id: {charity_employee.id}.'
         )
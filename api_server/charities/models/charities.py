@@ -1,7 +1,7 @@
 from datetime import datetime
 import uuid
 
-from sqlalchemy import Column, DateTime, ForeignKey, String, UniqueConstraint
+from sqlalchemy import Column, DateTime, ForeignKey, Index, String, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.orm import relationship
@@ -22,7 +22,9 @@ class CharityEmployeeRoleAssociation(Base):
     charity_employee_id = Column(
         UUID(as_uuid=True), ForeignKey('charity_employee_association.id', ondelete='CASCADE'), nullable=False,
     )
-    role_id = Column(UUID(as_uuid=True), ForeignKey('employee_roles.id', ondelete='CASCADE'), nullable=False)
+    role_id = Column(
+        UUID(as_uuid=True), ForeignKey('employee_roles.id', ondelete='CASCADE'), nullable=False, index=True,
+    )
     created_at = Column(DateTime, default=datetime.now())
 
     __mapper_args__ = {'eager_defaults': True}
@@ -44,16 +46,18 @@ class CharityEmployeeAssociation(Base):
 
     id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4)
     charity_id = Column(UUID(as_uuid=True), ForeignKey('charities.id', ondelete='CASCADE'), nullable=False)
-    employee_id = Column(UUID(as_uuid=True), ForeignKey('employees.id', ondelete='CASCADE'), nullable=False)
+    employee_id = Column(
+        UUID(as_uuid=True), ForeignKey('employees.id', ondelete='CASCADE'), nullable=False, index=True,
+    )
     created_at = Column(DateTime, default=datetime.now())
 
     roles = relationship(
         'EmployeeRole',
         secondary='charity_employee_role_association',
-        lazy='selectin',
+        lazy='raise',
     )
 
-    employee = relationship('Employee', back_populates='charity', lazy='selectin')
+    employee = relationship('Employee', back_populates='charity', lazy='raise')
     user = association_proxy('employee', 'user')
 
     __mapper_args__ = {'eager_defaults': True}
@@ -69,6 +73,9 @@ class Charity(Base):
     """A model representing a charity."""
 
     __tablename__ = 'charities'
+    __table_args__ = (
+        Index('ix_charities_created_at_id', 'created_at', 'id'),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4)
     title = Column(String(length=CharityModelConstants.CHAR_SIZE_512.value), unique=True)
@@ -77,10 +84,16 @@ class Charity(Base):
     phone_number = Column(String(length=CharityModelConstants.CHAR_SIZE_128.value), unique=True)
     created_at = Column(DateTime, default=datetime.now())
 
-    charity_employees = relationship('CharityEmployeeAssociation', lazy='selectin', cascade='all, delete')
-    employees = relationship('Employee', secondary='charity_employee_association', lazy='selectin')
+    charity_employees = relationship(
+        'CharityEmployeeAssociation', lazy='raise', cascade='all, delete', passive_deletes=True,
+    )
+    employees = relationship(
+        'Employee', secondary='charity_employee_association', lazy='raise', passive_deletes=True,
+    )
 
-    fundraisers = relationship('Fundraise', back_populates='charity', lazy='selectin', cascade='all, delete')
+    fundraisers = relationship(
+        'Fundraise', back_populates='charity', lazy='raise', cascade='all, delete', passive_deletes=True,
+    )
 
     __mapper_args__ = {'eager_defaults': True}
 
@@ -1,11 +1,12 @@
+from typing import Union
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, Response, status
-
-from fastapi_jwt_auth import AuthJWT
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 
+from auth.utils.current_user import CurrentUser, get_current_user
 from charities.routers.charity_employees import charity_employees_router
 from charities.schemas import (  # AddManagerSchema,; CharityUpdateSchema,; ManagerResponseSchema,
+    CharityCursorPaginatedOutputSchema,
     CharityFullOutputSchema,
     CharityInputSchema,
     CharityPaginatedOutputSchema,
@@ -14,38 +15,52 @@ from charities.schemas import (  # AddManagerSchema,; CharityUpdateSchema,; Mana
 from charities.services.charities import CharityService
 from common.constants.charities import CharityRouteConstants
 from common.schemas.responses import ResponseBaseSchema
+from utils.compression import route_compression
+from utils.json_responses import (
+    ORJSONModelResponse,
+    create_conditional_response,
+    serialize_response_data,
+    wrap_response_data,
+)
 
 charities_router = APIRouter(prefix='/charities', tags=['Charities'])
 charities_router.include_router(charity_employees_router, prefix='/{charity_id}')
 
 
-@charities_router.post('/', response_model=ResponseBaseSchema, status_code=status.HTTP_201_CREATED)
+@charities_router.post(
+    '/', response_model=ResponseBaseSchema[CharityFullOutputSchema], status_code=status.HTTP_201_CREATED,
+)
 async def post_charities(
         charity: CharityInputSchema,
         charity_service: CharityService = Depends(),
-        Authorize: AuthJWT = Depends(),
+        current_user: CurrentUser = Depends(get_current_user),
 ):
     """POST '/charities' endpoint view function.
 
     Args:
         charity: Serialized CharityInputSchema object.
         charity_service: dependency as business logic instance.
-        Authorize: dependency of AuthJWT for JWT tokens.
+        current_user: dependency with request-scoped CurrentUser of authenticated user.
 
     Returns:
     ResponseBaseSchema object with CharityFullOutputSchema object as response data.
     """
-    Authorize.jwt_required()
-    jwt_subject = Authorize.get_jwt_subject()
-    return ResponseBaseSchema(
-        status_code=status.HTTP_201_CREATED,
-        data=CharityFullOutputSchema.from_orm(await charity_service.add_charity(charity, jwt_subject)),
-        errors=[],
+    jwt_subject = current_user.username
+    return ORJSONModelResponse(
+        ResponseBaseSchema[CharityFullOutputSchema](
+            status_code=status.HTTP_201_CREATED,
+            data=CharityFullOutputSchema.from_orm(await charity_service.add_charity(charity, jwt_subject)),
+            errors=[],
+        ),
     )
 
 
-@charities_router.get('/', response_model=ResponseBaseSchema)
+@charities_router.get(
+    '/', response_model=ResponseBaseSchema[Union[CharityPaginatedOutputSchema, CharityCursorPaginatedOutputSchema]],
+)
+@route_compression(gzip_level=CharityRouteConstants.LIST_GZIP_LEVEL.value)
 async def get_charities(
+        request: Request,
         page: int = Query(
             default=CharityRouteConstants.DEFAULT_START_PAGE.value,
             gt=CharityRouteConstants.ZERO_NUMBER.value,
@@ -55,94 +70,107 @@ async def get_charities(
             gt=CharityRouteConstants.ZERO_NUMBER.value,
             lt=CharityRouteConstants.MAX_PAGINATION_PAGE_SIZE.value,
         ),
+        cursor: str | None = Query(default=None),
         charity_service: CharityService = Depends(),
-) -> ResponseBaseSchema:
+) -> Response:
     """GET '/charities' endpoint view function.
 
     Args:
+        request: FastAPI Request object.
         page: pagination page.
         page_size: pagination page size, how many items to show per page.
+        cursor: opaque keyset pagination cursor, switches endpoint to keyset pagination, empty for the first page.
         charity_service: dependency as business logic instance.
 
     Returns:
-    ResponseBaseSchema object with list of CharityOutputSchema objects as response data.
+    ResponseBaseSchema JSON with list of CharityOutputSchema objects as response data, 304 response without body
+    if client has current page.
     """
-    return ResponseBaseSchema(
-        status_code=status.HTTP_200_OK,
-        data=CharityPaginatedOutputSchema.from_orm(await charity_service.get_charities(page, page_size)),
-        errors=[],
+    if cursor is not None:
+        data = CharityCursorPaginatedOutputSchema.from_orm(
+            await charity_service.get_charities_by_cursor(cursor, page_size),
+        )
+    else:
+        data = CharityPaginatedOutputSchema.from_orm(await charity_service.get_charities(page, page_size))
+    return create_conditional_response(
+        request,
+        serialize_response_data(ResponseBaseSchema(status_code=status.HTTP_200_OK, data=data, errors=[])),
+        cache_control=CharityRouteConstants.LIST_CACHE_CONTROL.value,
     )
 
 
-@charities_router.get('/{id}', response_model=ResponseBaseSchema)
+@charities_router.get('/{id}', response_model=ResponseBaseSchema[CharityFullOutputSchema])
 async def get_charity(
+        request: Request,
         id: UUID,
         charity_service: CharityService = Depends(),
-) -> ResponseBaseSchema:
+) -> Response:
     """GET '/charities/{id}' endpoint view function.
 
     Args:
+        request: FastAPI Request object.
         id: UUID of charity.
         charity_service: dependency as business logic instance.
 
     Returns:
-    ResponseBaseSchema object with CharityFullOutputSchema object as response data.
+    ResponseBaseSchema JSON with cached CharityFullOutputSchema JSON as response data, 304 response without body
+    if client has current charity.
     """
-    return ResponseBaseSchema(
-        status_code=status.HTTP_200_OK,
-        data=CharityFullOutputSchema.from_orm(await charity_service.get_charity_by_id(id_=id)),
-        errors=[],
+    return create_conditional_response(
+        request,
+        wrap_response_data(await charity_service.get_serialized_charity_by_id(id_=id)),
+        cache_control=CharityRouteConstants.DETAIL_CACHE_CONTROL.value,
     )
 
 
-@charities_router.put('/{id}', response_model=ResponseBaseSchema)
+@charities_router.put('/{id}', response_model=ResponseBaseSchema[CharityFullOutputSchema])
 async def put_charity(
         id: UUID,
         update_data: CharityUpdateSchema,
         charity_service: CharityService = Depends(),
-        Authorize: AuthJWT = Depends(),
-) -> ResponseBaseSchema:
+        current_user: CurrentUser = Depends(get_current_user),
+) -> ORJSONModelResponse:
     """PUT '/charities/{id}' endpoint view function.
 
     Args:
         id: UUID of charity.
         update_data: Serialized CharityUpdateSchema object.
         charity_service: dependency as business logic instance.
-        Authorize: dependency of AuthJWT for JWT tokens.
+        current_user: dependency with request-scoped CurrentUser of authenticated user.
 
     Returns:
     ResponseBaseSchema object with CharityFullOutputSchema object as response data.
     """
-    Authorize.jwt_required()
-    jwt_subject = Authorize.get_jwt_subject()
-
-    return ResponseBaseSchema(
-        status_code=status.HTTP_200_OK,
-        data=CharityFullOutputSchema.from_orm(
-            await charity_service.update_charity(id_=id, jwt_subject=jwt_subject, update_data=update_data)
+    jwt_subject = current_user.username
+
+    return ORJSONModelResponse(
+        ResponseBaseSchema[CharityFullOutputSchema](
+            status_code=status.HTTP_200_OK,
+            data=CharityFullOutputSchema.from_orm(
+                await charity_service.update_charity(id_=id, jwt_subject=jwt_subject, update_data=update_data)
+            ),
+            errors=[],
         ),
-        errors=[],
     )
 
 
-@charities_router.delete('/{id}', response_model=ResponseBaseSchema)
+@charities_router.delete('/{id}')
 async def delete_charity(
         id: UUID,
         charity_service: CharityService = Depends(),
-        Authorize: AuthJWT = Depends(),
-) -> ResponseBaseSchema:
+        current_user: CurrentUser = Depends(get_current_user),
+) -> Response:
     """DELETE '/charities/{id}' endpoint view function.
 
     Args:
         id: UUID of charity.
         charity_service: dependency as business logic instance.
-        Authorize: dependency of AuthJWT for JWT tokens.
+        current_user: dependency with request-scoped CurrentUser of authenticated user.
 
     Returns:
     http response with no data and 204 status code.
     """
-    Authorize.jwt_required()
-    jwt_subject = Authorize.get_jwt_subject()
+    jwt_subject = current_user.username
 
     await charity_service.delete_charity(id_=id, jwt_subject=jwt_subject)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -2,25 +2,25 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, status
 
-from fastapi_jwt_auth import AuthJWT
-
+from auth.utils.current_user import CurrentUser, get_current_user
 from charities.routers.employee_roles import employee_roles_router
 from charities.schemas import EmployeeInputSchema, EmployeeOutputMessageSchema, EmployeeOutputSchema
 from charities.services import CharityEmployeeService
 from common.schemas.responses import ResponseBaseSchema
+from utils.json_responses import ORJSONModelResponse
 
 charity_employees_router = APIRouter(prefix='/employees', tags=['Charity-employees'])
 charity_employees_router.include_router(employee_roles_router, prefix='/{employee_id}')
 
 
 @charity_employees_router.post(
-    '/', response_model=ResponseBaseSchema, status_code=status.HTTP_201_CREATED,
+    '/', response_model=ResponseBaseSchema[EmployeeOutputSchema], status_code=status.HTTP_201_CREATED,
 )
 async def post_charity_employees(
         charity_id: UUID,
         employee_data: EmployeeInputSchema,
         charity_employee_service: CharityEmployeeService = Depends(),
-        Authorize: AuthJWT = Depends(),
+        current_user: CurrentUser = Depends(get_current_user),
 ):
     """POST '/charities/{charity_id}/employees' endpoint view function.
 
@@ -28,23 +28,24 @@ async def post_charity_employees(
         charity_id: UUID of charity.
         employee_data: EmployeeInputSchema object.
         charity_employee_service: dependency as business logic instance.
-        Authorize: dependency of AuthJWT for JWT tokens.
+        current_user: dependency with request-scoped CurrentUser of authenticated user.
 
     Returns:
     ResponseBaseSchema object with EmployeeOutputSchema object as response data.
     """
-    Authorize.jwt_required()
-    jwt_subject = Authorize.get_jwt_subject()
-    return ResponseBaseSchema(
-        status_code=status.HTTP_201_CREATED,
-        data=EmployeeOutputSchema.from_orm(
-            await charity_employee_service.add_employee_to_charity(charity_id, jwt_subject, employee_data)
+    jwt_subject = current_user.username
+    return ORJSONModelResponse(
+        ResponseBaseSchema[EmployeeOutputSchema](
+            status_code=status.HTTP_201_CREATED,
+            data=EmployeeOutputSchema.from_orm(
+                await charity_employee_service.add_employee_to_charity(charity_id, jwt_subject, employee_data)
+            ),
+            errors=[],
         ),
-        errors=[],
     )
 
 
-@charity_employees_router.get('/', response_model=ResponseBaseSchema)
+@charity_employees_router.get('/', response_model=ResponseBaseSchema[list[EmployeeOutputSchema]])
 async def get_charity_employees(
         charity_id: UUID,
         charity_employee_service: CharityEmployeeService = Depends(),
@@ -58,17 +59,19 @@ async def get_charity_employees(
     Returns:
     ResponseBaseSchema object with list of EmployeeOutputSchema object as response data.
     """
-    return ResponseBaseSchema(
-        status_code=status.HTTP_200_OK,
-        data=[
-            EmployeeOutputSchema.from_orm(employee) for employee in
-            await charity_employee_service.get_charity_employees(charity_id)
-        ],
-        errors=[],
+    return ORJSONModelResponse(
+        ResponseBaseSchema[list[EmployeeOutputSchema]](
+            status_code=status.HTTP_200_OK,
+            data=[
+                EmployeeOutputSchema.from_orm(employee) for employee in
+                await charity_employee_service.get_charity_employees(charity_id)
+            ],
+            errors=[],
+        ),
     )
 
 
-@charity_employees_router.get('/{employee_id}', response_model=ResponseBaseSchema)
+@charity_employees_router.get('/{employee_id}', response_model=ResponseBaseSchema[EmployeeOutputSchema])
 async def get_charity_employee(
         charity_id: UUID,
         employee_id: UUID,
@@ -84,21 +87,23 @@ async def get_charity_employee(
     Returns:
     ResponseBaseSchema object with EmployeeOutputSchema object as response data.
     """
-    return ResponseBaseSchema(
-        status_code=status.HTTP_200_OK,
-        data=EmployeeOutputSchema.from_orm(
-            await charity_employee_service.get_charity_employee_by_id(charity_id, employee_id)
+    return ORJSONModelResponse(
+        ResponseBaseSchema[EmployeeOutputSchema](
+            status_code=status.HTTP_200_OK,
+            data=EmployeeOutputSchema.from_orm(
+                await charity_employee_service.get_charity_employee_by_id(charity_id, employee_id)
+            ),
+            errors=[],
         ),
-        errors=[],
     )
 
 
-@charity_employees_router.delete('/{employee_id}', response_model=ResponseBaseSchema)
+@charity_employees_router.delete('/{employee_id}', response_model=ResponseBaseSchema[EmployeeOutputMessageSchema])
 async def delete_charity_employee(
         charity_id: UUID,
         employee_id: UUID,
         charity_employee_service: CharityEmployeeService = Depends(),
-        Authorize: AuthJWT = Depends(),
+        current_user: CurrentUser = Depends(get_current_user),
 ):
     """DELETE '/charities/{charity_id}/employees/{employee_id}' endpoint view function.
 
@@ -106,18 +111,19 @@ async def delete_charity_employee(
         charity_id: UUID of charity.
         employee_data: EmployeeInputSchema object.
         charity_employee_service: dependency as business logic instance.
-        Authorize: dependency of AuthJWT for JWT tokens.
+        current_user: dependency with request-scoped CurrentUser of authenticated user.
 
     Returns:
     ResponseBaseSchema object with EmployeeOutputMessageSchema object as response data.
     """
-    Authorize.jwt_required()
-    jwt_subject = Authorize.get_jwt_subject()
-
-    return ResponseBaseSchema(
-        status_code=status.HTTP_200_OK,
-        data=EmployeeOutputMessageSchema(
-            **await charity_employee_service.remove_employee_from_charity(charity_id, employee_id, jwt_subject)
+    jwt_subject = current_user.username
+
+    return ORJSONModelResponse(
+        ResponseBaseSchema[EmployeeOutputMessageSchema](
+            status_code=status.HTTP_200_OK,
+            data=EmployeeOutputMessageSchema(
+                **await charity_employee_service.remove_employee_from_charity(charity_id, employee_id, jwt_subject)
+            ),
+            errors=[],
         ),
-        errors=[],
     )
@@ -2,16 +2,16 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, status
 
-from fastapi_jwt_auth import AuthJWT
-
+from auth.utils.current_user import CurrentUser, get_current_user
 from charities.schemas import EmployeeRoleInputSchema, EmployeeRoleOutputMessageSchema, EmployeeRoleOutputSchema
 from charities.services import EmployeeRoleService
 from common.schemas.responses import ResponseBaseSchema
+from utils.json_responses import ORJSONModelResponse
 
 employee_roles_router = APIRouter(prefix='/roles', tags=['Employee-roles'])
 
 
-@employee_roles_router.get('/', response_model=ResponseBaseSchema)
+@employee_roles_router.get('/', response_model=ResponseBaseSchema[list[EmployeeRoleOutputSchema]])
 async def get_employee_roles(
         charity_id: UUID,
         employee_id: UUID,
@@ -27,17 +27,19 @@ async def get_employee_roles(
     Returns:
     ResponseBaseSchema object with list of EmployeeRoleOutputSchema object as response data.
     """
-    return ResponseBaseSchema(
-        status_code=status.HTTP_200_OK,
-        data=[
-            EmployeeRoleOutputSchema.from_orm(role) for role in
-            await employee_roles_service.get_employee_roles(charity_id, employee_id)
-        ],
-        errors=[],
+    return ORJSONModelResponse(
+        ResponseBaseSchema[list[EmployeeRoleOutputSchema]](
+            status_code=status.HTTP_200_OK,
+            data=[
+                EmployeeRoleOutputSchema.from_orm(role) for role in
+                await employee_roles_service.get_employee_roles(charity_id, employee_id)
+            ],
+            errors=[],
+        ),
     )
 
 
-@employee_roles_router.get('/{role_id}', response_model=ResponseBaseSchema)
+@employee_roles_router.get('/{role_id}', response_model=ResponseBaseSchema[EmployeeRoleOutputSchema])
 async def get_employee_role(
         charity_id: UUID,
         employee_id: UUID,
@@ -55,22 +57,26 @@ async def get_employee_role(
     Returns:
     ResponseBaseSchema object with EmployeeRoleOutputSchema object as response data.
     """
-    return ResponseBaseSchema(
-        status_code=status.HTTP_200_OK,
-        data=EmployeeRoleOutputSchema.from_orm(
-            await employee_roles_service.get_employee_role_by_id(charity_id, employee_id, role_id)
+    return ORJSONModelResponse(
+        ResponseBaseSchema[EmployeeRoleOutputSchema](
+            status_code=status.HTTP_200_OK,
+            data=EmployeeRoleOutputSchema.from_orm(
+                await employee_roles_service.get_employee_role_by_id(charity_id, employee_id, role_id)
+            ),
+            errors=[],
         ),
-        errors=[],
     )
 
 
-@employee_roles_router.post('/', response_model=ResponseBaseSchema, status_code=status.HTTP_201_CREATED)
+@employee_roles_router.post(
+    '/', response_model=ResponseBaseSchema[EmployeeRoleOutputSchema], status_code=status.HTTP_201_CREATED,
+)
 async def post_employee_roles(
         charity_id: UUID,
         employee_id: UUID,
         role_data: EmployeeRoleInputSchema,
         employee_roles_service: EmployeeRoleService = Depends(),
-        Authorize: AuthJWT = Depends(),
+        current_user: CurrentUser = Depends(get_current_user),
 ):
     """POST '/charities/{charity_id}/employees/{employee_id}/roles' endpoint view function.
 
@@ -83,25 +89,26 @@ async def post_employee_roles(
     Returns:
     ResponseBaseSchema object with EmployeeRoleOutputSchema object as response data.
     """
-    Authorize.jwt_required()
-    jwt_subject = Authorize.get_jwt_subject()
-
-    return ResponseBaseSchema(
-        status_code=status.HTTP_201_CREATED,
-        data=EmployeeRoleOutputSchema.from_orm(
-            await employee_roles_service.add_role_to_employee(charity_id, employee_id, jwt_subject, role_data)
+    jwt_subject = current_user.username
+
+    return ORJSONModelResponse(
+        ResponseBaseSchema[EmployeeRoleOutputSchema](
+            status_code=status.HTTP_201_CREATED,
+            data=EmployeeRoleOutputSchema.from_orm(
+                await employee_roles_service.add_role_to_employee(charity_id, employee_id, jwt_subject, role_data)
+            ),
+            errors=[],
         ),
-        errors=[],
     )
 
 
-@employee_roles_router.delete('/{role_id}', response_model=ResponseBaseSchema)
+@employee_roles_router.delete('/{role_id}', response_model=ResponseBaseSchema[EmployeeRoleOutputMessageSchema])
 async def delete_employee_role(
         charity_id: UUID,
         employee_id: UUID,
         role_id: UUID,
         employee_roles_service: EmployeeRoleService = Depends(),
-        Authorize: AuthJWT = Depends(),
+        current_user: CurrentUser = Depends(get_current_user),
 ):
     """DELETE '/charities/{charity_id}/employees/{employee_id}/roles/{role_id}' endpoint view function.
 
@@ -114,13 +121,14 @@ async def delete_employee_role(
     Returns:
     ResponseBaseSchema object with EmployeeRoleOutputMessageSchema object as response data.
     """
-    Authorize.jwt_required()
-    jwt_subject = Authorize.get_jwt_subject()
-
-    return ResponseBaseSchema(
-        status_code=status.HTTP_200_OK,
-        data=EmployeeRoleOutputMessageSchema(
-            **await employee_roles_service.remove_role_from_employee(charity_id, employee_id, role_id, jwt_subject)
+    jwt_subject = current_user.username
+
+    return ORJSONModelResponse(
+        ResponseBaseSchema[EmployeeRoleOutputMessageSchema](
+            status_code=status.HTTP_200_OK,
+            data=EmployeeRoleOutputMessageSchema(
+                **await employee_roles_service.remove_role_from_employee(charity_id, employee_id, role_id, jwt_subject)
+            ),
+            errors=[],
         ),
-        errors=[],
     )
@@ -1,4 +1,5 @@
 from charities.schemas.charities import (
+    CharityCursorPaginatedOutputSchema,
     CharityFullOutputSchema,
     CharityInputSchema,
     CharityOutputSchema,
@@ -26,6 +27,7 @@ __all__ = [
     'EmployeeRoleInputSchema',
     'EmployeeRoleOutputSchema',
     'CharityPaginatedOutputSchema',
+    'CharityCursorPaginatedOutputSchema',
     'EmployeeDBSchema',
     'EmployeeOutputSchema',
     'EmployeeOutputMessageSchema',
@@ -118,6 +118,18 @@ class CharityPaginatedOutputSchema(BaseModel):
     next_page: int | None
     previous_page: int | None
     total_pages: int
+    total_pages_exact: bool
+
+    class Config:
+        orm_mode = True
+
+
+class CharityCursorPaginatedOutputSchema(BaseModel):
+    """Charity keyset paginated output schema for Charity model."""
+    has_next: bool
+    items: list[CharityFullOutputSchema]
+    next_cursor: str | None
+    page_size: int
 
     class Config:
         orm_mode = True
@@ -1,22 +1,27 @@
 # from typing import List
+from functools import partial
 from uuid import UUID
 
 from fastapi import Depends
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from auth.utils.current_user import CurrentUser
 from charities.db_services import CharityDBService, EmployeeDBService, EmployeeRoleDBService
 from charities.models import Charity
-from charities.schemas import CharityInputSchema, CharityUpdateSchema, EmployeeDBSchema
+from charities.schemas import CharityFullOutputSchema, CharityInputSchema, CharityUpdateSchema, EmployeeDBSchema
 from charities.services.commons import CharityCommonService
 from charities.utils.jwt import jwt_charity_validator
 from charities.utils.role_permissions import employee_role_validator
+from common.constants.cache import ReadThroughCacheConstants
 from common.constants.charities import CharityEmployeeRoleConstants
 from common.constants.prepopulates import EmployeeRolePopulateData
 from db import get_session
 from users.services import UserService
+from utils.cache import read_through_cache
+from utils.json_responses import serialize_response_data
 from utils.logging import setup_logging
-from utils.pagination import PaginationPage
+from utils.pagination import CursorPaginationPage, PaginationPage, decode_cursor
 
 
 class CharityService(CharityCommonService):
@@ -43,22 +48,22 @@ class CharityService(CharityCommonService):
         return await self._add_charity(charity, jwt_subject)
 
     async def _add_charity(self, charity: CharityInputSchema, jwt_subject: str) -> Charity:
-        db_user = await self.user_service.get_user_by_username(jwt_subject)
-        db_employee = db_user.employee
+        db_user = await self.user_service.get_user_by_jwt_subject(jwt_subject)
+        current_user = CurrentUser.from_session(self.session, jwt_subject)
+        db_employee = await current_user.get_employee()
         if not db_employee:
             employee = EmployeeDBSchema(user_id=db_user.id)
             db_employee = await self.employee_db_service.add_employee(employee)
+            current_user.set_employee(db_employee)
         db_charity = await self.charity_db_service.add_charity(charity)
         db_charity_employee = await self.save_employee_to_charity(employee=db_employee, charity=db_charity)
+        current_user.invalidate_charity_ids()
         supervisor_role = await self.employee_role_db_service.get_employee_role_by_name(
             EmployeeRolePopulateData.SUPERVISOR.value
         )
-        db_charity_employee_role = await self.employee_role_db_service.add_role_to_charity_employee(
+        await self.employee_role_db_service.add_role_to_charity_employee(
             role=supervisor_role, charity_employee=db_charity_employee,
         )
-        await self.charity_db_service.refresh_object(db_charity_employee_role)
-        await self.charity_db_service.refresh_object(db_charity_employee)
-        await self.charity_db_service.refresh_object(db_charity)
         return await self.get_charity_by_id(id_=db_charity.id)
 
     async def get_charities(self, page: int, page_size: int) -> PaginationPage:
@@ -69,14 +74,56 @@ class CharityService(CharityCommonService):
             page_size: number of items per page.
 
         Returns:
-        PaginationPage object with items as a list of Charity objects.
+        PaginationPage object with items as a list of CharityListItem objects.
         """
         return await self._get_charities(page, page_size)
 
     async def _get_charities(self, page: int, page_size: int) -> PaginationPage:
         charities = await self.charity_db_service.get_charities(page, page_size)
-        total_charities = await self.charity_db_service.get_total_charities()
-        return PaginationPage(items=charities, page=page, page_size=page_size, total=total_charities)
+        total_charities, is_exact = await self.charity_db_service.get_total_charities()
+        return PaginationPage(
+            items=charities, page=page, page_size=page_size, total=total_charities, total_pages_exact=is_exact,
+        )
+
+    async def get_charities_by_cursor(self, cursor: str, page_size: int) -> CursorPaginationPage:
+        """Get Charity objects from database with keyset pagination.
+
+        Args:
+            cursor: opaque pagination cursor from previous page, empty string for the first page.
+            page_size: number of items per page.
+
+        Returns:
+        CursorPaginationPage object with items as a list of CharityListItem objects.
+        """
+        return await self._get_charities_by_cursor(cursor, page_size)
+
+    async def _get_charities_by_cursor(self, cursor: str, page_size: int) -> CursorPaginationPage:
+        after = decode_cursor(cursor) if cursor else None
+        charities = await self.charity_db_service.get_charities_by_cursor(after=after, page_size=page_size)
+        return CursorPaginationPage(items=charities, page_size=page_size)
+
+    async def get_serialized_charity_by_id(self, id_: UUID) -> bytes:
+        """Get JSON of CharityFullOutputSchema object from read-through cache, loaded from database on cache miss.
+
+        Args:
+            id_: UUID of charity.
+        Raise:
+            CharityNotFoundError in case charity not found.
+
+        Returns:
+        JSON of CharityFullOutputSchema object.
+        """
+        return await self._get_serialized_charity_by_id(id_)
+
+    async def _get_serialized_charity_by_id(self, id_: UUID) -> bytes:
+        return await read_through_cache.get_or_load(
+            namespace=ReadThroughCacheConstants.CHARITIES_NAMESPACE.value,
+            id_=id_,
+            loader=partial(self._load_serialized_charity, id_),
+        )
+
+    async def _load_serialized_charity(self, id_: UUID) -> bytes:
+        return serialize_response_data(CharityFullOutputSchema.from_orm(await self.get_charity_by_id(id_)))
 
     async def update_charity(self, id_: UUID, jwt_subject: str, update_data: CharityUpdateSchema) -> Charity:
         """Updates Charity object data in the db.
@@ -95,23 +142,16 @@ class CharityService(CharityCommonService):
 
     async def _update_charity(self, id_: UUID, jwt_subject: str, update_data: CharityUpdateSchema) -> Charity:
         # Checking if currently authenticated user is in Charity employees list.
-        db_charity = await self.get_charity_by_id(id_)
-        usernames = [employee.user.username for employee in db_charity.employees]
-        if jwt_charity_validator(jwt_subject=jwt_subject, usernames=usernames):
+        authorization = await self.get_charity_employee_authorization(id_, jwt_subject)
+        if jwt_charity_validator(jwt_subject=jwt_subject, usernames=authorization.usernames):
             # Checking if currently authenticated employee have sufficient roles to perform charity update.
-            for db_employee in db_charity.charity_employees:
-                if db_employee.user.username == jwt_subject:
-                    break
-            db_employee_roles = [role for role in db_employee.roles]
-            db_employee_role_names = [role.name for role in db_employee_roles]
             if employee_role_validator(
-                    employee_roles=db_employee_role_names,
+                    employee_roles=authorization.role_names,
                     allowed_roles=CharityEmployeeRoleConstants.EDIT_CHARITY_ROLES.value,
             ):
-                # Updating and refreshing Charity.
+                # Updating and returning updated Charity.
                 await self.charity_db_service.update_charity(id_, update_data)
-                await self.charity_db_service.refresh_object(db_charity)
-                return db_charity
+                return await self.get_charity_by_id(id_)
 
     async def delete_charity(self, id_: UUID,  jwt_subject: str) -> None:
         """Delete Fundraise object from the database.
@@ -127,18 +167,13 @@ class CharityService(CharityCommonService):
 
     async def _delete_charity(self, id_: UUID, jwt_subject: str) -> None:
         # Checking if currently authenticated user is in Charity employees list.
-        db_charity = await self.get_charity_by_id(id_)
-        usernames = [employee.user.username for employee in db_charity.charity_employees]
-        if jwt_charity_validator(jwt_subject=jwt_subject, usernames=usernames):
+        authorization = await self.get_charity_employee_authorization(id_, jwt_subject)
+        if jwt_charity_validator(jwt_subject=jwt_subject, usernames=authorization.usernames):
             # Checking if currently authenticated employee have sufficient roles to perform delete charity.
-            for db_employee in db_charity.charity_employees:
-                if db_employee.user.username == jwt_subject:
-                    break
-            db_employee_roles = [role for role in db_employee.roles]
-            db_employee_role_names = [role.name for role in db_employee_roles]
             if employee_role_validator(
-                    employee_roles=db_employee_role_names,
+                    employee_roles=authorization.role_names,
                     allowed_roles=CharityEmployeeRoleConstants.DELETE_CHARITY_ROLES.value,
             ):
-                # Deleting Charity.
-                await self.charity_db_service.delete_charity(db_charity)
+                # Deleting Charity, related rows removed with 'ON DELETE CASCADE'.
+                await self.charity_db_service.delete_charity(authorization.charity)
+                CurrentUser.from_session(self.session, jwt_subject).invalidate_charity_ids()
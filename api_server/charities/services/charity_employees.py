@@ -4,8 +4,9 @@ from fastapi import Depends, status
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from auth.utils.current_user import CurrentUser
 from charities.db_services import CharityEmployeeDBService, EmployeeDBService, EmployeeRoleDBService
-from charities.models import Charity, Employee
+from charities.models import Charity, CharityEmployeeAssociation, Employee
 from charities.schemas import EmployeeDBSchema, EmployeeInputSchema
 from charities.services.commons import CharityCommonService
 from charities.utils.exceptions import CharityEmployeeNotFoundError, CharityNonRemovableEmployeeError
@@ -57,26 +58,21 @@ class CharityEmployeeService(CharityCommonService):
             allowed_roles=CharityEmployeeAllowedRolesConstants.ADD_EMPLOYEE_ROLES_MAPPING.value,
         )
         # Checking if currently authenticated user is in Charity employees list.
-        db_charity = await self.get_charity_by_id(charity_id)
-        db_charity_employee_usernames = [employee.user.username for employee in db_charity.employees]
-        if jwt_charity_validator(jwt_subject=jwt_subject, usernames=db_charity_employee_usernames):
+        authorization = await self.get_charity_employee_authorization(charity_id, jwt_subject)
+        if jwt_charity_validator(jwt_subject=jwt_subject, usernames=authorization.usernames):
             # Checking if currently authenticated employee have sufficient roles to add employee with role.
-            for current_db_employee in db_charity.charity_employees:
-                if current_db_employee.user.username == jwt_subject:
-                    break
-            current_db_employee_role_names = [role.name for role in current_db_employee.roles]
             if employee_role_validator(
-                    employee_roles=current_db_employee_role_names,
+                    employee_roles=authorization.role_names,
                     allowed_roles=allowed_roles,
             ):
                 # Using already created Employee or creating a new one.
                 new_employee_db_user = await self.user_service.get_user_by_email(employee_data.user_email)
-                new_db_employee = new_employee_db_user.employee
+                new_db_employee = await self.employee_db_service.get_employee_by_user_id(new_employee_db_user.id)
                 if not new_db_employee:
                     employee = EmployeeDBSchema(user_id=new_employee_db_user.id)
                     new_db_employee = await self.employee_db_service.add_employee(employee)
                 # Adding new employee to charity.
-                new_db_charity_employee = await self.save_employee_to_charity(new_db_employee, db_charity)
+                new_db_charity_employee = await self.save_employee_to_charity(new_db_employee, authorization.charity)
                 new_employee_role = await self.employee_role_db_service.get_employee_role_by_name(
                     name=employee_data.role,
                 )
@@ -85,9 +81,8 @@ class CharityEmployeeService(CharityCommonService):
                     role=new_employee_role,
                     charity_employee=new_db_charity_employee,
                 )
-                # Refreshing and returning new_db_charity_employee with roles.
-                await self.charity_db_service.refresh_object(new_db_charity_employee)
-                return new_db_charity_employee
+                # Returning new_db_charity_employee with roles.
+                return await self.charity_employee_db_service.get_charity_employee_by_id(new_db_charity_employee.id)
 
     async def get_charity_employees(self, charity_id: UUID) -> list[Employee]:
         """Get Charity's Employee objects from the database.
@@ -164,14 +159,13 @@ class CharityEmployeeService(CharityCommonService):
 
     async def _remove_employee_from_charity(self, charity_id: UUID, employee_id: UUID, jwt_subject: str) -> dict:
         # Checking if currently authenticated user is in Charity employees list.
-        db_charity = await self.get_charity_by_id(charity_id)
-        db_charity_employee_usernames = [employee.user.username for employee in db_charity.charity_employees]
-        if jwt_charity_validator(jwt_subject=jwt_subject, usernames=db_charity_employee_usernames):
+        authorization = await self.get_charity_employee_authorization(charity_id, jwt_subject)
+        db_charity = authorization.charity
+        if jwt_charity_validator(jwt_subject=jwt_subject, usernames=authorization.usernames):
             # Checking if currently authenticated employee have sufficient roles to perform action.
-            authenticated_employee = await self.get_employee_from_charity_by_username(db_charity, jwt_subject)
-            authenticated_employee_role_names = [role.name for role in authenticated_employee.roles]
+            authenticated_employee_role_names = authorization.role_names
             # Getting allowed roles for employee_to_delete roles.
-            employee_to_delete = await self.get_employee_from_charity_by_id(db_charity, employee_id)
+            employee_to_delete = await self.get_charity_employee_from_db(db_charity, employee_id)
             employee_to_delete_role_names = [role.name for role in employee_to_delete.roles]
             employee_to_delete_allowed_roles = get_allowed_roles_for_employee_roles(
                 roles=employee_to_delete_role_names,
@@ -199,10 +193,8 @@ class CharityEmployeeService(CharityCommonService):
                     self._log.debug(err_msg)
                     raise CharityNonRemovableEmployeeError(status_code=status.HTTP_403_FORBIDDEN, detail=err_msg)
                 # Removing Employee from Charity.employees.
-                await self.charity_employee_db_service.remove_employee_from_charity(
-                    db_charity,
-                    employee_to_delete.employee,
-                )
+                await self.charity_employee_db_service.remove_employee_from_charity(employee_to_delete)
+                CurrentUser.from_session(self.session, jwt_subject).invalidate_charity_ids()
                 CharityEmployeeServiceConstants.SUCCESSFUL_EMPLOYEE_REMOVAL_MSG.value['message'] = (
                     CharityEmployeeServiceConstants.SUCCESSFUL_EMPLOYEE_REMOVAL_MSG.value['message'].format(
                         charity_id=db_charity.id,
@@ -211,6 +203,33 @@ class CharityEmployeeService(CharityCommonService):
                 )
                 return CharityEmployeeServiceConstants.SUCCESSFUL_EMPLOYEE_REMOVAL_MSG.value
 
+    async def get_charity_employee_from_db(self, charity: Charity, employee_id: UUID) -> CharityEmployeeAssociation:
+        """Get charity's CharityEmployeeAssociation object with roles from the database filtered by id.
+
+        Args:
+            charity: Charity object.
+            employee_id: UUID of a CharityEmployeeAssociation object.
+
+        Raise:
+            CharityEmployeeNotFoundError in case employee not present in charity.
+
+        Returns:
+        Single charity's CharityEmployeeAssociation object filtered by id.
+        """
+        return await self._get_charity_employee_from_db(charity, employee_id)
+
+    async def _get_charity_employee_from_db(self, charity: Charity, employee_id: UUID) -> CharityEmployeeAssociation:
+        employee = await self.charity_employee_db_service.get_charity_employee_by_id(employee_id)
+        if not employee or employee.charity_id != charity.id:
+            err_msg = CharityEmployeesExceptionMsgs.EMPLOYEE_NOT_FOUND.value.format(
+                field_name='id',
+                field_value=employee_id,
+                charity_id=charity.id,
+            )
+            self._log.debug(err_msg)
+            raise CharityEmployeeNotFoundError(status_code=status.HTTP_404_NOT_FOUND, detail=err_msg)
+        return employee
+
     async def get_employee_from_charity_by_username(self, charity: Charity, username: str) -> Employee:
         """Get Employee object by 'User.username' from 'Charity.employees' collection.
 
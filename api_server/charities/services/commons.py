@@ -4,7 +4,12 @@ from fastapi import Depends, status
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from charities.db_services import CharityDBService, CharityEmployeeDBService
+from charities.db_services import (
+    CharityAuthorizationDBService,
+    CharityDBService,
+    CharityEmployeeAuthorization,
+    CharityEmployeeDBService,
+)
 from charities.models import Charity, Employee
 from charities.utils.exceptions import CharityNotFoundError
 from common.exceptions.charities import CharityExceptionMsgs
@@ -19,6 +24,7 @@ class CharityCommonService:
         self.session = session
         self.charity_db_service = CharityDBService(session)
         self.charity_employee_db_service = CharityEmployeeDBService(session)
+        self.charity_authorization_db_service = CharityAuthorizationDBService(session)
 
     async def get_charity_by_id(self, id_: UUID) -> Charity:
         """Get Charity object from database filtered by id.
@@ -44,6 +50,37 @@ class CharityCommonService:
             raise CharityNotFoundError(status_code=status.HTTP_404_NOT_FOUND, detail=err_msg)
         return charity
 
+    async def get_charity_employee_authorization(
+            self, charity_id: UUID, username: str,
+    ) -> CharityEmployeeAuthorization:
+        """Get Charity and roles of employee with provided username in this charity.
+
+        Args:
+            charity_id: UUID of charity.
+            username: User username.
+        Raise:
+            CharityNotFoundError in case charity not found.
+
+        Returns:
+        CharityEmployeeAuthorization object, used by 'jwt_charity_validator' and 'employee_role_validator'.
+        """
+        return await self._get_charity_employee_authorization(charity_id, username)
+
+    async def _get_charity_employee_authorization(
+            self, charity_id: UUID, username: str,
+    ) -> CharityEmployeeAuthorization:
+        authorization = await self.charity_authorization_db_service.get_charity_employee_authorization(
+            charity_id, username,
+        )
+        if not authorization:
+            err_msg = CharityExceptionMsgs.CHARITY_NOT_FOUND.value.format(
+                column='id',
+                value=charity_id,
+            )
+            self._log.debug(err_msg)
+            raise CharityNotFoundError(status_code=status.HTTP_404_NOT_FOUND, detail=err_msg)
+        return authorization
+
     async def save_employee_to_charity(self, employee: Employee, charity: Charity) -> Charity:
         """Save Employee to Charity in the database via many-to-many relationship.
 
@@ -72,12 +109,7 @@ class CharityCommonService:
         return await self._count_employee_role_in_charity(charity, role_name)
 
     async def _count_employee_role_in_charity(self, charity: Charity, role_name: str) -> int:
-        total_roles = 0
-        for employee in charity.charity_employees:
-            for role in employee.roles:
-                if role.name == role_name:
-                    total_roles += 1
-        return total_roles
+        return await self.charity_employee_db_service.count_charity_employees_with_role(charity.id, role_name)
 
     async def employee_has_role(self, employee: Employee, role_name: str) -> bool:
         """Check if Employee have a role with provided role name.
@@ -1,3 +1,6 @@
+from typing import Callable
+import json
+
 from fastapi import FastAPI, status
 
 from httpx import AsyncClient
@@ -5,17 +8,49 @@ from pytest import fixture
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 import pytest
+import pytest_asyncio
 
+from charities.db_services import CharityAuthorizationDBService
 from charities.models import Charity, Employee
+from charities.schemas import CharityPaginatedOutputSchema
 from charities.tests.test_data import response_charities_test_data
+from common.constants.charities import CharityEmployeeRoleConstants, CharityRouteConstants
+from common.constants.compression import CompressionConstants
+from common.constants.tests import GenericTestConstants
+from common.schemas.responses import ResponseBaseSchema
 from common.tests.generics import TestMixin
 from common.tests.test_data.charities import request_test_charity_data
 from common.tests.test_data.users import request_test_user_data
+from users.cruds import UserPictureCRUD
 from users.models import User
+from utils.json_responses import ORJSONModelResponse
+from utils.tests import count_statements, measure_response_compression, measure_response_serialization
 
 
 class TestCaseGetCharities(TestMixin):
 
+    @pytest_asyncio.fixture
+    async def test_charities_page(self, db_session: AsyncSession) -> list[Charity]:
+        """A pytest fixture that adds benchmark page size of charities to test database.
+
+        Args:
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+
+        Returns:
+        list of newly created Charity objects.
+        """
+        charities = [
+            Charity(
+                title=f'{index} {request_test_charity_data.ADD_CHARITY_TEST_DATA["title"]}',
+                description=request_test_charity_data.ADD_CHARITY_TEST_DATA['description'],
+                phone_number=f'+380500000{index:03}',
+                email=f'{index}.{request_test_charity_data.ADD_CHARITY_TEST_DATA["email"]}',
+            ) for index in range(GenericTestConstants.BENCHMARK_PAGE_SIZE.value)
+        ]
+        db_session.add_all(charities)
+        await db_session.commit()
+        return charities
+
     @pytest.mark.asyncio
     async def test_get_charities_empty_db(self, app: FastAPI, client: AsyncClient, db_session: AsyncSession) -> None:
         """Test GET '/charities' endpoint with no charity data added to the db.
@@ -61,6 +96,132 @@ class TestCaseGetCharities(TestMixin):
         assert (await db_session.execute(select(func.count(Charity.id)))).scalar_one() == 1
         assert (await db_session.execute(select(func.count(Employee.id)))).scalar_one() == 1
 
+    @pytest.mark.asyncio
+    async def test_get_charities_cursor_test_data_in_db(
+            self, app: FastAPI, client: AsyncClient, db_session: AsyncSession, test_charity: Charity,
+    ) -> None:
+        """Test GET '/charities' endpoint with keyset pagination cursor and charity test data added to the db.
+
+        Args:
+            app: pytest fixture, an instance of FastAPI.
+            client: pytest fixture, an instance of AsyncClient for http requests.
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+            test_charity: pytest fixture, add charity to database.
+
+        Returns:
+        Nothing.
+        """
+        url = app.url_path_for('get_charities')
+        response = await client.get(url, params={'cursor': ''})
+        response_data = response.json()
+        expected_result = response_charities_test_data.RESPONSE_GET_CHARITIES_CURSOR
+        assert response_data == expected_result
+        assert response.status_code == status.HTTP_200_OK
+
+    @pytest.mark.asyncio
+    async def test_get_charities_cursor_statements_count(
+            self, app: FastAPI, client: AsyncClient, db_session: AsyncSession, test_charity: Charity,
+    ) -> None:
+        """Test GET '/charities' endpoint loads page with column-projected queries, one query per relationship.
+
+        Args:
+            app: pytest fixture, an instance of FastAPI.
+            client: pytest fixture, an instance of AsyncClient for http requests.
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+            test_charity: pytest fixture, add charity to database.
+
+        Returns:
+        Nothing.
+        """
+        url = app.url_path_for('get_charities')
+        with count_statements(app.db_engine) as statements:
+            response = await client.get(url, params={'cursor': ''})
+        assert response.status_code == status.HTTP_200_OK
+        assert len(statements) == GenericTestConstants.GET_CHARITIES_CURSOR_STATEMENTS.value
+
+    @pytest.mark.asyncio
+    async def test_get_charities_page_serialization_benchmark(
+            self, app: FastAPI, client: AsyncClient, db_session: AsyncSession, test_charities_page: list[Charity],
+            record_property: Callable,
+    ) -> None:
+        """Test ORJSONModelResponse serializes full page of charities like fastapi response model path, reports timings.
+
+        Args:
+            app: pytest fixture, an instance of FastAPI.
+            client: pytest fixture, an instance of AsyncClient for http requests.
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+            test_charities_page: pytest fixture, add full page of charities to database.
+            record_property: pytest fixture, adds serialization timings to test report.
+
+        Returns:
+        Nothing.
+        """
+        page_size = GenericTestConstants.BENCHMARK_PAGE_SIZE.value
+        response = await client.get(app.url_path_for('get_charities'), params={'page_size': page_size})
+        assert response.status_code == status.HTTP_200_OK
+        response_data = ResponseBaseSchema[CharityPaginatedOutputSchema].parse_raw(response.content)
+        assert len(response_data.data.items) == page_size
+        assert json.loads(ORJSONModelResponse(response_data).body) == response.json()
+        timings = await measure_response_serialization(response_data, GenericTestConstants.BENCHMARK_ROUNDS.value)
+        # Timings depend on machine load, so they are reported and not asserted.
+        for serializer, seconds in timings.items():
+            record_property(f'{serializer}_serialization_seconds', seconds)
+
+    @pytest.mark.asyncio
+    async def test_get_charities_page_compression_benchmark(
+            self, app: FastAPI, client: AsyncClient, db_session: AsyncSession, test_charities_page: list[Charity],
+    ) -> None:
+        """Test GET '/charities' endpoint compresses full page with route gzip level and reduces bytes on the wire.
+
+        Args:
+            app: pytest fixture, an instance of FastAPI.
+            client: pytest fixture, an instance of AsyncClient for http requests.
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+            test_charities_page: pytest fixture, add full page of charities to database.
+
+        Returns:
+        Nothing.
+        """
+        url = app.url_path_for('get_charities')
+        params = {'page_size': GenericTestConstants.BENCHMARK_PAGE_SIZE.value}
+        identity_response = await client.get(url, params=params, headers={'accept-encoding': 'identity'})
+        response = await client.get(url, params=params, headers={'accept-encoding': 'gzip'})
+        assert 'content-encoding' not in identity_response.headers
+        assert response.headers['content-encoding'] == 'gzip'
+        assert response.headers['vary'] == identity_response.headers['vary'] == 'Accept-Encoding'
+        assert response.json() == identity_response.json()
+        results = measure_response_compression(
+            identity_response.content,
+            gzip_levels=[CharityRouteConstants.LIST_GZIP_LEVEL.value, CompressionConstants.DEFAULT_GZIP_LEVEL.value],
+            brotli_quality=CompressionConstants.DEFAULT_BROTLI_QUALITY.value,
+            rounds=GenericTestConstants.BENCHMARK_ROUNDS.value,
+        )
+        identity_result = results.pop('identity')
+        assert identity_response.num_bytes_downloaded == identity_result['bytes']
+        route_result = results[f'gzip-{CharityRouteConstants.LIST_GZIP_LEVEL.value}']
+        assert response.num_bytes_downloaded == route_result['bytes']
+        assert all(result['bytes'] < identity_result['bytes'] / 2 for result in results.values())
+
+    @pytest.mark.asyncio
+    async def test_get_charities_small_response_not_compressed(
+            self, app: FastAPI, client: AsyncClient, db_session: AsyncSession,
+    ) -> None:
+        """Test GET '/charities' endpoint sends response smaller than compression minimum size as is.
+
+        Args:
+            app: pytest fixture, an instance of FastAPI.
+            client: pytest fixture, an instance of AsyncClient for http requests.
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+
+        Returns:
+        Nothing.
+        """
+        response = await client.get(app.url_path_for('get_charities'), headers={'accept-encoding': 'gzip'})
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.content) < CompressionConstants.DEFAULT_MINIMUM_SIZE.value
+        assert 'content-encoding' not in response.headers
+        assert response.headers['vary'] == 'Accept-Encoding'
+
 
 class TestCaseGetCharity(TestMixin):
 
@@ -109,6 +270,118 @@ class TestCaseGetCharity(TestMixin):
         assert (await db_session.execute(select(func.count(Charity.id)))).scalar_one() == 1
         assert (await db_session.execute(select(func.count(Employee.id)))).scalar_one() == 1
 
+    @pytest.mark.asyncio
+    async def test_get_charity_statements_count(
+            self, app: FastAPI, client: AsyncClient, db_session: AsyncSession, test_charity: Charity,
+    ) -> None:
+        """Test GET '/charities/{id}' endpoint loads charity relationships with fixed number of sql statements.
+
+        Args:
+            app: pytest fixture, an instance of FastAPI.
+            client: pytest fixture, an instance of AsyncClient for http requests.
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+            test_charity: pytest fixture, add charity to database.
+
+        Returns:
+        Nothing.
+        """
+        url = app.url_path_for('get_charity', id=test_charity.id)
+        with count_statements(app.db_engine) as statements:
+            response = await client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert len(statements) == GenericTestConstants.GET_CHARITY_STATEMENTS.value
+
+    @pytest.mark.asyncio
+    async def test_get_charity_cached_until_charity_update(
+            self, app: FastAPI, client: AsyncClient, db_session: AsyncSession, test_charity: Charity,
+    ) -> None:
+        """Test GET '/charities/{id}' endpoint reads charity from cache, cache invalidated by charity update.
+
+        Args:
+            app: pytest fixture, an instance of FastAPI.
+            client: pytest fixture, an instance of AsyncClient for http requests.
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+            test_charity: pytest fixture, add charity to database.
+
+        Returns:
+        Nothing.
+        """
+        url = app.url_path_for('get_charity', id=test_charity.id)
+        await client.get(url)
+        with count_statements(app.db_engine) as statements:
+            response = await client.get(url)
+        assert response.json() == response_charities_test_data.RESPONSE_GET_CHARITY
+        assert len(statements) == 0
+        await client.put(
+            app.url_path_for('put_charity', id=test_charity.id),
+            json=request_test_charity_data.UPDATE_CHARITY_TEST_DATA,
+        )
+        response = await client.get(url)
+        assert response.json() == response_charities_test_data.RESPONSE_PUT_CHARITY
+
+    @pytest.mark.asyncio
+    async def test_get_charity_cached_until_employee_update(
+            self, app: FastAPI, client: AsyncClient, db_session: AsyncSession, test_charity: Charity,
+            authenticated_test_user: User,
+    ) -> None:
+        """Test GET '/charities/{id}' endpoint cache invalidated by update and new picture of charity employee.
+
+        Args:
+            app: pytest fixture, an instance of FastAPI.
+            client: pytest fixture, an instance of AsyncClient for http requests.
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+            test_charity: pytest fixture, add charity to database.
+            authenticated_test_user: pytest fixture, add user to database and add auth cookies to client fixture.
+
+        Returns:
+        Nothing.
+        """
+        url = app.url_path_for('get_charity', id=test_charity.id)
+        await client.get(url)
+        await client.put(
+            app.url_path_for('put_user', id=authenticated_test_user.id),
+            json=request_test_user_data.UPDATE_USER_TEST_DATA,
+        )
+        employee_user = (await client.get(url)).json()['data']['charity_employees'][0]['user']
+        assert employee_user['first_name'] == request_test_user_data.UPDATE_USER_TEST_DATA['first_name']
+        assert employee_user['profile_picture'] is None
+        user_picture = await UserPictureCRUD(session=db_session).add_user_picture(authenticated_test_user.id)
+        employee_user = (await client.get(url)).json()['data']['charity_employees'][0]['user']
+        assert employee_user['profile_picture']['id'] == str(user_picture.id)
+
+    @pytest.mark.asyncio
+    async def test_get_charity_conditional_request(
+            self, app: FastAPI, client: AsyncClient, db_session: AsyncSession, test_charity: Charity,
+    ) -> None:
+        """Test GET '/charities/{id}' endpoint answers 304 for current etag and new etag after charity update.
+
+        Args:
+            app: pytest fixture, an instance of FastAPI.
+            client: pytest fixture, an instance of AsyncClient for http requests.
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+            test_charity: pytest fixture, add charity to database.
+
+        Returns:
+        Nothing.
+        """
+        url = app.url_path_for('get_charity', id=test_charity.id)
+        response = await client.get(url)
+        etag = response.headers['etag']
+        assert response.headers['cache-control'] == CharityRouteConstants.DETAIL_CACHE_CONTROL.value
+        response = await client.get(url, headers={'if-none-match': etag})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b''
+        assert response.headers['etag'] == etag
+        assert response.headers['vary'] == CompressionConstants.VARY_HEADER.value
+        await client.put(
+            app.url_path_for('put_charity', id=test_charity.id),
+            json=request_test_charity_data.UPDATE_CHARITY_TEST_DATA,
+        )
+        response = await client.get(url, headers={'if-none-match': etag})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers['etag'] != etag
+        assert response.json() == response_charities_test_data.RESPONSE_PUT_CHARITY
+
 
 class TestCasePostCharities(TestMixin):
 
@@ -300,3 +573,36 @@ class TestCaseDeleteCharity(TestMixin):
         assert response.status_code == status.HTTP_403_FORBIDDEN
         assert (await db_session.execute(select(func.count(Charity.id)))).scalar_one() == 1
         assert (await db_session.execute(select(func.count(Employee.id)))).scalar_one() == 2
+
+
+class TestCaseCharityEmployeeAuthorization(TestMixin):
+
+    @pytest.mark.asyncio
+    async def test_get_charity_employee_authorization_single_statement(
+            self, db_session: AsyncSession, test_charity: Charity, authenticated_test_user: User,
+    ) -> None:
+        """Test charity membership and employee roles are fetched with a single sql statement.
+
+        Args:
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+            test_charity: pytest fixture, add charity to database.
+            authenticated_test_user: pytest fixture, add user to database and auth cookies to client fixture.
+
+        Returns:
+        Nothing.
+        """
+        charity_authorization_db_service = CharityAuthorizationDBService(db_session)
+        with count_statements(db_session.bind) as statements:
+            authorization = await charity_authorization_db_service.get_charity_employee_authorization(
+                test_charity.id, authenticated_test_user.username,
+            )
+        assert len(statements) == 1
+        assert authorization.charity.id == test_charity.id
+        assert authorization.usernames == [authenticated_test_user.username]
+        assert CharityEmployeeRoleConstants.SUPERVISOR.value in authorization.role_names
+        non_employee_authorization = await charity_authorization_db_service.get_charity_employee_authorization(
+            test_charity.id, 'non_employee_username',
+        )
+        assert non_employee_authorization.is_employee is False
+        assert non_employee_authorization.usernames == []
+        assert non_employee_authorization.role_names == []
@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 import pytest
 
 from charities.models import Charity, Employee
+from charities.services import CharityService
 from charities.tests.test_data import response_charity_employees_test_data
 from common.tests.generics import TestMixin
 from common.tests.test_data.charities import request_test_charity_employee_data
@@ -134,7 +135,11 @@ class TestCasePostCharityEmployees(TestMixin):
         expected_result = response_charity_employees_test_data.RESPONSE_CHARITY_EMPLOYEES_ALREADY_ADDED
         expected_result['errors'][0]['detail'] = expected_result['errors'][0]['detail'].format(
             charity_id=random_test_charity.id,
-            employee_id=authenticated_random_test_user.employee.id,
+            employee_id=(
+                await db_session.execute(
+                    select(Employee.id).where(Employee.user_id == authenticated_random_test_user.id),
+                )
+            ).scalar_one(),
         )
         assert response_data == expected_result
         assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -183,7 +188,7 @@ class TestCaseDeleteCharityEmployee(TestMixin):
     @pytest.mark.asyncio
     async def test_delete_charity_employee_valid_data(
             self, app: FastAPI, client: AsyncClient, db_session: AsyncSession, random_test_charity: Charity,
-            test_employee_manager: Employee,
+            test_employee_manager: Employee, charity_service: CharityService,
     ) -> None:
         """Test DELETE '/charities/{charity_id}/employees/{employee_id}' endpoint with valid employee data and roles.
 
@@ -193,6 +198,7 @@ class TestCaseDeleteCharityEmployee(TestMixin):
             db_session: pytest fixture, sqlalchemy AsyncSession.
             random_test_charity: pytest fixture, add charity with random data to database.
             test_employee_manager: pytest fixture, add employee with manager role to random_test_charity.
+            charity_service: pytest fixture, instance of CharityService business logic class.
 
         Returns:
         Nothing.
@@ -210,7 +216,7 @@ class TestCaseDeleteCharityEmployee(TestMixin):
             charity_id=random_test_charity.id,
             employee_id=test_employee_manager.id,
         )
-        await db_session.refresh(random_test_charity)
+        random_test_charity = await charity_service.get_charity_by_id(random_test_charity.id)
         assert response_data == expected_result
         assert response.status_code == status.HTTP_200_OK
         assert (await db_session.execute(select(func.count(Charity.id)))).scalar_one() == 1
@@ -225,6 +231,7 @@ class TestCaseDeleteCharityEmployee(TestMixin):
     async def test_delete_charity_employee_with_manager_role_tries_remove_supervisor(
             self, app: FastAPI, client: AsyncClient, db_session: AsyncSession, random_test_charity: Charity,
             test_employee_manager: Employee, authenticated_random_test_user: User, login_as: fixture,
+            charity_service: CharityService,
     ) -> None:
         """Test DELETE '/charities/{charity_id}/employees/{employee_id}' endpoint with employee with role 'manager'
         tries to delete employee with 'supervisor' role from charity.
@@ -238,6 +245,7 @@ class TestCaseDeleteCharityEmployee(TestMixin):
             authenticated_random_test_user: pytest fixture, add random user to database and auth cookies to client
             fixture.
             login_as: pytest fixture, finds and authenticate user by provided username.
+            charity_service: pytest fixture, instance of CharityService business logic class.
 
         Returns:
         Nothing.
@@ -251,7 +259,7 @@ class TestCaseDeleteCharityEmployee(TestMixin):
         response = await client.delete(url)
         response_data = response.json()
         expected_result = response_charity_employees_test_data.RESPONSE_EMPLOYEE_ROLE_MANAGER_NOT_ENOUGH_PERMISSIONS
-        await db_session.refresh(random_test_charity)
+        random_test_charity = await charity_service.get_charity_by_id(random_test_charity.id)
         assert response_data == expected_result
         assert response.status_code == status.HTTP_403_FORBIDDEN
         assert (await db_session.execute(select(func.count(Charity.id)))).scalar_one() == 1
@@ -260,7 +268,7 @@ class TestCaseDeleteCharityEmployee(TestMixin):
     @pytest.mark.asyncio
     async def test_delete_charity_employee_the_only_supervisor_deleting_himself(
             self, app: FastAPI, client: AsyncClient, db_session: AsyncSession, random_test_charity: Charity,
-            authenticated_random_test_user: User,
+            authenticated_random_test_user: User, charity_service: CharityService,
     ) -> None:
         """Test DELETE '/charities/{charity_id}/employees/{employee_id}' endpoint with the only charity's employee
         with supervisor role tries to remove himself.
@@ -272,6 +280,7 @@ class TestCaseDeleteCharityEmployee(TestMixin):
             random_test_charity: pytest fixture, add charity with random data to database.
             authenticated_random_test_user: pytest fixture, add random user to database and auth cookies to client
             fixture.
+            charity_service: pytest fixture, instance of CharityService business logic class.
 
         Returns:
         Nothing.
@@ -288,7 +297,7 @@ class TestCaseDeleteCharityEmployee(TestMixin):
         expected_result['errors'][0]['detail'] = expected_result['errors'][0]['detail'].format(
             charity_id=random_test_charity.id,
         )
-        await db_session.refresh(random_test_charity)
+        random_test_charity = await charity_service.get_charity_by_id(random_test_charity.id)
         assert response_data == expected_result
         assert response.status_code == status.HTTP_403_FORBIDDEN
         assert (await db_session.execute(select(func.count(Charity.id)))).scalar_one() == 1
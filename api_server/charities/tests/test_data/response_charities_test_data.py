@@ -22,7 +22,8 @@ RESPONSE_GET_CHARITIES_EMPTY_DB = {
         'items': [],
         'next_page': None,
         'previous_page': None,
-        'total_pages': 0
+        'total_pages': 0,
+        'total_pages_exact': True
     },
     'errors': [],
     'status_code': 200
@@ -47,7 +48,18 @@ RESPONSE_GET_CHARITIES = {
         ],
         'next_page': None,
         'previous_page': None,
-        'total_pages': 1
+        'total_pages': 1,
+        'total_pages_exact': True
+    },
+    'errors': [],
+    'status_code': 200
+}
+RESPONSE_GET_CHARITIES_CURSOR = {
+    'data': {
+        'has_next': False,
+        'items': RESPONSE_GET_CHARITIES['data']['items'],
+        'next_cursor': None,
+        'page_size': 20,
     },
     'errors': [],
     'status_code': 200
@@ -8,3 +8,9 @@ class ApiConstants(enum.Enum):
     LOG_FORMAT = '%(asctime)s %(levelname)s %(name)s:%(lineno)s %(message)s'
     DEVELOPMENT_CONFIG = 'development'
     TESTING_CONFIG = 'testing'
+
+
+class JSONResponseConstants(enum.Enum):
+    """JSON response constants."""
+    ETAG_DIGEST_SIZE = 16
+    MEDIA_TYPE = 'application/json'
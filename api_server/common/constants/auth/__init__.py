@@ -5,6 +5,7 @@ from common.constants.auth.change_password_tokens import (
     ChangePasswordTokenModelConstants,
     ChangePasswordTokenSchemaConstants,
 )
+from common.constants.auth.current_user import CurrentUserConstants
 from common.constants.auth.email_confirmation_tokens import (
     EmailConfirmationLetterConstants,
     EmailConfirmationTokenConstants,
@@ -12,7 +13,9 @@ from common.constants.auth.email_confirmation_tokens import (
     EmailConfirmationTokenSchemaConstants,
     JWTTokenConstants,
 )
-from common.constants.auth.email_lambda_client import EmailLambdaClientConstants
+from common.constants.auth.email_lambda_client import EmailTransportConstants, StubEmailLambdaConstants
+from common.constants.auth.email_templates import EmailTemplateRegistryConstants
+from common.constants.auth.password_hashing import PasswordHashingConstants
 
 __all__ = [
     'AuthJWTConstants',
@@ -24,6 +27,10 @@ __all__ = [
     'ChangePasswordTokenSchemaConstants',
     'ChangePasswordTokenConstants',
     'ChangePasswordLetterConstants',
-    'EmailLambdaClientConstants',
+    'CurrentUserConstants',
+    'EmailTransportConstants',
+    'EmailTemplateRegistryConstants',
+    'StubEmailLambdaConstants',
     'JWTTokenConstants',
+    'PasswordHashingConstants',
 ]
@@ -4,6 +4,7 @@ import enum
 class ChangePasswordTokenModelConstants(enum.Enum):
     """ChangePasswordToken model constants."""
     CHAR_SIZE_2048 = 2048
+    SHA256_DIGEST_SIZE = 32
 
 
 class ChangePasswordTokenSchemaConstants(enum.Enum):
@@ -0,0 +1,9 @@
+import enum
+
+
+class CurrentUserConstants(enum.Enum):
+    """Request-scoped CurrentUser constants."""
+    SESSION_INFO_KEY = 'current_user'
+    USER = 'user'
+    EMPLOYEE = 'employee'
+    CHARITY_IDS = 'charity_ids'
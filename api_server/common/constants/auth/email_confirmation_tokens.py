@@ -4,6 +4,7 @@ import enum
 class EmailConfirmationTokenModelConstants(enum.Enum):
     """EmailConfirmationToken model constants."""
     CHAR_SIZE_2048 = 2048
+    SHA256_DIGEST_SIZE = 32
 
 
 class EmailConfirmationTokenSchemaConstants(enum.Enum):
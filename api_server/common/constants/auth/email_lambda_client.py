@@ -1,7 +1,36 @@
 import enum
 
 
-class EmailLambdaClientConstants(enum.Enum):
-    """EmailConfirmationLambdaClient constants."""
-    SECOND_1 = 1
-    TIMES_5 = 5
+class EmailTransportConstants(enum.Enum):
+    """EmailTransport constants."""
+    THREAD_NAME = 'email_transport'
+    # Retries with exponential backoff and full jitter, so retrying workers don't hit email lambda at the same time.
+    MAX_ATTEMPTS = 5
+    RETRY_MULTIPLIER = 0.5
+    RETRY_MAX_WAIT = 10
+    RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+    # Connection pool settings of http client.
+    DEFAULT_MAX_CONNECTIONS = 20
+    MAX_KEEPALIVE_CONNECTIONS = 10
+    KEEPALIVE_EXPIRY = 60
+    CONNECT_TIMEOUT = 5
+    TIMEOUT = 30
+    HTTP2_PACKAGE = 'h2'
+    # Batch mode settings, letters queued within the window are sent by one lambda call.
+    DEFAULT_BATCH_MAX_SIZE = 50
+    DEFAULT_BATCH_WINDOW = 0.5
+    BATCH_LETTERS_KEY = 'letters'
+    BATCH_RESULTS_KEY = 'results'
+    BATCH_ERROR_KEY = 'error'
+    SHUTDOWN_TIMEOUT = 30
+    # Celery retries of letter tasks failed after transport retries, for example while email lambda is unavailable.
+    TASK_MAX_RETRIES = 3
+    TASK_RETRY_BACKOFF = 30
+
+
+class StubEmailLambdaConstants(enum.Enum):
+    """Stub email lambda server constants."""
+    DEFAULT_HOST = '127.0.0.1'
+    DEFAULT_PORT = 8025
+    DEFAULT_LATENCY = 0.05
+    STATS_PATH = '/stats'
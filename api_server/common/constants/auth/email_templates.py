@@ -0,0 +1,11 @@
+import enum
+
+
+class EmailTemplateRegistryConstants(enum.Enum):
+    """EmailTemplateRegistry constants."""
+    EMAIL_CONFIRMATION_TEMPLATE = 'email_confirmation.html'
+    CHANGE_PASSWORD_TEMPLATE = 'change_password.html'
+    BYTECODE_CACHE_PATTERN = 'dp_retraining_jinja_%s.cache'
+    BENCHMARK_DEFAULT_LETTERS_COUNT = 1000
+    BENCHMARK_TOKEN = 'benchmark-token'
+    BENCHMARK_EMAIL = 'benchmark@test.com'
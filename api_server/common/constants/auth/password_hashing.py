@@ -0,0 +1,12 @@
+import enum
+
+
+class PasswordHashingConstants(enum.Enum):
+    """PasswordHashingExecutor constants."""
+    THREAD_EXECUTOR = 'thread'
+    PROCESS_EXECUTOR = 'process'
+    ARGON2_ROUNDS = 4
+    DEFAULT_MAX_WORKERS = 2
+    DEFAULT_MAX_QUEUE_DEPTH = 64
+    HASH_OPERATION = 'hash'
+    VERIFY_OPERATION = 'verify'
@@ -0,0 +1,13 @@
+import enum
+
+
+class ReadThroughCacheConstants(enum.Enum):
+    """ReadThroughCache constants."""
+    KEY_PREFIX = 'dp_retraining_cache'
+    # Bumped on changes of cached output schemas, so payloads of previous releases are not read.
+    SCHEMA_VERSION = 1
+    CHARITIES_NAMESPACE = 'charities'
+    FUNDRAISERS_NAMESPACE = 'fundraisers'
+    DEFAULT_TTL = 300
+    DEFAULT_LOCAL_MAX_SIZE = 1024
+    DEFAULT_LOCAL_TTL = 5
@@ -6,3 +6,5 @@ class CeleryConstants(enum.Enum):
     """Project Celery constants."""
     DEVELOPMENT_CONFIG = 'development'
     TESTING_CONFIG = 'testing'
+    BENCHMARK_DEFAULT_ITERATIONS = 10
+    BENCHMARK_QUERY = 'SELECT 1'
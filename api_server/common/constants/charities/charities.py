@@ -26,6 +26,12 @@ class CharityRouteConstants(Enum):
     DEFAULT_START_PAGE = 1
     DEFAULT_PAGE_SIZE = 20
     MAX_PAGINATION_PAGE_SIZE = 101
+    # Shared caches store responses and revalidate them with 'If-None-Match' on every request.
+    DETAIL_CACHE_CONTROL = 'public, no-cache'
+    # Pages are served from shared caches for a few seconds before revalidation.
+    LIST_CACHE_CONTROL = 'public, max-age=10'
+    # Pages are the largest responses, the fastest gzip level saves most of the bytes of the default level.
+    LIST_GZIP_LEVEL = 1
 
 
 class CharityEmployeeRoleConstants(Enum):
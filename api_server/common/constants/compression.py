@@ -0,0 +1,25 @@
+import enum
+
+
+class CompressionConstants(enum.Enum):
+    """CompressionMiddleware constants."""
+    GZIP_ENCODING = 'gzip'
+    BROTLI_ENCODING = 'br'
+    ANY_ENCODING = '*'
+    QUALITY_PARAM = 'q'
+    VARY_HEADER = 'Accept-Encoding'
+    # Compressed response is not byte-identical to uncompressed one, so its strong etag is made weak.
+    WEAK_ETAG_PREFIX = 'W/'
+    ROUTE_SETTINGS_ATTRIBUTE = 'compression_settings'
+    # Responses smaller than a single network packet gain nothing from compression.
+    DEFAULT_MINIMUM_SIZE = 1024
+    DEFAULT_GZIP_LEVEL = 6
+    DEFAULT_BROTLI_QUALITY = 4
+    DEFAULT_CONTENT_TYPES = [
+        'application/json',
+        'text/plain',
+        'text/html',
+        'text/css',
+        'text/csv',
+        'application/javascript',
+    ]
@@ -0,0 +1,8 @@
+import enum
+
+
+class FileSpoolConstants(enum.Enum):
+    """FileSpool constants."""
+    DEFAULT_DIR_NAME = 'dp_retraining_spool'
+    CHUNK_SIZE = 1024 * 1024
+    KEY_PATTERN = r'[0-9a-f]{32}'
@@ -0,0 +1,12 @@
+import enum
+
+
+class OutboxMessageModelConstants(enum.Enum):
+    """OutboxMessage model constants."""
+    CHAR_SIZE_256 = 256
+
+
+class OutboxRelayConstants(enum.Enum):
+    """OutboxRelay constants."""
+    DEFAULT_BATCH_SIZE = 100
+    DEFAULT_POLL_INTERVAL = 1.0
@@ -0,0 +1,10 @@
+import enum
+
+
+class PaginationCountConstants(enum.Enum):
+    """PaginationCountProvider constants."""
+    EXACT_STRATEGY = 'exact'
+    CACHED_STRATEGY = 'cached'
+    ESTIMATED_STRATEGY = 'estimated'
+    DEFAULT_CACHE_TTL = 30
+    RELTUPLES_QUERY = 'SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table_name)'
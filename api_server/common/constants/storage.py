@@ -0,0 +1,29 @@
+import enum
+
+
+class PictureStorageConstants(enum.Enum):
+    """Picture storage constants."""
+    S3_BACKEND = 's3'
+    LOCAL_BACKEND = 'local'
+    DEFAULT_DIR_NAME = 'dp_retraining_storage'
+    DEFAULT_BASE_URL = '/api/v1/picture-files'
+    FILE_URL = '{base_url}/{file_name}'
+    # Etag and content type of stored file are kept in sidecar file, like AWS S3 object metadata.
+    METADATA_FILE_SUFFIX = '.metadata.json'
+    TEMPORARY_FILE_SUFFIX = '.{token}.tmp'
+    SUCCESSFUL_UPLOAD_MSG = 'File object saved to local storage {file_name}.'
+    SUCCESSFUL_DELETE_MSG = '{deleted_count} file objects deleted from local storage with prefix {prefix}.'
+
+
+class FileResponseConstants(enum.Enum):
+    """File response constants."""
+    CHUNK_SIZE = 64 * 1024
+    ACCEPT_RANGES = 'bytes'
+    # At least one of range positions is required, 'bytes=-' is malformed.
+    RANGE_REGEX = r'bytes=(?=\d|-\d)(\d*)-(\d*)'
+    CONTENT_RANGE = 'bytes {start}-{end}/{size}'
+    UNSATISFIED_CONTENT_RANGE = 'bytes */{size}'
+    ANY_ETAG = '*'
+    WEAK_ETAG_PREFIX = 'W/'
+    # ASGI extension letting server send file with zero-copy 'sendfile', used if server supports it.
+    ZEROCOPY_SEND_EXTENSION = 'http.response.zerocopysend'
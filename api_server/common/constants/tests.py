@@ -7,6 +7,13 @@ class GenericTestConstants(enum.Enum):
     SELECT_DATABASE_QUERY = "select * from pg_database where datname='{db_name}';"
     DELETE_DATABASE_QUERY = 'drop database {db_name};'
     CREATE_DATABASE_QUERY = 'create database {db_name};'
+    SELECT_INDEXES_QUERY = "select tablename, indexname from pg_indexes where schemaname = 'public';"
+    SELECT_INDEXES_LEADING_COLUMNS_QUERY = (
+        'select t.relname, a.attname from pg_index i '
+        'join pg_class t on t.oid = i.indrelid '
+        'join pg_attribute a on a.attrelid = t.oid and a.attnum = i.indkey[0] '
+        "join pg_namespace n on n.oid = t.relnamespace where n.nspname = 'public';"
+    )
     # Alembic variables.
     ALEMBIC_MIGRATIONS_FOLDER = '/migrations'
     ALEMBIC_INI_FILENAME = 'alembic.ini'
@@ -17,6 +24,15 @@ class GenericTestConstants(enum.Enum):
     # AsyncClient stuff.
     BASE_URL_TEMPLATE = 'http://{api_host}:{api_port}'
     TEST_CLIENT_HEADERS = {'Content-Type': 'application/json'}
+    # Expected number of sql statements per endpoint.
+    GET_USER_STATEMENTS = 1
+    GET_CHARITY_STATEMENTS = 5
+    GET_FUNDRAISE_STATEMENTS = 3
+    GET_CHARITIES_CURSOR_STATEMENTS = 4
+    GET_FUNDRAISERS_CURSOR_STATEMENTS = 2
+    # Response serialization benchmark.
+    BENCHMARK_PAGE_SIZE = 100
+    BENCHMARK_ROUNDS = 20
 
 
 class HealthChecksConstants(enum.Enum):
@@ -4,4 +4,5 @@ import enum
 class UserPictureSchemaConstants(enum.Enum):
     """UserPicture schema constants."""
     CHAR_SIZE_2 = 2
+    CHAR_SIZE_64 = 64
     CHAR_SIZE_512 = 512
@@ -16,7 +16,10 @@ class UserModelConstants(enum.Enum):
 class UserPictureModelConstants(enum.Enum):
     """User model constants."""
     # Numerics.
+    CHAR_SIZE_16 = 16
+    CHAR_SIZE_64 = 64
     CHAR_SIZE_512 = 512
+    ZERO_REFERENCES = 0
 
 
 class UserSchemaConstants(enum.Enum):
@@ -47,6 +50,8 @@ class UserServiceConstants(enum.Enum):
         FILE_BMP_EXTENSION: FILE_BMP_EXTENSION,
         FILE_GIF_EXTENSION: FILE_GIF_EXTENSION,
     }
+    VALID_IMAGE_FORMATS = {'JPEG', 'MPO', 'PNG', 'BMP', 'GIF'}
+    IMAGE_READ_CHUNK_SIZE = 64 * 1024
     MIN_IMAGE_WIDTH = 32
     MAX_IMAGE_WIDTH = 5184
     MIN_IMAGE_HEIGHT = 32
@@ -58,7 +63,9 @@ class S3ClientConstants(enum.Enum):
     S3_NAME = 's3'
     ACL_PUBLIC_READ = 'public-read'
     SUCCESSFUL_UPLOAD_MSG = 'File object uploaded to https://{bucket_name}.s3.{bucket_region}.amazonaws.com/{file_name}'
-    PICTURE_FILE_NAME = 'users/{user_id}/profile_pics/{picture_id}.{file_extension}'
+    # Pictures are stored by SHA-256 hash of their content, so identical uploads share the same objects.
+    CONTENT_FILE_NAME = 'pictures/{content_hash}/original.{file_extension}'
+    CONTENT_FOLDER_NAME = 'pictures/{content_hash}/'
     CONTENT_TYPE_JPEG = 'image/jpeg'
     UPLOADED_FILE_URL = 'https://{bucket_name}.s3.{bucket_region}.amazonaws.com/{file_name}'
     AWS_S3_RESPONSE_DATETIME_FORMAT = '%a, %d %b %Y %H:%M:%S %Z'
@@ -66,7 +73,64 @@ class S3ClientConstants(enum.Enum):
         'users/{user_id}/profile_pics'
     )
     SUCCESSFUL_DELETE_MSG = 'File object successfully deleted {file_path}.'
+    SUCCESSFUL_BATCH_DELETE_MSG = '{deleted_count} file objects successfully deleted with prefix {prefix}.'
+    FAILED_DELETE_MSG = 'File object {file_path} not deleted, error: {code} {message}.'
     GMT_TIMEZONE = 'GMT'
+    LIST_OBJECTS_PAGINATOR = 'list_objects_v2'
+    # AWS S3 limit of keys in a single 'delete_objects' request.
+    MAX_DELETE_BATCH_SIZE = 1000
+    # Connection pool settings of aiobotocore client.
+    DEFAULT_MAX_POOL_CONNECTIONS = 10
+    CONNECT_TIMEOUT = 5
+    READ_TIMEOUT = 30
+    MAX_RETRY_ATTEMPTS = 3
+    RETRY_MODE = 'standard'
+    # Throughput benchmark settings.
+    BENCHMARK_DEFAULT_OBJECTS_COUNT = 200
+    BENCHMARK_OBJECT_SIZE = 64 * 1024
+    BENCHMARK_FOLDER_NAME = 'benchmarks/{run_id}/'
+    BENCHMARK_FILE_NAME = 'benchmarks/{run_id}/{index}.bin'
+    BENCHMARK_CONTENT_TYPE = 'application/octet-stream'
+
+
+class UserPictureRenditionConstants(enum.Enum):
+    """UserPicture rendition constants."""
+    ORIGINAL_SIZE = 'original'
+    THUMBNAIL_SIZE = 'thumbnail'
+    SMALL_SIZE = 'small'
+    MEDIUM_SIZE = 'medium'
+    # Maximum width and height in pixels of rendition, ordered from the largest to the smallest size.
+    SIZES = {
+        MEDIUM_SIZE: 800,
+        SMALL_SIZE: 320,
+        THUMBNAIL_SIZE: 128,
+    }
+    SIZE_REGEX = r'^(original|thumbnail|small|medium)$'
+    JPEG_FORMAT = 'JPEG'
+    PNG_FORMAT = 'PNG'
+    WEBP_FORMAT = 'WEBP'
+    AVIF_FORMAT = 'AVIF'
+    # Encoded in addition to JPEG or PNG renditions if Pillow build supports them.
+    OPTIONAL_FORMATS = (WEBP_FORMAT, AVIF_FORMAT)
+    FORMAT_REGEX = r'^(jpeg|png|webp|avif)$'
+    FILE_EXTENSIONS = {
+        JPEG_FORMAT: 'jpg',
+        PNG_FORMAT: 'png',
+        WEBP_FORMAT: 'webp',
+        AVIF_FORMAT: 'avif',
+    }
+    CONTENT_TYPES = {
+        JPEG_FORMAT: 'image/jpeg',
+        PNG_FORMAT: 'image/png',
+        WEBP_FORMAT: 'image/webp',
+        AVIF_FORMAT: 'image/avif',
+    }
+    ALPHA_MODES = ('RGBA', 'LA', 'PA')
+    ENCODING_QUALITY = 80
+    FILE_NAME = 'pictures/{content_hash}/{size}.{file_extension}'
+    THREAD_EXECUTOR = 'thread'
+    PROCESS_EXECUTOR = 'process'
+    DEFAULT_MAX_WORKERS = 2
 
 
 class UserRouteConstants(enum.Enum):
@@ -75,3 +139,6 @@ class UserRouteConstants(enum.Enum):
     DEFAULT_START_PAGE = 1
     DEFAULT_PAGE_SIZE = 20
     MAX_PAGINATION_PAGE_SIZE = 101
+    # User data is kept out of shared caches, browser revalidates it with 'If-None-Match' on every request.
+    DETAIL_CACHE_CONTROL = 'private, no-cache'
+    LIST_CACHE_CONTROL = 'private, no-cache'
@@ -4,6 +4,7 @@ import enum
 class AuthExceptionMsgs(enum.Enum):
     """Constants for Auth exception messages."""
     WRONG_USERNAME_OR_PASSWORD = 'Incorrect username or password.'
+    PASSWORD_HASHING_QUEUE_FULL = 'Server is busy processing passwords, please try again later.'
 
 
 class EmailConfirmationTokenExceptionMsgs(enum.Enum):
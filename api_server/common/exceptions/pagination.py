@@ -0,0 +1,6 @@
+import enum
+
+
+class PaginationExceptionMsgs(enum.Enum):
+    """Constants for pagination exception messages."""
+    INVALID_CURSOR = "Pagination cursor: '{cursor}' is invalid."
@@ -26,3 +26,4 @@ class UserPictureExceptionMsgs(enum.Enum):
         )
     )
     USER_PICTURE_NOT_FOUND = "UserPicture with {column}: '{value}' not found."
+    PICTURE_FILE_NOT_FOUND = "Picture file: '{file_name}' not found."
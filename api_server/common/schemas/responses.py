@@ -1,10 +1,16 @@
-from typing import Any
+from typing import Any, Generic, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import Field
+from pydantic.generics import GenericModel
 
+DataT = TypeVar('DataT')
 
-class ResponseBaseSchema(BaseModel):
-    """Base http response schema."""
+
+class ResponseBaseSchema(GenericModel, Generic[DataT]):
+    """Base http response schema, parametrized with response data schema, e.g. 'ResponseBaseSchema[UserOutputSchema]'.
+
+    Not parametrized schema accepts any response data.
+    """
     status_code: Any = Field()
-    data: Any = Field()
+    data: DataT = Field()
     errors: Any = Field()
@@ -29,7 +29,7 @@ from app.celery_base import create_celery_app
 from auth.cruds import ChangePasswordTokenCRUD, EmailConfirmationTokenCRUD
 from auth.models import ChangePasswordToken, EmailConfirmationToken
 from auth.services import AuthService
-from auth.utils.jwt_tokens import create_jwt_token, create_token_payload
+from auth.utils.jwt_tokens import create_jwt_token, create_token_digest, create_token_payload
 from charities.models import Charity, Employee
 from charities.schemas import CharityInputSchema, EmployeeInputSchema, EmployeeRoleInputSchema
 from charities.services import CharityEmployeeService, CharityService, EmployeeRoleService
@@ -456,9 +456,13 @@ class TestMixin:
         Returns:
         An instance of UserImageFile object.
         """
+        request_test_user_pictures_data.TEST_USER_PICTURE_VALID_JPEG.seek(0)
+        image_data = request_test_user_pictures_data.TEST_USER_PICTURE_VALID_JPEG.read()
+        request_test_user_pictures_data.TEST_USER_PICTURE_VALID_JPEG.seek(0)
         return UserImageFile(
-            db_user_picture=test_user_picture,
-            image_data=request_test_user_pictures_data.TEST_USER_PICTURE_VALID_JPEG.read(),
+            user_id=test_user_picture.user_id,
+            picture_id=test_user_picture.id,
+            image_data=image_data,
             content_type=request_test_user_pictures_data.TEST_USER_PICTURE_CONTENT_TYPE,
             file_extension=request_test_user_pictures_data.TEST_USER_PICTURE_EXTENSION,
         )
@@ -537,8 +541,7 @@ class TestMixin:
         db_token.created_at = db_token.created_at - timedelta(**EmailConfirmationTokenConstants.TIMEDELTA_10_MIN.value)
         db_session.add(db_token)
         await db_session.commit()
-        await db_session.refresh(db_token)
-        return db_token
+        return await email_confirmation_token_crud._select_email_confirmation_token(column='id', value=db_token.id)
 
     @pytest_asyncio.fixture
     async def test_activated_email_confirmation_token(
@@ -559,8 +562,9 @@ class TestMixin:
         """
         await email_confirmation_token_crud._activate_user_by_id(test_email_confirmation_token.user.id)
         await email_confirmation_token_crud._expire_email_confirmation_token_by_id(test_email_confirmation_token.id)
-        await db_session.refresh(test_email_confirmation_token)
-        return test_email_confirmation_token
+        return await email_confirmation_token_crud._select_email_confirmation_token(
+            column='id', value=test_email_confirmation_token.id,
+        )
 
     @pytest_asyncio.fixture(autouse=True)
     async def change_password_token_crud(self, db_session: AsyncSession) -> ChangePasswordTokenCRUD:
@@ -600,8 +604,7 @@ class TestMixin:
         db_token.created_at = db_token.created_at - timedelta(**ChangePasswordTokenConstants.TIMEDELTA_10_MIN.value)
         db_session.add(db_token)
         await db_session.commit()
-        await db_session.refresh(db_token)
-        return db_token
+        return await change_password_token_crud._select_change_password_token(column='id', value=db_token.id)
 
     @pytest_asyncio.fixture
     async def test_db_expired_change_password_token(
@@ -621,8 +624,9 @@ class TestMixin:
         A ChangePasswordToken object with filled 'expired_at' field.
         """
         await change_password_token_crud._expire_change_password_token_by_id(test_change_password_token.id)
-        await db_session.refresh(test_change_password_token)
-        return test_change_password_token
+        return await change_password_token_crud._select_change_password_token(
+            column='id', value=test_change_password_token.id,
+        )
 
     @pytest_asyncio.fixture
     async def test_jwt_expired_change_password_token(
@@ -648,10 +652,12 @@ class TestMixin:
         )
         jwt_token = create_jwt_token(payload=jwt_token_payload, key=test_change_password_token.user.password)
         test_change_password_token.token = jwt_token
+        test_change_password_token.token_digest = create_token_digest(jwt_token)
         db_session.add(test_change_password_token)
         await db_session.commit()
-        await db_session.refresh(test_change_password_token)
-        return test_change_password_token
+        return await change_password_token_crud._select_change_password_token(
+            column='id', value=test_change_password_token.id,
+        )
 
     @contextmanager
     def patch_model_time(self, time_to_freeze=None, model=None, field=None, tick=True):
@@ -862,7 +868,8 @@ class TestMixin:
                 **request_test_charity_employee_data.ADD_CHARITY_EMPLOYEE_MANAGER_TEST_DATA
             ),
         )
-        await db_session.refresh(random_test_charity)
+        # Reloading random_test_charity relationships with newly added employee.
+        await charity_employee_service.get_charity_by_id(random_test_charity.id)
         return employee
 
     @pytest_asyncio.fixture
@@ -943,8 +950,9 @@ class TestMixin:
             jwt_subject=authenticated_random_test_user.username,
             role_data=EmployeeRoleInputSchema(**request_test_employee_role_data.ADD_EMPLOYEE_ROLE_SUPERVISOR_TEST_DATA),
         )
-        await db_session.refresh(test_employee_manager)
-        return test_employee_manager
+        return await employee_role_service.charity_employee_db_service.get_charity_employee_by_id(
+            test_employee_manager.id,
+        )
 
     @pytest_asyncio.fixture(autouse=True)
     async def fundraise_service(self, db_session: AsyncSession) -> FundraiseService:
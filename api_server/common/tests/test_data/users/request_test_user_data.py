@@ -6,6 +6,14 @@ ADD_USER_TEST_DATA = {
     'password': '12345678',
     'phone_number': '+380991112233',
 }
+ADD_SECOND_USER_TEST_DATA = {
+    'username': 'test_jane',
+    'first_name': 'jane',
+    'last_name': 'bar',
+    'email': 'test_jane@jane.com',
+    'password': '12345678',
+    'phone_number': '+380994445577',
+}
 DUMMY_USER_UUID = '7c1b7fb5-20f2-4988-b075-e4cc236f7784'
 ADD_USER_EMPTY_TEST_DATA = {}
 UPDATE_USER_TEST_DATA = {
@@ -1,5 +1,6 @@
-from fastapi import Request
+from fastapi import FastAPI, Request
 
+from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
@@ -7,40 +8,80 @@ from sqlalchemy.orm import sessionmaker
 Base = declarative_base()
 
 
-def create_engine(database_url: str, echo: bool, future: bool) -> AsyncEngine:
+def create_engine(database_url: str, echo: bool, future: bool, **pool_settings) -> AsyncEngine:
     """Create sqlalchemy async engine.
 
     Args:
         database_url: postgres database url.
         echo: sqlalchemy echo logs.
         future: sqlalchemy future bool.
+        pool_settings: optional sqlalchemy connection pool settings.
 
     Returns:
     newly created AsyncEngine instance.
     """
-    return create_async_engine(database_url, echo=echo, future=future)
+    return create_async_engine(database_url, echo=echo, future=future, **pool_settings)
 
 
-async def get_session(request: Request) -> AsyncSession:
-    """Creates sqlalchemy async session based on config from request app.
+def create_pooled_engine(config: BaseModel) -> AsyncEngine:
+    """Create sqlalchemy async engine with connection pool settings from app config.
 
     Args:
-        request: fastapi Request object.
+        config: fastapi app config.
 
     Returns:
-    newly created AsyncSession instance.
+    newly created AsyncEngine instance.
     """
-    engine = create_engine(
-        database_url=request.app.app_config.POSTGRES_DATABASE_URL,
-        echo=request.app.app_config.API_SQLALCHEMY_ECHO,
-        future=request.app.app_config.API_SQLALCHEMY_FUTURE,
+    return create_engine(
+        database_url=config.POSTGRES_DATABASE_URL,
+        echo=config.API_SQLALCHEMY_ECHO,
+        future=config.API_SQLALCHEMY_FUTURE,
+        pool_size=config.API_SQLALCHEMY_POOL_SIZE,
+        max_overflow=config.API_SQLALCHEMY_MAX_OVERFLOW,
+        pool_recycle=config.API_SQLALCHEMY_POOL_RECYCLE,
+        pool_pre_ping=config.API_SQLALCHEMY_POOL_PRE_PING,
+        pool_timeout=config.API_SQLALCHEMY_POOL_TIMEOUT,
     )
-    async_session = sessionmaker(
-        engine, class_=AsyncSession, expire_on_commit=False,
+
+
+async def start_db_engine(app: FastAPI) -> None:
+    """Creates application-lifetime AsyncEngine and session factory and stores them in FastAPI app.
+
+    Args:
+        app: FastAPI instance.
+
+    Returns:
+    Nothing.
+    """
+    app.db_engine = create_pooled_engine(app.app_config)
+    app.db_session_maker = sessionmaker(
+        app.db_engine, class_=AsyncSession, expire_on_commit=False,
     )
-    async with async_session() as session:
+
+
+async def dispose_db_engine(app: FastAPI) -> None:
+    """Closes all connections of application-lifetime AsyncEngine connection pool.
+
+    Args:
+        app: FastAPI instance.
+
+    Returns:
+    Nothing.
+    """
+    await app.db_engine.dispose()
+
+
+async def get_session(request: Request) -> AsyncSession:
+    """Checks out sqlalchemy async session from request app's engine connection pool.
+
+    Args:
+        request: fastapi Request object.
+
+    Returns:
+    AsyncSession instance bound to application-lifetime AsyncEngine.
+    """
+    async with request.app.db_session_maker() as session:
         try:
             yield session
         finally:
             await session.close()
-            await engine.dispose()
@@ -11,7 +11,8 @@ from charities.models import Charity, CharityEmployeeAssociation, CharityEmploye
 from common.constants.api import ApiConstants
 from db import Base
 from fundraisers.models import Fundraise, FundraiseStatus
-from users.models import User, UserPicture
+from outbox.models import OutboxMessage
+from users.models import User, UserPicture, UserPictureContent, UserPictureRendition
 
 Config = get_app_config(ApiConstants.DEVELOPMENT_CONFIG.value)
 
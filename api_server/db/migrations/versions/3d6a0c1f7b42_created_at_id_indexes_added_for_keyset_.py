@@ -0,0 +1,26 @@
+"""(created_at, id) indexes added for keyset pagination.
+
+Revision ID: 3d6a0c1f7b42
+Revises: 2b3f329f911f
+Create Date: 2026-10-17 10:12:41.508213
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '3d6a0c1f7b42'
+down_revision = '2b3f329f911f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_users_created_at_id', 'users', ['created_at', 'id'], unique=False)
+    op.create_index('ix_charities_created_at_id', 'charities', ['created_at', 'id'], unique=False)
+    op.create_index('ix_fundraisers_created_at_id', 'fundraisers', ['created_at', 'id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_fundraisers_created_at_id', table_name='fundraisers')
+    op.drop_index('ix_charities_created_at_id', table_name='charities')
+    op.drop_index('ix_users_created_at_id', table_name='users')
@@ -0,0 +1,55 @@
+"""Foreign key and lookup indexes added.
+
+Revision ID: 7f2e9b4c5a13
+Revises: 3d6a0c1f7b42
+Create Date: 2026-10-17 11:02:18.734105
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '7f2e9b4c5a13'
+down_revision = '3d6a0c1f7b42'
+branch_labels = None
+depends_on = None
+
+# (index name, table name, columns) of indexes on foreign key columns.
+FOREIGN_KEY_INDEXES = [
+    ('ix_email-confirmation-token_user_id', 'email-confirmation-token', ['user_id']),
+    ('ix_change-password-token_user_id', 'change-password-token', ['user_id']),
+    ('ix_fundraisers_charity_id', 'fundraisers', ['charity_id']),
+    ('ix_fundraise_status_association_fundraise_id', 'fundraise_status_association', ['fundraise_id']),
+    ('ix_fundraise_status_association_status_id', 'fundraise_status_association', ['status_id']),
+    ('ix_charity_employee_association_employee_id', 'charity_employee_association', ['employee_id']),
+    ('ix_charity_employee_role_association_role_id', 'charity_employee_role_association', ['role_id']),
+]
+# (index name, table name) of partial indexes for user's last non-expired token lookups.
+NOT_EXPIRED_TOKEN_INDEXES = [
+    ('ix_email_confirmation_token_user_id_not_expired', 'email-confirmation-token'),
+    ('ix_change_password_token_user_id_not_expired', 'change-password-token'),
+]
+
+
+def upgrade():
+    # 'CREATE INDEX CONCURRENTLY' can't run inside a transaction block.
+    with op.get_context().autocommit_block():
+        for index_name, table_name, columns in FOREIGN_KEY_INDEXES:
+            op.create_index(op.f(index_name), table_name, columns, unique=False, postgresql_concurrently=True)
+        for index_name, table_name in NOT_EXPIRED_TOKEN_INDEXES:
+            op.create_index(
+                index_name,
+                table_name,
+                ['user_id'],
+                unique=False,
+                postgresql_where=sa.text('expired_at IS NULL'),
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for index_name, table_name in reversed(NOT_EXPIRED_TOKEN_INDEXES):
+            op.drop_index(index_name, table_name=table_name, postgresql_concurrently=True)
+        for index_name, table_name, _ in reversed(FOREIGN_KEY_INDEXES):
+            op.drop_index(op.f(index_name), table_name=table_name, postgresql_concurrently=True)
@@ -0,0 +1,35 @@
+"""'token_digest' field added to EmailConfirmationToken and ChangePasswordToken models.
+
+Revision ID: 9b1c4e8d2f60
+Revises: 7f2e9b4c5a13
+Create Date: 2026-10-17 11:48:05.391276
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '9b1c4e8d2f60'
+down_revision = '7f2e9b4c5a13'
+branch_labels = None
+depends_on = None
+
+TOKEN_TABLES = ['email-confirmation-token', 'change-password-token']
+
+
+def upgrade():
+    for table_name in TOKEN_TABLES:
+        op.add_column(table_name, sa.Column('token_digest', sa.LargeBinary(length=32), nullable=True))
+        # Backfill existing rows with the same SHA-256 digest application computes in 'create_token_digest'.
+        op.execute(
+            f'UPDATE "{table_name}" SET token_digest = sha256(convert_to(token, \'UTF8\')) WHERE token IS NOT NULL'
+        )
+        op.create_unique_constraint(f'{table_name}_token_digest_key', table_name, ['token_digest'])
+        op.drop_constraint(f'{table_name}_token_key', table_name, type_='unique')
+
+
+def downgrade():
+    for table_name in reversed(TOKEN_TABLES):
+        op.create_unique_constraint(f'{table_name}_token_key', table_name, ['token'])
+        op.drop_constraint(f'{table_name}_token_digest_key', table_name, type_='unique')
+        op.drop_column(table_name, 'token_digest')
@@ -9,5 +9,8 @@ if [ $RUN_FOR_EVER = "True" ]
 
 elif [  $RUN_FOR_EVER = "False" ]
     then
-        cd /usr/src/app/ && celery -A app.celery_base:app worker -l INFO --detach && python api_server_startup.py
+        cd /usr/src/app/ && celery -A app.celery_base:app worker -l INFO --detach
+        # Outbox relay sends Celery tasks created by api server to broker.
+        python outbox_relay_startup.py &
+        python api_server_startup.py
 fi
@@ -1,7 +1,8 @@
 from fundraisers.db_services.fundraise_statuses import FundraiseStatusDBService
-from fundraisers.db_services.fundraisers import FundraiseDBService
+from fundraisers.db_services.fundraisers import FundraiseDBService, FundraiseListItem
 
 __all__ = [
     'FundraiseDBService',
+    'FundraiseListItem',
     'FundraiseStatusDBService',
 ]
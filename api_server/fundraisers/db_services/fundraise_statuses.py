@@ -3,8 +3,11 @@ from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from common.constants.cache import ReadThroughCacheConstants
 from fundraisers.models import Fundraise, FundraiseStatus, FundraiseStatusAssociation
 from fundraisers.schemas import FundraiseStatusInputSchema
+from fundraisers.utils.fundraise_status_registry import fundraise_status_registry
+from utils.cache import read_through_cache
 from utils.logging import setup_logging
 
 
@@ -26,7 +29,26 @@ class FundraiseStatusDBService:
         return await self._get_fundraise_status_by_name(name)
 
     async def _get_fundraise_status_by_name(self, name: str) -> FundraiseStatus | None:
-        return await self._select_fundraise_status(column='name', value=name)
+        registered_fundraise_status = fundraise_status_registry.get(name)
+        if registered_fundraise_status:
+            # Attaching registered status to current session without querying the db.
+            return await self.session.merge(registered_fundraise_status, load=False)
+        db_fundraise_status = await self._select_fundraise_status(column='name', value=name)
+        if db_fundraise_status:
+            fundraise_status_registry.register(db_fundraise_status)
+        return db_fundraise_status
+
+    async def get_fundraise_statuses(self) -> list[FundraiseStatus]:
+        """Get all FundraiseStatus objects from database.
+
+        Returns:
+        list of FundraiseStatus objects.
+        """
+        return await self._get_fundraise_statuses()
+
+    async def _get_fundraise_statuses(self) -> list[FundraiseStatus]:
+        self._log.debug('Getting all FundraiseStatus objects from the db.')
+        return (await self.session.execute(select(FundraiseStatus))).scalars().all()
 
     async def _select_fundraise_status(self, column: str, value: UUID | str) -> FundraiseStatus | None:
         self._log.debug(f'Getting FundraiseStatus with "{column}": "{value}" from the db.')
@@ -50,6 +72,7 @@ class FundraiseStatusDBService:
         self.session.add(db_fundraise_status)
         await self.session.commit()
         await self.session.refresh(db_fundraise_status)
+        fundraise_status_registry.register(db_fundraise_status)
         self._log.debug(f'FundraiseStatus with name: "{db_fundraise_status.name}" successfully created.')
         return db_fundraise_status
 
@@ -75,7 +98,8 @@ class FundraiseStatusDBService:
         fundraise_status_association.status = fundraise_status
         self.session.add(fundraise_status_association)
         await self.session.commit()
-        await self.session.refresh(fundraise_status_association)
+        await read_through_cache.invalidate(ReadThroughCacheConstants.FUNDRAISERS_NAMESPACE.value, fundraise.id)
+        await self.session.refresh(fundraise_status_association, attribute_names=['created_at'])
         self._log.debug(
             f'FundraiseStatus with name: "{fundraise_status.name}" added to Fundraise with id: {fundraise.id}.'
         )
@@ -1,12 +1,29 @@
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import func, update
+from sqlalchemy import update
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.sql import Select
 
-from fundraisers.models import Fundraise
+from charities.models import Charity, Employee
+from common.constants.cache import ReadThroughCacheConstants
+from fundraisers.models import Fundraise, FundraiseStatus, FundraiseStatusAssociation
 from fundraisers.schemas import FundraiseInputSchema, FundraiseIsDonatableUpdateSchema, FundraiseUpdateSchema
+from utils.cache import read_through_cache
+from utils.count_providers import pagination_count_provider
 from utils.logging import setup_logging
+from utils.orm_helpers import KeyedBundle, ProjectedItem, apply_keyset_pagination, group_by_attribute
+
+
+class FundraiseListItem(ProjectedItem):
+    """Fundraise of list page with attributes required by FundraiseFullOutputSchema."""
+
+    __slots__ = (
+        'id', 'title', 'description', 'goal', 'ending_at', 'is_donatable', 'created_at', 'charity', 'statuses',
+    )
 
 
 class FundraiseDBService:
@@ -15,32 +32,112 @@ class FundraiseDBService:
         self._log = setup_logging(self.__class__.__name__)
         self.session = session
 
-    async def get_fundraisers(self, page: int, page_size: int) -> list[Fundraise]:
-        """Get Fundraise objects from database.
+    def _fundraise_load_options(self) -> tuple:
+        # Relationships required by FundraiseFullOutputSchema.
+        return (
+            joinedload(Fundraise.charity),
+            selectinload(Fundraise.statuses).joinedload(FundraiseStatusAssociation.status),
+        )
+
+    async def get_fundraisers(self, page: int, page_size: int) -> list[FundraiseListItem]:
+        """Get fundraisers from database with column-projected queries.
 
         Args:
             page: number of result page.
             page_size: number of items per page.
 
         Returns:
-        list of Fundraise objects.
+        list of FundraiseListItem objects.
         """
         return await self._get_fundraisers(page, page_size)
 
-    async def _get_fundraisers(self, page: int, page_size: int) -> None:
+    async def _get_fundraisers(self, page: int, page_size: int) -> list[FundraiseListItem]:
         self._log.debug(f'Getting fundraisers from the db, page: {page} with page size: {page_size}.')
-        q = select(Fundraise).limit(page_size).offset((page - 1) * page_size)
-        return (await self.session.execute(q)).scalars().all()
+        q = self._select_fundraise_list_columns().limit(page_size).offset((page - 1) * page_size)
+        return await self._select_fundraise_list_items(q)
 
-    async def _get_total_fundraisers(self) -> int:
-        """Counts number of fundraisers in Fundraise table.
+    async def get_fundraisers_by_cursor(
+            self, after: tuple[datetime, UUID] | None, page_size: int,
+    ) -> list[FundraiseListItem]:
+        """Get fundraisers from database with keyset pagination and column-projected queries.
+
+        Args:
+            after: tuple with 'created_at' and 'id' of the last fundraise on a previous page, None for the first page.
+            page_size: number of items per page.
 
         Returns:
-        Quantity of fundraise objects in Fundraise table.
+        list of FundraiseListItem objects with one extra FundraiseListItem object in case next page exists.
         """
-        total_fundraisers = (await self.session.execute(select(func.count(Fundraise.id)))).scalar_one()
-        self._log.debug(f'Fundraise table has totally: "{total_fundraisers}" fundraisers.')
-        return total_fundraisers
+        return await self._get_fundraisers_by_cursor(after, page_size)
+
+    async def _get_fundraisers_by_cursor(
+            self, after: tuple[datetime, UUID] | None, page_size: int,
+    ) -> list[FundraiseListItem]:
+        self._log.debug(f'Getting fundraisers from the db after: {after} with page size: {page_size}.')
+        q = apply_keyset_pagination(
+            self._select_fundraise_list_columns(),
+            model=Fundraise,
+            after=after,
+            page_size=page_size,
+        )
+        return await self._select_fundraise_list_items(q)
+
+    def _select_fundraise_list_columns(self) -> Select:
+        # Columns required by FundraiseFullOutputSchema, 'created_at' is used for keyset pagination cursor.
+        return select(
+            Fundraise.id,
+            Fundraise.title,
+            Fundraise.description,
+            Fundraise.goal,
+            Fundraise.ending_at,
+            Fundraise.is_donatable,
+            Fundraise.created_at,
+            KeyedBundle(
+                'charity', Charity.id, Charity.title, Charity.description, Charity.email, Charity.phone_number,
+            ),
+        ).select_from(
+            Fundraise,
+        ).join(
+            Charity, Charity.id == Fundraise.charity_id,
+        )
+
+    async def _select_fundraise_list_items(self, q: Select) -> list[FundraiseListItem]:
+        # Rows of the page and their statuses are not added to identity map.
+        fundraise_rows = (await self.session.execute(q)).all()
+        if not fundraise_rows:
+            return []
+        status_rows = group_by_attribute(
+            await self._get_fundraisers_status_rows([fundraise_row.id for fundraise_row in fundraise_rows]),
+            'fundraise_id',
+        )
+        return [
+            FundraiseListItem(fundraise_row, statuses=status_rows[fundraise_row.id]) for fundraise_row in fundraise_rows
+        ]
+
+    async def _get_fundraisers_status_rows(self, fundraise_ids: list[UUID]) -> list[Row]:
+        q = select(
+            FundraiseStatusAssociation.fundraise_id,
+            FundraiseStatusAssociation.id,
+            FundraiseStatusAssociation.created_at,
+            FundraiseStatus.name,
+        ).join(
+            FundraiseStatus, FundraiseStatus.id == FundraiseStatusAssociation.status_id,
+        ).where(
+            FundraiseStatusAssociation.fundraise_id.in_(fundraise_ids),
+        ).order_by(
+            FundraiseStatusAssociation.created_at, FundraiseStatusAssociation.id,
+        )
+        return (await self.session.execute(q)).all()
+
+    async def _get_total_fundraisers(self) -> tuple[int, bool]:
+        """Counts number of fundraisers in Fundraise table with configured pagination count strategy.
+
+        Returns:
+        tuple with quantity of fundraise objects in Fundraise table and bool whether quantity is exact.
+        """
+        total_fundraisers, is_exact = await pagination_count_provider.count(self.session, Fundraise)
+        self._log.debug(f'Fundraise table has totally: "{total_fundraisers}" fundraisers, exact: {is_exact}.')
+        return total_fundraisers, is_exact
 
     async def add_fundraise(self, fundraise: FundraiseInputSchema) -> Fundraise:
         """Add Fundraise object to the database.
@@ -57,6 +154,10 @@ class FundraiseDBService:
         db_fundraise = Fundraise(**fundraise.dict())
         self.session.add(db_fundraise)
         await self.session.commit()
+        pagination_count_provider.invalidate(Fundraise)
+        await read_through_cache.invalidate(
+            ReadThroughCacheConstants.CHARITIES_NAMESPACE.value, db_fundraise.charity_id,
+        )
         await self.session.refresh(db_fundraise)
         self._log.debug(f'Fundraise with id: "{db_fundraise.id}" successfully created.')
         return db_fundraise
@@ -77,7 +178,16 @@ class FundraiseDBService:
 
     async def _select_fundraise(self, column: str, value: UUID | str) -> Fundraise | None:
         self._log.debug(f'Getting Fundraise with "{column}": "{value}" from the db.')
-        q = select(Fundraise).where(Fundraise.__table__.columns[column] == value)
+        q = (
+            select(Fundraise)
+            .where(Fundraise.__table__.columns[column] == value)
+            .options(
+                *self._fundraise_load_options(),
+                # Charity employees are used for fundraise permission checks.
+                joinedload(Fundraise.charity).selectinload(Charity.employees).joinedload(Employee.user),
+            )
+            .execution_options(populate_existing=True)
+        )
         result = await self.session.execute(q)
         return result.scalars().one_or_none()
 
@@ -98,7 +208,9 @@ class FundraiseDBService:
         await self.session.commit()
         # Return updated fundraise.
         self._log.debug(f'Fundraise with id: "{id_}" successfully updated.')
-        return await self._get_fundraise_by_id(id_=id_)
+        db_fundraise = await self._get_fundraise_by_id(id_=id_)
+        await self._invalidate_cached_fundraise(db_fundraise)
+        return db_fundraise
 
     async def delete_fundraise(self, fundraise: Fundraise) -> None:
         """Delete fundraise object from the database.
@@ -114,8 +226,15 @@ class FundraiseDBService:
     async def _delete_fundraise(self, fundraise: Fundraise) -> None:
         await self.session.delete(fundraise)
         await self.session.commit()
+        pagination_count_provider.invalidate(Fundraise)
+        await self._invalidate_cached_fundraise(fundraise)
         self._log.debug(f'Fundraise with id: "{fundraise.id}" successfully deleted.')
 
+    async def _invalidate_cached_fundraise(self, fundraise: Fundraise) -> None:
+        # Cached charity includes its fundraisers data.
+        await read_through_cache.invalidate(ReadThroughCacheConstants.FUNDRAISERS_NAMESPACE.value, fundraise.id)
+        await read_through_cache.invalidate(ReadThroughCacheConstants.CHARITIES_NAMESPACE.value, fundraise.charity_id)
+
     async def update_fundraise_is_donatable_status(
             self, id_: UUID, update_data: FundraiseIsDonatableUpdateSchema
     ) -> Fundraise:
@@ -137,4 +256,6 @@ class FundraiseDBService:
         await self.session.commit()
         # Return updated fundraise.
         self._log.debug(f'Fundraise with id: "{id_}" successfully updated "is_donatable" field.')
-        return await self._get_fundraise_by_id(id_=id_)
+        db_fundraise = await self._get_fundraise_by_id(id_=id_)
+        await self._invalidate_cached_fundraise(db_fundraise)
+        return db_fundraise
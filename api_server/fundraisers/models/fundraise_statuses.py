@@ -15,11 +15,15 @@ class FundraiseStatusAssociation(Base):
     __tablename__ = 'fundraise_status_association'
 
     id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4)
-    fundraise_id = Column(UUID(as_uuid=True), ForeignKey('fundraisers.id', ondelete='CASCADE'), nullable=False)
-    status_id = Column(UUID(as_uuid=True), ForeignKey('fundraise_statuses.id', ondelete='CASCADE'), nullable=False)
+    fundraise_id = Column(
+        UUID(as_uuid=True), ForeignKey('fundraisers.id', ondelete='CASCADE'), nullable=False, index=True,
+    )
+    status_id = Column(
+        UUID(as_uuid=True), ForeignKey('fundraise_statuses.id', ondelete='CASCADE'), nullable=False, index=True,
+    )
     created_at = Column(DateTime, server_default=func.now())
-    fundraise = relationship('Fundraise', back_populates='statuses', lazy='selectin')
-    status = relationship('FundraiseStatus', back_populates='fundraisers', lazy='selectin')
+    fundraise = relationship('Fundraise', back_populates='statuses', lazy='raise')
+    status = relationship('FundraiseStatus', back_populates='fundraisers', lazy='raise')
     name = association_proxy('status', 'name')
 
     def __repr__(self):
@@ -39,7 +43,7 @@ class FundraiseStatus(Base):
     created_at = Column(DateTime, server_default=func.now())
 
     fundraisers = relationship(
-        'FundraiseStatusAssociation', back_populates='status', lazy='selectin',
+        'FundraiseStatusAssociation', back_populates='status', lazy='raise',
     )
 
     __mapper_args__ = {'eager_defaults': True}
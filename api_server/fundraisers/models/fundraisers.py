@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Numeric, String, func
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Numeric, String, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -12,9 +12,14 @@ class Fundraise(Base):
     """A model representing a fundraise."""
 
     __tablename__ = 'fundraisers'
+    __table_args__ = (
+        Index('ix_fundraisers_created_at_id', 'created_at', 'id'),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4)
-    charity_id = Column(UUID(as_uuid=True), ForeignKey('charities.id', ondelete='CASCADE'), nullable=False)
+    charity_id = Column(
+        UUID(as_uuid=True), ForeignKey('charities.id', ondelete='CASCADE'), nullable=False, index=True,
+    )
     title = Column(String(length=FundraiseModelConstants.CHAR_SIZE_512.value), nullable=False)
     description = Column(String(length=FundraiseModelConstants.CHAR_SIZE_8192.value), nullable=False)
     goal = Column(
@@ -29,10 +34,14 @@ class Fundraise(Base):
     is_donatable = Column(Boolean, nullable=False, default=True)
 
     charity = relationship(
-        'Charity', back_populates='fundraisers', uselist=False, lazy='selectin',
+        'Charity', back_populates='fundraisers', uselist=False, lazy='raise',
     )
     statuses = relationship(
-        'FundraiseStatusAssociation', back_populates='fundraise', lazy='selectin', cascade='all, delete',
+        'FundraiseStatusAssociation',
+        back_populates='fundraise',
+        lazy='raise',
+        cascade='all, delete',
+        passive_deletes=True,
     )
 
     __mapper_args__ = {'eager_defaults': True}
@@ -1,26 +1,38 @@
+from typing import Union
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, Response, status
-
-from fastapi_jwt_auth import AuthJWT
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 
+from auth.utils.current_user import CurrentUser, get_current_user
 from common.constants.fundraisers import FundraiseRouteConstants
 from common.schemas.responses import ResponseBaseSchema
 from fundraisers.routers.fundraise_statuses import fundraise_statuses_router
 from fundraisers.schemas import (
+    FundraiseCursorPaginatedOutputSchema,
     FundraiseFullOutputSchema,
     FundraiseInputSchema,
     FundraisePaginatedOutputSchema,
     FundraiseUpdateSchema,
 )
 from fundraisers.services import FundraiseService
+from utils.compression import route_compression
+from utils.json_responses import (
+    ORJSONModelResponse,
+    create_conditional_response,
+    serialize_response_data,
+    wrap_response_data,
+)
 
 fundraisers_router = APIRouter(prefix='/fundraisers', tags=['Fundraisers'])
 fundraisers_router.include_router(fundraise_statuses_router, prefix='/{fundraise_id}')
 
 
-@fundraisers_router.get('/', response_model=ResponseBaseSchema)
+@fundraisers_router.get(
+    '/', response_model=ResponseBaseSchema[Union[FundraisePaginatedOutputSchema, FundraiseCursorPaginatedOutputSchema]],
+)
+@route_compression(gzip_level=FundraiseRouteConstants.LIST_GZIP_LEVEL.value)
 async def get_fundraisers(
+        request: Request,
         page: int = Query(
             default=FundraiseRouteConstants.DEFAULT_START_PAGE.value,
             gt=FundraiseRouteConstants.ZERO_NUMBER.value,
@@ -30,97 +42,114 @@ async def get_fundraisers(
             gt=FundraiseRouteConstants.ZERO_NUMBER.value,
             lt=FundraiseRouteConstants.MAX_PAGINATION_PAGE_SIZE.value,
         ),
+        cursor: str | None = Query(default=None),
         fundraise_service: FundraiseService = Depends()
-) -> ResponseBaseSchema:
+) -> Response:
     """GET '/fundraisers' endpoint view function.
 
     Args:
+        request: FastAPI Request object.
         page: pagination page.
         page_size: pagination page size, how many items to show per page.
+        cursor: opaque keyset pagination cursor, switches endpoint to keyset pagination, empty for the first page.
         fundraise_service: dependency as business logic instance.
 
     Returns:
-    ResponseBaseSchema object with list of FundraiseFullOutputSchema objects as response data.
+    ResponseBaseSchema JSON with list of FundraiseFullOutputSchema objects as response data, 304 response without
+    body if client has current page.
     """
-    return ResponseBaseSchema(
-        status_code=status.HTTP_200_OK,
-        data=FundraisePaginatedOutputSchema.from_orm(await fundraise_service.get_fundraisers(page, page_size)),
-        errors=[],
+    if cursor is not None:
+        data = FundraiseCursorPaginatedOutputSchema.from_orm(
+            await fundraise_service.get_fundraisers_by_cursor(cursor, page_size),
+        )
+    else:
+        data = FundraisePaginatedOutputSchema.from_orm(await fundraise_service.get_fundraisers(page, page_size))
+    return create_conditional_response(
+        request,
+        serialize_response_data(ResponseBaseSchema(status_code=status.HTTP_200_OK, data=data, errors=[])),
+        cache_control=FundraiseRouteConstants.LIST_CACHE_CONTROL.value,
     )
 
 
-@fundraisers_router.post('/', response_model=ResponseBaseSchema, status_code=status.HTTP_201_CREATED)
+@fundraisers_router.post(
+    '/', response_model=ResponseBaseSchema[FundraiseFullOutputSchema], status_code=status.HTTP_201_CREATED,
+)
 async def post_fundraisers(
         fundraise: FundraiseInputSchema,
         fundraise_service: FundraiseService = Depends(),
-        Authorize: AuthJWT = Depends(),
-) -> ResponseBaseSchema:
+        current_user: CurrentUser = Depends(get_current_user),
+) -> ORJSONModelResponse:
     """POST '/fundraisers' endpoint view function.
 
     Args:
         fundraise: Serialized FundraiseInputSchema object.
         fundraise_service: dependency as business logic instance.
-        Authorize: dependency of AuthJWT for JWT tokens.
+        current_user: dependency with request-scoped CurrentUser of authenticated user.
 
     Returns:
     ResponseBaseSchema object with FundraiseFullOutputSchema object as response data.
     """
-    Authorize.jwt_required()
-    jwt_subject = Authorize.get_jwt_subject()
-    return ResponseBaseSchema(
-        status_code=status.HTTP_201_CREATED,
-        data=FundraiseFullOutputSchema.from_orm(await fundraise_service.add_fundraise(fundraise, jwt_subject)),
-        errors=[],
+    jwt_subject = current_user.username
+    return ORJSONModelResponse(
+        ResponseBaseSchema[FundraiseFullOutputSchema](
+            status_code=status.HTTP_201_CREATED,
+            data=FundraiseFullOutputSchema.from_orm(await fundraise_service.add_fundraise(fundraise, jwt_subject)),
+            errors=[],
+        ),
     )
 
 
-@fundraisers_router.get('/{id}', response_model=ResponseBaseSchema)
+@fundraisers_router.get('/{id}', response_model=ResponseBaseSchema[FundraiseFullOutputSchema])
 async def get_fundraise(
+        request: Request,
         id: UUID,
         fundraise_service: FundraiseService = Depends()
-) -> ResponseBaseSchema:
+) -> Response:
     """GET '/fundraisers/{id}' endpoint view function.
 
     Args:
+        request: FastAPI Request object.
         id: UUID of fundraise.
         fundraise_service: dependency as business logic instance.
 
     Returns:
-    ResponseBaseSchema object with FundraiseFullOutputSchema object as response data.
+    ResponseBaseSchema JSON with cached FundraiseFullOutputSchema JSON as response data, 304 response without body
+    if client has current fundraise.
     """
-    return ResponseBaseSchema(
-        status_code=status.HTTP_200_OK,
-        data=FundraiseFullOutputSchema.from_orm(await fundraise_service.get_fundraise_by_id(id_=id)),
-        errors=[],
+    return create_conditional_response(
+        request,
+        wrap_response_data(await fundraise_service.get_serialized_fundraise_by_id(id_=id)),
+        cache_control=FundraiseRouteConstants.DETAIL_CACHE_CONTROL.value,
     )
 
 
-@fundraisers_router.put('/{id}', response_model=ResponseBaseSchema)
+@fundraisers_router.put('/{id}', response_model=ResponseBaseSchema[FundraiseFullOutputSchema])
 async def put_fundraise(
         id: UUID,
         update_data: FundraiseUpdateSchema,
         fundraise_service: FundraiseService = Depends(),
-        Authorize: AuthJWT = Depends(),
-) -> ResponseBaseSchema:
+        current_user: CurrentUser = Depends(get_current_user),
+) -> ORJSONModelResponse:
     """PUT '/fundraisers/{id}' endpoint view function.
 
     Args:
         id: UUID of fundraise.
         update_data: Serialized FundraiseUpdateSchema object.
         fundraise_service: dependency as business logic instance.
-        Authorize: dependency of AuthJWT for JWT tokens.
+        current_user: dependency with request-scoped CurrentUser of authenticated user.
 
     Returns:
     ResponseBaseSchema object with FundraiseFullOutputSchema object as response data.
     """
-    Authorize.jwt_required()
-    jwt_subject = Authorize.get_jwt_subject()
-    return ResponseBaseSchema(
-        status_code=status.HTTP_200_OK,
-        data=FundraiseFullOutputSchema.from_orm(
-            await fundraise_service.update_fundraise(id_=id, jwt_subject=jwt_subject, update_data=update_data)
+    jwt_subject = current_user.username
+    return ORJSONModelResponse(
+        ResponseBaseSchema[FundraiseFullOutputSchema](
+            status_code=status.HTTP_200_OK,
+            data=FundraiseFullOutputSchema.from_orm(
+                await fundraise_service.update_fundraise(id_=id, jwt_subject=jwt_subject, update_data=update_data)
+            ),
+            errors=[],
         ),
-        errors=[],
     )
 
 
@@ -128,19 +157,18 @@ async def put_fundraise(
 async def delete_fundraise(
         id: UUID,
         fundraise_service: FundraiseService = Depends(),
-        Authorize: AuthJWT = Depends(),
+        current_user: CurrentUser = Depends(get_current_user),
 ) -> Response:
     """DELETE '/fundraisers/{id}' endpoint view function.
 
     Args:
         id: UUID of fundraise.
         fundraise_service: dependency as business logic instance.
-        Authorize: dependency of AuthJWT for JWT tokens.
+        current_user: dependency with request-scoped CurrentUser of authenticated user.
 
     Returns:
     http response with no data and 204 status code.
     """
-    Authorize.jwt_required()
-    jwt_subject = Authorize.get_jwt_subject()
+    jwt_subject = current_user.username
     await fundraise_service.delete_fundraise(id_=id, jwt_subject=jwt_subject)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -1,5 +1,6 @@
 from fundraisers.schemas.fundraise_statuses import FundraiseStatusInputSchema, FundraiseStatusOutputSchema
 from fundraisers.schemas.fundraisers import (
+    FundraiseCursorPaginatedOutputSchema,
     FundraiseFullOutputSchema,
     FundraiseInputSchema,
     FundraiseIsDonatableUpdateSchema,
@@ -10,6 +11,7 @@ from fundraisers.schemas.fundraisers import (
 
 __all__ = [
     'FundraisePaginatedOutputSchema',
+    'FundraiseCursorPaginatedOutputSchema',
     'FundraiseOutputSchema',
     'FundraiseFullOutputSchema',
     'FundraiseInputSchema',
@@ -53,6 +53,18 @@ class FundraisePaginatedOutputSchema(BaseModel):
     next_page: int | None
     previous_page: int | None
     total_pages: int
+    total_pages_exact: bool
+
+    class Config:
+        orm_mode = True
+
+
+class FundraiseCursorPaginatedOutputSchema(BaseModel):
+    """Fundraise keyset paginated output schema for Fundraise model."""
+    has_next: bool
+    items: list[FundraiseFullOutputSchema]
+    next_cursor: str | None
+    page_size: int
 
     class Config:
         orm_mode = True
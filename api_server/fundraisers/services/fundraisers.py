@@ -1,20 +1,30 @@
+from functools import partial
 from uuid import UUID
 
 from fastapi import Depends, status
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from auth.utils.current_user import CurrentUser
 from charities.services import CharityService
+from common.constants.cache import ReadThroughCacheConstants
 from common.constants.prepopulates.fundraise_statuses import FundraiseStatusConstants
 from common.exceptions.fundraisers import FundraiseExceptionMsgs
 from db import get_session
 from fundraisers.db_services import FundraiseDBService, FundraiseStatusDBService
 from fundraisers.models import Fundraise
-from fundraisers.schemas import FundraiseInputSchema, FundraiseIsDonatableUpdateSchema, FundraiseUpdateSchema
+from fundraisers.schemas import (
+    FundraiseFullOutputSchema,
+    FundraiseInputSchema,
+    FundraiseIsDonatableUpdateSchema,
+    FundraiseUpdateSchema,
+)
 from fundraisers.utils.exceptions import FundraiseNotFoundError
 from fundraisers.utils.jwt import jwt_fundraise_validator
+from utils.cache import read_through_cache
+from utils.json_responses import serialize_response_data
 from utils.logging import setup_logging
-from utils.pagination import PaginationPage
+from utils.pagination import CursorPaginationPage, PaginationPage, decode_cursor
 
 
 class FundraiseService:
@@ -34,14 +44,33 @@ class FundraiseService:
             page_size: number of items per page.
 
         Returns:
-        PaginationPage object with items as a list of Fundraise objects.
+        PaginationPage object with items as a list of FundraiseListItem objects.
         """
         return await self._get_fundraisers(page, page_size)
 
     async def _get_fundraisers(self, page: int, page_size: int) -> PaginationPage:
         fundraisers = await self.fundraise_db_service.get_fundraisers(page, page_size)
-        total_fundraisers = await self.fundraise_db_service._get_total_fundraisers()
-        return PaginationPage(items=fundraisers, page=page, page_size=page_size, total=total_fundraisers)
+        total_fundraisers, is_exact = await self.fundraise_db_service._get_total_fundraisers()
+        return PaginationPage(
+            items=fundraisers, page=page, page_size=page_size, total=total_fundraisers, total_pages_exact=is_exact,
+        )
+
+    async def get_fundraisers_by_cursor(self, cursor: str, page_size: int) -> CursorPaginationPage:
+        """Get Fundraise objects from database with keyset pagination.
+
+        Args:
+            cursor: opaque pagination cursor from previous page, empty string for the first page.
+            page_size: number of items per page.
+
+        Returns:
+        CursorPaginationPage object with items as a list of FundraiseListItem objects.
+        """
+        return await self._get_fundraisers_by_cursor(cursor, page_size)
+
+    async def _get_fundraisers_by_cursor(self, cursor: str, page_size: int) -> CursorPaginationPage:
+        after = decode_cursor(cursor) if cursor else None
+        fundraisers = await self.fundraise_db_service.get_fundraisers_by_cursor(after=after, page_size=page_size)
+        return CursorPaginationPage(items=fundraisers, page_size=page_size)
 
     async def add_fundraise(self, fundraise: FundraiseInputSchema, jwt_subject: str) -> Fundraise:
         """Add Fundraise object to the database.
@@ -56,8 +85,13 @@ class FundraiseService:
         return await self._add_fundraise(fundraise, jwt_subject)
 
     async def _add_fundraise(self, fundraise: FundraiseInputSchema, jwt_subject: str) -> Fundraise:
-        db_charity = await self.charity_service.get_charity_by_id(id_=fundraise.charity_id)
-        usernames = [employee.user.username for employee in db_charity.employees]
+        # Charity memberships of authenticated user are memoized for the request, charity with its employees loaded
+        # only when user is not listed in it.
+        if fundraise.charity_id in await CurrentUser.from_session(self.session, jwt_subject).get_charity_ids():
+            usernames = [jwt_subject]
+        else:
+            db_charity = await self.charity_service.get_charity_by_id(id_=fundraise.charity_id)
+            usernames = [employee.user.username for employee in db_charity.employees]
         if jwt_fundraise_validator(jwt_subject=jwt_subject, usernames=usernames):
             db_fundraise = await self.fundraise_db_service.add_fundraise(fundraise)
             db_fundraise_status = await self.fundraise_status_db_service.get_fundraise_status_by_name(
@@ -67,7 +101,7 @@ class FundraiseService:
                 fundraise=db_fundraise,
                 fundraise_status=db_fundraise_status,
             )
-            return db_fundraise
+            return await self.fundraise_db_service.get_fundraise_by_id(id_=db_fundraise.id)
 
     async def get_fundraise_by_id(self, id_: UUID) -> Fundraise:
         """Get Fundraise object from database filtered by id.
@@ -93,6 +127,29 @@ class FundraiseService:
             raise FundraiseNotFoundError(status_code=status.HTTP_404_NOT_FOUND, detail=err_msg)
         return fundraise
 
+    async def get_serialized_fundraise_by_id(self, id_: UUID) -> bytes:
+        """Get JSON of FundraiseFullOutputSchema object from read-through cache, loaded from database on cache miss.
+
+        Args:
+            id_: UUID of fundraise.
+        Raise:
+            FundraiseNotFoundError in case fundraise not found.
+
+        Returns:
+        JSON of FundraiseFullOutputSchema object.
+        """
+        return await self._get_serialized_fundraise_by_id(id_)
+
+    async def _get_serialized_fundraise_by_id(self, id_: UUID) -> bytes:
+        return await read_through_cache.get_or_load(
+            namespace=ReadThroughCacheConstants.FUNDRAISERS_NAMESPACE.value,
+            id_=id_,
+            loader=partial(self._load_serialized_fundraise, id_),
+        )
+
+    async def _load_serialized_fundraise(self, id_: UUID) -> bytes:
+        return serialize_response_data(FundraiseFullOutputSchema.from_orm(await self.get_fundraise_by_id(id_)))
+
     async def update_fundraise(self, id_: UUID, jwt_subject: str, update_data: FundraiseUpdateSchema) -> Fundraise:
         """Updates Fundraise object data in the db.
 
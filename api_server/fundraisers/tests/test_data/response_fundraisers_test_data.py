@@ -40,7 +40,8 @@ RESPONSE_GET_FUNDRAISERS_EMPTY_DB = {
         'items': [],
         'next_page': None,
         'previous_page': None,
-        'total_pages': 0
+        'total_pages': 0,
+        'total_pages_exact': True
     },
     'errors': [],
     'status_code': 200
@@ -53,7 +54,18 @@ RESPONSE_GET_FUNDRAISERS = {
         'items': [RESPONSE_FUNDRAISE_TEST_DATA],
         'next_page': None,
         'previous_page': None,
-        'total_pages': 1
+        'total_pages': 1,
+        'total_pages_exact': True
+    },
+    'errors': [],
+    'status_code': 200
+}
+RESPONSE_GET_FUNDRAISERS_CURSOR = {
+    'data': {
+        'has_next': False,
+        'items': [RESPONSE_FUNDRAISE_TEST_DATA],
+        'next_cursor': None,
+        'page_size': 20,
     },
     'errors': [],
     'status_code': 200
@@ -5,10 +5,13 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 import pytest
 
+from common.constants.fundraisers import FundraiseStatusConstants
 from common.tests.generics import TestMixin
 from common.tests.test_data.fundraisers import request_test_fundraise_status_data
+from fundraisers.db_services import FundraiseStatusDBService
 from fundraisers.models import Fundraise, FundraiseStatusAssociation
 from fundraisers.tests.test_data import response_fundraise_statuses_test_data
+from utils.tests import count_statements
 
 
 class TestCaseGetFundraiseStatuses(TestMixin):
@@ -271,3 +274,24 @@ class TestCasePostFundraiseStatuses(TestMixin):
         assert (await db_session.execute(select(func.count(Fundraise.id)))).scalar_one() == 1
         assert (await db_session.execute(select(func.count(FundraiseStatusAssociation.id)))).scalar_one() == 3
         assert test_fundraise.is_donatable is True
+
+
+class TestCaseFundraiseStatusRegistry(TestMixin):
+
+    @pytest.mark.asyncio
+    async def test_get_fundraise_status_by_name_from_registry(self, db_session: AsyncSession) -> None:
+        """Test FundraiseStatus lookup by name served from in-process registry without sql statements.
+
+        Args:
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+
+        Returns:
+        Nothing.
+        """
+        fundraise_status_db_service = FundraiseStatusDBService(db_session)
+        with count_statements(db_session.bind) as statements:
+            for status_name in FundraiseStatusConstants.ALL_STATUSES.value:
+                db_fundraise_status = await fundraise_status_db_service.get_fundraise_status_by_name(status_name)
+                assert db_fundraise_status.name == status_name
+                assert db_fundraise_status in db_session
+        assert statements == []
@@ -1,20 +1,56 @@
+from typing import Callable
+import json
+
 from fastapi import FastAPI, status
 
 from httpx import AsyncClient
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 import pytest
+import pytest_asyncio
 
 from charities.models import Charity
+from common.constants.compression import CompressionConstants
+from common.constants.fundraisers import FundraiseRouteConstants
+from common.constants.tests import GenericTestConstants
+from common.schemas.responses import ResponseBaseSchema
 from common.tests.generics import TestMixin
+from common.tests.test_data.charities import request_test_charity_data
 from common.tests.test_data.fundraisers import request_test_fundraise_data
 from fundraisers.models import Fundraise
+from fundraisers.schemas import FundraisePaginatedOutputSchema
 from fundraisers.tests.test_data import response_fundraisers_test_data
 from users.models import User
+from utils.json_responses import ORJSONModelResponse
+from utils.tests import count_statements, measure_response_compression, measure_response_serialization
 
 
 class TestCaseGetFundraisers(TestMixin):
 
+    @pytest_asyncio.fixture
+    async def test_fundraisers_page(self, db_session: AsyncSession, test_charity: Charity) -> list[Fundraise]:
+        """A pytest fixture that adds benchmark page size of fundraisers to test database.
+
+        Args:
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+            test_charity: pytest fixture, add charity to database.
+
+        Returns:
+        list of newly created Fundraise objects.
+        """
+        fundraise_data = request_test_fundraise_data.ADD_FUNDRAISE_TEST_DATA
+        fundraisers = [
+            Fundraise(
+                charity_id=test_charity.id,
+                title=f'{index} {fundraise_data["title"]}',
+                description=fundraise_data['description'],
+                goal=fundraise_data['goal'],
+            ) for index in range(GenericTestConstants.BENCHMARK_PAGE_SIZE.value)
+        ]
+        db_session.add_all(fundraisers)
+        await db_session.commit()
+        return fundraisers
+
     @pytest.mark.asyncio
     async def test_get_fundraisers_empty_db(self, app: FastAPI, client: AsyncClient, db_session: AsyncSession) -> None:
         """Test GET '/fundraisers' endpoint with no fundraise test data added to the db.
@@ -58,6 +94,112 @@ class TestCaseGetFundraisers(TestMixin):
         assert response.status_code == status.HTTP_200_OK
         assert (await db_session.execute(select(func.count(Fundraise.id)))).scalar_one() == 1
 
+    @pytest.mark.asyncio
+    async def test_get_fundraisers_cursor_test_data_in_db(
+            self, app: FastAPI, client: AsyncClient, db_session: AsyncSession, test_fundraise: Fundraise,
+    ) -> None:
+        """Test GET '/fundraisers' endpoint with keyset pagination cursor and fundraise test data added to the db.
+
+        Args:
+            app: pytest fixture, an instance of FastAPI.
+            client: pytest fixture, an instance of AsyncClient for http requests.
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+            test_fundraise: pytest fixture, add fundraise to database.
+
+        Returns:
+        Nothing.
+        """
+        url = app.url_path_for('get_fundraisers')
+        response = await client.get(url, params={'cursor': ''})
+        response_data = response.json()
+        expected_result = response_fundraisers_test_data.RESPONSE_GET_FUNDRAISERS_CURSOR
+        assert response_data == expected_result
+        assert response.status_code == status.HTTP_200_OK
+
+    @pytest.mark.asyncio
+    async def test_get_fundraisers_cursor_statements_count(
+            self, app: FastAPI, client: AsyncClient, db_session: AsyncSession, test_fundraise: Fundraise,
+    ) -> None:
+        """Test GET '/fundraisers' endpoint loads page with column-projected queries, one query per relationship.
+
+        Args:
+            app: pytest fixture, an instance of FastAPI.
+            client: pytest fixture, an instance of AsyncClient for http requests.
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+            test_fundraise: pytest fixture, add fundraise to database.
+
+        Returns:
+        Nothing.
+        """
+        url = app.url_path_for('get_fundraisers')
+        with count_statements(app.db_engine) as statements:
+            response = await client.get(url, params={'cursor': ''})
+        assert response.status_code == status.HTTP_200_OK
+        assert len(statements) == GenericTestConstants.GET_FUNDRAISERS_CURSOR_STATEMENTS.value
+
+    @pytest.mark.asyncio
+    async def test_get_fundraisers_page_serialization_benchmark(
+            self, app: FastAPI, client: AsyncClient, db_session: AsyncSession, test_fundraisers_page: list[Fundraise],
+            record_property: Callable,
+    ) -> None:
+        """Test ORJSONModelResponse serializes full page of fundraisers like fastapi response model path, reports timings.
+
+        Args:
+            app: pytest fixture, an instance of FastAPI.
+            client: pytest fixture, an instance of AsyncClient for http requests.
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+            test_fundraisers_page: pytest fixture, add full page of fundraisers to database.
+            record_property: pytest fixture, adds serialization timings to test report.
+
+        Returns:
+        Nothing.
+        """
+        page_size = GenericTestConstants.BENCHMARK_PAGE_SIZE.value
+        response = await client.get(app.url_path_for('get_fundraisers'), params={'page_size': page_size})
+        assert response.status_code == status.HTTP_200_OK
+        response_data = ResponseBaseSchema[FundraisePaginatedOutputSchema].parse_raw(response.content)
+        assert len(response_data.data.items) == page_size
+        assert json.loads(ORJSONModelResponse(response_data).body) == response.json()
+        timings = await measure_response_serialization(response_data, GenericTestConstants.BENCHMARK_ROUNDS.value)
+        # Timings depend on machine load, so they are reported and not asserted.
+        for serializer, seconds in timings.items():
+            record_property(f'{serializer}_serialization_seconds', seconds)
+
+    @pytest.mark.asyncio
+    async def test_get_fundraisers_page_compression_benchmark(
+            self, app: FastAPI, client: AsyncClient, db_session: AsyncSession, test_fundraisers_page: list[Fundraise],
+    ) -> None:
+        """Test GET '/fundraisers' endpoint compresses full page with route gzip level and reduces bytes on the wire.
+
+        Args:
+            app: pytest fixture, an instance of FastAPI.
+            client: pytest fixture, an instance of AsyncClient for http requests.
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+            test_fundraisers_page: pytest fixture, add full page of fundraisers to database.
+
+        Returns:
+        Nothing.
+        """
+        url = app.url_path_for('get_fundraisers')
+        params = {'page_size': GenericTestConstants.BENCHMARK_PAGE_SIZE.value}
+        identity_response = await client.get(url, params=params, headers={'accept-encoding': 'identity'})
+        response = await client.get(url, params=params, headers={'accept-encoding': 'gzip'})
+        assert 'content-encoding' not in identity_response.headers
+        assert response.headers['content-encoding'] == 'gzip'
+        assert response.headers['vary'] == identity_response.headers['vary'] == 'Accept-Encoding'
+        assert response.json() == identity_response.json()
+        results = measure_response_compression(
+            identity_response.content,
+            gzip_levels=[FundraiseRouteConstants.LIST_GZIP_LEVEL.value, CompressionConstants.DEFAULT_GZIP_LEVEL.value],
+            brotli_quality=CompressionConstants.DEFAULT_BROTLI_QUALITY.value,
+            rounds=GenericTestConstants.BENCHMARK_ROUNDS.value,
+        )
+        identity_result = results.pop('identity')
+        assert identity_response.num_bytes_downloaded == identity_result['bytes']
+        route_result = results[f'gzip-{FundraiseRouteConstants.LIST_GZIP_LEVEL.value}']
+        assert response.num_bytes_downloaded == route_result['bytes']
+        assert all(result['bytes'] < identity_result['bytes'] / 2 for result in results.values())
+
 
 class TestCaseGetFundraise(TestMixin):
 
@@ -104,6 +246,62 @@ class TestCaseGetFundraise(TestMixin):
         assert response.status_code == status.HTTP_200_OK
         assert (await db_session.execute(select(func.count(Fundraise.id)))).scalar_one() == 1
 
+    @pytest.mark.asyncio
+    async def test_get_fundraise_statements_count(
+            self, app: FastAPI, client: AsyncClient, db_session: AsyncSession, test_fundraise: Fundraise,
+    ) -> None:
+        """Test GET '/fundraisers/{id}' endpoint loads fundraise relationships with fixed number of sql statements.
+
+        Args:
+            app: pytest fixture, an instance of FastAPI.
+            client: pytest fixture, an instance of AsyncClient for http requests.
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+            test_fundraise: pytest fixture, add fundraise to database.
+
+        Returns:
+        Nothing.
+        """
+        url = app.url_path_for('get_fundraise', id=test_fundraise.id)
+        with count_statements(app.db_engine) as statements:
+            response = await client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert len(statements) == GenericTestConstants.GET_FUNDRAISE_STATEMENTS.value
+
+    @pytest.mark.asyncio
+    async def test_get_fundraise_cached_until_fundraise_and_charity_update(
+            self, app: FastAPI, client: AsyncClient, db_session: AsyncSession, test_fundraise: Fundraise,
+    ) -> None:
+        """Test GET '/fundraisers/{id}' endpoint reads fundraise from cache invalidated by fundraise and charity updates.
+
+        Args:
+            app: pytest fixture, an instance of FastAPI.
+            client: pytest fixture, an instance of AsyncClient for http requests.
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+            test_fundraise: pytest fixture, add fundraise to database.
+
+        Returns:
+        Nothing.
+        """
+        url = app.url_path_for('get_fundraise', id=test_fundraise.id)
+        await client.get(url)
+        with count_statements(app.db_engine) as statements:
+            response = await client.get(url)
+        assert response.json() == response_fundraisers_test_data.RESPONSE_GET_FUNDRAISE
+        assert len(statements) == 0
+        await client.put(
+            app.url_path_for('put_fundraise', id=test_fundraise.id),
+            json=request_test_fundraise_data.UPDATE_FUNDRAISE_TEST_DATA,
+        )
+        response = await client.get(url)
+        assert response.json() == response_fundraisers_test_data.RESPONSE_PUT_FUNDRAISE
+        await client.put(
+            app.url_path_for('put_charity', id=test_fundraise.charity_id),
+            json=request_test_charity_data.UPDATE_CHARITY_TEST_DATA,
+        )
+        response = await client.get(url)
+        charity_title = request_test_charity_data.UPDATE_CHARITY_TEST_DATA['title']
+        assert response.json()['data']['charity']['title'] == charity_title
+
 
 class TestCasePostFundraisers(TestMixin):
 
@@ -0,0 +1,59 @@
+from fundraisers.models import FundraiseStatus
+from utils.logging import setup_logging
+
+
+class FundraiseStatusRegistry:
+    """In-process registry of FundraiseStatus objects keyed by status name.
+
+    FundraiseStatus table holds static data populated on application startup, so statuses are kept detached from
+    any session and merged into request session without querying the database.
+    """
+
+    def __init__(self) -> None:
+        self._log = setup_logging(self.__class__.__name__)
+        self._statuses: dict[str, FundraiseStatus] = {}
+
+    def load(self, statuses: list[FundraiseStatus]) -> None:
+        """Replaces registry content with provided FundraiseStatus objects.
+
+        Args:
+            statuses: list of FundraiseStatus objects.
+
+        Returns:
+        Nothing.
+        """
+        self._statuses = {fundraise_status.name: fundraise_status for fundraise_status in statuses}
+        self._log.debug(f'FundraiseStatus registry loaded with statuses: {list(self._statuses)}.')
+
+    def register(self, fundraise_status: FundraiseStatus) -> None:
+        """Adds single FundraiseStatus object to registry.
+
+        Args:
+            fundraise_status: FundraiseStatus object.
+
+        Returns:
+        Nothing.
+        """
+        self._statuses[fundraise_status.name] = fundraise_status
+
+    def get(self, name: str) -> FundraiseStatus | None:
+        """Get FundraiseStatus object from registry filtered by name.
+
+        Args:
+            name: of fundraise status.
+
+        Returns:
+        single detached FundraiseStatus object or None if status not registered.
+        """
+        return self._statuses.get(name)
+
+    def clear(self) -> None:
+        """Removes all statuses from registry.
+
+        Returns:
+        Nothing.
+        """
+        self._statuses = {}
+
+
+fundraise_status_registry = FundraiseStatusRegistry()
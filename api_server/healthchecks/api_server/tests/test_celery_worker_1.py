@@ -0,0 +1,62 @@
+from celery import Celery
+from sqlalchemy import text
+
+from app.celery_worker import CeleryWorkerResources, benchmark_task_overhead, celery_worker_resources
+from auth.utils.email_lambdas import email_transport
+from common.constants.celery import CeleryConstants
+from common.tests.generics import TestMixin
+
+
+class TestCaseCeleryWorkerResources(TestMixin):
+
+    async def _select_one(self, resources: CeleryWorkerResources) -> int:
+        """Runs simple query with worker process session factory.
+
+        Args:
+            resources: started CeleryWorkerResources object.
+
+        Returns:
+        int query result.
+        """
+        async with resources.db_session_maker() as session:
+            return (await session.execute(text(CeleryConstants.BENCHMARK_QUERY.value))).scalar_one()
+
+    def test_worker_resources_reused_between_tasks(self, celery_app: Celery) -> None:
+        """Test worker process resources are created once and reused by consecutive task runs.
+
+        Args:
+            celery_app: pytest fixture that creates test Celery app.
+
+        Returns:
+        Nothing.
+        """
+        resources = CeleryWorkerResources()
+        resources.start(celery_app.conf)
+        loop, db_engine = resources.loop, resources.db_engine
+        s3_client = resources.s3_client
+        assert resources.run(self._select_one(resources)) == 1
+        assert resources.run(self._select_one(resources)) == 1
+        resources.start(celery_app.conf)
+        assert resources.loop is loop
+        assert resources.db_engine is db_engine
+        assert resources.s3_client is s3_client
+        assert email_transport.started
+        # Single pooled connection served both runs.
+        assert db_engine.pool.checkedin() == 1
+        resources.shutdown()
+        assert resources.started is False
+        assert loop.is_closed()
+        assert email_transport.started is False
+
+    def test_benchmark_task_overhead(self) -> None:
+        """Test benchmark task reports lower per task overhead with worker process resources.
+
+        Returns:
+        Nothing.
+        """
+        try:
+            result = benchmark_task_overhead.apply(kwargs={'iterations': 3}).get()
+        finally:
+            celery_worker_resources.shutdown()
+        assert result['iterations'] == 3
+        assert result['warm_avg_seconds'] < result['cold_avg_seconds']
@@ -0,0 +1,72 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+import pytest
+
+from common.constants.tests import GenericTestConstants
+from common.tests.generics import TestMixin
+from db import Base
+
+
+class TestCaseDBIndexes(TestMixin):
+
+    async def _get_db_indexes(self, db_session: AsyncSession) -> set[tuple[str, str]]:
+        """Get indexes of migrated test database.
+
+        Args:
+            db_session: sqlalchemy AsyncSession.
+
+        Returns:
+        set of tuples with table name and index name.
+        """
+        result = await db_session.execute(text(GenericTestConstants.SELECT_INDEXES_QUERY.value))
+        return {(table_name, index_name) for table_name, index_name in result.all()}
+
+    async def _get_db_indexed_columns(self, db_session: AsyncSession) -> set[tuple[str, str]]:
+        """Get leading columns of indexes of migrated test database, only leading column of index used in lookups.
+
+        Args:
+            db_session: sqlalchemy AsyncSession.
+
+        Returns:
+        set of tuples with table name and column name.
+        """
+        result = await db_session.execute(text(GenericTestConstants.SELECT_INDEXES_LEADING_COLUMNS_QUERY.value))
+        return {(table_name, column_name) for table_name, column_name in result.all()}
+
+    @pytest.mark.asyncio
+    async def test_model_indexes_migrated(self, db_session: AsyncSession) -> None:
+        """Test all indexes declared in models metadata are created by alembic migrations.
+
+        Args:
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+
+        Returns:
+        Nothing.
+        """
+        db_indexes = await self._get_db_indexes(db_session)
+        missing_indexes = [
+            (table.name, index.name)
+            for table in Base.metadata.sorted_tables
+            for index in table.indexes
+            if (table.name, index.name) not in db_indexes
+        ]
+        assert missing_indexes == []
+
+    @pytest.mark.asyncio
+    async def test_foreign_key_columns_indexed(self, db_session: AsyncSession) -> None:
+        """Test every foreign key column, used in 'where()' lookups and cascade deletes, has an index.
+
+        Args:
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+
+        Returns:
+        Nothing.
+        """
+        db_indexed_columns = await self._get_db_indexed_columns(db_session)
+        non_indexed_columns = [
+            (table.name, foreign_key.parent.name)
+            for table in Base.metadata.sorted_tables
+            for foreign_key in table.foreign_keys
+            if (table.name, foreign_key.parent.name) not in db_indexed_columns
+        ]
+        assert non_indexed_columns == []
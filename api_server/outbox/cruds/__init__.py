@@ -0,0 +1,5 @@
+from outbox.cruds.outbox_messages_crud import OutboxMessageCRUD
+
+__all__ = [
+    'OutboxMessageCRUD',
+]
@@ -0,0 +1,75 @@
+from celery import Task
+from sqlalchemy import delete, select
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from outbox.models import OutboxMessage
+from utils.logging import setup_logging
+
+
+class OutboxMessageCRUD:
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._log = setup_logging(self.__class__.__name__)
+        self.session = session
+
+    def stage_outbox_message(self, task: Task, kwargs: dict) -> OutboxMessage:
+        """Adds OutboxMessage object to the session, it is saved by the next commit of the session.
+
+        Message is committed in the same transaction as objects the task is started for, so the task is sent
+        to broker only if the objects are saved.
+
+        Args:
+            task: Celery task to start.
+            kwargs: JSON serializable task kwargs.
+
+        Returns:
+        newly created OutboxMessage object.
+        """
+        outbox_message = OutboxMessage(task_name=task.name, kwargs=kwargs)
+        self.session.add(outbox_message)
+        return outbox_message
+
+    async def add_outbox_message(self, task: Task, kwargs: dict) -> OutboxMessage:
+        """Add OutboxMessage object to the database.
+
+        Args:
+            task: Celery task to start.
+            kwargs: JSON serializable task kwargs.
+
+        Returns:
+        newly created OutboxMessage object.
+        """
+        return await self._add_outbox_message(task, kwargs)
+
+    async def _add_outbox_message(self, task: Task, kwargs: dict) -> OutboxMessage:
+        outbox_message = self.stage_outbox_message(task, kwargs)
+        await self.session.commit()
+        self._log.debug(f'OutboxMessage with id: "{outbox_message.id}" successfully created.')
+        return outbox_message
+
+    async def pop_outbox_messages(self, limit: int) -> list[Row]:
+        """Deletes oldest OutboxMessage objects not locked by other relays, transaction is not committed.
+
+        Args:
+            limit: maximum number of deleted messages.
+
+        Returns:
+        list of rows with id, task_name and kwargs of deleted messages in order of creation.
+        """
+        return await self._pop_outbox_messages(limit)
+
+    async def _pop_outbox_messages(self, limit: int) -> list[Row]:
+        oldest_messages = (
+            select(OutboxMessage.id)
+            .order_by(OutboxMessage.created_at, OutboxMessage.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.session.execute(
+            delete(OutboxMessage)
+            .where(OutboxMessage.id.in_(oldest_messages.scalar_subquery()))
+            .returning(OutboxMessage.id, OutboxMessage.task_name, OutboxMessage.kwargs, OutboxMessage.created_at)
+            .execution_options(synchronize_session=False)
+        )
+        return sorted(result.all(), key=lambda row: (row.created_at, row.id))
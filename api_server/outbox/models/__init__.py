@@ -0,0 +1,5 @@
+from outbox.models.outbox_messages import OutboxMessage
+
+__all__ = [
+    'OutboxMessage',
+]
@@ -0,0 +1,22 @@
+import uuid
+
+from sqlalchemy import Column, DateTime, String, func
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+
+from common.constants.outbox import OutboxMessageModelConstants
+from db import Base
+
+
+class OutboxMessage(Base):
+    """A model representing Celery task message waiting in transactional outbox to be sent to broker."""
+
+    __tablename__ = 'outbox-messages'
+
+    id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4)
+    task_name = Column(String(OutboxMessageModelConstants.CHAR_SIZE_256.value), nullable=False)
+    kwargs = Column(JSONB, nullable=False)
+    # Relay sends messages in order of creation.
+    created_at = Column(DateTime, server_default=func.now(), nullable=False, index=True)
+
+    def __repr__(self):
+        return f'OutboxMessage: id={self.id}, task_name={self.task_name}, created_at={self.created_at}'
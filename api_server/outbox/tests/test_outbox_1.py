@@ -0,0 +1,131 @@
+from unittest.mock import MagicMock
+
+from fastapi import FastAPI, status
+
+from celery import Celery
+from httpx import AsyncClient
+from pytest_mock.plugin import MockerFixture
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+import pytest
+
+from common.tests.generics import TestMixin
+from outbox.cruds import OutboxMessageCRUD
+from outbox.models import OutboxMessage
+from outbox.utils import OutboxRelay
+from users.models import UserPicture
+from users.tasks import delete_user_picture_in_aws_s3_bucket
+
+
+class TestCaseOutbox(TestMixin):
+
+    @pytest.fixture
+    def outbox_relay(self, celery_app: Celery, mocker: MockerFixture) -> OutboxRelay:
+        """A pytest fixture that creates OutboxRelay with mocked Celery broker producer.
+
+        Args:
+            celery_app: pytest fixture that creates test Celery app.
+            mocker: A pytest_mock lib fixture.
+
+        Returns:
+        An instance of OutboxRelay.
+        """
+        mocker.patch.object(celery_app, 'producer_or_acquire', return_value=MagicMock())
+        mocker.patch.object(celery_app, 'send_task')
+        outbox_relay = OutboxRelay(celery_app=celery_app)
+        outbox_relay.start(celery_app.conf)
+        return outbox_relay
+
+    @pytest.mark.asyncio
+    async def test_delete_user_picture_commits_task_to_outbox(
+            self, app: FastAPI, client: AsyncClient, db_session: AsyncSession,
+            authenticated_test_user_picture: UserPicture,
+    ) -> None:
+        """Test DELETE '/users/{user_id}/pictures/{picture_id}' endpoint saves task in outbox with picture deletion.
+
+        Args:
+            app: pytest fixture, an instance of FastAPI.
+            client: pytest fixture, an instance of AsyncClient for http requests.
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+            authenticated_test_user_picture: pytest fixture, add user with picture to database and authenticate user.
+
+        Returns:
+        Nothing.
+        """
+        url = app.url_path_for(
+            'delete_user_picture',
+            user_id=authenticated_test_user_picture.user_id,
+            picture_id=authenticated_test_user_picture.id,
+        )
+        response = await client.delete(url)
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        outbox_message = (await db_session.execute(
+            select(OutboxMessage).where(OutboxMessage.task_name == delete_user_picture_in_aws_s3_bucket.name)
+        )).scalars().one()
+        assert outbox_message.kwargs == {
+            'user_id': str(authenticated_test_user_picture.user_id),
+            'content_hash': authenticated_test_user_picture.content_hash,
+        }
+        assert (await db_session.execute(select(func.count(UserPicture.id)))).scalar_one() == 0
+
+    @pytest.mark.asyncio
+    async def test_outbox_relay_sends_messages_in_batches(
+            self, celery_app: Celery, db_session: AsyncSession, outbox_relay: OutboxRelay,
+    ) -> None:
+        """Test 'OutboxRelay' sends outbox messages to broker in order of creation and deletes them from outbox.
+
+        Args:
+            celery_app: pytest fixture that creates test Celery app.
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+            outbox_relay: pytest fixture, OutboxRelay with mocked broker producer.
+
+        Returns:
+        Nothing.
+        """
+        outbox_message_crud = OutboxMessageCRUD(db_session)
+        outbox_messages = [
+            await outbox_message_crud.add_outbox_message(
+                task=delete_user_picture_in_aws_s3_bucket, kwargs={'user_id': str(index), 'content_hash': None},
+            ) for index in range(3)
+        ]
+        outbox_relay.batch_size = 2
+        try:
+            assert await outbox_relay.relay_outbox_messages() == 2
+            assert await outbox_relay.relay_outbox_messages() == 1
+            assert await outbox_relay.relay_outbox_messages() == 0
+        finally:
+            await outbox_relay.shutdown()
+        sent_tasks = [
+            (call.args[0], call.kwargs['kwargs'], call.kwargs['task_id'])
+            for call in celery_app.send_task.call_args_list
+        ]
+        assert sent_tasks == [
+            (delete_user_picture_in_aws_s3_bucket.name, outbox_message.kwargs, str(outbox_message.id))
+            for outbox_message in outbox_messages
+        ]
+        assert (await db_session.execute(select(func.count(OutboxMessage.id)))).scalar_one() == 0
+
+    @pytest.mark.asyncio
+    async def test_outbox_relay_keeps_messages_when_broker_unavailable(
+            self, celery_app: Celery, db_session: AsyncSession, outbox_relay: OutboxRelay,
+    ) -> None:
+        """Test 'OutboxRelay' keeps outbox messages in outbox when sending to broker fails.
+
+        Args:
+            celery_app: pytest fixture that creates test Celery app.
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+            outbox_relay: pytest fixture, OutboxRelay with mocked broker producer.
+
+        Returns:
+        Nothing.
+        """
+        await OutboxMessageCRUD(db_session).add_outbox_message(task=delete_user_picture_in_aws_s3_bucket, kwargs={})
+        celery_app.send_task.side_effect = ConnectionError
+        try:
+            with pytest.raises(ConnectionError):
+                await outbox_relay.relay_outbox_messages()
+            celery_app.send_task.side_effect = None
+            assert await outbox_relay.relay_outbox_messages() == 1
+        finally:
+            await outbox_relay.shutdown()
+        assert celery_app.send_task.call_count == 2
@@ -0,0 +1,5 @@
+from outbox.utils.outbox_relay import OutboxRelay
+
+__all__ = [
+    'OutboxRelay',
+]
@@ -0,0 +1,123 @@
+from typing import Iterable
+import asyncio
+
+from celery import Celery
+from celery.app.utils import Settings
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from common.constants.outbox import OutboxRelayConstants
+from db import create_engine
+from outbox.cruds import OutboxMessageCRUD
+from utils.logging import setup_logging
+
+
+class OutboxRelay:
+    """Relay sending Celery task messages from transactional outbox to broker in batches.
+
+    Batch of messages is deleted from outbox and sent in one database transaction, the transaction is rolled back
+    if broker is unavailable, so every message is sent at least once. Outbox message id is used as task id.
+    Several relays can run at once, messages locked by one relay are skipped by others.
+    """
+
+    def __init__(self, celery_app: Celery) -> None:
+        self._log = setup_logging(self.__class__.__name__)
+        self.celery_app = celery_app
+        self.db_engine: AsyncEngine | None = None
+        self.db_session_maker: sessionmaker | None = None
+        self.batch_size = OutboxRelayConstants.DEFAULT_BATCH_SIZE.value
+        self.poll_interval = OutboxRelayConstants.DEFAULT_POLL_INTERVAL.value
+        self._stop_event: asyncio.Event | None = None
+
+    @property
+    def started(self) -> bool:
+        return self.db_engine is not None
+
+    def start(self, config: Settings) -> None:
+        """Creates AsyncEngine with single pooled connection and reads relay settings from Celery app config.
+
+        Args:
+            config: Celery app config.
+
+        Returns:
+        Nothing.
+        """
+        if self.started:
+            return
+        self.db_engine = create_engine(
+            database_url=config.get('POSTGRES_DATABASE_URL'),
+            echo=config.get('API_SQLALCHEMY_ECHO'),
+            future=config.get('API_SQLALCHEMY_FUTURE'),
+            pool_size=1,
+            max_overflow=0,
+            pool_pre_ping=True,
+        )
+        self.db_session_maker = sessionmaker(self.db_engine, class_=AsyncSession, expire_on_commit=False)
+        self.batch_size = config.get('OUTBOX_RELAY_BATCH_SIZE', self.batch_size)
+        self.poll_interval = config.get('OUTBOX_RELAY_POLL_INTERVAL', self.poll_interval)
+        self._log.debug(f'OutboxRelay started, batch size: {self.batch_size}, poll interval: {self.poll_interval}.')
+
+    async def shutdown(self) -> None:
+        """Closes connection pool of relay AsyncEngine.
+
+        Returns:
+        Nothing.
+        """
+        if not self.started:
+            return
+        await self.db_engine.dispose()
+        self.db_engine = None
+        self.db_session_maker = None
+        self._log.debug('OutboxRelay stopped.')
+
+    async def relay_outbox_messages(self) -> int:
+        """Sends one batch of the oldest outbox messages to broker.
+
+        Returns:
+        number of sent messages.
+        """
+        async with self.db_session_maker() as session:
+            messages = await OutboxMessageCRUD(session).pop_outbox_messages(self.batch_size)
+            if messages:
+                # Broker client is blocking, the batch is sent from thread while transaction stays open.
+                await asyncio.to_thread(self._send_messages, messages)
+            await session.commit()
+        if messages:
+            self._log.debug(f'{len(messages)} outbox messages sent.')
+        return len(messages)
+
+    def _send_messages(self, messages: Iterable[Row]) -> None:
+        with self.celery_app.producer_or_acquire() as producer:
+            for message in messages:
+                self.celery_app.send_task(
+                    message.task_name, kwargs=message.kwargs, task_id=str(message.id), producer=producer,
+                )
+
+    async def run(self) -> None:
+        """Sends outbox messages until stopped, waits for poll interval only when outbox is drained.
+
+        Returns:
+        Nothing.
+        """
+        self._stop_event = asyncio.Event()
+        while not self._stop_event.is_set():
+            try:
+                sent_count = await self.relay_outbox_messages()
+            except Exception as exc:
+                self._log.error(f'Outbox messages are not sent: {exc!r}.')
+                sent_count = 0
+            if sent_count < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._stop_event.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    def stop(self) -> None:
+        """Stops running relay after current batch is sent.
+
+        Returns:
+        Nothing.
+        """
+        if self._stop_event is not None:
+            self._stop_event.set()
@@ -0,0 +1,26 @@
+import asyncio
+import signal
+
+from app.celery_base import app
+from outbox.utils import OutboxRelay
+
+
+async def run_outbox_relay() -> None:
+    """Runs relay sending Celery task messages from transactional outbox to broker until SIGINT or SIGTERM.
+
+    Returns:
+    Nothing.
+    """
+    outbox_relay = OutboxRelay(celery_app=app)
+    outbox_relay.start(app.conf)
+    loop = asyncio.get_running_loop()
+    for signal_number in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signal_number, outbox_relay.stop)
+    try:
+        await outbox_relay.run()
+    finally:
+        await outbox_relay.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(run_outbox_relay())
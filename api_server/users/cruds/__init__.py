@@ -1,7 +1,11 @@
+from users.cruds.user_picture_contents_crud import UserPictureContentCRUD
+from users.cruds.user_picture_renditions_crud import UserPictureRenditionCRUD
 from users.cruds.user_pictures_crud import UserPictureCRUD
 from users.cruds.users_crud import UserCRUD
 
 __all__ = [
     'UserPictureCRUD',
+    'UserPictureContentCRUD',
+    'UserPictureRenditionCRUD',
     'UserCRUD',
 ]
@@ -0,0 +1,110 @@
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from users.models import UserPicture, UserPictureContent
+from utils.logging import setup_logging
+
+
+class UserPictureContentCRUD:
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._log = setup_logging(self.__class__.__name__)
+        self.session = session
+
+    async def acquire_user_picture_content(self, content_hash: str) -> Row:
+        """Gets and locks UserPictureContent object in the database, creates object for unknown content.
+
+        Changes are not committed, reference is added by committing UserPicture object with the same content_hash.
+
+        Args:
+            content_hash: SHA-256 hash of picture content.
+
+        Returns:
+        Row with url and etag of UserPictureContent.
+        """
+        return await self._acquire_user_picture_content(content_hash)
+
+    async def _acquire_user_picture_content(self, content_hash: str) -> Row:
+        # Upsert with no-op update locks existing row and waits for its concurrent release.
+        q = insert(UserPictureContent).values(content_hash=content_hash)
+        q = q.on_conflict_do_update(
+            index_elements=[UserPictureContent.content_hash],
+            set_={'content_hash': q.excluded.content_hash},
+        ).returning(UserPictureContent.url, UserPictureContent.etag)
+        user_picture_content = (await self.session.execute(q)).one()
+        self._log.debug(f'UserPictureContent with content_hash: "{content_hash}" acquired.')
+        return user_picture_content
+
+    async def update_user_picture_content(self, content_hash: str, url: str, etag: str) -> None:
+        """Saves AWS S3 information of uploaded UserPictureContent in the database, changes are not committed.
+
+        Args:
+            content_hash: SHA-256 hash of picture content.
+            url: url of uploaded picture.
+            etag: Etag of uploaded picture in AWS S3 bucket.
+
+        Returns:
+        Nothing.
+        """
+        return await self._update_user_picture_content(content_hash, url, etag)
+
+    async def _update_user_picture_content(self, content_hash: str, url: str, etag: str) -> None:
+        await self.session.execute(
+            update(UserPictureContent)
+            .where(UserPictureContent.content_hash == content_hash)
+            .values(url=url, etag=etag)
+        )
+        self._log.debug(f'UserPictureContent with content_hash: "{content_hash}" successfully updated.')
+
+    async def release_user_picture_content(self, content_hash: str) -> int | None:
+        """Counts UserPicture objects still referencing UserPictureContent object.
+
+        UserPictureContent object stays locked when no references are left, until it is deleted by
+        'delete_user_picture_content()' method or the transaction is rolled back.
+
+        Args:
+            content_hash: SHA-256 hash of picture content.
+
+        Returns:
+        int of references left, zero if content is not used anymore and its AWS S3 objects can be deleted, None if
+        UserPictureContent object doesn't exist.
+        """
+        return await self._release_user_picture_content(content_hash)
+
+    async def _release_user_picture_content(self, content_hash: str) -> int | None:
+        user_picture_content = (await self.session.execute(
+            select(UserPictureContent.content_hash)
+            .where(UserPictureContent.content_hash == content_hash)
+            .with_for_update()
+        )).scalar_one_or_none()
+        if user_picture_content is None:
+            await self.session.commit()
+            self._log.debug(f'UserPictureContent with content_hash: "{content_hash}" not found.')
+            return None
+        reference_count = (await self.session.execute(
+            select(func.count(UserPicture.id)).where(UserPicture.content_hash == content_hash)
+        )).scalar_one()
+        if reference_count:
+            await self.session.commit()
+        self._log.debug(
+            f'UserPictureContent with content_hash: "{content_hash}" released, references: {reference_count}.'
+        )
+        return reference_count
+
+    async def delete_user_picture_content(self, content_hash: str) -> None:
+        """Deletes UserPictureContent object from the database.
+
+        Args:
+            content_hash: SHA-256 hash of picture content.
+
+        Returns:
+        Nothing.
+        """
+        return await self._delete_user_picture_content(content_hash)
+
+    async def _delete_user_picture_content(self, content_hash: str) -> None:
+        await self.session.execute(delete(UserPictureContent).where(UserPictureContent.content_hash == content_hash))
+        await self.session.commit()
+        self._log.debug(f'UserPictureContent with content_hash: "{content_hash}" successfully deleted.')
@@ -0,0 +1,102 @@
+from uuid import UUID
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from common.constants.users import UserPictureRenditionConstants
+from users.models import UserPicture, UserPictureRendition
+from users.schemas.user_pictures import UserPictureRenditionSchema
+from utils.logging import setup_logging
+
+
+class UserPictureRenditionCRUD:
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._log = setup_logging(self.__class__.__name__)
+        self.session = session
+
+    async def replace_user_picture_renditions(
+            self, picture_id: UUID, renditions: list[UserPictureRenditionSchema],
+    ) -> list[UserPictureRendition]:
+        """Replaces all UserPictureRendition objects of UserPicture in the database.
+
+        Args:
+            picture_id: UUID of UserPicture object.
+            renditions: list of UserPictureRenditionSchema objects.
+
+        Returns:
+        list of newly created UserPictureRendition objects.
+        """
+        return await self._replace_user_picture_renditions(picture_id, renditions)
+
+    async def _replace_user_picture_renditions(
+            self, picture_id: UUID, renditions: list[UserPictureRenditionSchema],
+    ) -> list[UserPictureRendition]:
+        await self.session.execute(
+            delete(UserPictureRendition).where(UserPictureRendition.picture_id == picture_id)
+        )
+        user_picture_renditions = [
+            UserPictureRendition(picture_id=picture_id, **rendition.dict()) for rendition in renditions
+        ]
+        self.session.add_all(user_picture_renditions)
+        await self.session.commit()
+        self._log.debug(
+            f'{len(user_picture_renditions)} UserPictureRenditions of UserPicture with id: "{picture_id}" saved.'
+        )
+        return user_picture_renditions
+
+    async def get_user_picture_rendition(
+            self, picture_id: UUID, size: str, image_format: str | None = None,
+    ) -> UserPictureRendition | None:
+        """Get UserPictureRendition object from database filtered by UserPicture id, size and image format.
+
+        Args:
+            picture_id: UUID of UserPicture object.
+            size: rendition size name.
+            image_format: rendition image format, JPEG or PNG rendition is selected if not provided.
+
+        Returns:
+        single UserPictureRendition object or None.
+        """
+        return await self._get_user_picture_rendition(picture_id, size, image_format)
+
+    async def _get_user_picture_rendition(
+            self, picture_id: UUID, size: str, image_format: str | None = None,
+    ) -> UserPictureRendition | None:
+        self._log.debug(
+            f'Getting UserPictureRendition with "picture_id": "{picture_id}", "size": "{size}", '
+            f'"image_format": "{image_format}" from the db.'
+        )
+        image_formats = [image_format] if image_format else [
+            UserPictureRenditionConstants.JPEG_FORMAT.value,
+            UserPictureRenditionConstants.PNG_FORMAT.value,
+        ]
+        q = select(UserPictureRendition).where(
+            UserPictureRendition.picture_id == picture_id,
+            UserPictureRendition.size == size,
+            UserPictureRendition.image_format.in_(image_formats),
+        ).limit(1)
+        return (await self.session.execute(q)).scalars().one_or_none()
+
+    async def get_user_picture_renditions_by_content_hash(self, content_hash: str) -> list[UserPictureRendition]:
+        """Get UserPictureRendition objects of any UserPicture with the same content from the database.
+
+        Args:
+            content_hash: SHA-256 hash of picture content.
+
+        Returns:
+        list of UserPictureRendition objects of a single UserPicture, empty if renditions are not created yet.
+        """
+        return await self._get_user_picture_renditions_by_content_hash(content_hash)
+
+    async def _get_user_picture_renditions_by_content_hash(self, content_hash: str) -> list[UserPictureRendition]:
+        self._log.debug(f'Getting UserPictureRenditions with "content_hash": "{content_hash}" from the db.')
+        picture_id = select(
+            UserPictureRendition.picture_id
+        ).join(
+            UserPicture, UserPicture.id == UserPictureRendition.picture_id,
+        ).where(
+            UserPicture.content_hash == content_hash,
+        ).limit(1).scalar_subquery()
+        q = select(UserPictureRendition).where(UserPictureRendition.picture_id == picture_id)
+        return (await self.session.execute(q)).scalars().all()
@@ -1,8 +1,9 @@
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from users.cruds.users_crud import UserCRUD
 from users.models import UserPicture
 from users.schemas.user_pictures import UserPictureUpdateSchema
 from utils.logging import setup_logging
@@ -14,22 +15,24 @@ class UserPictureCRUD:
         self._log = setup_logging(self.__class__.__name__)
         self.session = session
 
-    async def add_user_picture(self, id_: UUID) -> UserPicture:
+    async def add_user_picture(self, id_: UUID, picture_id: UUID | None = None) -> UserPicture:
         """Add UserPicture object to the database.
 
         Args:
             id_: UUID of User object.
+            picture_id: UUID of created UserPicture object, generated if not provided.
 
         Returns:
         newly created UserPicture object.
         """
-        return await self._add_user_picture(id_)
+        return await self._add_user_picture(id_, picture_id)
 
-    async def _add_user_picture(self, id_: UUID) -> UserPicture:
-        user_picture = UserPicture(user_id=id_)
+    async def _add_user_picture(self, id_: UUID, picture_id: UUID | None = None) -> UserPicture:
+        user_picture = UserPicture(id=picture_id or uuid4(), user_id=id_)
         self.session.add(user_picture)
         await self.session.commit()
         await self.session.refresh(user_picture)
+        await UserCRUD(session=self.session).invalidate_cached_charities(id_)
         self._log.debug(f'UserPicture with id: "{user_picture.id}" successfully created.')
         return user_picture
 
@@ -52,7 +55,10 @@ class UserPictureCRUD:
         await self.session.commit()
         # Return updated UserPicture.
         self._log.debug(f'UserPicture with id: "{picture_id}" successfully updated.')
-        return await self._get_user_picture_by_id(id_=picture_id)
+        user_picture = await self._get_user_picture_by_id(id_=picture_id)
+        if user_picture is not None:
+            await UserCRUD(session=self.session).invalidate_cached_charities(user_picture.user_id)
+        return user_picture
 
     async def get_user_picture_by_id(self, id_: UUID) -> UserPicture:
         """Get UserPicture object from database filtered by id.
@@ -89,4 +95,5 @@ class UserPictureCRUD:
     async def _delete_user_picture(self, user_picture: UserPicture) -> None:
         await self.session.delete(user_picture)
         await self.session.commit()
+        await UserCRUD(session=self.session).invalidate_cached_charities(user_picture.user_id)
         self._log.debug(f'UserPicture with id: "{user_picture.id}" successfully deleted.')
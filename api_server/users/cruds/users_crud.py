@@ -1,13 +1,19 @@
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import func, update
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import joinedload, selectinload
 
+from charities.models import CharityEmployeeAssociation, Employee
+from common.constants.cache import ReadThroughCacheConstants
 from users.models import User
 from users.schemas import UserInputSchema, UserUpdateSchema
+from utils.cache import read_through_cache
+from utils.count_providers import pagination_count_provider
 from utils.logging import setup_logging
+from utils.orm_helpers import apply_keyset_pagination
 
 
 class UserCRUD:
@@ -30,12 +36,36 @@ class UserCRUD:
 
     async def _get_users(self, page: int, page_size: int) -> None:
         self._log.debug('Getting all users from the db.')
-        q = select(User).limit(page_size).offset((page - 1) * page_size)
+        q = select(User).options(joinedload(User.profile_picture)).limit(page_size).offset((page - 1) * page_size)
         return (await self.session.execute(q)).scalars().all()
 
-    async def _select_user(self, column: str, value: UUID | str) -> None:
+    async def get_users_by_cursor(self, after: tuple[datetime, UUID] | None, page_size: int) -> list[User]:
+        """Get User objects from database with keyset pagination.
+
+        Args:
+            after: tuple with 'created_at' and 'id' of the last user on a previous page, None for the first page.
+            page_size: number of items per page.
+
+        Returns:
+        list of User objects with one extra User object in case next page exists.
+        """
+        return await self._get_users_by_cursor(after, page_size)
+
+    async def _get_users_by_cursor(self, after: tuple[datetime, UUID] | None, page_size: int) -> list[User]:
+        self._log.debug(f'Getting users from the db after: {after} with page size: {page_size}.')
+        q = apply_keyset_pagination(
+            select(User).options(joinedload(User.profile_picture)), model=User, after=after, page_size=page_size,
+        )
+        return (await self.session.execute(q)).scalars().all()
+
+    async def _select_user(self, column: str, value: UUID | str, options: tuple = ()) -> None:
         self._log.debug(f'Getting user with "{column}": "{value}" from the db.')
-        user = await self.session.execute(select(User).where(User.__table__.columns[column] == value))
+        user = await self.session.execute(
+            select(User)
+            .where(User.__table__.columns[column] == value)
+            .options(*options)
+            .execution_options(populate_existing=True)
+        )
         return user.scalars().one_or_none()
 
     async def get_user_by_id(self, id_: UUID) -> User:
@@ -50,7 +80,7 @@ class UserCRUD:
         return await self._get_user_by_id(id_)
 
     async def _get_user_by_id(self, id_: UUID) -> None:
-        return await self._select_user(column='id', value=id_)
+        return await self._select_user(column='id', value=id_, options=(joinedload(User.profile_picture),))
 
     async def add_user(self, user: UserInputSchema) -> User:
         """Add User object to the database.
@@ -67,9 +97,9 @@ class UserCRUD:
         user = User(**user.dict())
         self.session.add(user)
         await self.session.commit()
-        await self.session.refresh(user)
+        pagination_count_provider.invalidate(User)
         self._log.debug(f'User with id: "{user.id}" successfully created.')
-        return user
+        return await self._get_user_by_id(id_=user.id)
 
     async def update_user(self, id_: UUID, user: UserUpdateSchema) -> User:
         """Updates User object in the database.
@@ -86,6 +116,7 @@ class UserCRUD:
     async def _update_user(self, id_: UUID, user: UserUpdateSchema) -> None:
         await self.session.execute(update(User).where(User.id == id_).values(**user.dict()))
         await self.session.commit()
+        await self._invalidate_cached_charities(await self._get_employing_charity_ids(id_))
         # Return updated user.
         self._log.debug(f'User with id: "{id_}" successfully updated.')
         return await self._get_user_by_id(id_=id_)
@@ -102,10 +133,49 @@ class UserCRUD:
         return await self._delete_user(id_)
 
     async def _delete_user(self, user: User) -> None:
+        # Relationships with delete cascade have to be loaded before deletion.
+        await self._select_user(
+            column='id',
+            value=user.id,
+            options=(
+                joinedload(User.profile_picture),
+                joinedload(User.employee),
+                selectinload(User.email_confirmation_token),
+                selectinload(User.change_password_token),
+            ),
+        )
+        charity_ids = await self._get_employing_charity_ids(user.id)
         await self.session.delete(user)
         await self.session.commit()
+        pagination_count_provider.invalidate(User)
+        await self._invalidate_cached_charities(charity_ids)
         self._log.debug(f'User with id: "{user.id}" successfully deleted.')
 
+    async def invalidate_cached_charities(self, id_: UUID) -> None:
+        """Drops cached charities listing user as employee, they are loaded with current user data on the next read.
+
+        Args:
+            id_: UUID of user.
+
+        Returns:
+        Nothing.
+        """
+        return await self._invalidate_cached_charities(await self._get_employing_charity_ids(id_))
+
+    async def _get_employing_charity_ids(self, id_: UUID) -> list[UUID]:
+        q = select(
+            CharityEmployeeAssociation.charity_id,
+        ).join(
+            Employee, Employee.id == CharityEmployeeAssociation.employee_id,
+        ).where(
+            Employee.user_id == id_,
+        )
+        return (await self.session.execute(q)).scalars().all()
+
+    async def _invalidate_cached_charities(self, charity_ids: list[UUID]) -> None:
+        # Cached charity embeds data and profile picture of its employees.
+        await read_through_cache.invalidate(ReadThroughCacheConstants.CHARITIES_NAMESPACE.value, *charity_ids)
+
     async def get_user_by_username(self, username: str) -> User:
         """Get User object from database filtered by username.
 
@@ -118,7 +188,9 @@ class UserCRUD:
         return await self._get_user_by_username(username)
 
     async def _get_user_by_username(self, username: str) -> None:
-        return await self._select_user(column='username', value=username)
+        return await self._select_user(
+            column='username', value=username, options=(joinedload(User.profile_picture),),
+        )
 
     async def get_user_by_email(self, email: str) -> User:
         """Get User object from database filtered by email.
@@ -132,7 +204,7 @@ class UserCRUD:
         return await self._get_user_by_email(email)
 
     async def _get_user_by_email(self, email: str) -> None:
-        return await self._select_user(column='email', value=email)
+        return await self._select_user(column='email', value=email, options=(joinedload(User.profile_picture),))
 
     async def _activate_user_by_id(self, id_: UUID) -> None:
         """Activates User by setting 'activated_at' field with current time.
@@ -155,15 +227,15 @@ class UserCRUD:
         await self.session.commit()
         self._log.debug(f'User with id: "{id_}" successfully activated.')
 
-    async def _get_total_of_users(self) -> int:
-        """Counts number of users in User table.
+    async def _get_total_of_users(self) -> tuple[int, bool]:
+        """Counts number of users in User table with configured pagination count strategy.
 
         Returns:
-        Quantity of user objects in User table.
+        tuple with quantity of user objects in User table and bool whether quantity is exact.
         """
-        total_users = (await self.session.execute(select(func.count(User.id)))).scalar_one()
-        self._log.debug(f'User table has totally: "{total_users}" users.')
-        return total_users
+        total_users, is_exact = await pagination_count_provider.count(self.session, User)
+        self._log.debug(f'User table has totally: "{total_users}" users, exact: {is_exact}.')
+        return total_users, is_exact
 
     async def _update_user_password(self, id_, pass_hash: str) -> None:
         """Updates user's 'password' field data in table.
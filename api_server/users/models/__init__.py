@@ -1,6 +1,8 @@
-from users.models.users import User, UserPicture
+from users.models.users import User, UserPicture, UserPictureContent, UserPictureRendition
 
 __all__ = [
     'User',
     'UserPicture',
+    'UserPictureContent',
+    'UserPictureRendition',
 ]
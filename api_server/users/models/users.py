@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Column, DateTime, ForeignKey, String, func
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, UniqueConstraint, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -13,6 +13,9 @@ class User(Base):
     """A model representing a user."""
 
     __tablename__ = 'users'
+    __table_args__ = (
+        Index('ix_users_created_at_id', 'created_at', 'id'),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4)
     first_name = Column(String(UserModelConstants.CHAR_SIZE_64.value), nullable=True)
@@ -24,16 +27,16 @@ class User(Base):
     activated_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, server_default=func.now())
     profile_picture = relationship(
-        'UserPicture', back_populates='user', uselist=False, lazy='selectin', cascade='all, delete',
+        'UserPicture', back_populates='user', uselist=False, lazy='raise', cascade='all, delete',
     )
     email_confirmation_token = relationship(
-        'EmailConfirmationToken', back_populates='user', lazy='selectin', cascade='all, delete',
+        'EmailConfirmationToken', back_populates='user', lazy='raise', cascade='all, delete',
     )
     change_password_token = relationship(
-        'ChangePasswordToken', back_populates='user', lazy='selectin', cascade='all, delete',
+        'ChangePasswordToken', back_populates='user', lazy='raise', cascade='all, delete',
     )
     employee = relationship(
-        'Employee', back_populates='user', uselist=False, lazy='selectin', cascade='all, delete',
+        'Employee', back_populates='user', uselist=False, lazy='raise', cascade='all, delete',
     )
 
     __mapper_args__ = {'eager_defaults': True}
@@ -49,13 +52,58 @@ class UserPicture(Base):
 
     id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=False, unique=True)
-    url = Column(String(UserPictureModelConstants.CHAR_SIZE_512.value), nullable=True, unique=True)
+    url = Column(String(UserPictureModelConstants.CHAR_SIZE_512.value), nullable=True)
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, nullable=True)
-    user = relationship('User', back_populates='profile_picture')
+    user = relationship('User', back_populates='profile_picture', lazy='raise')
     etag = Column(String(UserPictureModelConstants.CHAR_SIZE_512.value), nullable=True)
+    content_hash = Column(String(UserPictureModelConstants.CHAR_SIZE_64.value), nullable=True, index=True)
+    renditions = relationship(
+        'UserPictureRendition', back_populates='picture', lazy='raise', cascade='all, delete', passive_deletes=True,
+    )
 
     __mapper_args__ = {'eager_defaults': True}
 
     def __repr__(self):
         return f'UserPicture: id={self.id}, url={self.url}, created_at={self.created_at}'
+
+
+class UserPictureContent(Base):
+    """A model representing picture content stored in AWS S3 bucket and shared by UserPictures with the same content."""
+
+    __tablename__ = 'user-picture-contents'
+
+    content_hash = Column(String(UserPictureModelConstants.CHAR_SIZE_64.value), primary_key=True)
+    url = Column(String(UserPictureModelConstants.CHAR_SIZE_512.value), nullable=True)
+    etag = Column(String(UserPictureModelConstants.CHAR_SIZE_512.value), nullable=True)
+    created_at = Column(DateTime, server_default=func.now())
+
+    def __repr__(self):
+        return f'UserPictureContent: content_hash={self.content_hash}, url={self.url}'
+
+
+class UserPictureRendition(Base):
+    """A model representing resized and re-encoded copy of user's profile picture."""
+
+    __tablename__ = 'user-picture-renditions'
+    __table_args__ = (
+        UniqueConstraint('picture_id', 'size', 'image_format'),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4)
+    picture_id = Column(
+        UUID(as_uuid=True), ForeignKey('user-pictures.id', ondelete='CASCADE'), nullable=False, index=True,
+    )
+    size = Column(String(UserPictureModelConstants.CHAR_SIZE_16.value), nullable=False)
+    image_format = Column(String(UserPictureModelConstants.CHAR_SIZE_16.value), nullable=False)
+    width = Column(Integer, nullable=False)
+    height = Column(Integer, nullable=False)
+    url = Column(String(UserPictureModelConstants.CHAR_SIZE_512.value), nullable=False)
+    etag = Column(String(UserPictureModelConstants.CHAR_SIZE_512.value), nullable=True)
+    created_at = Column(DateTime, server_default=func.now())
+    picture = relationship('UserPicture', back_populates='renditions', lazy='raise')
+
+    __mapper_args__ = {'eager_defaults': True}
+
+    def __repr__(self):
+        return f'UserPictureRendition: id={self.id}, size={self.size}, image_format={self.image_format}'
@@ -1,5 +1,7 @@
+from users.routers.picture_files import picture_files_router
 from users.routers.users import users_router
 
 __all__ = [
+    'picture_files_router',
     'users_router',
 ]
@@ -0,0 +1,32 @@
+from fastapi import APIRouter, Depends, Request
+
+from users.services.picture_files import PictureFileService
+from utils.file_responses import create_file_response
+
+picture_files_router = APIRouter(prefix='/picture-files', tags=['Picture-files'])
+
+
+@picture_files_router.get('/{file_name:path}')
+async def get_picture_file(
+        request: Request,
+        file_name: str,
+        picture_file_service: PictureFileService = Depends(),
+):
+    """GET '/picture-files/{file_name}' endpoint view function, serves pictures saved in local storage.
+
+    Args:
+        request: FastAPI Request object.
+        file_name: full file path in storage.
+        picture_file_service: dependency as business logic instance.
+
+    Returns:
+    file response with stored etag, supports 'If-None-Match' and 'Range' request headers.
+    """
+    stored_file = await picture_file_service.get_picture_file(file_name)
+    return create_file_response(
+        request,
+        path=stored_file.path,
+        stat_result=stored_file.stat_result,
+        etag=stored_file.etag,
+        media_type=stored_file.content_type,
+    )
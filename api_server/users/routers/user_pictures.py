@@ -1,22 +1,25 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Response, UploadFile, status
-
-from fastapi_jwt_auth import AuthJWT
+from fastapi import APIRouter, Depends, Query, Response, UploadFile, status
 
+from auth.utils.current_user import CurrentUser, get_current_user
+from common.constants.users import UserPictureRenditionConstants
 from common.schemas.responses import ResponseBaseSchema
 from users.schemas.user_pictures import UserPictureOutputSchema
 from users.services.user_pictures import UserPictureService
+from utils.json_responses import ORJSONModelResponse
 
 user_pictures_router = APIRouter(prefix='/pictures', tags=['User-pictures'])
 
 
-@user_pictures_router.post('/', response_model=ResponseBaseSchema, status_code=status.HTTP_201_CREATED)
+@user_pictures_router.post(
+    '/', response_model=ResponseBaseSchema[UserPictureOutputSchema], status_code=status.HTTP_201_CREATED,
+)
 async def post_user_pictures(
         user_id: UUID,
         image: UploadFile,
         user_picture_service: UserPictureService = Depends(),
-        Authorize: AuthJWT = Depends(),
+        current_user: CurrentUser = Depends(get_current_user),
 ):
     """POST '/users/{user_id}/pictures' endpoint view function.
 
@@ -24,29 +27,30 @@ async def post_user_pictures(
         user_id: UUID of a User.
         image: image: Uploaded user image.
         user_picture_service: dependency as business logic instance.
-        Authorize: dependency of AuthJWT library for JWT tokens.
+        current_user: dependency with request-scoped CurrentUser of authenticated user.
 
     Returns:
     ResponseBaseSchema object with UserPictureOutputSchema object as response data.
     """
-    Authorize.jwt_required()
-    jwt_subject = Authorize.get_jwt_subject()
-    return ResponseBaseSchema(
-        status_code=status.HTTP_201_CREATED,
-        data=UserPictureOutputSchema.from_orm(
-            await user_picture_service.add_user_picture(id_=user_id, image=image, jwt_subject=jwt_subject)
+    jwt_subject = current_user.username
+    return ORJSONModelResponse(
+        ResponseBaseSchema[UserPictureOutputSchema](
+            status_code=status.HTTP_201_CREATED,
+            data=UserPictureOutputSchema.from_orm(
+                await user_picture_service.add_user_picture(id_=user_id, image=image, jwt_subject=jwt_subject)
+            ),
+            errors=[],
         ),
-        errors=[],
     )
 
 
-@user_pictures_router.put('/{picture_id}', response_model=ResponseBaseSchema)
+@user_pictures_router.put('/{picture_id}', response_model=ResponseBaseSchema[UserPictureOutputSchema])
 async def put_user_picture(
         user_id: UUID,
         picture_id: UUID,
         image: UploadFile,
         user_picture_service: UserPictureService = Depends(),
-        Authorize: AuthJWT = Depends(),
+        current_user: CurrentUser = Depends(get_current_user),
 ):
     """PUT '/users/{user_id}/pictures/{picture_id}' endpoint view function.
 
@@ -55,26 +59,36 @@ async def put_user_picture(
         picture_id: UUID of a UserPicture object.
         image: image: Uploaded user image.
         user_picture_service: dependency as business logic instance.
-        Authorize: dependency of AuthJWT library for JWT tokens.
+        current_user: dependency with request-scoped CurrentUser of authenticated user.
 
     Returns:
     ResponseBaseSchema object with UserPictureOutputSchema object as response data.
     """
-    Authorize.jwt_required()
-    jwt_subject = Authorize.get_jwt_subject()
-    return ResponseBaseSchema(
-        status_code=status.HTTP_200_OK,
-        data=UserPictureOutputSchema.from_orm(await user_picture_service.update_user_picture(
-            id_=user_id, picture_id=picture_id, image=image, jwt_subject=jwt_subject,
-        )),
-        errors=[],
+    jwt_subject = current_user.username
+    return ORJSONModelResponse(
+        ResponseBaseSchema[UserPictureOutputSchema](
+            status_code=status.HTTP_200_OK,
+            data=UserPictureOutputSchema.from_orm(await user_picture_service.update_user_picture(
+                id_=user_id, picture_id=picture_id, image=image, jwt_subject=jwt_subject,
+            )),
+            errors=[],
+        ),
     )
 
 
-@user_pictures_router.get('/{picture_id}', response_model=ResponseBaseSchema)
+@user_pictures_router.get('/{picture_id}', response_model=ResponseBaseSchema[UserPictureOutputSchema])
 async def get_user_picture(
         user_id: UUID,
         picture_id: UUID,
+        size: str = Query(
+            default=UserPictureRenditionConstants.ORIGINAL_SIZE.value,
+            regex=UserPictureRenditionConstants.SIZE_REGEX.value,
+        ),
+        image_format: str | None = Query(
+            default=None,
+            alias='format',
+            regex=UserPictureRenditionConstants.FORMAT_REGEX.value,
+        ),
         user_picture_service: UserPictureService = Depends(),
 ):
     """GET '/users/{user_id}/pictures/{picture_id}' endpoint view function.
@@ -82,17 +96,23 @@ async def get_user_picture(
     Args:
         user_id: UUID of a User object.
         picture_id: UUID of a UserPicture object.
+        size: picture size, one of 'original', 'medium', 'small', 'thumbnail'.
+        image_format: picture rendition format, one of 'jpeg', 'png', 'webp', 'avif'.
         user_picture_service: dependency as business logic instance.
 
     Returns:
     ResponseBaseSchema object with UserPictureOutputSchema object as response data.
     """
-    return ResponseBaseSchema(
-        status_code=status.HTTP_200_OK,
-        data=UserPictureOutputSchema.from_orm(await user_picture_service.get_user_picture_by_id(
-            picture_id=picture_id,
-        )),
-        errors=[],
+    user_picture = await user_picture_service.get_user_picture_by_id(picture_id=picture_id)
+    return ORJSONModelResponse(
+        ResponseBaseSchema[UserPictureOutputSchema](
+            status_code=status.HTTP_200_OK,
+            data=UserPictureOutputSchema(
+                id=user_picture.id,
+                url=await user_picture_service.get_user_picture_url(user_picture, size, image_format),
+            ),
+            errors=[],
+        ),
     )
 
 
@@ -101,7 +121,7 @@ async def delete_user_picture(
         user_id: UUID,
         picture_id: UUID,
         user_picture_service: UserPictureService = Depends(),
-        Authorize: AuthJWT = Depends(),
+        current_user: CurrentUser = Depends(get_current_user),
 ):
     """DELETE '/users/{user_id}/pictures/{picture_id}' endpoint view function.
 
@@ -109,12 +129,11 @@ async def delete_user_picture(
         user_id: UUID of a User object.
         picture_id: UUID of a UserPicture object.
         user_picture_service: dependency as business logic instance.
-        Authorize: dependency of AuthJWT library for JWT tokens.
+        current_user: dependency with request-scoped CurrentUser of authenticated user.
 
     Returns:
     http response with no data and 204 status code.
     """
-    Authorize.jwt_required()
-    jwt_subject = Authorize.get_jwt_subject()
+    jwt_subject = current_user.username
     await user_picture_service.delete_user_picture(user_id, picture_id, jwt_subject)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
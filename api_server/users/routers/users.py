@@ -1,21 +1,31 @@
+from typing import Union
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, Response, status
-
-from fastapi_jwt_auth import AuthJWT
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 
+from auth.utils.current_user import CurrentUser, get_current_user
 from common.constants.users import UserRouteConstants
 from common.schemas.responses import ResponseBaseSchema
 from users.routers.user_pictures import user_pictures_router
-from users.schemas import UserInputSchema, UserOutputSchema, UserPaginatedOutputSchema, UserUpdateSchema
+from users.schemas import (
+    UserCursorPaginatedOutputSchema,
+    UserInputSchema,
+    UserOutputSchema,
+    UserPaginatedOutputSchema,
+    UserUpdateSchema,
+)
 from users.services import UserService
+from utils.json_responses import ORJSONModelResponse, create_conditional_response, serialize_response_data
 
 users_router = APIRouter(prefix='/users', tags=['Users'])
 users_router.include_router(user_pictures_router, prefix='/{user_id}')
 
 
-@users_router.get('/', response_model=ResponseBaseSchema)
+@users_router.get(
+    '/', response_model=ResponseBaseSchema[Union[UserPaginatedOutputSchema, UserCursorPaginatedOutputSchema]],
+)
 async def get_users(
+        request: Request,
         page: int = Query(
             default=UserRouteConstants.DEFAULT_START_PAGE.value,
             gt=UserRouteConstants.ZERO_NUMBER.value,
@@ -25,48 +35,61 @@ async def get_users(
             gt=UserRouteConstants.ZERO_NUMBER.value,
             lt=UserRouteConstants.MAX_PAGINATION_PAGE_SIZE.value,
         ),
+        cursor: str | None = Query(default=None),
         user_service: UserService = Depends()
-) -> ResponseBaseSchema:
+) -> Response:
     """GET '/users' endpoint view function.
 
     Args:
+        request: FastAPI Request object.
         page: pagination page.
         page_size: pagination page size, how many items to show per page.
+        cursor: opaque keyset pagination cursor, switches endpoint to keyset pagination, empty for the first page.
         user_service: dependency as business logic instance.
 
     Returns:
-    ResponseBaseSchema object with list of UserOutputSchema objects as response data.
+    ResponseBaseSchema JSON with list of UserOutputSchema objects as response data, 304 response without body
+    if client has current page.
     """
-    return ResponseBaseSchema(
-        status_code=status.HTTP_200_OK,
-        data=UserPaginatedOutputSchema.from_orm(await user_service.get_users(page, page_size)),
-        errors=[],
+    if cursor is not None:
+        data = UserCursorPaginatedOutputSchema.from_orm(await user_service.get_users_by_cursor(cursor, page_size))
+    else:
+        data = UserPaginatedOutputSchema.from_orm(await user_service.get_users(page, page_size))
+    return create_conditional_response(
+        request,
+        serialize_response_data(ResponseBaseSchema(status_code=status.HTTP_200_OK, data=data, errors=[])),
+        cache_control=UserRouteConstants.LIST_CACHE_CONTROL.value,
     )
 
 
-@users_router.get('/{id}', response_model=ResponseBaseSchema)
-async def get_user(id: UUID, user_service: UserService = Depends()) -> ResponseBaseSchema:
+@users_router.get('/{id}', response_model=ResponseBaseSchema[UserOutputSchema])
+async def get_user(request: Request, id: UUID, user_service: UserService = Depends()) -> Response:
     """GET '/users/{id}' endpoint view function.
 
     Args:
+        request: FastAPI Request object.
         id: UUID of user.
         user_service: dependency as business logic instance.
 
     Returns:
-    ResponseBaseSchema object with UserOutputSchema object as response data.
+    ResponseBaseSchema JSON with UserOutputSchema object as response data, 304 response without body if client
+    has current user.
     """
-    return ResponseBaseSchema(
+    response_data = ResponseBaseSchema(
         status_code=status.HTTP_200_OK,
         data=UserOutputSchema.from_orm(await user_service.get_user_by_id(id_=id)),
         errors=[],
     )
+    return create_conditional_response(
+        request, serialize_response_data(response_data), cache_control=UserRouteConstants.DETAIL_CACHE_CONTROL.value,
+    )
 
 
-@users_router.post('/', response_model=ResponseBaseSchema, status_code=status.HTTP_201_CREATED)
+@users_router.post('/', response_model=ResponseBaseSchema[UserOutputSchema], status_code=status.HTTP_201_CREATED)
 async def post_users(
         user: UserInputSchema,
         user_service: UserService = Depends(),
-) -> ResponseBaseSchema:
+) -> ORJSONModelResponse:
     """POST '/users' endpoint view function.
 
     Args:
@@ -76,52 +99,59 @@ async def post_users(
     Returns:
     ResponseBaseSchema object with UserOutputSchema object as response data.
     """
-    return ResponseBaseSchema(
-        status_code=status.HTTP_201_CREATED,
-        data=UserOutputSchema.from_orm(await user_service.add_user(user=user)),
-        errors=[],
+    return ORJSONModelResponse(
+        ResponseBaseSchema[UserOutputSchema](
+            status_code=status.HTTP_201_CREATED,
+            data=UserOutputSchema.from_orm(await user_service.add_user(user=user)),
+            errors=[],
+        ),
     )
 
 
-@users_router.put('/{id}', response_model=ResponseBaseSchema)
+@users_router.put('/{id}', response_model=ResponseBaseSchema[UserOutputSchema])
 async def put_user(
-        id: UUID, update_data: UserUpdateSchema, user_service: UserService = Depends(), Authorize: AuthJWT = Depends(),
-) -> ResponseBaseSchema:
+        id: UUID,
+        update_data: UserUpdateSchema,
+        user_service: UserService = Depends(),
+        current_user: CurrentUser = Depends(get_current_user),
+) -> ORJSONModelResponse:
     """PUT '/users/{id}' endpoint view function.
 
     Args:
         id: UUID of user.
         update_data: Serialized UserUpdateSchema object.
         user_service: dependency as business logic instance.
-        Authorize: dependency of AuthJWT library for JWT tokens.
+        current_user: dependency with request-scoped CurrentUser of authenticated user.
 
     Returns:
     ResponseBaseSchema object with UserOutputSchema object as response data.
     """
-    Authorize.jwt_required()
-    jwt_subject = Authorize.get_jwt_subject()
-    return ResponseBaseSchema(
-        status_code=status.HTTP_200_OK,
-        data=UserOutputSchema.from_orm(
-            await user_service.update_user(id_=id, jwt_subject=jwt_subject, update_data=update_data)
+    jwt_subject = current_user.username
+    return ORJSONModelResponse(
+        ResponseBaseSchema[UserOutputSchema](
+            status_code=status.HTTP_200_OK,
+            data=UserOutputSchema.from_orm(
+                await user_service.update_user(id_=id, jwt_subject=jwt_subject, update_data=update_data)
+            ),
+            errors=[],
         ),
-        errors=[],
     )
 
 
 @users_router.delete('/{id}')
-async def delete_user(id: UUID, user_service: UserService = Depends(), Authorize: AuthJWT = Depends()) -> Response:
+async def delete_user(
+        id: UUID, user_service: UserService = Depends(), current_user: CurrentUser = Depends(get_current_user),
+) -> Response:
     """DELETE '/users/{id}' endpoint view function.
 
     Args:
         id: UUID of user.
         user_service: dependency as business logic instance.
-        Authorize: dependency of AuthJWT library for JWT tokens.
+        current_user: dependency with request-scoped CurrentUser of authenticated user.
 
     Returns:
     http response with no data and 204 status code.
     """
-    Authorize.jwt_required()
-    jwt_subject = Authorize.get_jwt_subject()
+    jwt_subject = current_user.username
     await user_service.delete_user(id_=id, jwt_subject=jwt_subject)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
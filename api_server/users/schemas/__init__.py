@@ -1,11 +1,19 @@
-from users.schemas.user_pictures import UserPictureOutputSchema, UserPictureUpdateSchema
-from users.schemas.users import UserInputSchema, UserOutputSchema, UserPaginatedOutputSchema, UserUpdateSchema
+from users.schemas.user_pictures import UserPictureOutputSchema, UserPictureRenditionSchema, UserPictureUpdateSchema
+from users.schemas.users import (
+    UserCursorPaginatedOutputSchema,
+    UserInputSchema,
+    UserOutputSchema,
+    UserPaginatedOutputSchema,
+    UserUpdateSchema,
+)
 
 __all__ = [
     'UserInputSchema',
     'UserOutputSchema',
     'UserPaginatedOutputSchema',
+    'UserCursorPaginatedOutputSchema',
     'UserUpdateSchema',
     'UserPictureOutputSchema',
     'UserPictureUpdateSchema',
+    'UserPictureRenditionSchema',
 ]
@@ -36,3 +36,23 @@ class UserPictureUpdateSchema(UserPictureBaseSchema):
     etag: str = Field(
         description='Etag of user picture in AWS S3 bucket.',
     )
+    content_hash: str | None = Field(
+        description="SHA-256 hash of user's picture content.",
+        max_length=UserPictureSchemaConstants.CHAR_SIZE_64.value,
+    )
+
+
+class UserPictureRenditionSchema(UserPictureBaseSchema):
+    """UserPictureRendition schema for UserPictureRendition model."""
+    size: str = Field(description="Rendition size name of user's picture.")
+    image_format: str = Field(description="Rendition image format of user's picture.")
+    width: int = Field(description="Rendition width in pixels of user's picture.")
+    height: int = Field(description="Rendition height in pixels of user's picture.")
+    url: str = Field(
+        description="url of user's picture rendition.",
+        min_length=UserPictureSchemaConstants.CHAR_SIZE_2.value,
+        max_length=UserPictureSchemaConstants.CHAR_SIZE_512.value,
+    )
+    etag: str | None = Field(
+        description='Etag of user picture rendition in AWS S3 bucket.',
+    )
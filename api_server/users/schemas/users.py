@@ -70,6 +70,18 @@ class UserPaginatedOutputSchema(BaseModel):
     next_page: int | None
     previous_page: int | None
     total_pages: int
+    total_pages_exact: bool
+
+    class Config:
+        orm_mode = True
+
+
+class UserCursorPaginatedOutputSchema(BaseModel):
+    """User keyset paginated output schema for User model."""
+    has_next: bool
+    items: list[UserOutputSchema]
+    next_cursor: str | None
+    page_size: int
 
     class Config:
         orm_mode = True
@@ -1,7 +1,9 @@
+from users.services.picture_files import PictureFileService
 from users.services.user_pictures import UserPictureService
 from users.services.users import UserService
 
 __all__ = [
+    'PictureFileService',
     'UserPictureService',
     'UserService',
 ]
@@ -0,0 +1,31 @@
+from fastapi import status
+
+from common.exceptions.users import UserPictureExceptionMsgs
+from users.utils.exceptions import UserPictureNotFoundError
+from users.utils.storage import StoredFile, local_storage
+from utils.logging import setup_logging
+
+
+class PictureFileService:
+
+    def __init__(self) -> None:
+        self._log = setup_logging(self.__class__.__name__)
+
+    async def get_picture_file(self, file_name: str) -> StoredFile:
+        """Get picture file saved in local storage.
+
+        Args:
+            file_name: string with full file path in storage.
+
+        Returns:
+        StoredFile object with file path, stat result, etag and content type.
+        """
+        return await self._get_picture_file(file_name)
+
+    async def _get_picture_file(self, file_name: str) -> StoredFile:
+        stored_file = await local_storage.get_file(file_name)
+        if not stored_file:
+            err_msg = UserPictureExceptionMsgs.PICTURE_FILE_NOT_FOUND.value.format(file_name=file_name)
+            self._log.debug(err_msg)
+            raise UserPictureNotFoundError(status_code=status.HTTP_404_NOT_FOUND, detail=err_msg)
+        return stored_file
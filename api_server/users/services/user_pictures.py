@@ -1,12 +1,13 @@
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from fastapi import Depends, UploadFile, status
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from common.constants.users import UserPictureRenditionConstants
 from common.exceptions.users import UserPictureExceptionMsgs
 from db import get_session
-from users.cruds import UserPictureCRUD
+from users.cruds import UserPictureCRUD, UserPictureRenditionCRUD
 from users.models import UserPicture
 from users.services.users import UserService
 from users.tasks.user_pictures import (
@@ -17,6 +18,7 @@ from users.tasks.user_pictures import (
 from users.utils.exceptions import UserPictureNotFoundError
 from users.utils.jwt.user_picture import jwt_user_picture_validator
 from users.utils.user_pictures import UserProfileImageValidator
+from utils.file_spool import file_spool
 from utils.logging import setup_logging
 
 
@@ -27,6 +29,7 @@ class UserPictureService(UserService):
         self._log = setup_logging(self.__class__.__name__)
         self.session = session
         self.user_picture_crud = UserPictureCRUD(session=self.session)
+        self.user_picture_rendition_crud = UserPictureRenditionCRUD(session=self.session)
 
     async def add_user_picture(self, id_: UUID, image: UploadFile, jwt_subject: str) -> UserPicture:
         """Add UserPicture object to the database.
@@ -42,25 +45,30 @@ class UserPictureService(UserService):
         return await self._add_user_picture(id_, image, jwt_subject)
 
     async def _add_user_picture(self, id_: UUID, image: UploadFile, jwt_subject: str) -> UserPicture:
-        user = await self.get_user_by_id(id_=id_)
+        user = await self.get_user_by_id_for_jwt_subject(id_, jwt_subject)
         if jwt_user_picture_validator(jwt_subject=jwt_subject, username=user.username):
-            # Validating incoming image.
-            await UserProfileImageValidator.validate_image(image)
-            # Saving UserPicture object.
-            user_picture = await self.user_picture_crud.add_user_picture(id_)
-            # Starting celery task to save image in AWS S3 bucket.
-            await image.seek(0)
-            save_user_picture_in_aws_s3_bucket.apply_async(
+            # Validating incoming image, valid image content is stored in file spool.
+            validated_image = await UserProfileImageValidator.validate_image(image)
+            picture_id = uuid4()
+            # Task saving image in AWS S3 bucket is committed to outbox together with UserPicture object,
+            # image content passed through file spool.
+            self.outbox_message_crud.stage_outbox_message(
+                task=save_user_picture_in_aws_s3_bucket,
                 kwargs={
-                    'db_user_picture': user_picture,
-                    'image_data': await image.read(),
+                    'user_id': str(id_),
+                    'picture_id': str(picture_id),
+                    'spool_key': validated_image.spool_key,
                     'content_type': image.content_type,
-                    'file_extension': image.filename.split('.')[-1].lower(),
+                    'file_extension': validated_image.file_extension,
+                    'content_hash': validated_image.content_hash,
                 },
-                serializers='pickle',
             )
-
-            return user_picture
+            try:
+                # Saving UserPicture object.
+                return await self.user_picture_crud.add_user_picture(id_, picture_id=picture_id)
+            except Exception:
+                file_spool.delete(validated_image.spool_key)
+                raise
 
     async def update_user_picture(
             self, id_: UUID, picture_id: UUID, image: UploadFile, jwt_subject: str,
@@ -81,21 +89,26 @@ class UserPictureService(UserService):
     async def _update_user_picture(
             self, id_: UUID, picture_id: UUID, image: UploadFile, jwt_subject: str,
     ) -> UserPicture:
-        user = await self.get_user_by_id(id_=id_)
+        user = await self.get_user_by_id_for_jwt_subject(id_, jwt_subject)
         if jwt_user_picture_validator(jwt_subject=jwt_subject, username=user.username):
-            # Validating incoming image.
-            await UserProfileImageValidator.validate_image(image)
-            user_picture = await self.get_user_picture_by_id(picture_id)
-            # Starting celery task to update image in AWS S3 bucket.
-            await image.seek(0)
-            update_user_picture_in_aws_s3_bucket.apply_async(
+            # Validating incoming image, valid image content is stored in file spool.
+            validated_image = await UserProfileImageValidator.validate_image(image)
+            try:
+                user_picture = await self.get_user_picture_by_id(picture_id)
+            except Exception:
+                file_spool.delete(validated_image.spool_key)
+                raise
+            # Adding task to update image in AWS S3 bucket to outbox, image content passed through file spool.
+            await self.outbox_message_crud.add_outbox_message(
+                task=update_user_picture_in_aws_s3_bucket,
                 kwargs={
-                    'db_user_picture': user_picture,
-                    'image_data': await image.read(),
+                    'user_id': str(user_picture.user_id),
+                    'picture_id': str(user_picture.id),
+                    'spool_key': validated_image.spool_key,
                     'content_type': image.content_type,
-                    'file_extension': image.filename.split('.')[-1].lower(),
+                    'file_extension': validated_image.file_extension,
+                    'content_hash': validated_image.content_hash,
                 },
-                serializers='pickle',
             )
             return user_picture
 
@@ -121,6 +134,39 @@ class UserPictureService(UserService):
             raise UserPictureNotFoundError(status_code=status.HTTP_404_NOT_FOUND, detail=err_msg)
         return user_picture
 
+    async def get_user_picture_url(
+            self, user_picture: UserPicture, size: str, image_format: str | None = None,
+    ) -> str | None:
+        """Get url of UserPicture of selected size and image format.
+
+        Args:
+            user_picture: UserPicture object.
+            size: rendition size name, 'original' for uploaded image.
+            image_format: rendition image format, JPEG or PNG rendition is selected if not provided.
+
+        Returns:
+        url of UserPictureRendition, url of UserPicture if size is 'original' or rendition is not created yet.
+        """
+        return await self._get_user_picture_url(user_picture, size, image_format)
+
+    async def _get_user_picture_url(
+            self, user_picture: UserPicture, size: str, image_format: str | None = None,
+    ) -> str | None:
+        if size == UserPictureRenditionConstants.ORIGINAL_SIZE.value:
+            return user_picture.url
+        user_picture_rendition = await self.user_picture_rendition_crud.get_user_picture_rendition(
+            picture_id=user_picture.id,
+            size=size,
+            image_format=image_format.upper() if image_format else None,
+        )
+        if not user_picture_rendition:
+            self._log.debug(
+                f'UserPictureRendition "{size}" of UserPicture with id: "{user_picture.id}" not found, '
+                f'using original picture url.'
+            )
+            return user_picture.url
+        return user_picture_rendition.url
+
     async def delete_user_picture(self, id_: UUID, picture_id: UUID, jwt_subject: str) -> None:
         """Delete UserPicture object from the database.
 
@@ -135,12 +181,12 @@ class UserPictureService(UserService):
         return await self._delete_user_picture(id_, picture_id, jwt_subject)
 
     async def _delete_user_picture(self, id_: UUID, picture_id: UUID, jwt_subject: str) -> None:
-        user = await self.get_user_by_id(id_)
+        user = await self.get_user_by_id_for_jwt_subject(id_, jwt_subject)
         if jwt_user_picture_validator(jwt_subject=jwt_subject, username=user.username):
             user_picture = await self.get_user_picture_by_id(picture_id)
-            await self.user_picture_crud.delete_user_picture(user_picture)
-            # Starting celery task to delete image in AWS S3 bucket.
-            delete_user_picture_in_aws_s3_bucket.apply_async(
-                kwargs={'user_id': user.id},
-                serializers='pickle',
+            # Task deleting image in AWS S3 bucket is committed to outbox together with UserPicture deletion.
+            self.outbox_message_crud.stage_outbox_message(
+                task=delete_user_picture_in_aws_s3_bucket,
+                kwargs={'user_id': str(user.id), 'content_hash': user_picture.content_hash},
             )
+            await self.user_picture_crud.delete_user_picture(user_picture)
@@ -1,23 +1,25 @@
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from fastapi import Depends, status
 
-from passlib.hash import argon2
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from auth.cruds import EmailConfirmationTokenCRUD
 from auth.tasks import send_email_confirmation_letter
+from auth.utils.current_user import CurrentUser
 from auth.utils.jwt_tokens import create_jwt_token, create_token_payload
+from auth.utils.password_hashing import password_hashing_executor
 from common.constants.auth.email_confirmation_tokens import EmailConfirmationTokenConstants
 from common.exceptions.users import UserExceptionMsgs
 from db import get_session
+from outbox.cruds import OutboxMessageCRUD
 from users.cruds import UserCRUD
 from users.models import User
 from users.schemas import UserInputSchema, UserUpdateSchema
 from users.utils.exceptions import UserNotFoundError
 from users.utils.jwt.user import jwt_user_validator
 from utils.logging import setup_logging
-from utils.pagination import PaginationPage
+from utils.pagination import CursorPaginationPage, PaginationPage, decode_cursor
 
 
 class UserService:
@@ -27,6 +29,7 @@ class UserService:
         self.session = session
         self.user_crud = UserCRUD(session=self.session)
         self.email_confirmation_token_crud = EmailConfirmationTokenCRUD(session=self.session)
+        self.outbox_message_crud = OutboxMessageCRUD(session=self.session)
 
     async def get_users(self, page: int, page_size: int) -> list[User]:
         """Get User objects from database.
@@ -42,8 +45,27 @@ class UserService:
 
     async def _get_users(self, page: int, page_size: int) -> None:
         users = await self.user_crud.get_users(page, page_size)
-        total_users = await self.user_crud._get_total_of_users()
-        return PaginationPage(items=users, page=page, page_size=page_size, total=total_users)
+        total_users, is_exact = await self.user_crud._get_total_of_users()
+        return PaginationPage(
+            items=users, page=page, page_size=page_size, total=total_users, total_pages_exact=is_exact,
+        )
+
+    async def get_users_by_cursor(self, cursor: str, page_size: int) -> CursorPaginationPage:
+        """Get User objects from database with keyset pagination.
+
+        Args:
+            cursor: opaque pagination cursor from previous page, empty string for the first page.
+            page_size: number of items per page.
+
+        Returns:
+        CursorPaginationPage object with items as a list of User objects.
+        """
+        return await self._get_users_by_cursor(cursor, page_size)
+
+    async def _get_users_by_cursor(self, cursor: str, page_size: int) -> CursorPaginationPage:
+        after = decode_cursor(cursor) if cursor else None
+        users = await self.user_crud.get_users_by_cursor(after=after, page_size=page_size)
+        return CursorPaginationPage(items=users, page_size=page_size)
 
     async def get_user_by_id(self, id_: UUID) -> User:
         """Get User object from database filtered by id.
@@ -79,7 +101,7 @@ class UserService:
         return await self._add_user(user)
 
     async def _hash_password(self, password: str) -> str:
-        """Creates password hash with argon2 algorithm.
+        """Creates password hash with argon2 algorithm in password hashing worker pool.
 
         Args:
             password: string with raw password to hash.
@@ -87,7 +109,7 @@ class UserService:
         Returns:
         Hashed password string.
         """
-        return argon2.using(rounds=4).hash(password)
+        return await password_hashing_executor.hash(password)
 
     async def _add_user(self, user: UserInputSchema) -> User:
         user.password = await self._hash_password(user.password)
@@ -99,16 +121,18 @@ class UserService:
             time_unit=EmailConfirmationTokenConstants.MINUTES.value,
         )
         jwt_token = create_jwt_token(payload=jwt_token_payload, key=user.password)
-        db_email_confirmation_token = await self.email_confirmation_token_crud.add_email_confirmation_token(
-            id_=user.id,
-            token=jwt_token,
-        )
-        # Start of the sending confirmation email task.
-        send_email_confirmation_letter.apply_async(
+        token_id = uuid4()
+        # Sending confirmation email task is committed to outbox together with EmailConfirmationToken.
+        self.outbox_message_crud.stage_outbox_message(
+            task=send_email_confirmation_letter,
             kwargs={
-                'email_confirmation_token': db_email_confirmation_token,
+                'email_confirmation_token_id': str(token_id),
             },
-            serializers='pickle',
+        )
+        await self.email_confirmation_token_crud.add_email_confirmation_token(
+            id_=user.id,
+            token=jwt_token,
+            token_id=token_id,
         )
         return user
 
@@ -126,7 +150,7 @@ class UserService:
         return await self._update_user(id_, jwt_subject, update_data)
 
     async def _update_user(self, id_: UUID, jwt_subject: str, update_data: UserUpdateSchema) -> None:
-        user = await self.get_user_by_id(id_)
+        user = await self.get_user_by_id_for_jwt_subject(id_, jwt_subject)
         if user:
             if jwt_user_validator(jwt_subject=jwt_subject, username=user.username):
                 # Updating user.
@@ -145,11 +169,12 @@ class UserService:
         return await self._delete_user(id_, jwt_subject)
 
     async def _delete_user(self, id_: UUID, jwt_subject: str) -> None:
-        user = await self.get_user_by_id(id_)
+        user = await self.get_user_by_id_for_jwt_subject(id_, jwt_subject)
         if user:
             if jwt_user_validator(jwt_subject=jwt_subject, username=user.username):
                 # Deleting user.
-                return await self.user_crud.delete_user(user)
+                await self.user_crud.delete_user(user)
+                CurrentUser.forget(self.session)
 
     async def get_user_by_username(self, username: str) -> User:
         """Get User object from database filtered by username.
@@ -173,6 +198,46 @@ class UserService:
             raise UserNotFoundError(status_code=status.HTTP_404_NOT_FOUND, detail=err_msg)
         return user
 
+    async def get_user_by_jwt_subject(self, jwt_subject: str) -> User:
+        """Get User object of authenticated user, memoized for the rest of the request.
+
+        Args:
+            jwt_subject: User's username from jwt token identity.
+
+        Returns:
+        Single User object filtered by username.
+        """
+        return await self._get_user_by_jwt_subject(jwt_subject)
+
+    async def _get_user_by_jwt_subject(self, jwt_subject: str) -> User:
+        user = await CurrentUser.from_session(self.session, jwt_subject).get_user()
+        if not user:
+            err_msg = UserExceptionMsgs.USER_NOT_FOUND.value.format(
+                column='username',
+                value=jwt_subject,
+            )
+            self._log.debug(err_msg)
+            raise UserNotFoundError(status_code=status.HTTP_404_NOT_FOUND, detail=err_msg)
+        return user
+
+    async def get_user_by_id_for_jwt_subject(self, id_: UUID, jwt_subject: str) -> User:
+        """Get User object filtered by id, authenticated user memoized for the request is reused when ids match.
+
+        Args:
+            id_: UUID of user.
+            jwt_subject: User's username from jwt token identity.
+
+        Returns:
+        single User object filtered by id.
+        """
+        return await self._get_user_by_id_for_jwt_subject(id_, jwt_subject)
+
+    async def _get_user_by_id_for_jwt_subject(self, id_: UUID, jwt_subject: str) -> User:
+        current_user = await CurrentUser.from_session(self.session, jwt_subject).get_user()
+        if current_user and current_user.id == id_:
+            return current_user
+        return await self.get_user_by_id(id_)
+
     async def get_user_by_email(self, email: str) -> User:
         """Get User object from database filtered by email.
 
@@ -1,4 +1,5 @@
 from users.tasks.user_pictures import (
+    benchmark_s3_throughput,
     delete_user_picture_in_aws_s3_bucket,
     save_user_picture_in_aws_s3_bucket,
     update_user_picture_in_aws_s3_bucket,
@@ -8,4 +9,5 @@ __all__ = [
     'save_user_picture_in_aws_s3_bucket',
     'update_user_picture_in_aws_s3_bucket',
     'delete_user_picture_in_aws_s3_bucket',
+    'benchmark_s3_throughput',
 ]
@@ -1,109 +1,197 @@
-from uuid import UUID
+from uuid import UUID, uuid4
 import asyncio
+import os
+import time
 
 from app.celery_base import app
-from db import create_engine
-from users.models import UserPicture
+from app.celery_worker import celery_worker_resources
+from common.constants.storage import PictureStorageConstants
+from common.constants.users import S3ClientConstants
 from users.utils.aws_s3 import S3Client
 from users.utils.aws_s3.user_pictures import S3EventHandler, UserImageFile
-from utils.orm_helpers import create_db_session
+from users.utils.storage import PictureStorage, local_storage
+from utils.file_spool import file_spool
 
 
-@app.task
-def save_user_picture_in_aws_s3_bucket(
-    db_user_picture: UserPicture, image_data: bytes, content_type: str, file_extension: str,
-        ) -> UserPicture:
-    """Background celery task saving user's uploaded image to AWS S3 bucket.
-
-    Args:
-        db_user_picture: UserPicture instance.
-        image_data: bytes content of uploaded image.
-        content_type: image's content-type.
-        file_extension: image file extension.
+def _create_s3_client() -> S3Client:
+    """Creates S3Client reusing aiobotocore client of worker process.
 
     Returns:
-    Updated UserPicture object.
+    An instance of S3Client.
     """
-    s3_client = S3Client(
+    return S3Client(
         aws_access_key_id=app.conf.get('AWS_ACCESS_KEY_ID'),
         aws_secret_access_key=app.conf.get('AWS_SECRET_ACCESS_KEY'),
         aws_s3_bucket_region=app.conf.get('AWS_S3_BUCKET_REGION'),
         aws_s3_bucket_name=app.conf.get('AWS_S3_BUCKET_NAME'),
+        client=celery_worker_resources.s3_client,
     )
-    user_image_file = UserImageFile(
-        db_user_picture=db_user_picture,
-        image_data=image_data,
+
+
+def _create_picture_storage() -> PictureStorage:
+    """Selects pictures storage backend from Celery app config.
+
+    Returns:
+    LocalStorage if 'local' backend is configured, otherwise S3Client.
+    """
+    if app.conf.get('PICTURE_STORAGE_BACKEND') == PictureStorageConstants.LOCAL_BACKEND.value:
+        return local_storage
+    return _create_s3_client()
+
+
+def _create_user_image_file(
+        user_id: str, picture_id: str, spool_key: str, content_type: str, file_extension: str,
+        content_hash: str | None,
+) -> UserImageFile:
+    """Creates UserImageFile with image content read from file spool.
+
+    Args:
+        user_id: string with UUID of User object.
+        picture_id: string with UUID of UserPicture object.
+        spool_key: key of spooled image file.
+        content_type: image's content-type.
+        file_extension: image file extension.
+        content_hash: SHA-256 hash of image content computed during upload.
+
+    Returns:
+    An instance of UserImageFile.
+    """
+    return UserImageFile(
+        user_id=UUID(user_id),
+        picture_id=UUID(picture_id),
+        image_data=file_spool.read(spool_key),
         content_type=content_type,
         file_extension=file_extension,
+        content_hash=content_hash,
     )
-    engine = create_engine(
-        database_url=app.conf.get('POSTGRES_DATABASE_URL'),
-        echo=app.conf.get('API_SQLALCHEMY_ECHO'),
-        future=app.conf.get('API_SQLALCHEMY_FUTURE'),
+
+
+@app.task
+def save_user_picture_in_aws_s3_bucket(
+        user_id: str, picture_id: str, spool_key: str, content_type: str, file_extension: str,
+        content_hash: str | None = None,
+) -> str:
+    """Background celery task saving user's uploaded image to AWS S3 bucket.
+
+    Args:
+        user_id: string with UUID of User object.
+        picture_id: string with UUID of UserPicture object.
+        spool_key: key of spooled image file, removed from spool when task is done.
+        content_type: image's content-type.
+        file_extension: image file extension.
+        content_hash: SHA-256 hash of image content computed during upload, computed by task if not provided.
+
+    Returns:
+    string with UUID of updated UserPicture object.
+    """
+    try:
+        user_image_file = _create_user_image_file(
+            user_id, picture_id, spool_key, content_type, file_extension, content_hash,
+        )
+        return celery_worker_resources.run(_upload_image_to_s3(user_image_file))
+    finally:
+        file_spool.delete(spool_key)
+
+
+async def _upload_image_to_s3(user_image_file: UserImageFile) -> str:
+    s3_event_handler = S3EventHandler(
+        s3_client=_create_picture_storage(),
+        user_image_file=user_image_file,
+        db_session=celery_worker_resources.db_session_maker(),
     )
-    db_session = create_db_session(engine=engine)
-    s3_event_handler = S3EventHandler(s3_client=s3_client, user_image_file=user_image_file, db_session=db_session)
-    return asyncio.run(s3_event_handler.upload_image_to_s3())
+    return str((await s3_event_handler.upload_image_to_s3()).id)
 
 
-@app.task()
+@app.task
 def update_user_picture_in_aws_s3_bucket(
-    db_user_picture: UserPicture, image_data: bytes, content_type: str, file_extension: str,
-        ) -> UserPicture:
+        user_id: str, picture_id: str, spool_key: str, content_type: str, file_extension: str,
+        content_hash: str | None = None,
+) -> str:
     """Background celery task updating user's uploaded image in the AWS S3 bucket.
 
     Args:
-        db_user_picture: UserPicture instance.
-        image_data: bytes content of uploaded image.
+        user_id: string with UUID of User object.
+        picture_id: string with UUID of UserPicture object.
+        spool_key: key of spooled image file, removed from spool when task is done.
         content_type: image's content-type.
         file_extension: image file extension.
+        content_hash: SHA-256 hash of image content computed during upload, computed by task if not provided.
 
     Returns:
-    Updated UserPicture object.
+    string with UUID of updated UserPicture object.
     """
-    s3_client = S3Client(
-        aws_access_key_id=app.conf.get('AWS_ACCESS_KEY_ID'),
-        aws_secret_access_key=app.conf.get('AWS_SECRET_ACCESS_KEY'),
-        aws_s3_bucket_region=app.conf.get('AWS_S3_BUCKET_REGION'),
-        aws_s3_bucket_name=app.conf.get('AWS_S3_BUCKET_NAME'),
-    )
-    user_image_file = UserImageFile(
-        db_user_picture=db_user_picture,
-        image_data=image_data,
-        content_type=content_type,
-        file_extension=file_extension,
-    )
-    engine = create_engine(
-        database_url=app.conf.get('POSTGRES_DATABASE_URL'),
-        echo=app.conf.get('API_SQLALCHEMY_ECHO'),
-        future=app.conf.get('API_SQLALCHEMY_FUTURE'),
+    try:
+        user_image_file = _create_user_image_file(
+            user_id, picture_id, spool_key, content_type, file_extension, content_hash,
+        )
+        return celery_worker_resources.run(_update_image_in_s3(user_image_file))
+    finally:
+        file_spool.delete(spool_key)
+
+
+async def _update_image_in_s3(user_image_file: UserImageFile) -> str:
+    s3_event_handler = S3EventHandler(
+        s3_client=_create_picture_storage(),
+        user_image_file=user_image_file,
+        db_session=celery_worker_resources.db_session_maker(),
     )
-    db_session = create_db_session(engine=engine)
-    s3_event_handler = S3EventHandler(s3_client=s3_client, user_image_file=user_image_file, db_session=db_session)
-    return asyncio.run(s3_event_handler.update_image_in_s3())
+    return str((await s3_event_handler.update_image_in_s3()).id)
 
 
 @app.task
-def delete_user_picture_in_aws_s3_bucket(user_id: UUID) -> bool:
-    """Background celery task deletes user's uploaded image in the AWS S3 bucket.
+def delete_user_picture_in_aws_s3_bucket(user_id: str, content_hash: str | None = None) -> bool:
+    """Background celery task deletes user's uploaded image in the AWS S3 bucket if no other picture uses it.
 
     Args:
-        user_id: UUID of User object.
+        user_id: string with UUID of User object.
+        content_hash: SHA-256 hash of deleted picture content.
 
     Returns:
-    bool as task result.
+    bool of deleting files in AWS S3 bucket as task result.
     """
-    s3_client = S3Client(
-        aws_access_key_id=app.conf.get('AWS_ACCESS_KEY_ID'),
-        aws_secret_access_key=app.conf.get('AWS_SECRET_ACCESS_KEY'),
-        aws_s3_bucket_region=app.conf.get('AWS_S3_BUCKET_REGION'),
-        aws_s3_bucket_name=app.conf.get('AWS_S3_BUCKET_NAME'),
-    )
-    engine = create_engine(
-        database_url=app.conf.get('POSTGRES_DATABASE_URL'),
-        echo=app.conf.get('API_SQLALCHEMY_ECHO'),
-        future=app.conf.get('API_SQLALCHEMY_FUTURE'),
-    )
-    db_session = create_db_session(engine=engine)
-    s3_event_handler = S3EventHandler(s3_client, db_session)
-    return asyncio.run(s3_event_handler.delete_images_in_s3(user_id))
+    return celery_worker_resources.run(_delete_images_in_s3(UUID(user_id), content_hash))
+
+
+async def _delete_images_in_s3(user_id: UUID, content_hash: str | None) -> bool:
+    s3_event_handler = S3EventHandler(_create_picture_storage(), celery_worker_resources.db_session_maker())
+    response = await s3_event_handler.delete_images_in_s3(user_id, content_hash)
+    return response is not None
+
+
+@app.task
+def benchmark_s3_throughput(objects_count: int = S3ClientConstants.BENCHMARK_DEFAULT_OBJECTS_COUNT.value) -> dict:
+    """Background celery task measuring upload and batch delete throughput of worker process S3 client.
+
+    Run the worker with AWS_S3_LOCAL_DIR set to benchmark offline against LocalS3Client.
+
+    Args:
+        objects_count: number of uploaded and deleted file objects.
+
+    Returns:
+    dict with file objects per second of uploads and deletes.
+    """
+    return celery_worker_resources.run(_benchmark_s3_throughput(objects_count))
+
+
+async def _benchmark_s3_throughput(objects_count: int) -> dict:
+    s3_client = _create_s3_client()
+    run_id = uuid4()
+    file_obj = os.urandom(S3ClientConstants.BENCHMARK_OBJECT_SIZE.value)
+    upload_started_at = time.perf_counter()
+    # Concurrent uploads are limited by connection pool size of S3 client.
+    await asyncio.gather(*(
+        s3_client.upload_file_object(
+            file_name=S3ClientConstants.BENCHMARK_FILE_NAME.value.format(run_id=run_id, index=index),
+            content_type=S3ClientConstants.BENCHMARK_CONTENT_TYPE.value,
+            file_obj=file_obj,
+        ) for index in range(objects_count)
+    ))
+    upload_seconds = time.perf_counter() - upload_started_at
+    delete_started_at = time.perf_counter()
+    await s3_client.delete_file_objects_by_prefix(S3ClientConstants.BENCHMARK_FOLDER_NAME.value.format(run_id=run_id))
+    delete_seconds = time.perf_counter() - delete_started_at
+    return {
+        'objects_count': objects_count,
+        'upload_objects_per_second': objects_count / upload_seconds,
+        'delete_objects_per_second': objects_count / delete_seconds,
+    }
@@ -20,7 +20,8 @@ RESPONSE_USERS_EMPTY_DB = {
         'items': [],
         'next_page': None,
         'previous_page': None,
-        'total_pages': 0
+        'total_pages': 0,
+        'total_pages_exact': True
     },
     'errors': [],
     'status_code': 200
@@ -33,11 +34,27 @@ RESPONSE_GET_USERS = {
         'items': [RESPONSE_USER_TEST_DATA],
         'next_page': None,
         'previous_page': None,
-        'total_pages': 1
+        'total_pages': 1,
+        'total_pages_exact': True
     },
     'errors': [],
     'status_code': 200,
 }
+RESPONSE_GET_USERS_CURSOR = {
+    'data': {
+        'has_next': False,
+        'items': [RESPONSE_USER_TEST_DATA],
+        'next_cursor': None,
+        'page_size': 20,
+    },
+    'errors': [],
+    'status_code': 200,
+}
+RESPONSE_USERS_INVALID_CURSOR = {
+    'data': [],
+    'errors': [{'detail': "Pagination cursor: 'invalid_cursor' is invalid."}],
+    'status_code': 400,
+}
 RESPONSE_GET_USER = {
     'data': RESPONSE_USER_TEST_DATA,
     'errors': [],
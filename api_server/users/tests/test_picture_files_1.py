@@ -0,0 +1,203 @@
+from pathlib import Path
+
+from fastapi import FastAPI, status
+
+from httpx import AsyncClient
+from pytest_mock.plugin import MockerFixture
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+import pytest
+
+from common.tests.generics import TestMixin
+from users.cruds import UserPictureCRUD
+from users.models import UserPicture, UserPictureRendition
+from users.utils.aws_s3 import S3EventHandler
+from users.utils.aws_s3.user_pictures import UserImageFile
+from users.utils.storage import LocalStorage, PictureStorage, local_storage
+from utils.file_responses import RangeFileResponse
+
+
+class TestCaseLocalStorage(TestMixin):
+
+    @pytest.fixture
+    def test_local_storage(self, tmp_path: Path, mocker: MockerFixture) -> LocalStorage:
+        """A pytest fixture that points 'local_storage' to temporary directory.
+
+        Args:
+            tmp_path: pytest fixture, creates temporary directory.
+            mocker: A pytest_mock lib fixture.
+
+        Returns:
+        An instance of LocalStorage.
+        """
+        mocker.patch.object(local_storage, 'directory', tmp_path)
+        return local_storage
+
+    async def _upload_test_picture(
+            self, db_session: AsyncSession, test_local_storage: LocalStorage, test_user_image_file: UserImageFile,
+    ) -> UserPicture:
+        s3_handler = S3EventHandler(
+            s3_client=test_local_storage,
+            user_image_file=test_user_image_file,
+            db_session=db_session,
+        )
+        return await s3_handler.upload_image_to_s3()
+
+    @pytest.mark.asyncio
+    async def test_S3Handler_upload_image_to_local_storage(
+            self, db_session: AsyncSession, client: AsyncClient, test_local_storage: LocalStorage,
+            test_user_image_file: UserImageFile,
+    ) -> None:
+        """Test 'S3EventHandler' saves picture with renditions in LocalStorage and files are served with stored etag.
+
+        Args:
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+            client: pytest fixture, an instance of AsyncClient for http requests.
+            test_local_storage: pytest fixture, LocalStorage in temporary directory.
+            test_user_image_file: pytest fixture, creates valid UserImageFile object.
+
+        Returns:
+        Nothing.
+        """
+        user_picture = await self._upload_test_picture(db_session, test_local_storage, test_user_image_file)
+        response = await client.get(user_picture.url)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.content == test_user_image_file.image_data
+        assert response.headers['etag'] == user_picture.etag
+        assert response.headers['content-type'] == test_user_image_file.content_type
+        assert response.headers['accept-ranges'] == 'bytes'
+        renditions = (await db_session.execute(
+            select(UserPictureRendition).where(UserPictureRendition.picture_id == user_picture.id)
+        )).scalars().all()
+        assert renditions
+        for rendition in renditions:
+            response = await client.get(rendition.url)
+            assert response.status_code == status.HTTP_200_OK
+            assert response.headers['etag'] == rendition.etag
+
+    @pytest.mark.asyncio
+    async def test_get_picture_file_conditional_and_range_requests(
+            self, db_session: AsyncSession, client: AsyncClient, test_local_storage: LocalStorage,
+            test_user_image_file: UserImageFile,
+    ) -> None:
+        """Test GET '/picture-files/{file_name}' endpoint with 'If-None-Match' and 'Range' request headers.
+
+        Args:
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+            client: pytest fixture, an instance of AsyncClient for http requests.
+            test_local_storage: pytest fixture, LocalStorage in temporary directory.
+            test_user_image_file: pytest fixture, creates valid UserImageFile object.
+
+        Returns:
+        Nothing.
+        """
+        user_picture = await self._upload_test_picture(db_session, test_local_storage, test_user_image_file)
+        image_data = test_user_image_file.image_data
+        size = len(image_data)
+        response = await client.get(user_picture.url, headers={'If-None-Match': user_picture.etag})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b''
+        assert response.headers['etag'] == user_picture.etag
+        response = await client.get(user_picture.url, headers={'If-None-Match': '"stale"'})
+        assert response.status_code == status.HTTP_200_OK
+        response = await client.get(user_picture.url, headers={'Range': 'bytes=10-99'})
+        assert response.status_code == status.HTTP_206_PARTIAL_CONTENT
+        assert response.content == image_data[10:100]
+        assert response.headers['content-range'] == f'bytes 10-99/{size}'
+        assert response.headers['content-length'] == '90'
+        response = await client.get(user_picture.url, headers={'Range': 'bytes=-100'})
+        assert response.status_code == status.HTTP_206_PARTIAL_CONTENT
+        assert response.content == image_data[-100:]
+        response = await client.get(user_picture.url, headers={'Range': f'bytes={size - 10}-'})
+        assert response.content == image_data[-10:]
+        response = await client.get(user_picture.url, headers={'Range': 'bytes=10-99', 'If-Range': '"stale"'})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.content == image_data
+        response = await client.get(user_picture.url, headers={'Range': 'bytes=-'})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.content == image_data
+        response = await client.get(user_picture.url, headers={'Range': f'bytes={size}-'})
+        assert response.status_code == status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+        assert response.headers['content-range'] == f'bytes */{size}'
+
+    @pytest.mark.asyncio
+    async def test_get_picture_file_not_found(
+            self, app: FastAPI, client: AsyncClient, test_local_storage: LocalStorage,
+    ) -> None:
+        """Test GET '/picture-files/{file_name}' endpoint with missing file and file outside of storage directory.
+
+        Args:
+            app: pytest fixture, an instance of FastAPI.
+            client: pytest fixture, an instance of AsyncClient for http requests.
+            test_local_storage: pytest fixture, LocalStorage in temporary directory.
+
+        Returns:
+        Nothing.
+        """
+        (test_local_storage.directory.parent / 'secret.txt').write_text('secret')
+        for file_name in ['pictures/missing/original.jpg', '../secret.txt']:
+            response = await client.get(app.url_path_for('get_picture_file', file_name=file_name))
+            assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    @pytest.mark.asyncio
+    async def test_S3Handler_delete_images_in_local_storage(
+            self, db_session: AsyncSession, client: AsyncClient, test_local_storage: LocalStorage,
+            test_user_image_file: UserImageFile,
+    ) -> None:
+        """Test 'S3EventHandler.delete_images_in_s3()' deletes picture with renditions from LocalStorage.
+
+        Args:
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+            client: pytest fixture, an instance of AsyncClient for http requests.
+            test_local_storage: pytest fixture, LocalStorage in temporary directory.
+            test_user_image_file: pytest fixture, creates valid UserImageFile object.
+
+        Returns:
+        Nothing.
+        """
+        user_picture = await self._upload_test_picture(db_session, test_local_storage, test_user_image_file)
+        await UserPictureCRUD(session=db_session).delete_user_picture(user_picture)
+        s3_handler = S3EventHandler(s3_client=test_local_storage, db_session=db_session)
+        response = await s3_handler.delete_images_in_s3(user_picture.user_id, user_picture.content_hash)
+        assert test_user_image_file.file_name in {file_object['Key'] for file_object in response['Deleted']}
+        assert not any(path.is_file() for path in test_local_storage.directory.rglob('*'))
+        response = await client.get(user_picture.url)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_picture_storage_backend_missing_method(self) -> None:
+        """Test 'PictureStorage' backend without all storage methods fails on creation, not in the middle of task.
+
+        Returns:
+        Nothing.
+        """
+
+        class UploadOnlyStorage(PictureStorage):
+
+            async def upload_file_object(
+                    self, file_name: str = None, content_type: str = None, file_obj: bytes = None,
+            ) -> dict:
+                return {}
+
+        with pytest.raises(TypeError):
+            UploadOnlyStorage()
+
+    @pytest.mark.asyncio
+    async def test_RangeFileResponse_zerocopy_send(self, tmp_path: Path) -> None:
+        """Test 'RangeFileResponse' passes file range to ASGI server supporting 'http.response.zerocopysend'.
+
+        Args:
+            tmp_path: pytest fixture, creates temporary directory.
+
+        Returns:
+        Nothing.
+        """
+        path = tmp_path / 'file.bin'
+        path.write_bytes(b'0123456789')
+        messages = []
+
+        async def send(message: dict) -> None:
+            messages.append({key: value for key, value in message.items() if key != 'file'})
+
+        response = RangeFileResponse(path, start=2, end=5, stat_result=path.stat())
+        await response({'type': 'http', 'extensions': {'http.response.zerocopysend': {}}}, None, send)
+        assert messages[1] == {'type': 'http.response.zerocopysend', 'offset': 2, 'count': 4, 'more_body': False}
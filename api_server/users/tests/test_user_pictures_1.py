@@ -1,14 +1,29 @@
-from fastapi import FastAPI, status
+from io import BytesIO
+import hashlib
+import json
+import os
+import tracemalloc
+
+from fastapi import FastAPI, UploadFile, status
 
 from httpx import AsyncClient
+from PIL import Image
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 import pytest
 
+from common.constants.users import UserPictureRenditionConstants, UserServiceConstants
 from common.tests.generics import TestMixin
 from common.tests.test_data.users import request_test_user_pictures_data
+from outbox.models import OutboxMessage
+from users.cruds import UserPictureRenditionCRUD
 from users.models import User, UserPicture
+from users.schemas import UserPictureRenditionSchema
+from users.tasks import save_user_picture_in_aws_s3_bucket
 from users.tests.test_data import response_test_user_pictures_data
+from users.utils.exceptions import UserPictureSizeError
+from users.utils.user_pictures import UserProfileImageValidator
+from utils.file_spool import file_spool
 
 
 class TestCaseGetUserPicture(TestMixin):
@@ -67,6 +82,46 @@ class TestCaseGetUserPicture(TestMixin):
         assert response.status_code == status.HTTP_200_OK
         assert (await db_session.execute(select(func.count(UserPicture.id)))).scalar_one() == 1
 
+    @pytest.mark.asyncio
+    async def test_get_user_picture_size_selector(
+            self, app: FastAPI, client: AsyncClient, db_session: AsyncSession, test_user_picture: UserPicture,
+    ) -> None:
+        """Test GET '/users/{user_id}/pictures/{picture_id}' endpoint returns url of selected picture rendition.
+
+        Args:
+            app: pytest fixture, an instance of FastAPI.
+            client: pytest fixture, an instance of AsyncClient for http requests.
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+            test_user_picture: pytest fixture, add user picture to database.
+
+        Returns:
+        Nothing.
+        """
+        renditions = [
+            UserPictureRenditionSchema(
+                size=UserPictureRenditionConstants.THUMBNAIL_SIZE.value,
+                image_format=image_format,
+                width=128,
+                height=72,
+                url=f'https://test-bucket.s3.amazonaws.com/thumbnail.{image_format.lower()}',
+                etag=None,
+            ) for image_format in (
+                UserPictureRenditionConstants.JPEG_FORMAT.value, UserPictureRenditionConstants.WEBP_FORMAT.value,
+            )
+        ]
+        await UserPictureRenditionCRUD(db_session).replace_user_picture_renditions(test_user_picture.id, renditions)
+        url = app.url_path_for('get_user_picture', user_id=test_user_picture.user_id, picture_id=test_user_picture.id)
+        response = await client.get(url, params={'size': 'thumbnail'})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()['data']['url'] == renditions[0].url
+        response = await client.get(url, params={'size': 'thumbnail', 'format': 'webp'})
+        assert response.json()['data']['url'] == renditions[1].url
+        # Rendition that is not created falls back to the original picture url.
+        response = await client.get(url, params={'size': 'medium'})
+        assert response.json()['data'] == {'id': str(test_user_picture.id), 'url': test_user_picture.url}
+        response = await client.get(url, params={'size': 'huge'})
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
 
 class TestCasePostUserPictures(TestMixin):
 
@@ -99,6 +154,38 @@ class TestCasePostUserPictures(TestMixin):
         assert response.status_code == status.HTTP_201_CREATED
         assert (await db_session.execute(select(func.count(UserPicture.id)))).scalar_one() == 1
 
+    @pytest.mark.asyncio
+    async def test_post_user_pictures_task_message_contains_only_ids(
+            self, app: FastAPI, client: AsyncClient, db_session: AsyncSession, authenticated_test_user: User,
+    ) -> None:
+        """Test POST '/users/{user_id}/pictures/' endpoint saves JSON task kwargs with spooled image key in outbox.
+
+        Args:
+            app: pytest fixture, an instance of FastAPI.
+            client: pytest fixture, an instance of AsyncClient for http requests.
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+            authenticated_test_user: pytest fixture, add user to database and add auth cookies to client fixture.
+
+        Returns:
+        Nothing.
+        """
+        url = app.url_path_for('post_user_pictures', user_id=authenticated_test_user.id)
+        request_test_user_pictures_data.TEST_USER_PICTURE_VALID_JPEG.seek(0)
+        image_data = request_test_user_pictures_data.TEST_USER_PICTURE_VALID_JPEG.read()
+        request_test_user_pictures_data.TEST_USER_PICTURE_VALID_JPEG.seek(0)
+        response = await client.post(url, files={'image': ('image.jpeg', image_data, 'image/jpeg')})
+        assert response.status_code == status.HTTP_201_CREATED
+        outbox_message = (await db_session.execute(
+            select(OutboxMessage).where(OutboxMessage.task_name == save_user_picture_in_aws_s3_bucket.name)
+        )).scalars().one()
+        task_kwargs = outbox_message.kwargs
+        assert json.loads(json.dumps(task_kwargs)) == task_kwargs
+        assert task_kwargs['user_id'] == str(authenticated_test_user.id)
+        assert task_kwargs['picture_id'] == response.json()['data']['id']
+        assert file_spool.read(task_kwargs['spool_key']) == image_data
+        assert task_kwargs['content_hash'] == hashlib.sha256(image_data).hexdigest()
+        file_spool.delete(task_kwargs['spool_key'])
+
 
 class TestCaseDeleteUserPicture(TestMixin):
 
@@ -133,3 +220,47 @@ class TestCaseDeleteUserPicture(TestMixin):
         assert response.status_code == status.HTTP_204_NO_CONTENT
         assert (await db_session.execute(select(func.count(UserPicture.id)))).scalar_one() == 0
         assert (await db_session.execute(select(func.count(User.id)))).scalar_one() == 1
+
+
+class TestCaseUserProfileImageValidator(TestMixin):
+
+    @pytest.mark.asyncio
+    async def test_validate_image_bounded_memory(self) -> None:
+        """Test 'UserProfileImageValidator.validate_image()' spools large image with memory bounded by chunk size.
+
+        Returns:
+        Nothing.
+        """
+        image_buffer = BytesIO()
+        Image.frombytes('RGB', (3000, 2000), os.urandom(3000 * 2000 * 3)).save(image_buffer, 'JPEG', quality=85)
+        image_data = image_buffer.getvalue()
+        assert len(image_data) > 4 * 1024 * 1024
+        image = UploadFile(filename='image.jpg', file=BytesIO(image_data), content_type='image/jpeg')
+        tracemalloc.start()
+        try:
+            validated_image = await UserProfileImageValidator.validate_image(image)
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert peak_memory < 4 * UserServiceConstants.IMAGE_READ_CHUNK_SIZE.value
+        assert (validated_image.image_format, validated_image.width, validated_image.height) == ('JPEG', 3000, 2000)
+        assert validated_image.size == len(image_data)
+        assert validated_image.file_extension == 'jpg'
+        assert file_spool.read(validated_image.spool_key) == image_data
+        file_spool.delete(validated_image.spool_key)
+
+    @pytest.mark.asyncio
+    async def test_validate_image_oversized_stream_rejected(self) -> None:
+        """Test 'UserProfileImageValidator._spool_image()' stops reading oversized image and removes partial spool.
+
+        Returns:
+        Nothing.
+        """
+        image = UploadFile(
+            filename='image.jpg', file=BytesIO(bytes(UserServiceConstants.IMAGE_SIZE_6_MB.value + 1)),
+        )
+        spooled_files_before = set(file_spool.directory.iterdir())
+        with pytest.raises(UserPictureSizeError):
+            await UserProfileImageValidator._spool_image(image)
+        assert image.file.tell() == UserServiceConstants.IMAGE_SIZE_6_MB.value
+        assert set(file_spool.directory.iterdir()) == spooled_files_before
@@ -1,14 +1,34 @@
+from io import BytesIO
+from pathlib import Path
 from unittest.mock import AsyncMock
+import asyncio
 
+from fastapi import UploadFile
+
+from celery import Celery
+from PIL import Image
+from pytest_mock.plugin import MockerFixture
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 import pytest
 
+from app.celery_worker import celery_worker_resources
+from common.constants.users import S3ClientConstants, UserPictureRenditionConstants
 from common.tests.generics import TestMixin
-from common.tests.test_data.users import user_pictures_mock_data
-from users.models import UserPicture
-from users.utils.aws_s3 import S3Client, S3EventHandler
+from common.tests.test_data.users import (
+    request_test_user_data,
+    request_test_user_pictures_data,
+    user_pictures_mock_data,
+)
+from users.cruds import UserPictureCRUD
+from users.models import UserPicture, UserPictureContent, UserPictureRendition
+from users.schemas import UserInputSchema
+from users.services import UserService
+from users.tasks import benchmark_s3_throughput, save_user_picture_in_aws_s3_bucket
+from users.utils.aws_s3 import LocalS3Client, S3Client, S3EventHandler
 from users.utils.aws_s3.user_pictures import UserImageFile
+from users.utils.image_renditions import get_rendition_formats, image_rendition_executor
+from utils.file_spool import file_spool
 
 
 class TestCaseS3HandlerValidData(TestMixin):
@@ -71,3 +91,325 @@ class TestCaseS3HandlerValidData(TestMixin):
         assert test_user_picture.url == expected_url
         assert test_user_picture.etag == expected_etag
         assert (await db_session.execute(select(func.count(UserPicture.id)))).scalar_one() == 1
+
+    @pytest.mark.asyncio
+    async def test_S3Handler_upload_image_to_s3_creates_renditions(
+            self, db_session: AsyncSession, test_S3Client: S3Client, test_user_image_file: UserImageFile,
+            mock_upload_file_object: AsyncMock, test_user_picture: UserPicture,
+    ) -> None:
+        """Test 'S3Handler.upload_image_to_s3()' method uploads and saves every rendition of user's image.
+
+        Args:
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+            test_S3Client: pytest fixture, creates valid S3Client object.
+            test_user_image_file: pytest fixture, creates valid UserImageFile object.
+            mock_upload_file_object: pytest fixture, creates mocked 'S3Client.upload_file_object()' method.
+            test_user_picture: pytest fixture, add user picture to database.
+
+        Returns:
+        Nothing.
+        """
+        s3_handler = S3EventHandler(
+            s3_client=test_S3Client,
+            db_session=db_session,
+            user_image_file=test_user_image_file,
+        )
+        await s3_handler.upload_image_to_s3()
+        rendition_formats = get_rendition_formats(has_alpha=False)
+        renditions_count = len(UserPictureRenditionConstants.SIZES.value) * len(rendition_formats)
+        assert mock_upload_file_object.call_count == 1 + renditions_count
+        uploaded_file_names = {call.kwargs['file_name'] for call in mock_upload_file_object.call_args_list}
+        assert f'pictures/{test_user_image_file.content_hash}/thumbnail.jpg' in uploaded_file_names
+        renditions = (await db_session.execute(select(UserPictureRendition))).scalars().all()
+        assert len(renditions) == renditions_count
+        assert {rendition.image_format for rendition in renditions} == set(rendition_formats)
+        for rendition in renditions:
+            max_side = UserPictureRenditionConstants.SIZES.value[rendition.size]
+            assert max(rendition.width, rendition.height) == max_side
+            # Test image is 1920x1080, so aspect ratio of renditions is 16:9.
+            assert abs(rendition.width / rendition.height - 16 / 9) < 0.05
+
+
+class TestCaseS3HandlerContentDeduplication(TestMixin):
+
+    async def _upload_same_image_for_second_user(
+            self, db_session: AsyncSession, test_S3Client: S3Client, test_user_image_file: UserImageFile,
+            user_service: UserService, user_picture_crud: UserPictureCRUD,
+    ) -> UserPicture:
+        """Uploads test image for test user and the same image for the second user.
+
+        Args:
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+            test_S3Client: pytest fixture, creates valid S3Client object.
+            test_user_image_file: pytest fixture, creates valid UserImageFile object.
+            user_service: pytest fixture, instance of business logic class.
+            user_picture_crud: pytest fixture, instance of database crud logic class.
+
+        Returns:
+        UserPicture object of the second user.
+        """
+        await S3EventHandler(test_S3Client, db_session, test_user_image_file).upload_image_to_s3()
+        second_user = await self._create_user(
+            user_service, UserInputSchema(**request_test_user_data.ADD_SECOND_USER_TEST_DATA),
+        )
+        second_user_picture = await user_picture_crud.add_user_picture(second_user.id)
+        second_user_image_file = UserImageFile(
+            user_id=second_user.id,
+            picture_id=second_user_picture.id,
+            image_data=test_user_image_file.image_data,
+            content_type=test_user_image_file.content_type,
+            file_extension=test_user_image_file.file_extension,
+        )
+        return await S3EventHandler(test_S3Client, db_session, second_user_image_file).upload_image_to_s3()
+
+    @pytest.mark.asyncio
+    async def test_S3Handler_upload_known_content_skips_upload(
+            self, db_session: AsyncSession, test_S3Client: S3Client, test_user_image_file: UserImageFile,
+            mock_upload_file_object: AsyncMock, test_user_picture: UserPicture, user_service: UserService,
+            user_picture_crud: UserPictureCRUD,
+    ) -> None:
+        """Test 'S3Handler.upload_image_to_s3()' method doesn't upload image with content already stored in AWS S3.
+
+        Args:
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+            test_S3Client: pytest fixture, creates valid S3Client object.
+            test_user_image_file: pytest fixture, creates valid UserImageFile object.
+            mock_upload_file_object: pytest fixture, creates mocked 'S3Client.upload_file_object()' method.
+            test_user_picture: pytest fixture, add user picture to database.
+            user_service: pytest fixture, instance of business logic class.
+            user_picture_crud: pytest fixture, instance of database crud logic class.
+
+        Returns:
+        Nothing.
+        """
+        second_user_picture = await self._upload_same_image_for_second_user(
+            db_session, test_S3Client, test_user_image_file, user_service, user_picture_crud,
+        )
+        renditions_count = len(UserPictureRenditionConstants.SIZES.value) * len(get_rendition_formats(False))
+        assert mock_upload_file_object.call_count == 1 + renditions_count
+        assert second_user_picture.url == test_user_picture.url
+        assert second_user_picture.content_hash == test_user_picture.content_hash == test_user_image_file.content_hash
+        assert (await db_session.execute(select(func.count(UserPictureContent.content_hash)))).scalar_one() == 1
+        assert (await db_session.execute(
+            select(func.count(UserPicture.id)).where(UserPicture.content_hash == test_user_image_file.content_hash)
+        )).scalar_one() == 2
+        second_user_renditions = (await db_session.execute(
+            select(UserPictureRendition).where(UserPictureRendition.picture_id == second_user_picture.id)
+        )).scalars().all()
+        assert len(second_user_renditions) == renditions_count
+
+    @pytest.mark.asyncio
+    async def test_S3Handler_delete_images_in_s3_deletes_content_with_last_reference(
+            self, db_session: AsyncSession, test_S3Client: S3Client, test_user_image_file: UserImageFile,
+            mock_upload_file_object: AsyncMock, test_user_picture: UserPicture, user_service: UserService,
+            user_picture_crud: UserPictureCRUD, mocker: MockerFixture,
+    ) -> None:
+        """Test 'S3Handler.delete_images_in_s3()' method deletes files in AWS S3 only when content reference is last.
+
+        Args:
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+            test_S3Client: pytest fixture, creates valid S3Client object.
+            test_user_image_file: pytest fixture, creates valid UserImageFile object.
+            mock_upload_file_object: pytest fixture, creates mocked 'S3Client.upload_file_object()' method.
+            test_user_picture: pytest fixture, add user picture to database.
+            user_service: pytest fixture, instance of business logic class.
+            user_picture_crud: pytest fixture, instance of database crud logic class.
+            mocker: A pytest_mock lib fixture.
+
+        Returns:
+        Nothing.
+        """
+        mock_delete_content_file_objects = mocker.patch(
+            'users.utils.aws_s3.S3Client.delete_content_file_objects',
+            side_effect=AsyncMock(return_value=user_pictures_mock_data.S3Client_delete_images_in_s3_valid_response),
+        )
+        second_user_picture = await self._upload_same_image_for_second_user(
+            db_session, test_S3Client, test_user_image_file, user_service, user_picture_crud,
+        )
+        content_hash = test_user_image_file.content_hash
+        s3_handler = S3EventHandler(test_S3Client, db_session)
+        await user_picture_crud.delete_user_picture(test_user_picture)
+        # Retried task doesn't release the same content twice.
+        for _ in range(2):
+            assert await s3_handler.delete_images_in_s3(test_user_picture.user_id, content_hash) is None
+        mock_delete_content_file_objects.assert_not_called()
+        await user_picture_crud.delete_user_picture(second_user_picture)
+        assert await s3_handler.delete_images_in_s3(second_user_picture.user_id, content_hash) is not None
+        mock_delete_content_file_objects.assert_called_once_with(content_hash)
+        assert (await db_session.execute(select(func.count(UserPictureContent.content_hash)))).scalar_one() == 0
+        # Content already deleted by the first task run keeps its AWS S3 files untouched.
+        assert await s3_handler.delete_images_in_s3(second_user_picture.user_id, content_hash) is None
+        mock_delete_content_file_objects.assert_called_once_with(content_hash)
+
+
+class TestCaseS3ClientBatchDelete(TestMixin):
+
+    @staticmethod
+    def _create_local_s3_client(directory: Path) -> tuple[S3Client, LocalS3Client]:
+        local_s3_client = LocalS3Client(str(directory))
+        s3_client = S3Client(aws_s3_bucket_name='test-bucket', client=local_s3_client)
+        return s3_client, local_s3_client
+
+    @pytest.mark.asyncio
+    async def test_S3Client_delete_content_file_objects_single_batch(self, tmp_path: Path) -> None:
+        """Test 'S3Client.delete_content_file_objects()' deletes picture with renditions by one DeleteObjects request.
+
+        Args:
+            tmp_path: pytest fixture, creates temporary directory.
+
+        Returns:
+        Nothing.
+        """
+        s3_client, local_s3_client = self._create_local_s3_client(tmp_path)
+        content_hash = 'a' * 64
+        sizes = [UserPictureRenditionConstants.ORIGINAL_SIZE.value, *UserPictureRenditionConstants.SIZES.value]
+        file_names = [
+            UserPictureRenditionConstants.FILE_NAME.value.format(
+                content_hash=content_hash, size=size, file_extension='jpg',
+            ) for size in sizes
+        ]
+        other_file_name = UserPictureRenditionConstants.FILE_NAME.value.format(
+            content_hash='b' * 64, size=UserPictureRenditionConstants.ORIGINAL_SIZE.value, file_extension='jpg',
+        )
+        for file_name in [*file_names, other_file_name]:
+            response = await s3_client.upload_file_object(file_name=file_name, content_type='image/jpeg', file_obj=b'1')
+            assert response['uploaded_file_url']
+        assert await s3_client.delete_content_file_objects(content_hash) is not None
+        assert local_s3_client.requests['delete_objects'] == 1
+        assert local_s3_client.requests['delete_object'] == 0
+        bucket_dir = local_s3_client.get_bucket_dir('test-bucket')
+        assert [path.relative_to(bucket_dir).as_posix() for path in bucket_dir.rglob('*') if path.is_file()] == [
+            other_file_name,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_S3Client_delete_file_objects_by_prefix_batches(self, tmp_path: Path) -> None:
+        """Test 'S3Client.delete_file_objects_by_prefix()' splits deleted keys by batches of maximum size.
+
+        Args:
+            tmp_path: pytest fixture, creates temporary directory.
+
+        Returns:
+        Nothing.
+        """
+        s3_client, local_s3_client = self._create_local_s3_client(tmp_path)
+        prefix = S3ClientConstants.BENCHMARK_FOLDER_NAME.value.format(run_id='test')
+        objects_count = 2 * S3ClientConstants.MAX_DELETE_BATCH_SIZE.value + 500
+        for index in range(objects_count):
+            await local_s3_client.put_object(
+                Bucket='test-bucket',
+                Key=S3ClientConstants.BENCHMARK_FILE_NAME.value.format(run_id='test', index=index),
+                Body=b'1',
+            )
+        assert await s3_client.delete_file_objects_by_prefix(prefix) is not None
+        assert local_s3_client.requests['delete_objects'] == 3
+        assert not any(path.is_file() for path in local_s3_client.get_bucket_dir('test-bucket').rglob('*'))
+        assert await s3_client.delete_file_objects_by_prefix(prefix) is None
+
+
+class TestCaseImageRenditions(TestMixin):
+
+    @pytest.mark.asyncio
+    async def test_image_rendition_executor_render_valid_image(self) -> None:
+        """Test 'ImageRenditionExecutor.render()' method creates decodable renditions of every size and format.
+
+        Returns:
+        Nothing.
+        """
+        request_test_user_pictures_data.TEST_USER_PICTURE_VALID_JPEG.seek(0)
+        image_data = request_test_user_pictures_data.TEST_USER_PICTURE_VALID_JPEG.read()
+        request_test_user_pictures_data.TEST_USER_PICTURE_VALID_JPEG.seek(0)
+        renditions = await image_rendition_executor.render(image_data)
+        assert {(rendition.size, rendition.image_format) for rendition in renditions} == {
+            (size, image_format)
+            for size in UserPictureRenditionConstants.SIZES.value
+            for image_format in get_rendition_formats(has_alpha=False)
+        }
+        for rendition in renditions:
+            with Image.open(BytesIO(rendition.image_data)) as image:
+                assert image.format == rendition.image_format
+                assert image.size == (rendition.width, rendition.height)
+            assert len(rendition.image_data) < len(image_data)
+
+    @pytest.mark.asyncio
+    async def test_image_rendition_executor_render_transparent_image(self) -> None:
+        """Test 'ImageRenditionExecutor.render()' method keeps transparency of image with PNG base format.
+
+        Returns:
+        Nothing.
+        """
+        buffer = BytesIO()
+        Image.new('RGBA', (400, 200), (255, 0, 0, 0)).save(buffer, 'PNG')
+        renditions = await image_rendition_executor.render(buffer.getvalue())
+        assert {rendition.image_format for rendition in renditions} == set(get_rendition_formats(has_alpha=True))
+        assert UserPictureRenditionConstants.PNG_FORMAT.value in {rendition.image_format for rendition in renditions}
+        thumbnail = [
+            rendition for rendition in renditions
+            if (rendition.size, rendition.image_format) == (
+                UserPictureRenditionConstants.THUMBNAIL_SIZE.value, UserPictureRenditionConstants.PNG_FORMAT.value,
+            )
+        ][0]
+        assert (thumbnail.width, thumbnail.height) == (128, 64)
+        with Image.open(BytesIO(thumbnail.image_data)) as image:
+            assert image.mode == 'RGBA'
+
+
+class TestCaseUserPictureTasks(TestMixin):
+
+    def test_save_user_picture_task_with_spooled_image(
+            self, celery_app: Celery, test_user_picture: UserPicture, mock_upload_file_object: AsyncMock,
+    ) -> None:
+        """Test 'save_user_picture_in_aws_s3_bucket' task reads spooled image and removes it when done.
+
+        Args:
+            celery_app: pytest fixture that creates test Celery app.
+            test_user_picture: pytest fixture, add user picture to database.
+            mock_upload_file_object: pytest fixture, creates mocked 'S3Client.upload_file_object()' method.
+
+        Returns:
+        Nothing.
+        """
+        request_test_user_pictures_data.TEST_USER_PICTURE_VALID_JPEG.seek(0)
+        image_data = request_test_user_pictures_data.TEST_USER_PICTURE_VALID_JPEG.read()
+        request_test_user_pictures_data.TEST_USER_PICTURE_VALID_JPEG.seek(0)
+        spool_key = asyncio.run(file_spool.save_upload_file(UploadFile(filename='image.jpg', file=BytesIO(image_data))))
+        celery_worker_resources.start(celery_app.conf)
+        try:
+            result = save_user_picture_in_aws_s3_bucket.apply(kwargs={
+                'user_id': str(test_user_picture.user_id),
+                'picture_id': str(test_user_picture.id),
+                'spool_key': spool_key,
+                'content_type': request_test_user_pictures_data.TEST_USER_PICTURE_CONTENT_TYPE,
+                'file_extension': request_test_user_pictures_data.TEST_USER_PICTURE_EXTENSION,
+            }).get()
+        finally:
+            celery_worker_resources.shutdown()
+        assert result == str(test_user_picture.id)
+        assert mock_upload_file_object.call_args_list[0].kwargs['file_obj'] == image_data
+        with pytest.raises(FileNotFoundError):
+            file_spool.read(spool_key)
+
+    def test_benchmark_s3_throughput_task_with_local_s3(self, celery_app: Celery, tmp_path: Path) -> None:
+        """Test 'benchmark_s3_throughput' task uploads and deletes file objects with LocalS3Client.
+
+        Args:
+            celery_app: pytest fixture that creates test Celery app.
+            tmp_path: pytest fixture, creates temporary directory.
+
+        Returns:
+        Nothing.
+        """
+        celery_app.conf.AWS_S3_LOCAL_DIR = str(tmp_path)
+        celery_worker_resources.start(celery_app.conf)
+        try:
+            result = benchmark_s3_throughput.apply(kwargs={'objects_count': 20}).get()
+            local_s3_client = celery_worker_resources.s3_client
+        finally:
+            celery_worker_resources.shutdown()
+            celery_app.conf.AWS_S3_LOCAL_DIR = None
+        assert result['objects_count'] == 20
+        assert result['upload_objects_per_second'] > 0
+        assert result['delete_objects_per_second'] > 0
+        assert local_s3_client.requests['put_object'] == 20
+        assert local_s3_client.requests['delete_objects'] == 1
+        assert not any(path.is_file() for path in tmp_path.rglob('*'))
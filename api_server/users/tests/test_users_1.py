@@ -1,15 +1,22 @@
 from fastapi import FastAPI, status
 
 from httpx import AsyncClient
-from sqlalchemy import func, select
+from sqlalchemy import func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 import pytest
 
 from auth.models import EmailConfirmationToken
+from common.constants.pagination import PaginationCountConstants
+from common.constants.tests import GenericTestConstants
+from common.constants.users import UserRouteConstants
 from common.tests.generics import TestMixin
 from common.tests.test_data.users import request_test_user_data
 from users.models import User
+from users.schemas import UserInputSchema
+from users.services import UserService
 from users.tests.test_data import response_test_user_data
+from utils.count_providers import PaginationCountProvider
+from utils.tests import count_statements
 
 
 class TestCaseGetUsers(TestMixin):
@@ -57,6 +64,109 @@ class TestCaseGetUsers(TestMixin):
         assert response.status_code == status.HTTP_200_OK
         assert (await db_session.execute(select(func.count(User.id)))).scalar_one() == 1
 
+    @pytest.mark.asyncio
+    async def test_get_users_conditional_request(
+            self, app: FastAPI, client: AsyncClient, db_session: AsyncSession, test_user: User,
+    ) -> None:
+        """Test GET '/users' endpoint answers 304 without body when 'If-None-Match' header has current etag.
+
+        Args:
+            app: pytest fixture, an instance of FastAPI.
+            client: pytest fixture, an instance of AsyncClient for http requests.
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+            test_user: pytest fixture, add user to database.
+
+        Returns:
+        Nothing.
+        """
+        url = app.url_path_for('get_users')
+        response = await client.get(url)
+        assert response.headers['cache-control'] == UserRouteConstants.LIST_CACHE_CONTROL.value
+        response = await client.get(url, headers={'if-none-match': f'"other", W/{response.headers["etag"]}'})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b''
+        response = await client.get(url, headers={'if-none-match': '"other"'})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == response_test_user_data.RESPONSE_GET_USERS
+
+    @pytest.mark.asyncio
+    async def test_get_users_cursor_test_data_in_db(
+            self, app: FastAPI, client: AsyncClient, db_session: AsyncSession, test_user: User,
+    ) -> None:
+        """Test GET '/users' endpoint with keyset pagination cursor and user's test data added to the db.
+
+        Args:
+            app: pytest fixture, an instance of FastAPI.
+            client: pytest fixture, an instance of AsyncClient for http requests.
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+            test_user: pytest fixture, add user to database.
+
+        Returns:
+        Nothing.
+        """
+        url = app.url_path_for('get_users')
+        response = await client.get(url, params={'cursor': ''})
+        response_data = response.json()
+        expected_result = response_test_user_data.RESPONSE_GET_USERS_CURSOR
+        assert response_data == expected_result
+        assert response.status_code == status.HTTP_200_OK
+
+    @pytest.mark.asyncio
+    async def test_get_users_cursor_next_page(
+            self,
+            app: FastAPI,
+            client: AsyncClient,
+            db_session: AsyncSession,
+            user_service: UserService,
+            test_user: User,
+    ) -> None:
+        """Test GET '/users' endpoint walks all users with keyset pagination 'next_cursor'.
+
+        Args:
+            app: pytest fixture, an instance of FastAPI.
+            client: pytest fixture, an instance of AsyncClient for http requests.
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+            user_service: pytest fixture, instance of UserService business logic.
+            test_user: pytest fixture, add user to database.
+
+        Returns:
+        Nothing.
+        """
+        second_user = await self._create_user(
+            user_service, UserInputSchema(**request_test_user_data.ADD_SECOND_USER_TEST_DATA),
+        )
+        url = app.url_path_for('get_users')
+        first_page = (await client.get(url, params={'cursor': '', 'page_size': 1})).json()['data']
+        assert first_page['has_next'] is True
+        assert first_page['next_cursor'] is not None
+        second_page = (
+            await client.get(url, params={'cursor': first_page['next_cursor'], 'page_size': 1})
+        ).json()['data']
+        assert second_page['has_next'] is False
+        assert second_page['next_cursor'] is None
+        assert {first_page['items'][0]['id'], second_page['items'][0]['id']} == {
+            str(test_user.id), str(second_user.id),
+        }
+
+    @pytest.mark.asyncio
+    async def test_get_users_invalid_cursor(self, app: FastAPI, client: AsyncClient, db_session: AsyncSession) -> None:
+        """Test GET '/users' endpoint with malformed keyset pagination cursor.
+
+        Args:
+            app: pytest fixture, an instance of FastAPI.
+            client: pytest fixture, an instance of AsyncClient for http requests.
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+
+        Returns:
+        Nothing.
+        """
+        url = app.url_path_for('get_users')
+        response = await client.get(url, params={'cursor': 'invalid_cursor'})
+        response_data = response.json()
+        expected_result = response_test_user_data.RESPONSE_USERS_INVALID_CURSOR
+        assert response_data == expected_result
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
 
 class TestCaseGetUser(TestMixin):
 
@@ -105,6 +215,78 @@ class TestCaseGetUser(TestMixin):
         assert response.status_code == status.HTTP_200_OK
         assert (await db_session.execute(select(func.count(User.id)))).scalar_one() == 1
 
+    @pytest.mark.asyncio
+    async def test_get_user_statements_count(
+            self, app: FastAPI, client: AsyncClient, db_session: AsyncSession, test_user: User,
+    ) -> None:
+        """Test GET '/users/{id}' endpoint loads user with its profile picture in a single sql statement.
+
+        Args:
+            app: pytest fixture, an instance of FastAPI.
+            client: pytest fixture, an instance of AsyncClient for http requests.
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+            test_user: pytest fixture, add user to database.
+
+        Returns:
+        Nothing.
+        """
+        url = app.url_path_for('get_user', id=test_user.id)
+        with count_statements(app.db_engine) as statements:
+            response = await client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert len(statements) == GenericTestConstants.GET_USER_STATEMENTS.value
+
+
+class TestCasePaginationCountProvider(TestMixin):
+
+    @pytest.mark.asyncio
+    async def test_cached_count_strategy(self, app: FastAPI, db_session: AsyncSession, test_user: User) -> None:
+        """Test cached count strategy reuses stored count until it gets invalidated.
+
+        Args:
+            app: pytest fixture, an instance of FastAPI.
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+            test_user: pytest fixture, add user to database.
+
+        Returns:
+        Nothing.
+        """
+        count_provider = PaginationCountProvider()
+        count_provider.start(
+            app.app_config.copy(update={'PAGINATION_COUNT_STRATEGY': PaginationCountConstants.CACHED_STRATEGY.value}),
+        )
+        async with app.db_session_maker() as session:
+            with count_statements(app.db_engine) as statements:
+                assert await count_provider.count(session, User) == (1, False)
+                assert await count_provider.count(session, User) == (1, False)
+            assert len(statements) == 1
+            count_provider.invalidate(User)
+            with count_statements(app.db_engine) as statements:
+                assert await count_provider.count(session, User) == (1, False)
+            assert len(statements) == 1
+
+    @pytest.mark.asyncio
+    async def test_estimated_count_strategy(self, app: FastAPI, db_session: AsyncSession, test_user: User) -> None:
+        """Test estimated count strategy takes number of rows from postgres table statistics.
+
+        Args:
+            app: pytest fixture, an instance of FastAPI.
+            db_session: pytest fixture, sqlalchemy AsyncSession.
+            test_user: pytest fixture, add user to database.
+
+        Returns:
+        Nothing.
+        """
+        count_provider = PaginationCountProvider()
+        count_provider.start(
+            app.app_config.copy(
+                update={'PAGINATION_COUNT_STRATEGY': PaginationCountConstants.ESTIMATED_STRATEGY.value},
+            ),
+        )
+        await db_session.execute(text(f'ANALYZE {User.__tablename__}'))
+        await db_session.commit()
+        assert await count_provider.count(db_session, User) == (1, False)
+
 
 class TestCasePostUsers(TestMixin):
 
@@ -1,7 +1,10 @@
-from users.utils.aws_s3.aws_s3 import S3Client
+from users.utils.aws_s3.aws_s3 import S3Client, create_s3_client
+from users.utils.aws_s3.local_s3 import LocalS3Client
 from users.utils.aws_s3.user_pictures import S3EventHandler
 
 __all__ = [
     'S3Client',
     'S3EventHandler',
+    'LocalS3Client',
+    'create_s3_client',
 ]
@@ -1,15 +1,55 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 from uuid import UUID
 
 from fastapi import status
 
+from aiobotocore.config import AioConfig
 from aiobotocore.session import get_session
 from botocore.exceptions import ClientError
 
 from common.constants.users import S3ClientConstants
+from users.utils.aws_s3.local_s3 import LocalS3Client
+from users.utils.storage.base import PictureStorage
 from utils.logging import setup_logging
 
 
-class S3Client:
+def create_s3_client(
+        aws_access_key_id: str = None,
+        aws_secret_access_key: str = None,
+        max_pool_connections: int = S3ClientConstants.DEFAULT_MAX_POOL_CONNECTIONS.value,
+        local_dir: str | None = None,
+):
+    """Creates aiobotocore S3 client with connection pool, timeouts and retries settings.
+
+    Args:
+        aws_access_key_id: AWS access key id.
+        aws_secret_access_key: AWS secret access key.
+        max_pool_connections: maximum number of kept alive connections to AWS S3.
+        local_dir: directory of LocalS3Client, used instead of AWS S3 if provided.
+
+    Returns:
+    S3 client async context manager.
+    """
+    if local_dir:
+        return LocalS3Client(local_dir)
+    return get_session().create_client(
+        S3ClientConstants.S3_NAME.value,
+        aws_secret_access_key=aws_secret_access_key,
+        aws_access_key_id=aws_access_key_id,
+        config=AioConfig(
+            max_pool_connections=max_pool_connections,
+            connect_timeout=S3ClientConstants.CONNECT_TIMEOUT.value,
+            read_timeout=S3ClientConstants.READ_TIMEOUT.value,
+            retries={
+                'max_attempts': S3ClientConstants.MAX_RETRY_ATTEMPTS.value,
+                'mode': S3ClientConstants.RETRY_MODE.value,
+            },
+        ),
+    )
+
+
+class S3Client(PictureStorage):
     """Helper class to handle requests and responses to AWS S3."""
 
     def __init__(
@@ -18,13 +58,31 @@ class S3Client:
             aws_secret_access_key: str = None,
             aws_s3_bucket_name: str = None,
             aws_s3_bucket_region: str = None,
+            client=None,
     ):
         self.aws_access_key_id = aws_access_key_id
         self.aws_secret_access_key = aws_secret_access_key
         self.aws_s3_bucket_name = aws_s3_bucket_name
         self.aws_s3_bucket_region = aws_s3_bucket_region
+        self.client = client
         self._log = setup_logging(self.__class__.__name__)
 
+    @asynccontextmanager
+    async def _get_client(self) -> AsyncIterator:
+        """Yields long-lived aiobotocore S3 client if provided, otherwise creates short-lived one.
+
+        Returns:
+        aiobotocore S3 client within async context manager.
+        """
+        if self.client is not None:
+            yield self.client
+            return
+        async with create_s3_client(
+                aws_access_key_id=self.aws_access_key_id,
+                aws_secret_access_key=self.aws_secret_access_key,
+        ) as client:
+            yield client
+
     async def upload_file_object(
             self, file_name: str = None, content_type: str = None, file_obj: bytes = None,
     ) -> dict:
@@ -38,12 +96,7 @@ class S3Client:
         Returns:
         A dict with AWS S3 response.
         """
-        session = get_session()
-        async with session.create_client(
-                S3ClientConstants.S3_NAME.value,
-                aws_secret_access_key=self.aws_secret_access_key,
-                aws_access_key_id=self.aws_access_key_id,
-        ) as client:
+        async with self._get_client() as client:
             try:
                 response = await client.put_object(
                     Bucket=self.aws_s3_bucket_name,
@@ -79,28 +132,61 @@ class S3Client:
         Returns:
         A dict with AWS S3 response.
         """
-        session = get_session()
-        async with session.create_client(
-                S3ClientConstants.S3_NAME.value,
-                aws_secret_access_key=self.aws_secret_access_key,
-                aws_access_key_id=self.aws_access_key_id,
-        ) as client:
-            user_folder = S3ClientConstants.USER_PROFILE_PICS_FOLDER_NAME.value.format(
-                user_id=user_id,
-            )
-            paginator = client.get_paginator('list_objects')
-            async for result in paginator.paginate(Bucket=self.aws_s3_bucket_name, Prefix=user_folder):
-                for user_picture in result.get('Contents', []):
+        return await self._delete_file_objects_by_prefix(
+            S3ClientConstants.USER_PROFILE_PICS_FOLDER_NAME.value.format(user_id=user_id),
+        )
+
+    async def delete_content_file_objects(self, content_hash: str) -> dict:
+        """Deletes original picture and all its renditions stored by content hash.
+
+        Args:
+            content_hash: SHA-256 hash of picture content.
+
+        Returns:
+        A dict with AWS S3 response.
+        """
+        return await self._delete_file_objects_by_prefix(
+            S3ClientConstants.CONTENT_FOLDER_NAME.value.format(content_hash=content_hash),
+        )
+
+    async def delete_file_objects_by_prefix(self, prefix: str) -> dict | None:
+        """Deletes file objects with key prefix by batches of up to 1000 keys per DeleteObjects request.
+
+        Args:
+            prefix: key prefix of deleted file objects.
+
+        Returns:
+        A dict with AWS S3 response of the last batch, None if no file objects found.
+        """
+        return await self._delete_file_objects_by_prefix(prefix)
+
+    async def _delete_file_objects_by_prefix(self, prefix: str) -> dict | None:
+        response = None
+        async with self._get_client() as client:
+            paginator = client.get_paginator(S3ClientConstants.LIST_OBJECTS_PAGINATOR.value)
+            # Listing pages hold up to 1000 keys, so every page is deleted with a single request.
+            async for result in paginator.paginate(
+                    Bucket=self.aws_s3_bucket_name,
+                    Prefix=prefix,
+                    PaginationConfig={'PageSize': S3ClientConstants.MAX_DELETE_BATCH_SIZE.value},
+            ):
+                keys = [file_object['Key'] for file_object in result.get('Contents', [])]
+                for batch_start in range(0, len(keys), S3ClientConstants.MAX_DELETE_BATCH_SIZE.value):
+                    batch = keys[batch_start:batch_start + S3ClientConstants.MAX_DELETE_BATCH_SIZE.value]
                     try:
-                        response = await client.delete_object(
+                        response = await client.delete_objects(
                             Bucket=self.aws_s3_bucket_name,
-                            Key=user_picture['Key']
+                            Delete={'Objects': [{'Key': key} for key in batch], 'Quiet': True},
                         )
                     except ClientError as exc:
                         self._log.warning(exc)
                         raise exc
-                    if response['ResponseMetadata']['HTTPStatusCode'] == status.HTTP_204_NO_CONTENT:
-                        self._log.debug(S3ClientConstants.SUCCESSFUL_DELETE_MSG.value.format(
-                            file_path=user_picture['Key']),
-                        )
+                    errors = response.get('Errors', [])
+                    for error in errors:
+                        self._log.warning(S3ClientConstants.FAILED_DELETE_MSG.value.format(
+                            file_path=error.get('Key'), code=error.get('Code'), message=error.get('Message'),
+                        ))
+                    self._log.debug(S3ClientConstants.SUCCESSFUL_BATCH_DELETE_MSG.value.format(
+                        deleted_count=len(batch) - len(errors), prefix=prefix,
+                    ))
             return response
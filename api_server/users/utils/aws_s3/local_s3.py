@@ -0,0 +1,112 @@
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import AsyncIterator
+import hashlib
+
+from fastapi import status
+
+from botocore.exceptions import ClientError
+
+from common.constants.users import S3ClientConstants
+from utils.logging import setup_logging
+
+
+class LocalS3Paginator:
+    """Paginator of LocalS3Client listing file objects by key prefix."""
+
+    def __init__(self, client: 'LocalS3Client') -> None:
+        self.client = client
+
+    async def paginate(self, Bucket: str, Prefix: str = '', **kwargs) -> AsyncIterator[dict]:
+        """Yields pages of file objects with keys starting with prefix, in the same shape as AWS S3 responses.
+
+        Args:
+            Bucket: bucket name.
+            Prefix: key prefix.
+
+        Returns:
+        async iterator of dicts with 'Contents' list of file objects.
+        """
+        self.client.requests['list_objects_v2'] += 1
+        bucket_dir = self.client.get_bucket_dir(Bucket)
+        keys = sorted(
+            path.relative_to(bucket_dir).as_posix() for path in bucket_dir.rglob('*') if path.is_file()
+        ) if bucket_dir.exists() else []
+        keys = [key for key in keys if key.startswith(Prefix)]
+        page_size = S3ClientConstants.MAX_DELETE_BATCH_SIZE.value
+        for page_start in range(0, len(keys), page_size):
+            yield {'Contents': [{'Key': key} for key in keys[page_start:page_start + page_size]]}
+
+
+class LocalS3Client:
+    """Filesystem stand-in for aiobotocore S3 client, used to run and benchmark S3 operations offline.
+
+    Supports the subset of S3 API used by S3Client and counts requests made by operation name.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self._log = setup_logging(self.__class__.__name__)
+        self.directory = Path(directory)
+        self.requests = Counter()
+
+    async def __aenter__(self) -> 'LocalS3Client':
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._log.debug(f'LocalS3Client started in directory: "{self.directory}".')
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._log.debug(f'LocalS3Client closed, requests: {dict(self.requests)}.')
+
+    def get_bucket_dir(self, bucket: str) -> Path:
+        return self.directory / bucket
+
+    def _get_path(self, bucket: str, key: str) -> Path:
+        bucket_dir = self.get_bucket_dir(bucket).resolve()
+        path = (bucket_dir / key).resolve()
+        if bucket_dir not in path.parents:
+            raise ValueError(f'Invalid LocalS3Client key: "{key}".')
+        return path
+
+    @staticmethod
+    def _response_metadata(status_code: int) -> dict:
+        return {
+            'HTTPStatusCode': status_code,
+            'HTTPHeaders': {
+                'date': (
+                    datetime.utcnow().strftime(S3ClientConstants.AWS_S3_RESPONSE_DATETIME_FORMAT.value)
+                    + S3ClientConstants.GMT_TIMEZONE.value
+                ),
+            },
+        }
+
+    async def put_object(self, Bucket: str, Key: str, Body: bytes, **kwargs) -> dict:
+        self.requests['put_object'] += 1
+        path = self._get_path(Bucket, Key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(Body)
+        return {
+            'ResponseMetadata': self._response_metadata(status.HTTP_200_OK),
+            'ETag': f'"{hashlib.md5(Body).hexdigest()}"',
+        }
+
+    async def delete_object(self, Bucket: str, Key: str) -> dict:
+        self.requests['delete_object'] += 1
+        self._get_path(Bucket, Key).unlink(missing_ok=True)
+        return {'ResponseMetadata': self._response_metadata(status.HTTP_204_NO_CONTENT)}
+
+    async def delete_objects(self, Bucket: str, Delete: dict) -> dict:
+        self.requests['delete_objects'] += 1
+        if len(Delete['Objects']) > S3ClientConstants.MAX_DELETE_BATCH_SIZE.value:
+            raise ClientError(
+                {'Error': {'Code': 'MalformedXML', 'Message': 'Too many keys in delete request.'}}, 'DeleteObjects',
+            )
+        for file_object in Delete['Objects']:
+            self._get_path(Bucket, file_object['Key']).unlink(missing_ok=True)
+        response = {'ResponseMetadata': self._response_metadata(status.HTTP_200_OK)}
+        if not Delete.get('Quiet'):
+            response['Deleted'] = [{'Key': file_object['Key']} for file_object in Delete['Objects']]
+        return response
+
+    def get_paginator(self, operation_name: str) -> LocalS3Paginator:
+        return LocalS3Paginator(self)
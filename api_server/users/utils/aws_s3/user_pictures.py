@@ -1,38 +1,68 @@
 from datetime import datetime
 from typing import AsyncContextManager
 from uuid import UUID
+import asyncio
+import hashlib
 
-from common.constants.users import S3ClientConstants
-from users.cruds import UserPictureCRUD
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from common.constants.users import S3ClientConstants, UserPictureModelConstants, UserPictureRenditionConstants
+from users.cruds import UserPictureContentCRUD, UserPictureCRUD, UserPictureRenditionCRUD
 from users.models import UserPicture
-from users.schemas.user_pictures import UserPictureUpdateSchema
-from users.utils.aws_s3.aws_s3 import S3Client
+from users.schemas.user_pictures import UserPictureRenditionSchema, UserPictureUpdateSchema
+from users.utils.image_renditions import ImageRendition, image_rendition_executor
+from users.utils.storage import PictureStorage
 
 
 class UserImageFile:
     """Container object for UserPicture object attributes."""
 
-    def __init__(self, db_user_picture: UserPicture, image_data: bytes,  content_type: str, file_extension: str):
-        self.db_user_picture = db_user_picture
+    def __init__(
+            self, user_id: UUID, picture_id: UUID, image_data: bytes, content_type: str, file_extension: str,
+            content_hash: str | None = None,
+    ):
+        self.user_id = user_id
+        self.picture_id = picture_id
         self.image_data = image_data
         self.content_type = content_type
         self.file_extension = file_extension
+        self.content_hash = content_hash or hashlib.sha256(image_data).hexdigest()
 
     @property
     def file_name(self):
-        return S3ClientConstants.PICTURE_FILE_NAME.value.format(
-            user_id=self.db_user_picture.user_id,
-            picture_id=self.db_user_picture.id,
+        return S3ClientConstants.CONTENT_FILE_NAME.value.format(
+            content_hash=self.content_hash,
             file_extension=self.file_extension,
         )
 
+    def get_rendition_file_name(self, rendition: ImageRendition) -> str:
+        """Makes full file path of image rendition on AWS S3 bucket.
+
+        Args:
+            rendition: ImageRendition object.
+
+        Returns:
+        string with rendition file path.
+        """
+        return UserPictureRenditionConstants.FILE_NAME.value.format(
+            content_hash=self.content_hash,
+            size=rendition.size,
+            file_extension=rendition.file_extension,
+        )
+
 
 class S3EventHandler:
-    """Helper class to handle S3 events such as upload, delete files in AWS S3."""
+    """Helper class to handle S3 events such as upload, delete files in AWS S3.
+
+    Pictures are stored in AWS S3 bucket by hash of their content shared by UserPictureContent object, so picture
+    with already stored content is not uploaded again and stored files are deleted with the last UserPicture using
+    them.
+    Any PictureStorage backend can be used instead of S3Client, for example LocalStorage.
+    """
 
     def __init__(
             self,
-            s3_client: S3Client,
+            s3_client: PictureStorage,
             db_session: AsyncContextManager,
             user_image_file: UserImageFile | None = None,
     ):
@@ -41,13 +71,53 @@ class S3EventHandler:
         self.db_session = db_session
 
     async def upload_image_to_s3(self) -> UserPicture:
-        """Uploads user's image to AWS S3 bucket and saves additional info in UserPicture model.
+        """Uploads user's image with its renditions to AWS S3 bucket and saves additional info in the database.
+
+        Returns:
+        Updated UserPicture object with image's S3 information.
+        """
+        async with self.db_session as session:
+            return await self._upload_image_content(session)
+
+    async def _upload_image_content(self, session: AsyncSession) -> UserPicture:
+        """Adds reference to image content, uploads image and its renditions only if content is not stored yet.
+
+        Content is acquired in the same transaction as UserPicture update, so failed upload adds no reference.
+
+        Args:
+            session: sqlalchemy AsyncSession.
 
         Returns:
         Updated UserPicture object with image's S3 information.
         """
-        response = await self._upload_image_to_s3()
-        return await self._save_uploaded_image_data(s3_response=response)
+        content_hash = self.user_image_file.content_hash
+        user_picture_content_crud = UserPictureContentCRUD(session=session)
+        user_picture_content = await user_picture_content_crud.acquire_user_picture_content(content_hash)
+        if user_picture_content.url:
+            url, etag, updated_at = user_picture_content.url, user_picture_content.etag, datetime.utcnow()
+            user_picture_rendition_crud = UserPictureRenditionCRUD(session=session)
+            renditions = [
+                UserPictureRenditionSchema.from_orm(rendition)
+                for rendition in await user_picture_rendition_crud.get_user_picture_renditions_by_content_hash(
+                    content_hash,
+                )
+            ]
+        else:
+            response = await self._upload_image_to_s3()
+            url, etag = response['uploaded_file_url'], response['ETag']
+            updated_at = datetime.strptime(
+                response['ResponseMetadata']['HTTPHeaders']['date'],
+                S3ClientConstants.AWS_S3_RESPONSE_DATETIME_FORMAT.value,
+            )
+            await user_picture_content_crud.update_user_picture_content(content_hash, url=url, etag=etag)
+            renditions = []
+        if not renditions:
+            renditions = await self._upload_renditions_to_s3()
+        return await self._save_uploaded_image_data(
+            session,
+            picture_data=UserPictureUpdateSchema(url=url, updated_at=updated_at, etag=etag, content_hash=content_hash),
+            renditions=renditions,
+        )
 
     async def _upload_image_to_s3(self) -> dict:
         """Uploads file to AWS S3 bucket.
@@ -61,50 +131,98 @@ class S3EventHandler:
             file_name=self.user_image_file.file_name,
         )
 
-    async def _save_uploaded_image_data(self, s3_response: dict) -> UserPicture:
-        """Saves additional UserPicture data in the database.
+    async def _upload_renditions_to_s3(self) -> list[UserPictureRenditionSchema]:
+        """Creates image renditions in worker pool and uploads them to AWS S3 bucket concurrently.
+
+        Returns:
+        list of UserPictureRenditionSchema objects with renditions S3 information.
+        """
+        image_renditions = await image_rendition_executor.render(self.user_image_file.image_data)
+        responses = await asyncio.gather(*(
+            self.s3_client.upload_file_object(
+                content_type=rendition.content_type,
+                file_obj=rendition.image_data,
+                file_name=self.user_image_file.get_rendition_file_name(rendition),
+            ) for rendition in image_renditions
+        ))
+        return [
+            UserPictureRenditionSchema(
+                size=rendition.size,
+                image_format=rendition.image_format,
+                width=rendition.width,
+                height=rendition.height,
+                url=response['uploaded_file_url'],
+                etag=response['ETag'],
+            ) for rendition, response in zip(image_renditions, responses)
+        ]
+
+    async def _save_uploaded_image_data(
+            self, session: AsyncSession, picture_data: UserPictureUpdateSchema,
+            renditions: list[UserPictureRenditionSchema],
+    ) -> UserPicture:
+        """Saves additional UserPicture data and UserPictureRendition objects in the database.
 
         Args:
-            s3_response: dict with response data from AWS S3.
+            session: sqlalchemy AsyncSession.
+            picture_data: UserPictureUpdateSchema object with image's S3 information.
+            renditions: list of UserPictureRenditionSchema objects.
 
         Returns:
         Updated UserPicture object.
         """
-        formatted_updated_at_datetime = datetime.strptime(
-            s3_response['ResponseMetadata']['HTTPHeaders']['date'],
-            S3ClientConstants.AWS_S3_RESPONSE_DATETIME_FORMAT.value,
+        user_picture_crud = UserPictureCRUD(session=session)
+        user_picture = await user_picture_crud.update_user_picture(
+            picture_id=self.user_image_file.picture_id,
+            picture_data=picture_data,
         )
-        user_picture_update_data = UserPictureUpdateSchema(
-            url=s3_response['uploaded_file_url'],
-            updated_at=formatted_updated_at_datetime,
-            etag=s3_response['ETag'],
+        user_picture_rendition_crud = UserPictureRenditionCRUD(session=session)
+        await user_picture_rendition_crud.replace_user_picture_renditions(
+            picture_id=self.user_image_file.picture_id,
+            renditions=renditions,
         )
-        async with self.db_session as session:
-            user_picture_crud = UserPictureCRUD(session=session)
-            return await user_picture_crud.update_user_picture(
-                picture_id=self.user_image_file.db_user_picture.id,
-                picture_data=user_picture_update_data,
-            )
+        return user_picture
 
     async def update_image_in_s3(self) -> UserPicture:
-        """Deletes Previously uploaded user's image and uploads new user's image.
+        """Uploads new user's image and releases content of previously uploaded user's image.
 
         Returns:
         Updated UserPicture object with image's S3 information.
         """
-        await self._delete_images_in_s3(user_id=self.user_image_file.db_user_picture.user_id)
-        return await self.upload_image_to_s3()
+        async with self.db_session as session:
+            previous_user_picture = await UserPictureCRUD(session=session).get_user_picture_by_id(
+                self.user_image_file.picture_id,
+            )
+            previous_content_hash = previous_user_picture.content_hash if previous_user_picture else None
+            # New content is acquired first, so re-upload of the same image never drops its references to zero.
+            user_picture = await self._upload_image_content(session)
+            await self._release_image_content(session, self.user_image_file.user_id, previous_content_hash)
+            return user_picture
 
-    async def delete_images_in_s3(self, user_id: UUID) -> dict:
-        """Delete all files in user's folder in AWS S3 bucket.
+    async def delete_images_in_s3(self, user_id: UUID, content_hash: str | None = None) -> dict | None:
+        """Releases user's image content and deletes its files in AWS S3 bucket when it is not referenced anymore.
 
         Args:
             user_id: UUID of User object.
+            content_hash: SHA-256 hash of deleted picture content, pictures uploaded before content hashing are
+                deleted from user's folder.
 
         Returns:
-        dict with AWS S3 response.
+        dict with AWS S3 response or None if nothing was deleted.
         """
-        return await self._delete_images_in_s3(user_id)
-
-    async def _delete_images_in_s3(self, user_id: UUID) -> dict:
-        return await self.s3_client.delete_file_objects(user_id)
+        async with self.db_session as session:
+            return await self._release_image_content(session, user_id, content_hash)
+
+    async def _release_image_content(
+            self, session: AsyncSession, user_id: UUID, content_hash: str | None,
+    ) -> dict | None:
+        if content_hash is None:
+            return await self.s3_client.delete_file_objects(user_id)
+        user_picture_content_crud = UserPictureContentCRUD(session=session)
+        reference_count = await user_picture_content_crud.release_user_picture_content(content_hash)
+        # Missing content was already deleted or never stored, so its AWS S3 objects are not touched.
+        if reference_count != UserPictureModelConstants.ZERO_REFERENCES.value:
+            return None
+        response = await self.s3_client.delete_content_file_objects(content_hash)
+        # Content is deleted after its files, so failed deletion of files is retried with the same result.
+        await user_picture_content_crud.delete_user_picture_content(content_hash)
+        return response
@@ -0,0 +1,139 @@
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from io import BytesIO
+import asyncio
+import time
+
+from PIL import Image, ImageOps
+
+from common.constants.users import UserPictureRenditionConstants
+from utils.logging import setup_logging
+
+
+class ImageRendition:
+    """Container object for encoded image rendition."""
+
+    def __init__(self, size: str, image_format: str, width: int, height: int, image_data: bytes) -> None:
+        self.size = size
+        self.image_format = image_format
+        self.width = width
+        self.height = height
+        self.image_data = image_data
+
+    @property
+    def content_type(self) -> str:
+        return UserPictureRenditionConstants.CONTENT_TYPES.value[self.image_format]
+
+    @property
+    def file_extension(self) -> str:
+        return UserPictureRenditionConstants.FILE_EXTENSIONS.value[self.image_format]
+
+
+def get_rendition_formats(has_alpha: bool) -> list[str]:
+    """Makes list of image formats renditions encoded to, optional formats are skipped if Pillow can't save them.
+
+    Args:
+        has_alpha: bool of image transparency, PNG is used instead of JPEG for transparent images.
+
+    Returns:
+    list of Pillow image format names.
+    """
+    Image.init()
+    base_format = (
+        UserPictureRenditionConstants.PNG_FORMAT.value if has_alpha else UserPictureRenditionConstants.JPEG_FORMAT.value
+    )
+    return [base_format] + [
+        image_format for image_format in UserPictureRenditionConstants.OPTIONAL_FORMATS.value
+        if image_format in Image.SAVE
+    ]
+
+
+def _render_image(image_data: bytes) -> tuple[list[ImageRendition], float]:
+    """Resizes image to every rendition size and encodes it to every supported format inside executor worker.
+
+    Args:
+        image_data: bytes with original image content.
+
+    Returns:
+    tuple with list of ImageRendition objects and rendering seconds.
+    """
+    started_at = time.monotonic()
+    renditions = []
+    with Image.open(BytesIO(image_data)) as image:
+        largest_size = max(UserPictureRenditionConstants.SIZES.value.values())
+        # JPEG decoder downscales by power of two while decoding, so full resolution image is never decoded.
+        image.draft('RGB', (largest_size, largest_size))
+        has_alpha = image.mode in UserPictureRenditionConstants.ALPHA_MODES.value or 'transparency' in image.info
+        resized_image = ImageOps.exif_transpose(image).convert('RGBA' if has_alpha else 'RGB')
+    rendition_formats = get_rendition_formats(has_alpha)
+    # Sizes are ordered from the largest, so every rendition is resized from previous smaller one.
+    for size, max_side in UserPictureRenditionConstants.SIZES.value.items():
+        resized_image.thumbnail((max_side, max_side))
+        for image_format in rendition_formats:
+            buffer = BytesIO()
+            resized_image.save(buffer, image_format, quality=UserPictureRenditionConstants.ENCODING_QUALITY.value)
+            renditions.append(ImageRendition(
+                size=size,
+                image_format=image_format,
+                width=resized_image.width,
+                height=resized_image.height,
+                image_data=buffer.getvalue(),
+            ))
+    return renditions, time.monotonic() - started_at
+
+
+class ImageRenditionExecutor:
+    """Runs CPU bound Pillow resizing and encoding of user pictures in a worker pool outside of the event loop."""
+
+    def __init__(self) -> None:
+        self._log = setup_logging(self.__class__.__name__)
+        self._executor: Executor | None = None
+        self.max_workers = UserPictureRenditionConstants.DEFAULT_MAX_WORKERS.value
+
+    def start(self, config=None) -> None:
+        """Creates worker pool based on Celery app config, default settings used if config not provided.
+
+        Args:
+            config: Celery app config.
+
+        Returns:
+        Nothing.
+        """
+        executor_type = UserPictureRenditionConstants.THREAD_EXECUTOR.value
+        if config:
+            executor_type = config.IMAGE_RENDITION_EXECUTOR
+            self.max_workers = config.IMAGE_RENDITION_MAX_WORKERS
+        if executor_type == UserPictureRenditionConstants.PROCESS_EXECUTOR.value:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='image_rendition')
+        self._log.debug(f'Image rendition {executor_type} pool started with {self.max_workers} workers.')
+
+    def shutdown(self) -> None:
+        """Shutdowns worker pool.
+
+        Returns:
+        Nothing.
+        """
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._log.debug('Image rendition pool stopped.')
+
+    async def render(self, image_data: bytes) -> list[ImageRendition]:
+        """Creates renditions of image in worker pool.
+
+        Args:
+            image_data: bytes with original image content.
+
+        Returns:
+        list of ImageRendition objects.
+        """
+        if not self._executor:
+            self.start()
+        loop = asyncio.get_running_loop()
+        renditions, rendering_time = await loop.run_in_executor(self._executor, _render_image, image_data)
+        self._log.debug(f'{len(renditions)} image renditions created in {rendering_time:.4f}s.')
+        return renditions
+
+
+image_rendition_executor = ImageRenditionExecutor()
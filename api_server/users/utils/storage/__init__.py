@@ -0,0 +1,9 @@
+from users.utils.storage.base import PictureStorage
+from users.utils.storage.local_storage import LocalStorage, StoredFile, local_storage
+
+__all__ = [
+    'PictureStorage',
+    'LocalStorage',
+    'StoredFile',
+    'local_storage',
+]
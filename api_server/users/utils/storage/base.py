@@ -0,0 +1,58 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+
+class PictureStorage(ABC):
+    """Interface of user pictures storage backend.
+
+    Upload response has the same shape as AWS S3 'put_object' response with additional 'uploaded_file_url', so
+    S3EventHandler works with any backend. Backend missing any of the methods can't be created.
+    """
+
+    @abstractmethod
+    async def upload_file_object(
+            self, file_name: str = None, content_type: str = None, file_obj: bytes = None,
+    ) -> dict:
+        """Saves file object in storage.
+
+        Args:
+            file_name: string with full file path in storage.
+            content_type: file's content type.
+            file_obj: file object to save.
+
+        Returns:
+        A dict with 'uploaded_file_url', 'ETag' and 'ResponseMetadata' of saved file object.
+        """
+
+    @abstractmethod
+    async def delete_file_objects(self, user_id: UUID) -> dict | None:
+        """Deletes all file objects in user profile_pics folder.
+
+        Args:
+            user_id: UUID of user.
+
+        Returns:
+        A dict with storage response, None if nothing was deleted.
+        """
+
+    @abstractmethod
+    async def delete_content_file_objects(self, content_hash: str) -> dict | None:
+        """Deletes original picture and all its renditions stored by content hash.
+
+        Args:
+            content_hash: SHA-256 hash of picture content.
+
+        Returns:
+        A dict with storage response, None if nothing was deleted.
+        """
+
+    @abstractmethod
+    async def delete_file_objects_by_prefix(self, prefix: str) -> dict | None:
+        """Deletes all file objects with key prefix.
+
+        Args:
+            prefix: key prefix of deleted file objects.
+
+        Returns:
+        A dict with storage response, None if nothing was deleted.
+        """
@@ -0,0 +1,204 @@
+from datetime import datetime
+from pathlib import Path
+from uuid import UUID, uuid4
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+
+from fastapi import status
+
+from pydantic import BaseModel
+
+from common.constants.storage import PictureStorageConstants
+from common.constants.users import S3ClientConstants
+from users.utils.storage.base import PictureStorage
+from utils.logging import setup_logging
+
+
+class StoredFile:
+    """Container object for file saved in LocalStorage."""
+
+    def __init__(self, path: Path, stat_result: os.stat_result, etag: str, content_type: str) -> None:
+        self.path = path
+        self.stat_result = stat_result
+        self.etag = etag
+        self.content_type = content_type
+
+
+class LocalStorage(PictureStorage):
+    """Stores user pictures in local directory shared by api server and Celery workers.
+
+    Files are served by api server, so dev, test and on-prem deployments don't need AWS S3.
+    """
+
+    def __init__(self) -> None:
+        self._log = setup_logging(self.__class__.__name__)
+        self.directory = Path(tempfile.gettempdir()) / PictureStorageConstants.DEFAULT_DIR_NAME.value
+        self.base_url = PictureStorageConstants.DEFAULT_BASE_URL.value
+
+    def start(self, config: BaseModel | None = None) -> None:
+        """Configures storage directory and base url of stored files from app config.
+
+        Args:
+            config: fastapi app config or Celery app config.
+
+        Returns:
+        Nothing.
+        """
+        if config is not None:
+            if config.LOCAL_STORAGE_DIR:
+                self.directory = Path(config.LOCAL_STORAGE_DIR)
+            if config.LOCAL_STORAGE_URL:
+                self.base_url = config.LOCAL_STORAGE_URL.rstrip('/')
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._log.debug(f'LocalStorage started in directory: "{self.directory}".')
+
+    def _get_path(self, file_name: str) -> Path:
+        directory = self.directory.resolve()
+        path = (directory / file_name).resolve()
+        if directory not in path.parents:
+            raise ValueError(f'Invalid LocalStorage file name: "{file_name}".')
+        return path
+
+    @staticmethod
+    def _get_metadata_path(path: Path) -> Path:
+        return path.with_name(path.name + PictureStorageConstants.METADATA_FILE_SUFFIX.value)
+
+    @staticmethod
+    def _write_file(path: Path, data: bytes) -> None:
+        # File is replaced atomically, so concurrent readers never see partially written file.
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = path.with_name(
+            path.name + PictureStorageConstants.TEMPORARY_FILE_SUFFIX.value.format(token=uuid4().hex),
+        )
+        temporary_path.write_bytes(data)
+        os.replace(temporary_path, path)
+
+    async def upload_file_object(
+            self, file_name: str = None, content_type: str = None, file_obj: bytes = None,
+    ) -> dict:
+        """Saves file object with its etag and content type in storage directory.
+
+        Args:
+            file_name: string with full file path in storage.
+            content_type: file's content type.
+            file_obj: file object to save.
+
+        Returns:
+        A dict with 'uploaded_file_url', 'ETag' and 'ResponseMetadata' of saved file object.
+        """
+        path = self._get_path(file_name)
+        etag = f'"{hashlib.md5(file_obj).hexdigest()}"'
+        metadata = json.dumps({'etag': etag, 'content_type': content_type}).encode()
+        await asyncio.to_thread(self._write_file, path, file_obj)
+        await asyncio.to_thread(self._write_file, self._get_metadata_path(path), metadata)
+        self._log.debug(PictureStorageConstants.SUCCESSFUL_UPLOAD_MSG.value.format(file_name=file_name))
+        return {
+            'ResponseMetadata': {
+                'HTTPStatusCode': status.HTTP_200_OK,
+                'HTTPHeaders': {
+                    'date': (
+                        datetime.utcnow().strftime(S3ClientConstants.AWS_S3_RESPONSE_DATETIME_FORMAT.value)
+                        + S3ClientConstants.GMT_TIMEZONE.value
+                    ),
+                },
+            },
+            'ETag': etag,
+            'uploaded_file_url': PictureStorageConstants.FILE_URL.value.format(
+                base_url=self.base_url,
+                file_name=file_name,
+            ),
+        }
+
+    async def get_file(self, file_name: str) -> StoredFile | None:
+        """Gets stored file with its etag and content type.
+
+        Args:
+            file_name: string with full file path in storage.
+
+        Returns:
+        StoredFile object or None if file not found.
+        """
+        try:
+            path = self._get_path(file_name)
+        except ValueError:
+            return None
+        return await asyncio.to_thread(self._get_file, path)
+
+    def _get_file(self, path: Path) -> StoredFile | None:
+        try:
+            metadata = json.loads(self._get_metadata_path(path).read_bytes())
+            stat_result = path.stat()
+        except FileNotFoundError:
+            return None
+        return StoredFile(
+            path=path,
+            stat_result=stat_result,
+            etag=metadata['etag'],
+            content_type=metadata['content_type'],
+        )
+
+    async def delete_file_objects(self, user_id: UUID) -> dict | None:
+        """Deletes all file objects in user profile_pics folder.
+
+        Args:
+            user_id: UUID of user.
+
+        Returns:
+        A dict with deleted file names, None if nothing was deleted.
+        """
+        return await self.delete_file_objects_by_prefix(
+            S3ClientConstants.USER_PROFILE_PICS_FOLDER_NAME.value.format(user_id=user_id),
+        )
+
+    async def delete_content_file_objects(self, content_hash: str) -> dict | None:
+        """Deletes original picture and all its renditions stored by content hash.
+
+        Args:
+            content_hash: SHA-256 hash of picture content.
+
+        Returns:
+        A dict with deleted file names, None if nothing was deleted.
+        """
+        return await self.delete_file_objects_by_prefix(
+            S3ClientConstants.CONTENT_FOLDER_NAME.value.format(content_hash=content_hash),
+        )
+
+    async def delete_file_objects_by_prefix(self, prefix: str) -> dict | None:
+        """Deletes all file objects with file name prefix together with their metadata.
+
+        Args:
+            prefix: file name prefix of deleted file objects.
+
+        Returns:
+        A dict with deleted file names, None if nothing was deleted.
+        """
+        deleted_file_names = await asyncio.to_thread(self._delete_file_objects_by_prefix, prefix)
+        self._log.debug(PictureStorageConstants.SUCCESSFUL_DELETE_MSG.value.format(
+            deleted_count=len(deleted_file_names), prefix=prefix,
+        ))
+        if not deleted_file_names:
+            return None
+        return {'Deleted': [{'Key': file_name} for file_name in deleted_file_names]}
+
+    def _delete_file_objects_by_prefix(self, prefix: str) -> list[str]:
+        if not self.directory.exists():
+            return []
+        deleted_file_names = []
+        parent_dirs = set()
+        for path in list(self.directory.rglob('*')):
+            file_name = path.relative_to(self.directory).as_posix()
+            if path.is_file() and file_name.startswith(prefix):
+                path.unlink(missing_ok=True)
+                parent_dirs.add(path.parent)
+                if not file_name.endswith(PictureStorageConstants.METADATA_FILE_SUFFIX.value):
+                    deleted_file_names.append(file_name)
+        for parent_dir in sorted(parent_dirs, reverse=True):
+            if parent_dir != self.directory and not any(parent_dir.iterdir()):
+                parent_dir.rmdir()
+        return deleted_file_names
+
+
+local_storage = LocalStorage()
@@ -1,32 +1,71 @@
+import hashlib
+import os
+
 from fastapi import UploadFile, status
 
-from PIL import Image
+from PIL import Image, UnidentifiedImageError
 
 from common.constants.users import UserServiceConstants
 from common.exceptions.users import UserPictureExceptionMsgs
 from users.utils.exceptions import UserPictureExtensionError, UserPictureResolutionError, UserPictureSizeError
+from utils.file_spool import file_spool
+
+
+class ValidatedImage:
+    """Result of image validation, validated image content is stored in file spool."""
+
+    def __init__(
+            self, spool_key: str, content_hash: str, size: int, image_format: str, width: int, height: int,
+            file_extension: str,
+    ) -> None:
+        self.spool_key = spool_key
+        self.content_hash = content_hash
+        self.size = size
+        self.image_format = image_format
+        self.width = width
+        self.height = height
+        self.file_extension = file_extension
 
 
 class UserProfileImageValidator:
 
     @staticmethod
-    async def validate_image(image: UploadFile) -> None:
+    async def validate_image(image: UploadFile) -> ValidatedImage:
         """Validates image size, extension and resolution raises exceptions in case of invalidation.
 
+        Image is read once by chunks of fixed size and copied to file spool while its size is checked and its SHA-256
+        content hash is computed, format and resolution are read from image header of spooled file without decoding
+        the image, so memory used per upload is bounded by chunk size. Spooled file is removed if image is invalid.
+
         Args:
             image: UploadFile image object.
 
         Raise:
             UserPictureSizeError if image size exceeds maximum image size.
-            UserPictureExtensionError if image extension not supported.
+            UserPictureExtensionError if image extension or image format not supported.
             UserPictureResolutionError if image resolution not in allowed image resolution range.
 
         Returns:
-            Nothing.
+        ValidatedImage object with key of spooled image.
         """
         await UserProfileImageValidator.validate_image_size(image)
         await UserProfileImageValidator.validate_image_extension(image)
-        await UserProfileImageValidator.validate_image_resolution(image)
+        spool_key, image_size, content_hash = await UserProfileImageValidator._spool_image(image)
+        try:
+            image_format, width, height = UserProfileImageValidator._read_image_header(spool_key)
+            await UserProfileImageValidator.validate_image_resolution(width, height)
+        except Exception:
+            file_spool.delete(spool_key)
+            raise
+        return ValidatedImage(
+            spool_key=spool_key,
+            content_hash=content_hash,
+            size=image_size,
+            image_format=image_format,
+            width=width,
+            height=height,
+            file_extension=image.filename.split('.')[-1].lower(),
+        )
 
     @staticmethod
     async def validate_image_size(image: UploadFile) -> None:
@@ -49,7 +88,7 @@ class UserProfileImageValidator:
 
     @staticmethod
     async def _validate_image_size(image: UploadFile) -> bool:
-        """Checks currently uploaded image size to the maximum image size threshold.
+        """Checks currently uploaded image size to the maximum image size threshold without reading the image.
 
         Args:
             image: UploadFile image object.
@@ -57,9 +96,68 @@ class UserProfileImageValidator:
         Returns:
         bool of comparison uploaded image size and maximum image size threshold.
         """
-        image_size = len(await image.read())
+        image_size = image.file.seek(0, os.SEEK_END)
+        image.file.seek(0)
         return image_size >= UserServiceConstants.IMAGE_SIZE_6_MB.value
 
+    @staticmethod
+    async def _spool_image(image: UploadFile) -> tuple[str, int, str]:
+        """Copies uploaded image to file spool by chunks and hashes it, stops reading at maximum image size.
+
+        Args:
+            image: UploadFile image object.
+
+        Raise:
+            UserPictureSizeError if image size exceeds maximum image size.
+
+        Returns:
+        tuple of key of spooled image, image size in bytes and hex SHA-256 digest of image content.
+        """
+        await image.seek(0)
+        spool_key, spooled_file = file_spool.create()
+        image_size = 0
+        content_hash = hashlib.sha256()
+        try:
+            with spooled_file:
+                while chunk := await image.read(UserServiceConstants.IMAGE_READ_CHUNK_SIZE.value):
+                    image_size += len(chunk)
+                    if image_size >= UserServiceConstants.IMAGE_SIZE_6_MB.value:
+                        raise UserPictureSizeError(
+                            status_code=status.HTTP_400_BAD_REQUEST,
+                            detail=UserPictureExceptionMsgs.IMAGE_EXCEED_MAX_SIZE.value,
+                        )
+                    content_hash.update(chunk)
+                    spooled_file.write(chunk)
+        except Exception:
+            file_spool.delete(spool_key)
+            raise
+        return spool_key, image_size, content_hash.hexdigest()
+
+    @staticmethod
+    def _read_image_header(spool_key: str) -> tuple[str, int, int]:
+        """Reads format, width and height from header of spooled image, image data is not decoded.
+
+        Args:
+            spool_key: key of spooled image.
+
+        Raise:
+            UserPictureExtensionError if image format not recognized or not supported.
+
+        Returns:
+        tuple of image format, width and height.
+        """
+        try:
+            with file_spool.open(spool_key) as spooled_file, Image.open(spooled_file) as pillow_image:
+                image_format, width, height = pillow_image.format, pillow_image.width, pillow_image.height
+        except UnidentifiedImageError:
+            image_format = None
+        if image_format not in UserServiceConstants.VALID_IMAGE_FORMATS.value:
+            raise UserPictureExtensionError(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=UserPictureExceptionMsgs.UNSUPPORTED_IMAGE_EXTENSION.value,
+            )
+        return image_format, width, height
+
     @staticmethod
     async def validate_image_extension(image: UploadFile) -> None:
         """Validates image extension and raises exception in case of invalidation.
@@ -93,11 +191,12 @@ class UserProfileImageValidator:
         return bool(UserServiceConstants.VALID_IMAGE_EXTENSIONS.value.get(image_extension))
 
     @staticmethod
-    async def validate_image_resolution(image: UploadFile) -> None:
+    async def validate_image_resolution(width: int, height: int) -> None:
         """Validates image resolution in allowed range and raises exception in case of invalidation.
 
         Args:
-            image: UploadFile image object.
+            width: image width in pixels.
+            height: image height in pixels.
 
         Raise:
             UserPictureResolutionError if image resolution not in allowed image resolution range.
@@ -105,28 +204,28 @@ class UserProfileImageValidator:
         Returns:
         Nothing.
         """
-        if not await UserProfileImageValidator._validate_image_resolution(image):
+        if not await UserProfileImageValidator._validate_image_resolution(width, height):
             raise UserPictureResolutionError(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=UserPictureExceptionMsgs.INVALID_IMAGE_RESOLUTION.value,
             )
 
     @staticmethod
-    async def _validate_image_resolution(image: UploadFile) -> bool:
+    async def _validate_image_resolution(width: int, height: int) -> bool:
         """Checks if currently uploaded image's width and height present in allowed image resolution range.
 
         Args:
-            image: UploadFile image object.
+            width: image width in pixels.
+            height: image height in pixels.
 
         Returns:
         bool of presence uploaded image's width and height in allowed image resolution range.
         """
-        pillow_image = Image.open(image.file)
-        width_check = pillow_image.width in range(
+        width_check = width in range(
             UserServiceConstants.MIN_IMAGE_WIDTH.value,
             UserServiceConstants.MAX_IMAGE_WIDTH.value,
         )
-        height_check = pillow_image.height in range(
+        height_check = height in range(
             UserServiceConstants.MIN_IMAGE_HEIGHT.value,
             UserServiceConstants.MAX_IMAGE_HEIGHT.value,
         )
@@ -0,0 +1,229 @@
+from collections import OrderedDict
+from functools import partial
+from typing import Awaitable, Callable
+from uuid import UUID
+import asyncio
+import time
+
+from celery.app.utils import Settings
+from pydantic import BaseModel
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+from common.constants.cache import ReadThroughCacheConstants
+from utils.logging import setup_logging
+
+
+class LRUCache:
+    """Stores at most 'max_size' values in process memory for 'ttl' seconds, least recently used value is evicted."""
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._values: OrderedDict[str, tuple[bytes, float]] = OrderedDict()
+
+    def get(self, key: str) -> bytes | None:
+        """Get stored value if it's not expired.
+
+        Args:
+            key: key of value.
+
+        Returns:
+        stored value or None.
+        """
+        cached = self._values.get(key)
+        if cached is None:
+            return None
+        if cached[1] <= time.monotonic():
+            del self._values[key]
+            return None
+        self._values.move_to_end(key)
+        return cached[0]
+
+    def set(self, key: str, value: bytes) -> None:
+        """Stores value, evicts least recently used value when cache is full.
+
+        Args:
+            key: key of value.
+            value: stored value.
+
+        Returns:
+        Nothing.
+        """
+        self._values[key] = (value, time.monotonic() + self.ttl)
+        self._values.move_to_end(key)
+        while len(self._values) > self.max_size:
+            self._values.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Drops stored value.
+
+        Args:
+            key: key of value.
+
+        Returns:
+        Nothing.
+        """
+        self._values.pop(key, None)
+
+    def clear(self) -> None:
+        """Drops all stored values.
+
+        Returns:
+        Nothing.
+        """
+        self._values.clear()
+
+
+class ReadThroughCache:
+    """Caches serialized objects in process memory LRU cache in front of Redis.
+
+    Redis keys include object version, invalidation increments the version, so a value loaded from database before
+    invalidation is never read after it. Values in process memory of other processes stay for 'CACHE_LOCAL_TTL'
+    seconds. Concurrent misses of one key in the process wait for a single load. Cache works with process memory
+    only when Redis url is not configured and falls back to loader when Redis is unavailable.
+    """
+
+    def __init__(self) -> None:
+        self._log = setup_logging(self.__class__.__name__)
+        self.enabled = False
+        self.redis: aioredis.Redis | None = None
+        self.ttl = ReadThroughCacheConstants.DEFAULT_TTL.value
+        self.local = LRUCache(
+            max_size=ReadThroughCacheConstants.DEFAULT_LOCAL_MAX_SIZE.value,
+            ttl=ReadThroughCacheConstants.DEFAULT_LOCAL_TTL.value,
+        )
+        self._loads: dict[str, asyncio.Task] = {}
+
+    def start(self, config: BaseModel | Settings | None = None, redis_client: aioredis.Redis | None = None) -> None:
+        """Enables cache with settings from app config, process memory values are dropped.
+
+        Args:
+            config: fastapi app config or Celery app config.
+            redis_client: Redis client used instead of client created from 'CACHE_REDIS_URL' setting.
+
+        Returns:
+        Nothing.
+        """
+        self.enabled = config.CACHE_ENABLED if config else True
+        self.redis = redis_client
+        if self.redis is None and config and config.CACHE_REDIS_URL:
+            self.redis = aioredis.from_url(config.CACHE_REDIS_URL)
+        if config:
+            self.ttl = config.CACHE_TTL
+            self.local = LRUCache(max_size=config.CACHE_LOCAL_MAX_SIZE, ttl=config.CACHE_LOCAL_TTL)
+        self.local.clear()
+        self._loads.clear()
+        self._log.debug(f'Read-through cache started, enabled: {self.enabled}, redis: {self.redis is not None}.')
+
+    async def shutdown(self) -> None:
+        """Closes Redis connection pool.
+
+        Returns:
+        Nothing.
+        """
+        if self.redis is not None:
+            await self.redis.close()
+            self.redis = None
+        self._log.debug('Read-through cache stopped.')
+
+    async def get_or_load(self, namespace: str, id_: UUID, loader: Callable[[], Awaitable[bytes]]) -> bytes:
+        """Get cached serialized object, loads and caches it with loader on cache miss.
+
+        Args:
+            namespace: name of cached objects type.
+            id_: UUID of object.
+            loader: coroutine function loading serialized object from database.
+
+        Returns:
+        serialized object.
+        """
+        if not self.enabled:
+            return await loader()
+        key = f'{namespace}:{id_}'
+        cached = self.local.get(key)
+        if cached is not None:
+            return cached
+        load = self._loads.get(key)
+        if load is None:
+            load = asyncio.ensure_future(self._load(key, loader))
+            self._loads[key] = load
+            load.add_done_callback(partial(self._forget_load, key))
+        # Cancellation of one waiting request doesn't cancel the load for others.
+        return await asyncio.shield(load)
+
+    async def _load(self, key: str, loader: Callable[[], Awaitable[bytes]]) -> bytes:
+        version = await self._get_version(key)
+        value_key = self._value_key(key, version)
+        cached = await self._redis_call('get', value_key) if version is not None else None
+        if cached is None:
+            cached = await loader()
+            if version is not None:
+                await self._redis_call('set', value_key, cached, ex=self.ttl)
+        # Key invalidated while loading is not stored, load started after invalidation stores it.
+        if self._loads.get(key) is asyncio.current_task():
+            self.local.set(key, cached)
+        return cached
+
+    def _forget_load(self, key: str, load: asyncio.Task) -> None:
+        if self._loads.get(key) is load:
+            del self._loads[key]
+
+    async def invalidate(self, namespace: str, *ids: UUID) -> None:
+        """Drops cached objects, new versions of the objects are loaded on the next read.
+
+        Args:
+            namespace: name of cached objects type.
+            ids: UUIDs of objects.
+
+        Returns:
+        Nothing.
+        """
+        if not self.enabled:
+            return
+        keys = [f'{namespace}:{id_}' for id_ in ids]
+        for key in keys:
+            self.local.delete(key)
+            self._loads.pop(key, None)
+        if self.redis is None or not keys:
+            return
+        try:
+            async with self.redis.pipeline(transaction=False) as pipeline:
+                for key in keys:
+                    # Version outlives values written with it, so an expired version doesn't reveal them again.
+                    pipeline.incr(self._version_key(key)).expire(self._version_key(key), self.ttl * 2)
+                await pipeline.execute()
+        except RedisError as exc:
+            self._log.error(f'Cached "{namespace}" with ids: {ids} are not invalidated: {exc!r}.')
+            return
+        self._log.debug(f'Cached "{namespace}" with ids: {ids} invalidated.')
+
+    async def _get_version(self, key: str) -> int | None:
+        if self.redis is None:
+            return None
+        try:
+            return int(await self.redis.get(self._version_key(key)) or 0)
+        except RedisError as exc:
+            self._log.error(f'Version of "{key}" is not read: {exc!r}.')
+            return None
+
+    async def _redis_call(self, command: str, *args, **kwargs) -> bytes | None:
+        try:
+            return await getattr(self.redis, command)(*args, **kwargs)
+        except RedisError as exc:
+            self._log.error(f'Redis "{command}" of "{args[0]}" failed: {exc!r}.')
+            return None
+
+    @staticmethod
+    def _version_key(key: str) -> str:
+        return f'{ReadThroughCacheConstants.KEY_PREFIX.value}:{key}:version'
+
+    @staticmethod
+    def _value_key(key: str, version: int | None) -> str:
+        return (
+            f'{ReadThroughCacheConstants.KEY_PREFIX.value}:v{ReadThroughCacheConstants.SCHEMA_VERSION.value}:'
+            f'{key}:{version}'
+        )
+
+
+read_through_cache = ReadThroughCache()
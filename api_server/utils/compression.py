@@ -0,0 +1,209 @@
+from typing import Callable
+import zlib
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from common.constants.compression import CompressionConstants
+
+try:
+    import brotli
+except ImportError:  # Brotli is optional, responses are compressed with gzip only without it.
+    brotli = None
+
+
+def route_compression(
+        enabled: bool = True, gzip_level: int | None = None, brotli_quality: int | None = None,
+) -> Callable:
+    """Decorator overriding CompressionMiddleware settings for responses of a route.
+
+    Args:
+        enabled: whether responses of the route are compressed.
+        gzip_level: gzip compression level from 1 to 9, middleware level is used if None.
+        brotli_quality: brotli compression quality from 0 to 11, middleware quality is used if None.
+
+    Returns:
+    decorator saving settings to the route endpoint function.
+    """
+    def decorator(endpoint: Callable) -> Callable:
+        setattr(
+            endpoint,
+            CompressionConstants.ROUTE_SETTINGS_ATTRIBUTE.value,
+            {'enabled': enabled, 'gzip_level': gzip_level, 'brotli_quality': brotli_quality},
+        )
+        return endpoint
+    return decorator
+
+
+class GzipCompressor:
+    """Incremental gzip compressor."""
+
+    def __init__(self, level: int) -> None:
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+
+class BrotliCompressor:
+    """Incremental brotli compressor."""
+
+    def __init__(self, quality: int) -> None:
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.finish()
+
+
+class CompressionMiddleware:
+    """Compresses responses with brotli, when 'brotli' package is installed and client accepts it, or with gzip.
+
+    Responses smaller than 'minimum_size', with content type not listed in 'content_types', partial and already
+    encoded responses are sent as is. Routes override compression settings with 'route_compression' decorator.
+    Streamed responses are compressed chunk by chunk.
+    """
+
+    def __init__(
+            self,
+            app: ASGIApp,
+            minimum_size: int = CompressionConstants.DEFAULT_MINIMUM_SIZE.value,
+            gzip_level: int = CompressionConstants.DEFAULT_GZIP_LEVEL.value,
+            brotli_quality: int = CompressionConstants.DEFAULT_BROTLI_QUALITY.value,
+            content_types: list[str] | None = None,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.content_types = set(content_types or CompressionConstants.DEFAULT_CONTENT_TYPES.value)
+        self.encodings = [CompressionConstants.GZIP_ENCODING.value]
+        if brotli is not None:
+            self.encodings.insert(0, CompressionConstants.BROTLI_ENCODING.value)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http' or scope['method'] == 'HEAD':
+            await self.app(scope, receive, send)
+            return
+        encoding = self.select_encoding(Headers(scope=scope).get('accept-encoding', ''))
+        responder = CompressionResponder(self, scope, send, encoding)
+        await self.app(scope, receive, responder.send)
+
+    def select_encoding(self, accept_encoding: str) -> str | None:
+        """Selects the most efficient encoding accepted by client.
+
+        Args:
+            accept_encoding: value of 'Accept-Encoding' header.
+
+        Returns:
+        name of encoding or None if client accepts none of supported encodings.
+        """
+        qualities = {}
+        for accepted in accept_encoding.split(','):
+            coding, *params = accepted.split(';')
+            quality = 1.0
+            for param in params:
+                name, _, value = param.partition('=')
+                if name.strip() == CompressionConstants.QUALITY_PARAM.value:
+                    try:
+                        quality = float(value)
+                    except ValueError:
+                        quality = 0.0
+            qualities[coding.strip().lower()] = quality
+        any_quality = qualities.get(CompressionConstants.ANY_ENCODING.value, 0.0)
+        for encoding in self.encodings:
+            if qualities.get(encoding, any_quality) > 0:
+                return encoding
+        return None
+
+    def create_compressor(self, scope: Scope, encoding: str) -> GzipCompressor | BrotliCompressor | None:
+        """Creates compressor with settings of the matched route.
+
+        Args:
+            scope: ASGI connection scope.
+            encoding: name of encoding.
+
+        Returns:
+        compressor or None if responses of the route are not compressed.
+        """
+        route_settings = getattr(scope.get('endpoint'), CompressionConstants.ROUTE_SETTINGS_ATTRIBUTE.value, {})
+        if not route_settings.get('enabled', True):
+            return None
+        if encoding == CompressionConstants.BROTLI_ENCODING.value:
+            brotli_quality = route_settings.get('brotli_quality')
+            return BrotliCompressor(self.brotli_quality if brotli_quality is None else brotli_quality)
+        gzip_level = route_settings.get('gzip_level')
+        return GzipCompressor(self.gzip_level if gzip_level is None else gzip_level)
+
+
+class CompressionResponder:
+    """Delays response start until the first body chunk, which shows whether response is worth compressing."""
+
+    def __init__(self, middleware: CompressionMiddleware, scope: Scope, send: Send, encoding: str | None) -> None:
+        self.middleware = middleware
+        self.scope = scope
+        self.encoding = encoding
+        self._send = send
+        self._start_message: Message | None = None
+        self._compressor: GzipCompressor | BrotliCompressor | None = None
+
+    async def send(self, message: Message) -> None:
+        if message['type'] == 'http.response.start':
+            self._start_message = message
+        elif message['type'] == 'http.response.body' and self._start_message is not None:
+            await self._send_first_body(message)
+        elif message['type'] == 'http.response.body' and self._compressor is not None:
+            await self._send_compressed_body(message)
+        else:
+            await self._send(message)
+
+    async def _send_first_body(self, message: Message) -> None:
+        start_message, self._start_message = self._start_message, None
+        headers = MutableHeaders(scope=start_message)
+        if not self._is_compressible(headers):
+            await self._send(start_message)
+            await self._send(message)
+            return
+        # Response representation depends on 'Accept-Encoding' even when this client gets it uncompressed.
+        headers.add_vary_header(CompressionConstants.VARY_HEADER.value)
+        body = message.get('body', b'')
+        more_body = message.get('more_body', False)
+        if self.encoding is not None and (more_body or len(body) >= self.middleware.minimum_size):
+            self._compressor = self.middleware.create_compressor(self.scope, self.encoding)
+        if self._compressor is None:
+            await self._send(start_message)
+            await self._send(message)
+            return
+        headers['content-encoding'] = self.encoding
+        etag = headers.get('etag')
+        if etag and not etag.startswith(CompressionConstants.WEAK_ETAG_PREFIX.value):
+            headers['etag'] = CompressionConstants.WEAK_ETAG_PREFIX.value + etag
+        if more_body:
+            del headers['content-length']
+            await self._send(start_message)
+            await self._send_compressed_body(message)
+            return
+        body = self._compressor.compress(body) + self._compressor.flush()
+        headers['content-length'] = str(len(body))
+        await self._send(start_message)
+        await self._send({'type': 'http.response.body', 'body': body})
+
+    async def _send_compressed_body(self, message: Message) -> None:
+        more_body = message.get('more_body', False)
+        body = self._compressor.compress(message.get('body', b''))
+        if not more_body:
+            body += self._compressor.flush()
+        await self._send({'type': 'http.response.body', 'body': body, 'more_body': more_body})
+
+    def _is_compressible(self, headers: MutableHeaders) -> bool:
+        content_type = headers.get('content-type', '').partition(';')[0].strip().lower()
+        return (
+            content_type in self.middleware.content_types
+            and 'content-encoding' not in headers
+            and 'content-range' not in headers
+        )
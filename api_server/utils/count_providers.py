@@ -0,0 +1,170 @@
+import time
+
+from pydantic import BaseModel
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from common.constants.pagination import PaginationCountConstants
+from db import Base
+from utils.logging import setup_logging
+
+
+class ExactCountStrategy:
+    """Counts table rows with 'count(id)' query, requires full table scan on every call."""
+
+    is_exact = True
+
+    def __init__(self) -> None:
+        self._log = setup_logging(self.__class__.__name__)
+
+    async def count(self, session: AsyncSession, model: Base) -> tuple[int, bool]:
+        """Counts number of rows in model's table.
+
+        Args:
+            session: sqlalchemy AsyncSession.
+            model: sqlalchemy model.
+
+        Returns:
+        tuple with number of rows and bool whether number is exact.
+        """
+        total = (await session.execute(select(func.count(model.id)))).scalar_one()
+        return total, self.is_exact
+
+    def invalidate(self, model: Base) -> None:
+        """Drops stored count of model's table, nothing stored for exact strategy.
+
+        Args:
+            model: sqlalchemy model.
+
+        Returns:
+        Nothing.
+        """
+
+
+class CachedCountStrategy(ExactCountStrategy):
+    """Stores exact count of table rows in process memory for 'ttl' seconds.
+
+    Count is invalidated on insert and delete made by this process, other processes changes are visible after 'ttl'
+    expires, so count is reported as not exact.
+    """
+
+    is_exact = False
+
+    def __init__(self, ttl: int) -> None:
+        super().__init__()
+        self.ttl = ttl
+        self._counts: dict[str, tuple[int, float]] = {}
+
+    async def count(self, session: AsyncSession, model: Base) -> tuple[int, bool]:
+        """Counts number of rows in model's table, stored count used if it's not expired.
+
+        Args:
+            session: sqlalchemy AsyncSession.
+            model: sqlalchemy model.
+
+        Returns:
+        tuple with number of rows and bool whether number is exact.
+        """
+        table_name = model.__tablename__
+        cached = self._counts.get(table_name)
+        if cached and cached[1] > time.monotonic():
+            return cached[0], self.is_exact
+        total, _ = await super().count(session, model)
+        self._counts[table_name] = (total, time.monotonic() + self.ttl)
+        self._log.debug(f'Cached count of "{table_name}" table: "{total}" for {self.ttl}s.')
+        return total, self.is_exact
+
+    def invalidate(self, model: Base) -> None:
+        """Drops stored count of model's table.
+
+        Args:
+            model: sqlalchemy model.
+
+        Returns:
+        Nothing.
+        """
+        self._counts.pop(model.__tablename__, None)
+
+
+class EstimatedCountStrategy(ExactCountStrategy):
+    """Takes planner estimate of table rows from 'pg_class.reltuples', updated by VACUUM and ANALYZE.
+
+    Falls back to exact count for tables that were never analyzed.
+    """
+
+    is_exact = False
+
+    async def count(self, session: AsyncSession, model: Base) -> tuple[int, bool]:
+        """Estimates number of rows in model's table.
+
+        Args:
+            session: sqlalchemy AsyncSession.
+            model: sqlalchemy model.
+
+        Returns:
+        tuple with number of rows and bool whether number is exact.
+        """
+        estimate = (
+            await session.execute(
+                text(PaginationCountConstants.RELTUPLES_QUERY.value), {'table_name': model.__tablename__},
+            )
+        ).scalar_one_or_none()
+        if estimate is None or estimate < 0:
+            return await super().count(session, model)
+        return estimate, self.is_exact
+
+
+class PaginationCountProvider:
+    """Provides total number of rows for PaginationPage with strategy selected in app config."""
+
+    def __init__(self) -> None:
+        self._log = setup_logging(self.__class__.__name__)
+        self.strategy = ExactCountStrategy()
+
+    def start(self, config: BaseModel | None = None) -> None:
+        """Selects count strategy based on app config, exact strategy used if config not provided.
+
+        Args:
+            config: fastapi app config.
+
+        Returns:
+        Nothing.
+        """
+        strategy_name = PaginationCountConstants.EXACT_STRATEGY.value
+        if config:
+            strategy_name = config.PAGINATION_COUNT_STRATEGY
+        if strategy_name == PaginationCountConstants.CACHED_STRATEGY.value:
+            ttl = config.PAGINATION_COUNT_CACHE_TTL if config else PaginationCountConstants.DEFAULT_CACHE_TTL.value
+            self.strategy = CachedCountStrategy(ttl=ttl)
+        elif strategy_name == PaginationCountConstants.ESTIMATED_STRATEGY.value:
+            self.strategy = EstimatedCountStrategy()
+        else:
+            self.strategy = ExactCountStrategy()
+        self._log.debug(f'Pagination count provider started with "{strategy_name}" strategy.')
+
+    async def count(self, session: AsyncSession, model: Base) -> tuple[int, bool]:
+        """Counts number of rows in model's table with selected strategy.
+
+        Args:
+            session: sqlalchemy AsyncSession.
+            model: sqlalchemy model.
+
+        Returns:
+        tuple with number of rows and bool whether number is exact.
+        """
+        return await self.strategy.count(session, model)
+
+    def invalidate(self, *models: Base) -> None:
+        """Drops stored counts of models tables after insert or delete.
+
+        Args:
+            models: sqlalchemy models.
+
+        Returns:
+        Nothing.
+        """
+        for model in models:
+            self.strategy.invalidate(model)
+
+
+pagination_count_provider = PaginationCountProvider()
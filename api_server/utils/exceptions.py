@@ -1,6 +1,6 @@
 import re
 
-from fastapi import Request, status
+from fastapi import HTTPException, Request, status
 from fastapi.responses import JSONResponse
 
 from sqlalchemy.exc import IntegrityError
@@ -60,3 +60,26 @@ def get_error_message(exc: IntegrityError) -> str:
         'IntegrityError': f"{table_name} with {field}: '{value}' already exists."
     }
     return SQLALCHEMY_INTEGRITY_ERROR_MAP[exc.orig.__class__.__name__]
+
+
+class PaginationCursorError(HTTPException):
+    """Custom invalid pagination cursor exception."""
+    pass
+
+
+def pagination_cursor_error_handler(request: Request, exc: PaginationCursorError) -> JSONResponse:
+    """Handler for PaginationCursorError exception that makes http response.
+
+    Args:
+        request: FastAPI Request object.
+        exc: raised PaginationCursorError.
+
+    Returns:
+    http response for raised PaginationCursorError.
+    """
+    response = ResponseBaseSchema(
+        status_code=exc.status_code,
+        data=[],
+        errors=[{'detail': exc.detail}],
+    ).dict()
+    return JSONResponse(status_code=exc.status_code, content=response)
@@ -0,0 +1,147 @@
+from email.utils import formatdate
+from pathlib import Path
+import os
+import re
+
+from fastapi import Request, Response, status
+from fastapi.responses import FileResponse
+
+from starlette.types import Receive, Scope, Send
+import anyio
+
+from common.constants.storage import FileResponseConstants
+
+
+class RangeFileResponse(FileResponse):
+    """FileResponse sending byte range of file from 'start' to 'end' inclusive.
+
+    File is sent with zero-copy 'sendfile' when ASGI server supports 'http.response.zerocopysend' extension,
+    otherwise it is read by chunks.
+    """
+
+    chunk_size = FileResponseConstants.CHUNK_SIZE.value
+
+    def __init__(self, path: Path, start: int, end: int, **kwargs) -> None:
+        super().__init__(path, **kwargs)
+        self.start = start
+        self.end = end
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({
+            'type': 'http.response.start',
+            'status': self.status_code,
+            'headers': self.raw_headers,
+        })
+        count = self.end - self.start + 1
+        if self.send_header_only or not count:
+            await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
+        elif FileResponseConstants.ZEROCOPY_SEND_EXTENSION.value in scope.get('extensions', {}):
+            with open(self.path, 'rb') as file:
+                await send({
+                    'type': FileResponseConstants.ZEROCOPY_SEND_EXTENSION.value,
+                    'file': file,
+                    'offset': self.start,
+                    'count': count,
+                    'more_body': False,
+                })
+        else:
+            async with await anyio.open_file(self.path, mode='rb') as file:
+                await file.seek(self.start)
+                remaining = count
+                while remaining:
+                    chunk = await file.read(min(self.chunk_size, remaining))
+                    remaining = remaining - len(chunk) if chunk else 0
+                    await send({'type': 'http.response.body', 'body': chunk, 'more_body': bool(remaining)})
+        if self.background is not None:
+            await self.background()
+
+
+def etag_matches(etag: str, header_value: str) -> bool:
+    """Checks if etag is listed in 'If-None-Match' header, weak comparison is used.
+
+    Args:
+        etag: quoted etag of file.
+        header_value: value of 'If-None-Match' header.
+
+    Returns:
+    bool of etag presence in header.
+    """
+    weak_prefix = FileResponseConstants.WEAK_ETAG_PREFIX.value
+    etags = {value.strip().removeprefix(weak_prefix) for value in header_value.split(',')}
+    return FileResponseConstants.ANY_ETAG.value in etags or etag.removeprefix(weak_prefix) in etags
+
+
+def _parse_range(header_value: str, size: int) -> tuple[int, int] | None:
+    """Parses single byte range of 'Range' header.
+
+    Args:
+        header_value: value of 'Range' header.
+        size: file size in bytes.
+
+    Returns:
+    tuple of first and last byte positions, None if range is not satisfiable.
+    """
+    start, end = re.fullmatch(FileResponseConstants.RANGE_REGEX.value, header_value.strip()).groups()
+    if not start:
+        if not int(end):
+            return None
+        return max(size - int(end), 0), size - 1
+    end = min(int(end), size - 1) if end else size - 1
+    if int(start) > end:
+        return None
+    return int(start), end
+
+
+def create_file_response(
+        request: Request, path: Path, stat_result: os.stat_result, etag: str, media_type: str,
+) -> Response:
+    """Makes file response supporting conditional 'If-None-Match' and single range 'Range' requests.
+
+    Multiple ranges and malformed 'Range' headers are ignored and the whole file is sent.
+
+    Args:
+        request: FastAPI Request object.
+        path: path of sent file.
+        stat_result: os.stat_result of sent file.
+        etag: quoted etag of file stored with it.
+        media_type: file's content type.
+
+    Returns:
+    304 response if client has current file, 416 response if range is not satisfiable, otherwise 206 response with
+    requested range or 200 response with the whole file.
+    """
+    size = stat_result.st_size
+    headers = {
+        'etag': etag,
+        'last-modified': formatdate(stat_result.st_mtime, usegmt=True),
+        'accept-ranges': FileResponseConstants.ACCEPT_RANGES.value,
+    }
+    if_none_match = request.headers.get('if-none-match')
+    if if_none_match and etag_matches(etag, if_none_match):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    start, end, status_code = 0, size - 1, status.HTTP_200_OK
+    range_header = request.headers.get('range')
+    if_range = request.headers.get('if-range')
+    if (
+            range_header
+            and re.fullmatch(FileResponseConstants.RANGE_REGEX.value, range_header.strip())
+            and (not if_range or if_range == etag)
+    ):
+        byte_range = _parse_range(range_header, size)
+        if byte_range is None:
+            headers['content-range'] = FileResponseConstants.UNSATISFIED_CONTENT_RANGE.value.format(size=size)
+            return Response(status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE, headers=headers)
+        start, end = byte_range
+        status_code = status.HTTP_206_PARTIAL_CONTENT
+        headers['content-range'] = FileResponseConstants.CONTENT_RANGE.value.format(start=start, end=end, size=size)
+    headers['content-length'] = str(end - start + 1)
+    return RangeFileResponse(
+        path,
+        start=start,
+        end=end,
+        status_code=status_code,
+        headers=headers,
+        media_type=media_type,
+        stat_result=stat_result,
+        method=request.method,
+    )
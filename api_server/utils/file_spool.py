@@ -0,0 +1,106 @@
+from pathlib import Path
+from typing import BinaryIO
+from uuid import uuid4
+import re
+import tempfile
+
+from fastapi import UploadFile
+
+from pydantic import BaseModel
+
+from common.constants.file_spool import FileSpoolConstants
+from utils.logging import setup_logging
+
+
+class FileSpool:
+    """Local spool directory shared by api server and Celery workers.
+
+    Large payloads like uploaded images are written to spool and only its key is sent through Celery broker.
+    """
+
+    def __init__(self) -> None:
+        self._log = setup_logging(self.__class__.__name__)
+        self.directory = Path(tempfile.gettempdir()) / FileSpoolConstants.DEFAULT_DIR_NAME.value
+
+    def start(self, config: BaseModel | None = None) -> None:
+        """Configures spool directory from app config.
+
+        Args:
+            config: fastapi app config or Celery app config.
+
+        Returns:
+        Nothing.
+        """
+        if config is not None and config.FILE_SPOOL_DIR:
+            self.directory = Path(config.FILE_SPOOL_DIR)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._log.debug(f'FileSpool started in directory: "{self.directory}".')
+
+    def _get_path(self, key: str) -> Path:
+        if not re.fullmatch(FileSpoolConstants.KEY_PATTERN.value, key):
+            raise ValueError(f'Invalid FileSpool key: "{key}".')
+        return self.directory / key
+
+    def create(self) -> tuple[str, BinaryIO]:
+        """Creates new empty spooled file opened for binary writing.
+
+        Returns:
+        tuple of key and file object of spooled file, caller is responsible for closing the file.
+        """
+        key = uuid4().hex
+        self.directory.mkdir(parents=True, exist_ok=True)
+        return key, open(self._get_path(key), 'wb')
+
+    def open(self, key: str) -> BinaryIO:
+        """Opens spooled file for binary reading.
+
+        Args:
+            key: key of spooled file.
+
+        Returns:
+        file object of spooled file, caller is responsible for closing the file.
+        """
+        return open(self._get_path(key), 'rb')
+
+    async def save_upload_file(self, upload_file: UploadFile) -> str:
+        """Writes uploaded file content to spool by chunks.
+
+        Args:
+            upload_file: fastapi UploadFile object.
+
+        Returns:
+        key of spooled file.
+        """
+        await upload_file.seek(0)
+        key, spooled_file = self.create()
+        with spooled_file:
+            while chunk := await upload_file.read(FileSpoolConstants.CHUNK_SIZE.value):
+                spooled_file.write(chunk)
+        self._log.debug(f'File "{upload_file.filename}" spooled with key: "{key}".')
+        return key
+
+    def read(self, key: str) -> bytes:
+        """Reads spooled file content.
+
+        Args:
+            key: key of spooled file.
+
+        Returns:
+        bytes content of spooled file.
+        """
+        return self._get_path(key).read_bytes()
+
+    def delete(self, key: str) -> None:
+        """Removes spooled file, missing file is ignored.
+
+        Args:
+            key: key of spooled file.
+
+        Returns:
+        Nothing.
+        """
+        self._get_path(key).unlink(missing_ok=True)
+        self._log.debug(f'Spooled file with key: "{key}" removed.')
+
+
+file_spool = FileSpool()
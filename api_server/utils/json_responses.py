@@ -0,0 +1,91 @@
+from typing import Any
+import hashlib
+
+from fastapi import Request, Response, status
+
+from pydantic import BaseModel
+from pydantic.json import pydantic_encoder
+import orjson
+
+from common.constants.api import JSONResponseConstants
+from common.constants.compression import CompressionConstants
+from common.schemas.responses import ResponseBaseSchema
+from utils.file_responses import etag_matches
+
+
+def serialize_response_data(data: BaseModel | Any) -> bytes:
+    """Serializes already built response schema to JSON once, without fastapi response model validation.
+
+    orjson encodes datetimes, UUIDs and enums natively, other values are encoded like in fastapi 'jsonable_encoder',
+    e.g. Decimal as float.
+
+    Args:
+        data: pydantic schema of response data or JSON serializable object.
+
+    Returns:
+    JSON of response data.
+    """
+    if isinstance(data, BaseModel):
+        data = data.dict(by_alias=True)
+    return orjson.dumps(data, default=pydantic_encoder, option=orjson.OPT_NON_STR_KEYS)
+
+
+class ORJSONModelResponse(Response):
+    """JSON response serializing ResponseBaseSchema with orjson, status code is taken from the schema by default.
+
+    Returned from a route, it bypasses validation and 'jsonable_encoder' encoding of the route response model.
+    """
+
+    media_type = JSONResponseConstants.MEDIA_TYPE.value
+
+    def __init__(self, content: ResponseBaseSchema, status_code: int | None = None, **kwargs) -> None:
+        super().__init__(content, status_code=status_code or content.status_code, **kwargs)
+
+    def render(self, content: Any) -> bytes:
+        return serialize_response_data(content)
+
+
+def wrap_response_data(data: bytes, status_code: int = status.HTTP_200_OK) -> bytes:
+    """Wraps JSON of response data into ResponseBaseSchema JSON without deserializing it.
+
+    Args:
+        data: JSON of response data.
+        status_code: http status code of response.
+
+    Returns:
+    ResponseBaseSchema JSON.
+    """
+    return b''.join((b'{"status_code":', str(status_code).encode(), b',"data":', data, b',"errors":[]}'))
+
+
+def compute_etag(content: bytes) -> str:
+    """Computes strong etag from response body.
+
+    Args:
+        content: response body.
+
+    Returns:
+    quoted etag.
+    """
+    digest = hashlib.blake2b(content, digest_size=JSONResponseConstants.ETAG_DIGEST_SIZE.value).hexdigest()
+    return f'"{digest}"'
+
+
+def create_conditional_response(request: Request, content: bytes, cache_control: str) -> Response:
+    """Makes JSON response supporting conditional 'If-None-Match' requests.
+
+    Args:
+        request: FastAPI Request object.
+        content: JSON response body.
+        cache_control: value of 'Cache-Control' header of the route.
+
+    Returns:
+    304 response without body if client has current response body, otherwise 200 response with the body.
+    """
+    headers = {'etag': compute_etag(content), 'cache-control': cache_control}
+    if_none_match = request.headers.get('if-none-match')
+    if if_none_match and etag_matches(headers['etag'], if_none_match):
+        # 304 response has no content type, so CompressionMiddleware doesn't add 'Vary' header the 200 response has.
+        headers['vary'] = CompressionConstants.VARY_HEADER.value
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=content, headers=headers, media_type=JSONResponseConstants.MEDIA_TYPE.value)
@@ -1,8 +1,16 @@
+from collections import defaultdict
 from contextlib import asynccontextmanager
-from typing import AsyncContextManager
+from datetime import datetime
+from typing import Any, AsyncContextManager, Iterable
+from uuid import UUID
 
+from sqlalchemy import literal, tuple_
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Bundle, sessionmaker
+from sqlalchemy.sql import Select
+
+from db import Base
 
 
 @asynccontextmanager
@@ -24,3 +32,83 @@ async def create_db_session(engine: AsyncEngine) -> AsyncContextManager:
         finally:
             await session.close()
             await engine.dispose()
+
+
+def apply_keyset_pagination(query: Select, model: Base, after: tuple[datetime, UUID] | None, page_size: int) -> Select:
+    """Applies keyset pagination by ('created_at', 'id') columns to sqlalchemy select query.
+
+    Args:
+        query: sqlalchemy select query.
+        model: sqlalchemy model with 'created_at' and 'id' columns.
+        after: tuple with 'created_at' and 'id' of the last item on a previous page, None for the first page.
+        page_size: number of items per page.
+
+    Returns:
+    sqlalchemy select query ordered by ('created_at', 'id') and limited to page size plus one item to find out
+    presence of the next page.
+    """
+    if after:
+        created_at, id_ = after
+        query = query.where(
+            tuple_(model.created_at, model.id) > tuple_(
+                literal(created_at, type_=model.created_at.type),
+                literal(id_, type_=model.id.type),
+            )
+        )
+    return query.order_by(model.created_at, model.id).limit(page_size + 1)
+
+
+class KeyedBundle(Bundle):
+    """Bundle keyed by names of its columns.
+
+    sqlalchemy 1.4 deduplicates labels of bundled columns having the same names as other columns of the select, e.g.
+    'id' of joined table, so plain Bundle row would have 'id_1' key instead of 'id'.
+    """
+
+    def create_row_processor(self, query, procs, labels):
+        return super().create_row_processor(query, procs, list(self.c.keys()))
+
+
+class OptionalBundle(KeyedBundle):
+    """Bundle of outer joined columns, bundled value is None instead of tuple of Nones when outer join found nothing."""
+
+    def create_row_processor(self, query, procs, labels):
+        process_row = super().create_row_processor(query, procs, labels)
+
+        def process_optional_row(row):
+            bundled_row = process_row(row)
+            return None if all(value is None for value in bundled_row) else bundled_row
+
+        return process_optional_row
+
+
+class ProjectedItem:
+    """Lightweight item of column-projected query, not tracked by sqlalchemy session identity map.
+
+    Attributes are columns of the row and related items loaded by separate queries, subclasses list attribute names
+    in '__slots__'.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, row: Row, **related: Any) -> None:
+        for name, value in row._asdict().items():
+            setattr(self, name, value)
+        for name, value in related.items():
+            setattr(self, name, value)
+
+
+def group_by_attribute(items: Iterable, name: str) -> defaultdict[Any, list]:
+    """Groups rows or objects by value of attribute, e.g. related rows by foreign key column.
+
+    Args:
+        items: rows or objects.
+        name: name of attribute.
+
+    Returns:
+    defaultdict with lists of items by attribute value, empty list for missing value.
+    """
+    groups = defaultdict(list)
+    for item in items:
+        groups[getattr(item, name)].append(item)
+    return groups
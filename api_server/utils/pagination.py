@@ -1,10 +1,20 @@
+from datetime import datetime
+from uuid import UUID
+import base64
+import binascii
+import json
 import math
 
+from fastapi import status
+
+from common.exceptions.pagination import PaginationExceptionMsgs
+from utils.exceptions import PaginationCursorError
+
 
 class PaginationPage:
     """Custom pagination page object."""
 
-    def __init__(self, items: list, page: int, page_size: int, total: int) -> None:
+    def __init__(self, items: list, page: int, page_size: int, total: int, total_pages_exact: bool = True) -> None:
         self.current_page = page
         self.items = items
         self.previous_page = None
@@ -20,3 +30,55 @@ class PaginationPage:
             self.next_page = page + 1
 
         self.total_pages = int(math.ceil(total / float(page_size)))
+        self.total_pages_exact = total_pages_exact
+
+
+class CursorPaginationPage:
+    """Custom keyset pagination page object, doesn't require total number of items.
+
+    Items expected to be fetched with one extra item after the page, its presence means that next page exists.
+    """
+
+    def __init__(self, items: list, page_size: int) -> None:
+        self.page_size = page_size
+        self.items = items[:page_size]
+        self.has_next = len(items) > page_size
+        self.next_cursor = None
+        if self.has_next:
+            last_item = self.items[-1]
+            self.next_cursor = encode_cursor(created_at=last_item.created_at, id_=last_item.id)
+
+
+def encode_cursor(created_at: datetime, id_: UUID) -> str:
+    """Encodes keyset pagination position into opaque cursor string.
+
+    Args:
+        created_at: 'created_at' field value of the last item on a page.
+        id_: UUID of the last item on a page.
+
+    Returns:
+    urlsafe base64 encoded cursor string.
+    """
+    raw_cursor = json.dumps([created_at.isoformat(), str(id_)])
+    return base64.urlsafe_b64encode(raw_cursor.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decodes opaque cursor string into keyset pagination position.
+
+    Args:
+        cursor: urlsafe base64 encoded cursor string.
+    Raise:
+        PaginationCursorError in case cursor string is malformed.
+
+    Returns:
+    tuple with 'created_at' datetime and UUID of the last item on a previous page.
+    """
+    try:
+        created_at, id_ = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(created_at), UUID(id_)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise PaginationCursorError(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=PaginationExceptionMsgs.INVALID_CURSOR.value.format(cursor=cursor),
+        )
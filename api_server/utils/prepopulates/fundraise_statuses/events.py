@@ -4,11 +4,12 @@ from common.constants.prepopulates import FundraiseStatusConstants
 from db import create_engine
 from fundraisers.db_services import FundraiseStatusDBService
 from fundraisers.schemas import FundraiseStatusInputSchema
+from fundraisers.utils.fundraise_status_registry import fundraise_status_registry
 from utils.orm_helpers import create_db_session
 
 
 async def populate_fundraise_statuses_table(config: BaseModel) -> None:
-    """Populates app db FundraiseStatus table with data.
+    """Populates app db FundraiseStatus table with data and loads statuses into in-process registry.
 
     Args:
         config: fastapi app config.
@@ -23,9 +24,11 @@ async def populate_fundraise_statuses_table(config: BaseModel) -> None:
     )
     db_session = create_db_session(engine)
     async with db_session as session:
+        fundraise_status_db_service = FundraiseStatusDBService(session)
+        db_fundraise_statuses = await fundraise_status_db_service.get_fundraise_statuses()
+        fundraise_status_registry.load(db_fundraise_statuses)
         for status in FundraiseStatusConstants.ALL_STATUSES.value:
-            fundraise_status_db_service = FundraiseStatusDBService(session)
-            db_fundraise_status = await fundraise_status_db_service.get_fundraise_status_by_name(name=status)
+            db_fundraise_status = fundraise_status_registry.get(status)
             if not db_fundraise_status:
                 fundraise_status = FundraiseStatusInputSchema(name=status)
                 await fundraise_status_db_service.add_fundraise_status(fundraise_status)
@@ -1,4 +1,19 @@
+from contextlib import contextmanager
+from functools import partial
+from typing import Iterator
 import os
+import time
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from common.schemas.responses import ResponseBaseSchema
+from utils.compression import BrotliCompressor, GzipCompressor, brotli
+from utils.json_responses import ORJSONModelResponse
 
 
 def find_fullpath(filename: str, start_path: str) -> str:
@@ -14,3 +29,74 @@ def find_fullpath(filename: str, start_path: str) -> str:
     for root, dirs, files in os.walk(start_path):
         if filename in files:
             return os.path.join(root, filename)
+
+
+@contextmanager
+def count_statements(engine: AsyncEngine) -> Iterator[list[str]]:
+    """Collects sql statements executed by sqlalchemy engine inside of context manager.
+
+    Args:
+        engine: sqlalchemy AsyncEngine instance.
+
+    Returns:
+    list of executed sql statements, filled in while context manager is active.
+    """
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, 'before_cursor_execute', before_cursor_execute)
+
+
+async def measure_response_serialization(response_data: ResponseBaseSchema, rounds: int) -> dict[str, float]:
+    """Measures serialization time of response schema by fastapi response model path and by ORJSONModelResponse.
+
+    Args:
+        response_data: built response schema.
+        rounds: how many times response is serialized.
+
+    Returns:
+    dict with seconds spent by 'fastapi' and 'orjson' serialization.
+    """
+    response_field = create_response_field(name='response_benchmark', type_=ResponseBaseSchema)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        JSONResponse(await serialize_response(field=response_field, response_content=response_data)).body
+    fastapi_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(rounds):
+        ORJSONModelResponse(response_data).body
+    orjson_time = time.perf_counter() - start
+    return {'fastapi': fastapi_time, 'orjson': orjson_time}
+
+
+def measure_response_compression(
+        body: bytes, gzip_levels: list[int], brotli_quality: int, rounds: int,
+) -> dict[str, dict[str, float]]:
+    """Measures compressed size and CPU time of response body compression per request.
+
+    Args:
+        body: uncompressed response body.
+        gzip_levels: measured gzip compression levels.
+        brotli_quality: measured brotli compression quality, skipped when 'brotli' package is not installed.
+        rounds: how many times body is compressed.
+
+    Returns:
+    dict with 'bytes' and 'cpu_seconds' by encoding, e.g. 'identity', 'gzip-6', 'br-4'.
+    """
+    compressors = {f'gzip-{level}': partial(GzipCompressor, level) for level in gzip_levels}
+    if brotli is not None:
+        compressors[f'br-{brotli_quality}'] = partial(BrotliCompressor, brotli_quality)
+    results = {'identity': {'bytes': len(body), 'cpu_seconds': 0.0}}
+    for name, create_compressor in compressors.items():
+        start = time.process_time()
+        for _ in range(rounds):
+            compressor = create_compressor()
+            compressed_body = compressor.compress(body) + compressor.flush()
+        results[name] = {'bytes': len(compressed_body), 'cpu_seconds': (time.process_time() - start) / rounds}
+    return results
@@ -0,0 +1,92 @@
+from uuid import uuid4
+import asyncio
+
+import pytest
+
+from common.constants.cache import ReadThroughCacheConstants
+from utils.cache import ReadThroughCache
+
+
+class TestCaseReadThroughCache:
+
+    @pytest.mark.asyncio
+    async def test_read_through_cache_single_flight_load(self) -> None:
+        """Test concurrent misses of one key wait for a single load, loaded value is read from process memory.
+
+        Returns:
+        Nothing.
+        """
+        cache = ReadThroughCache()
+        cache.start()
+        loads = []
+
+        async def loader() -> bytes:
+            loads.append(1)
+            await asyncio.sleep(0.01)
+            return b'{}'
+
+        id_ = uuid4()
+        namespace = ReadThroughCacheConstants.CHARITIES_NAMESPACE.value
+        values = await asyncio.gather(*[cache.get_or_load(namespace, id_, loader) for _ in range(10)])
+        assert values == [b'{}'] * 10
+        assert await cache.get_or_load(namespace, id_, loader) == b'{}'
+        assert len(loads) == 1
+
+    @pytest.mark.asyncio
+    async def test_read_through_cache_invalidation_during_load(self) -> None:
+        """Test value loaded before invalidation is not cached, next read loads it again.
+
+        Returns:
+        Nothing.
+        """
+        cache = ReadThroughCache()
+        cache.start()
+        loaded = asyncio.Event()
+        invalidated = asyncio.Event()
+
+        async def stale_loader() -> bytes:
+            loaded.set()
+            await invalidated.wait()
+            return b'"stale"'
+
+        async def loader() -> bytes:
+            return b'"fresh"'
+
+        id_ = uuid4()
+        namespace = ReadThroughCacheConstants.CHARITIES_NAMESPACE.value
+        stale_read = asyncio.ensure_future(cache.get_or_load(namespace, id_, stale_loader))
+        await loaded.wait()
+        await cache.invalidate(namespace, id_)
+        invalidated.set()
+        assert await stale_read == b'"stale"'
+        assert await cache.get_or_load(namespace, id_, loader) == b'"fresh"'
+
+    @pytest.mark.asyncio
+    async def test_read_through_cache_redis_versioned_keys(self) -> None:
+        """Test values are shared between processes via Redis, invalidation in one process is visible in others.
+
+        Returns:
+        Nothing.
+        """
+        fakeredis_aioredis = pytest.importorskip('fakeredis.aioredis')
+        redis_client = fakeredis_aioredis.FakeRedis()
+        cache, other_process_cache = ReadThroughCache(), ReadThroughCache()
+        cache.start(redis_client=redis_client)
+        other_process_cache.start(redis_client=redis_client)
+        loads = []
+
+        async def loader() -> bytes:
+            loads.append(1)
+            return f'{len(loads)}'.encode()
+
+        id_ = uuid4()
+        namespace = ReadThroughCacheConstants.FUNDRAISERS_NAMESPACE.value
+        assert await cache.get_or_load(namespace, id_, loader) == b'1'
+        assert await other_process_cache.get_or_load(namespace, id_, loader) == b'1'
+        await cache.invalidate(namespace, id_)
+        # Process memory value of other process is dropped after local ttl.
+        other_process_cache.local.clear()
+        assert await other_process_cache.get_or_load(namespace, id_, loader) == b'2'
+        assert await cache.get_or_load(namespace, id_, loader) == b'2'
+        assert len(loads) == 2
+        await cache.shutdown()
@@ -0,0 +1,123 @@
+from fastapi import Request, Response
+from fastapi.responses import StreamingResponse
+
+from httpx import AsyncClient
+from starlette.applications import Starlette
+from starlette.routing import Route
+import pytest
+
+from common.constants.compression import CompressionConstants
+from common.tests.test_data.charities import request_test_charity_data
+from utils.compression import CompressionMiddleware, route_compression
+
+
+class TestCaseCompressionMiddleware:
+
+    @pytest.fixture
+    def compressed_app(self) -> CompressionMiddleware:
+        """A pytest fixture that creates Starlette app with streamed, image and not compressed routes.
+
+        Returns:
+        Starlette app wrapped into CompressionMiddleware.
+        """
+        text = request_test_charity_data.ADD_CHARITY_TEST_DATA['description'] * 100
+
+        async def stream_text(request: Request) -> StreamingResponse:
+            return StreamingResponse(iter([text.encode()] * 3), media_type='text/plain')
+
+        async def get_image(request: Request) -> Response:
+            return Response(text.encode(), media_type='image/png')
+
+        @route_compression(enabled=False)
+        async def get_not_compressed_text(request: Request) -> Response:
+            return Response(text.encode(), media_type='text/plain')
+
+        async def get_text_with_etag(request: Request) -> Response:
+            return Response(text.encode(), media_type='text/plain', headers={'etag': '"text"'})
+
+        routes = [
+            Route('/stream', stream_text),
+            Route('/image', get_image),
+            Route('/not-compressed', get_not_compressed_text),
+            Route('/etag', get_text_with_etag),
+        ]
+        return CompressionMiddleware(Starlette(routes=routes))
+
+    @pytest.mark.parametrize('accept_encoding, encoding', [
+        ('gzip, deflate', 'gzip'),
+        ('deflate;q=1.0, GZIP;q=0.5', 'gzip'),
+        ('gzip;q=0, *', None),
+        ('*;q=0.1', 'gzip'),
+        ('identity', None),
+        ('', None),
+    ])
+    def test_compression_middleware_select_encoding(self, accept_encoding: str, encoding: str | None) -> None:
+        """Test CompressionMiddleware selects gzip encoding only when client accepts it.
+
+        Args:
+            accept_encoding: value of 'Accept-Encoding' header.
+            encoding: expected selected encoding.
+
+        Returns:
+        Nothing.
+        """
+        middleware = CompressionMiddleware(Starlette())
+        middleware.encodings = [CompressionConstants.GZIP_ENCODING.value]
+        assert middleware.select_encoding(accept_encoding) == encoding
+
+    @pytest.mark.asyncio
+    async def test_compression_middleware_streamed_and_excluded_responses(
+            self, compressed_app: CompressionMiddleware,
+    ) -> None:
+        """Test streamed response is compressed by chunks, image and disabled route responses are sent as is.
+
+        Args:
+            compressed_app: pytest fixture, Starlette app wrapped into CompressionMiddleware.
+
+        Returns:
+        Nothing.
+        """
+        async with AsyncClient(app=compressed_app, base_url='http://test') as client:
+            response = await client.get('/stream', headers={'accept-encoding': 'gzip'})
+            assert response.headers['content-encoding'] == 'gzip'
+            assert 'content-length' not in response.headers
+            assert response.num_bytes_downloaded < len(response.content)
+            assert response.text == request_test_charity_data.ADD_CHARITY_TEST_DATA['description'] * 300
+            for url in ('/image', '/not-compressed'):
+                response = await client.get(url, headers={'accept-encoding': 'gzip'})
+                assert 'content-encoding' not in response.headers
+                assert response.num_bytes_downloaded == len(response.content)
+
+    @pytest.mark.asyncio
+    async def test_compression_middleware_weak_etag(self, compressed_app: CompressionMiddleware) -> None:
+        """Test etag of compressed response is made weak, etag of uncompressed response is kept strong.
+
+        Args:
+            compressed_app: pytest fixture, Starlette app wrapped into CompressionMiddleware.
+
+        Returns:
+        Nothing.
+        """
+        async with AsyncClient(app=compressed_app, base_url='http://test') as client:
+            response = await client.get('/etag', headers={'accept-encoding': 'gzip'})
+            assert response.headers['content-encoding'] == 'gzip'
+            assert response.headers['etag'] == 'W/"text"'
+            response = await client.get('/etag', headers={'accept-encoding': 'identity'})
+            assert 'content-encoding' not in response.headers
+            assert response.headers['etag'] == '"text"'
+
+    @pytest.mark.asyncio
+    async def test_compression_middleware_brotli(self, compressed_app: CompressionMiddleware) -> None:
+        """Test brotli is preferred over gzip when 'brotli' package is installed.
+
+        Args:
+            compressed_app: pytest fixture, Starlette app wrapped into CompressionMiddleware.
+
+        Returns:
+        Nothing.
+        """
+        pytest.importorskip('brotli')
+        async with AsyncClient(app=compressed_app, base_url='http://test') as client:
+            response = await client.get('/stream', headers={'accept-encoding': 'gzip, br'})
+        assert response.headers['content-encoding'] == 'br'
+        assert response.text == request_test_charity_data.ADD_CHARITY_TEST_DATA['description'] * 300